@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import MetricSnapshot
+from .models import MetricSnapshot, ParticipantsGrowthDay
 
 
 @admin.register(MetricSnapshot)
@@ -39,3 +39,26 @@ class MetricSnapshotAdmin(admin.ModelAdmin):
 
     def has_delete_permission(self, request, obj=None):
         return False
+
+
+@admin.register(ParticipantsGrowthDay)
+class ParticipantsGrowthDayAdmin(admin.ModelAdmin):
+    list_display = (
+        'date',
+        'validators',
+        'waitlist',
+        'builders',
+        'community_members',
+        'unique_contributors',
+        'total',
+        'computed_at',
+    )
+    ordering = ('-date',)
+    date_hierarchy = 'date'
+    actions = None
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from api.models import ParticipantsGrowthDay
+from api.participants_growth import refresh_participants_growth
+
+
+class Command(BaseCommand):
+    help = (
+        'Bring the participants-growth series up to today, recomputing from the '
+        'last stored day onward'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Rebuild the whole series, picking up late records dated before the last stored day',
+        )
+        parser.add_argument(
+            '--if-empty',
+            action='store_true',
+            help='Only seed the series when no day is stored yet',
+        )
+
+    def handle(self, *args, **options):
+        if options['if_empty'] and ParticipantsGrowthDay.objects.exists():
+            self.stdout.write('Participants growth already seeded.')
+            return
+
+        written, removed = refresh_participants_growth(full=options['full'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Participants growth refreshed: {written} day(s) written, {removed} removed.'
+        ))
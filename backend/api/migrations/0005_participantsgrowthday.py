@@ -0,0 +1,37 @@
+# Generated by Django 6.0.6 on 2026-10-19 11:32
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_metricsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParticipantsGrowthDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('validators_new', models.PositiveIntegerField(default=0)),
+                ('validators', models.PositiveIntegerField(default=0)),
+                ('waitlist_new', models.PositiveIntegerField(default=0)),
+                ('waitlist', models.PositiveIntegerField(default=0)),
+                ('builders_new', models.PositiveIntegerField(default=0)),
+                ('builders', models.PositiveIntegerField(default=0)),
+                ('community_members_new', models.PositiveIntegerField(default=0)),
+                ('community_members', models.PositiveIntegerField(default=0)),
+                ('unique_contributors_new', models.PositiveIntegerField(default=0)),
+                ('unique_contributors', models.PositiveIntegerField(default=0)),
+                ('total_new', models.PositiveIntegerField(default=0)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['date'],
+            },
+        ),
+    ]
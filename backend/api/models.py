@@ -34,3 +34,33 @@ class MetricSnapshot(BaseModel):
 
     def __str__(self):
         return f'{self.metric_key}={self.value} ({self.source})'
+
+
+class ParticipantsGrowthDay(models.Model):
+    """One day of the participants-growth series (see api.participants_growth).
+
+    Each cohort stores the users first counted that day (`*_new`) and the
+    cumulative size; `unique_contributors` and `total` are deduplicated
+    across cohorts.
+    """
+
+    date = models.DateField(unique=True)
+    validators_new = models.PositiveIntegerField(default=0)
+    validators = models.PositiveIntegerField(default=0)
+    waitlist_new = models.PositiveIntegerField(default=0)
+    waitlist = models.PositiveIntegerField(default=0)
+    builders_new = models.PositiveIntegerField(default=0)
+    builders = models.PositiveIntegerField(default=0)
+    community_members_new = models.PositiveIntegerField(default=0)
+    community_members = models.PositiveIntegerField(default=0)
+    unique_contributors_new = models.PositiveIntegerField(default=0)
+    unique_contributors = models.PositiveIntegerField(default=0)
+    total_new = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['date']
+
+    def __str__(self):
+        return f'{self.date}: {self.total} participants'
@@ -1,9 +1,16 @@
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone as dt_timezone
 from decimal import Decimal, InvalidOperation
+from functools import partial
+from http import cookiejar
 import json
 import logging
+import threading
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from django.utils import timezone
 
@@ -16,6 +23,14 @@ HTTP_TIMEOUT_SECONDS = 12
 # longer than the other overview providers. Keep connection failures fast while
 # allowing up to a minute for Studio to produce its response.
 STUDIO_HTTP_TIMEOUT = (HTTP_TIMEOUT_SECONDS, 60)
+# Upstream sources are fetched concurrently (OVERVIEW_METRICS_CONCURRENCY
+# workers). A source that has not resolved within its deadline, counted from
+# when a worker picks it up, is recorded as failed and abandoned so one hung
+# provider cannot hold up the refresh. requests' timeouts bound each socket
+# read, not a whole response, so the deadline is the only end-to-end bound.
+DEFAULT_OVERVIEW_METRICS_CONCURRENCY = 8
+SOURCE_DEADLINE_SECONDS = 2 * HTTP_TIMEOUT_SECONDS + 6
+STUDIO_SOURCE_DEADLINE_SECONDS = sum(STUDIO_HTTP_TIMEOUT) + 15
 GEN_DECIMALS = 18
 TESTNET_NETWORKS = ('asimov', 'bradbury')
 NETWORK_ACTIVITY_SOURCES = ('studio', *TESTNET_NETWORKS)
@@ -31,6 +46,120 @@ NETWORK_ACTIVITY_SECONDS_PER_WEEK = 7 * 24 * 60 * 60
 STUDIO_NETWORK_ACTIVITY_RANGE = 'year'
 OVERVIEW_PAYLOAD_METRIC_KEY = 'overview_payload'
 OVERVIEW_PAYLOAD_VERSION = 1
+TESTNET_KPI_KEYS = (
+    'decisions_made',
+    'chain_transactions',
+    'contracts_all_time',
+    'network_validators',
+    'gen_staked',
+)
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_overview_metrics_concurrency():
+    return max(1, int(getattr(
+        settings,
+        'OVERVIEW_METRICS_CONCURRENCY',
+        DEFAULT_OVERVIEW_METRICS_CONCURRENCY,
+    )))
+
+
+def get_http_session():
+    """Pooled session shared by every overview source and worker thread."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            pool_size = get_overview_metrics_concurrency()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            # Shared across threads; every provider authenticates by header,
+            # so keep the (not thread-safe) cookie jar empty.
+            session.cookies.set_policy(cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            _http_session = session
+        return _http_session
+
+
+def http_get(url, **kwargs):
+    return get_http_session().get(url, **kwargs)
+
+
+MetricSource = namedtuple('MetricSource', ['name', 'fetch', 'store', 'fail', 'deadline'])
+MetricSource.__doc__ = """One upstream fetch for run_metric_sources.
+
+`fetch()` runs on a worker thread and must not touch the database.
+`store(result)` and `fail(exc)` run on the calling thread and return the
+snapshots they saved.
+"""
+
+
+def run_metric_sources(sources, concurrency=None):
+    """Fetch `sources` concurrently, storing each one as soon as it resolves.
+
+    Snapshots are written by the calling thread as results arrive, so the
+    sources that finished are persisted even if a slower one later fails or
+    misses its deadline. Returns the stored snapshots in completion order.
+    """
+    results = []
+    if not sources:
+        return results
+    concurrency = concurrency or get_overview_metrics_concurrency()
+    started_at = {}
+
+    def run(source):
+        started_at[source.name] = time.monotonic()
+        return source.fetch()
+
+    def settle(source, handler, value):
+        try:
+            stored = handler(value)
+        except Exception as exc:
+            if handler is source.fail:
+                logger.exception('Overview source %s could not record its failure', source.name)
+                return
+            stored = source.fail(exc)
+        results.extend(stored or [])
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(concurrency, len(sources)),
+        thread_name_prefix='overview-metrics',
+    )
+    try:
+        pending = {executor.submit(run, source): source for source in sources}
+        while pending:
+            now = time.monotonic()
+            timeout = None
+            for future, source in list(pending.items()):
+                if future.done() or source.name not in started_at:
+                    continue
+                remaining = started_at[source.name] + source.deadline - now
+                if remaining <= 0:
+                    del pending[future]
+                    settle(source, source.fail, TimeoutError(
+                        f'{source.name} did not respond within {source.deadline}s'
+                    ))
+                elif timeout is None or remaining < timeout:
+                    timeout = remaining
+            if not pending:
+                break
+            if timeout is None and len(started_at) < len(sources):
+                # Queued sources have no deadline yet; re-check once they start.
+                timeout = 1
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                source = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    settle(source, source.fail, error)
+                else:
+                    settle(source, source.store, future.result())
+    finally:
+        # Never block on an abandoned worker; its late result is discarded.
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
 
 
 def decimal_value(value):
@@ -124,14 +253,11 @@ def overview_count_metric(metric_key, label, value, observed_at=None):
 
 
 def fetch_testnet_kpis(network):
-    base_url = {
-        'asimov': 'https://explorer-asimov.genlayer.com',
-        'bradbury': 'https://explorer-bradbury.genlayer.com',
-    }.get(network)
+    base_url = EXPLORER_BASE_URLS.get(network)
     if not base_url:
         raise ValueError(f'Unknown network {network}')
 
-    general = requests.get(f'{base_url}/api/v1/analytics/general-kpis', timeout=HTTP_TIMEOUT_SECONDS)
+    general = http_get(f'{base_url}/api/v1/analytics/general-kpis', timeout=HTTP_TIMEOUT_SECONDS)
     general.raise_for_status()
     data = general.json() or {}
     return {
@@ -144,24 +270,11 @@ def fetch_testnet_kpis(network):
     }
 
 
-def collect_testnet_metrics():
-    totals = {
-        'decisions_made': 0,
-        'chain_transactions': 0,
-        'contracts_all_time': 0,
-        'network_validators': 0,
-        'gen_staked': 0,
-    }
-    collected = []
-
-    for network in TESTNET_NETWORKS:
-        try:
-            metrics = fetch_testnet_kpis(network)
-        except Exception as exc:
-            collected.append(snapshot_error('network_status', 'genlayer_explorer', exc, dimensions={'network': network}))
-            continue
-
-        for key in totals:
+def testnet_metric_sources(totals):
+    """Explorer KPI sources; each adds its network's values into `totals`."""
+    def store(network, metrics):
+        collected = []
+        for key in TESTNET_KPI_KEYS:
             totals[key] += metrics[key]
             collected.append(snapshot(
                 key,
@@ -171,23 +284,47 @@ def collect_testnet_metrics():
                 dimensions={'network': network},
                 raw_payload=metrics['raw'],
             ))
+        return collected
+
+    def fail(network, exc):
+        return [snapshot_error('network_status', 'genlayer_explorer', exc, dimensions={'network': network})]
 
-    for key, value in totals.items():
-        collected.append(snapshot(
+    return [
+        MetricSource(
+            f'explorer-kpis:{network}',
+            partial(fetch_testnet_kpis, network),
+            partial(store, network),
+            partial(fail, network),
+            SOURCE_DEADLINE_SECONDS,
+        )
+        for network in TESTNET_NETWORKS
+    ]
+
+
+def store_testnet_totals(totals):
+    return [
+        snapshot(
             key,
             'genlayer_explorer',
             value,
             label=key.replace('_', ' ').title(),
             dimensions={'network': 'all'},
-        ))
+        )
+        for key, value in totals.items()
+    ]
 
+
+def collect_testnet_metrics():
+    totals = dict.fromkeys(TESTNET_KPI_KEYS, 0)
+    collected = run_metric_sources(testnet_metric_sources(totals))
+    collected.extend(store_testnet_totals(totals))
     return collected
 
 
 def get_portal_counts():
     from contributions.models import Contribution
     from validators.models import Validator
-    from community_xp.utils import get_community_member_user_ids
+    from community_xp.membership import community_membership_queryset
     from leaderboard.views import ONBOARDING_CONTRIBUTION_TYPE_SLUGS
 
     builder_count = (
@@ -210,7 +347,7 @@ def get_portal_counts():
     return {
         'builders': builder_count,
         'validators': Validator.objects.filter(user__visible=True).count(),
-        'community_members': len(get_community_member_user_ids(visible_only=True)),
+        'community_members': community_membership_queryset(visible_only=True).count(),
         'contributions': contributions_count,
     }
 
@@ -223,13 +360,27 @@ def collect_portal_metrics():
     ]
 
 
-def collect_discord_members():
+# External collectors are split in two: `fetch_*` talks to the provider (on a
+# worker thread) and returns the snapshot to save as keyword arguments, with
+# an `error` key for a failed metric; `store_snapshot` saves it.
+
+def store_snapshot(spec):
+    if 'error' in spec:
+        return snapshot_error(**spec)
+    return snapshot(**spec)
+
+
+def fetch_discord_members():
     token = getattr(settings, 'DISCORD_BOT_TOKEN', '')
     guild_id = getattr(settings, 'DISCORD_GUILD_ID', '')
     if not token or not guild_id:
-        return snapshot_error('discord_members', 'discord', 'DISCORD_BOT_TOKEN or DISCORD_GUILD_ID is not configured')
+        return {
+            'metric_key': 'discord_members',
+            'source': 'discord',
+            'error': 'DISCORD_BOT_TOKEN or DISCORD_GUILD_ID is not configured',
+        }
 
-    response = requests.get(
+    response = http_get(
         f'https://discord.com/api/v10/guilds/{guild_id}',
         params={'with_counts': 'true'},
         headers={'Authorization': f'Bot {token}'},
@@ -237,61 +388,70 @@ def collect_discord_members():
     )
     response.raise_for_status()
     payload = response.json() or {}
-    return snapshot(
-        'discord_members',
-        'discord',
-        payload.get('approximate_member_count'),
-        label='Discord members',
-        raw_payload=payload,
-    )
+    return {
+        'metric_key': 'discord_members',
+        'source': 'discord',
+        'value': payload.get('approximate_member_count'),
+        'label': 'Discord members',
+        'raw_payload': payload,
+    }
 
 
-def collect_telegram_members():
+def fetch_telegram_members():
     token = getattr(settings, 'TELEGRAM_BOT_TOKEN', '')
     chat_id = getattr(settings, 'TELEGRAM_CHAT_ID', '')
     if token and chat_id:
-        response = requests.get(
+        response = http_get(
             f'https://api.telegram.org/bot{token}/getChatMemberCount',
             params={'chat_id': chat_id},
             timeout=HTTP_TIMEOUT_SECONDS,
         )
         response.raise_for_status()
         payload = response.json() or {}
-        return snapshot(
-            'telegram_members',
-            'telegram',
-            payload.get('result'),
-            label='Telegram members',
-            raw_payload=payload,
-            dimensions={'chat_id': chat_id},
-        )
+        return {
+            'metric_key': 'telegram_members',
+            'source': 'telegram',
+            'value': payload.get('result'),
+            'label': 'Telegram members',
+            'raw_payload': payload,
+            'dimensions': {'chat_id': chat_id},
+        }
     if not token:
-        return snapshot(
-            'telegram_members',
-            'telegram',
-            getattr(settings, 'TELEGRAM_MEMBERS', '') or 13300,
-            label='Telegram members',
-            dimensions={'fallback': 'bot_token_missing'},
-        )
+        return {
+            'metric_key': 'telegram_members',
+            'source': 'telegram',
+            'value': getattr(settings, 'TELEGRAM_MEMBERS', '') or 13300,
+            'label': 'Telegram members',
+            'dimensions': {'fallback': 'bot_token_missing'},
+        }
 
     manual = getattr(settings, 'TELEGRAM_MEMBERS', '')
     if manual:
-        return snapshot('telegram_members', 'telegram', manual, label='Telegram members')
-    return snapshot_error(
-        'telegram_members',
-        'telegram',
-        'TELEGRAM_BOT_TOKEN/TELEGRAM_CHAT_ID or TELEGRAM_MEMBERS is not configured',
-    )
+        return {
+            'metric_key': 'telegram_members',
+            'source': 'telegram',
+            'value': manual,
+            'label': 'Telegram members',
+        }
+    return {
+        'metric_key': 'telegram_members',
+        'source': 'telegram',
+        'error': 'TELEGRAM_BOT_TOKEN/TELEGRAM_CHAT_ID or TELEGRAM_MEMBERS is not configured',
+    }
 
 
-def collect_x_followers():
+def fetch_x_followers():
     token = getattr(settings, 'SORSA_API_KEY', '')
     base_url = getattr(settings, 'SORSA_API_BASE_URL', '').rstrip('/')
     username = getattr(settings, 'X_METRICS_USERNAME', 'GenLayer')
     if not token or not base_url:
-        return snapshot_error('x_followers', 'sorsa', 'SORSA_API_BASE_URL or SORSA_API_KEY is not configured')
+        return {
+            'metric_key': 'x_followers',
+            'source': 'sorsa',
+            'error': 'SORSA_API_BASE_URL or SORSA_API_KEY is not configured',
+        }
 
-    response = requests.get(
+    response = http_get(
         f'{base_url}/info-batch',
         params={'usernames': [username.lstrip('@')]},
         headers={'ApiKey': token, 'Accept': 'application/json'},
@@ -303,18 +463,22 @@ def collect_x_followers():
     profile = users[0] if users else {}
     followers_count = profile.get('followers_count')
     if followers_count is None:
-        return snapshot_error('x_followers', 'sorsa', 'Sorsa profile response did not include followers_count')
-    return snapshot(
-        'x_followers',
-        'sorsa',
-        followers_count,
-        label='X followers',
-        raw_payload=payload,
-        dimensions={'username': username},
-    )
+        return {
+            'metric_key': 'x_followers',
+            'source': 'sorsa',
+            'error': 'Sorsa profile response did not include followers_count',
+        }
+    return {
+        'metric_key': 'x_followers',
+        'source': 'sorsa',
+        'value': followers_count,
+        'label': 'X followers',
+        'raw_payload': payload,
+        'dimensions': {'username': username},
+    }
 
 
-def collect_github_boilerplate_stars():
+def fetch_github_boilerplate_stars():
     repo = getattr(settings, 'GITHUB_METRICS_REPO', 'genlayerlabs/genlayer-project-boilerplate')
     headers = {
         'Accept': 'application/vnd.github+json',
@@ -324,54 +488,93 @@ def collect_github_boilerplate_stars():
     if token:
         headers['Authorization'] = f'Bearer {token}'
 
-    response = requests.get(f'https://api.github.com/repos/{repo}', headers=headers, timeout=HTTP_TIMEOUT_SECONDS)
+    response = http_get(f'https://api.github.com/repos/{repo}', headers=headers, timeout=HTTP_TIMEOUT_SECONDS)
     response.raise_for_status()
     payload = response.json() or {}
-    return snapshot(
-        'github_boilerplate_stars',
-        'github',
-        payload.get('stargazers_count'),
-        label='GitHub stars',
-        raw_payload=payload,
-        dimensions={'repo': repo},
-    )
+    return {
+        'metric_key': 'github_boilerplate_stars',
+        'source': 'github',
+        'value': payload.get('stargazers_count'),
+        'label': 'GitHub stars',
+        'raw_payload': payload,
+        'dimensions': {'repo': repo},
+    }
 
 
-def collect_defillama_fees_rank():
+def fetch_defillama_fees_rank():
     configured_rank = getattr(settings, 'DEFILLAMA_FEES_RANK', '')
     if configured_rank:
-        return snapshot(
-            'defillama_fees_rank',
-            'defillama',
-            configured_rank,
-            unit='rank',
-            label='DeFiLlama fees rank',
-            dimensions={'url': getattr(settings, 'DEFILLAMA_FEES_RANK_URL', 'https://defillama.com/fees/chains')},
+        return {
+            'metric_key': 'defillama_fees_rank',
+            'source': 'defillama',
+            'value': configured_rank,
+            'unit': 'rank',
+            'label': 'DeFiLlama fees rank',
+            'dimensions': {'url': getattr(settings, 'DEFILLAMA_FEES_RANK_URL', 'https://defillama.com/fees/chains')},
+        }
+    return {
+        'metric_key': 'defillama_fees_rank',
+        'source': 'defillama',
+        'error': (
+            'DEFILLAMA_FEES_RANK is not configured; documented API did not expose a stable '
+            'GenLayer chain-rank payload'
+        ),
+    }
+
+
+# (metric_key, source, fetcher) for each external overview metric.
+EXTERNAL_METRICS = (
+    ('discord_members', 'discord', fetch_discord_members),
+    ('telegram_members', 'telegram', fetch_telegram_members),
+    ('x_followers', 'sorsa', fetch_x_followers),
+    ('github_boilerplate_stars', 'github', fetch_github_boilerplate_stars),
+    ('defillama_fees_rank', 'defillama', fetch_defillama_fees_rank),
+)
+
+
+def _store_external(spec):
+    return [store_snapshot(spec)]
+
+
+def _fail_external(metric_key, source, exc):
+    return [snapshot_error(metric_key, source, exc)]
+
+
+def external_metric_sources():
+    return [
+        MetricSource(
+            metric_key,
+            fetcher,
+            _store_external,
+            partial(_fail_external, metric_key, source),
+            SOURCE_DEADLINE_SECONDS,
         )
-    return snapshot_error(
-        'defillama_fees_rank',
-        'defillama',
-        'DEFILLAMA_FEES_RANK is not configured; documented API did not expose a stable GenLayer chain-rank payload',
-    )
+        for metric_key, source, fetcher in EXTERNAL_METRICS
+    ]
+
+
+def collect_discord_members():
+    return store_snapshot(fetch_discord_members())
+
+
+def collect_telegram_members():
+    return store_snapshot(fetch_telegram_members())
+
+
+def collect_x_followers():
+    return store_snapshot(fetch_x_followers())
+
+
+def collect_github_boilerplate_stars():
+    return store_snapshot(fetch_github_boilerplate_stars())
+
+
+def collect_defillama_fees_rank():
+    return store_snapshot(fetch_defillama_fees_rank())
 
 
 def collect_external_metrics():
-    collectors = [
-        collect_discord_members,
-        collect_telegram_members,
-        collect_x_followers,
-        collect_github_boilerplate_stars,
-        collect_defillama_fees_rank,
-    ]
-    results = []
-    for collector in collectors:
-        try:
-            results.append(collector())
-        except Exception as exc:
-            metric_key = collector.__name__.replace('collect_', '')
-            source = 'sorsa' if metric_key == 'x_followers' else metric_key.split('_')[0]
-            results.append(snapshot_error(metric_key, source, exc))
-    return results
+    return run_metric_sources(external_metric_sources())
 
 
 # ---------------------------------------------------------------------------
@@ -444,7 +647,7 @@ def _daily_points_from_values(values, now):
 
 
 def _fetch_explorer_history(base, metric, frm, now):
-    history = requests.get(
+    history = http_get(
         f'{base}/api/v1/analytics/kpi-histories',
         params={
             'metric': metric,
@@ -496,7 +699,7 @@ def fetch_studio_activity(now, anchor_date):
         'STUDIO_METRICS_URL',
         'https://studio-metrics-dashboard.vercel.app/api/metrics/executive',
     )
-    response = requests.get(
+    response = http_get(
         url,
         params={'instanceId': 'all', 'range': STUDIO_NETWORK_ACTIVITY_RANGE},
         timeout=STUDIO_HTTP_TIMEOUT,
@@ -545,48 +748,72 @@ def _latest_week_meta(source_activity, week_key):
     return None
 
 
-def build_network_activity():
-    """Assemble the overview-chart payload and latest rolling-week KPIs.
+NetworkActivityWindow = namedtuple('NetworkActivityWindow', ['now', 'anchor_date', 'start', 'end', 'frm'])
 
-    Each source degrades independently; a failed upstream is just omitted.
-    """
+
+def network_activity_window():
     now = int(timezone.now().timestamp())
     anchor_date = datetime.fromtimestamp(now, tz=dt_timezone.utc).date()
     activity_start, activity_end = _activity_window(anchor_date)
-    frm = _utc_midnight_ts(activity_start)
+    return NetworkActivityWindow(now, anchor_date, activity_start, activity_end, _utc_midnight_ts(activity_start))
 
-    source_activity = []
 
-    # Studio first so it leads the legend/stack.
-    try:
-        studio = fetch_studio_activity(now, anchor_date)
-        if studio['points']:
-            source_activity.append({
-                'key': 'studio',
-                'label': 'Studio',
-                'points': studio['points'],
-                'chain_points': studio['chain_points'],
-                'daily_points': studio['daily_points'],
-                'chain_daily_points': studio['chain_daily_points'],
-            })
-    except Exception as exc:
-        logger.warning('Network activity: studio source failed: %s', exc)
+def network_activity_sources(activity, window):
+    """Studio and explorer history sources; results land in `activity[key]`."""
+    def store(key, result):
+        activity[key] = result
+        return []
 
+    def fail(key, exc):
+        logger.warning('Network activity: %s source failed: %s', key, exc)
+        return []
+
+    sources = [MetricSource(
+        'studio',
+        partial(fetch_studio_activity, window.now, window.anchor_date),
+        partial(store, 'studio'),
+        partial(fail, 'studio'),
+        STUDIO_SOURCE_DEADLINE_SECONDS,
+    )]
     for network in TESTNET_NETWORKS:
-        try:
-            net = fetch_explorer_activity(network, frm, now, anchor_date)
-        except Exception as exc:
-            logger.warning('Network activity: %s source failed: %s', network, exc)
+        sources.append(MetricSource(
+            network,
+            partial(fetch_explorer_activity, network, window.frm, window.now, window.anchor_date),
+            partial(store, network),
+            partial(fail, network),
+            SOURCE_DEADLINE_SECONDS,
+        ))
+    return sources
+
+
+def build_network_activity():
+    """Assemble the overview-chart payload and latest rolling-week KPIs.
+
+    Each source degrades independently; a failed upstream is just omitted.
+    """
+    window = network_activity_window()
+    activity = {}
+    run_metric_sources(network_activity_sources(activity, window))
+    return assemble_network_activity(activity, window)
+
+
+def assemble_network_activity(fetched, window):
+    """Build the payload from the fetched {source key: activity} results."""
+    activity_start, activity_end = window.start, window.end
+    source_activity = []
+    # Studio first so it leads the legend/stack, whichever source finished first.
+    for key in NETWORK_ACTIVITY_SOURCES:
+        result = fetched.get(key)
+        if not result or not result['points']:
             continue
-        if net['points']:
-            source_activity.append({
-                'key': network,
-                'label': network.title(),
-                'points': net['points'],
-                'chain_points': net['chain_points'],
-                'daily_points': net['daily_points'],
-                'chain_daily_points': net['chain_daily_points'],
-            })
+        source_activity.append({
+            'key': key,
+            'label': 'Studio' if key == 'studio' else key.title(),
+            'points': result['points'],
+            'chain_points': result['chain_points'],
+            'daily_points': result['daily_points'],
+            'chain_daily_points': result['chain_daily_points'],
+        })
 
     week_keys = sorted({
         point['week_start']
@@ -709,9 +936,17 @@ def _network_activity_payload_is_servable(payload):
     return len(source_keys) == len(set(source_keys)) and not _network_activity_missing_sources(payload)
 
 
-def collect_network_activity():
+def collect_network_activity(activity=None, window=None):
+    """Persist the network-activity snapshot.
+
+    Fetches the sources itself unless `activity` results (and the `window`
+    they were fetched for) are passed in by refresh_overview_metrics.
+    """
     try:
-        payload = build_network_activity()
+        if activity is None:
+            payload = build_network_activity()
+        else:
+            payload = assemble_network_activity(activity, window)
     except Exception as exc:
         return snapshot_error('network_activity', 'composite', exc)
     # A partial upstream result must not become the new public source of truth.
@@ -799,11 +1034,24 @@ def empty_network_activity_payload():
 
 
 def refresh_overview_metrics():
-    results = []
-    results.extend(collect_testnet_metrics())
-    results.extend(collect_portal_metrics())
-    results.extend(collect_external_metrics())
-    results.append(collect_network_activity())
+    """Collect every overview metric and store the composite payload.
+
+    All upstream sources share one worker pool, so a refresh takes about as
+    long as the slowest provider (usually Studio) instead of the sum of all
+    of them. Each source's snapshots are saved as soon as it resolves.
+    """
+    results = collect_portal_metrics()
+    window = network_activity_window()
+    activity = {}
+    totals = dict.fromkeys(TESTNET_KPI_KEYS, 0)
+    results.extend(run_metric_sources([
+        # Slowest first, so it never waits for a free worker.
+        *network_activity_sources(activity, window),
+        *testnet_metric_sources(totals),
+        *external_metric_sources(),
+    ]))
+    results.extend(store_testnet_totals(totals))
+    results.append(collect_network_activity(activity, window))
     results.append(collect_overview_payload())
     return results
 
@@ -0,0 +1,337 @@
+"""
+Daily participants-growth series behind ``/metrics/participants-growth/``.
+
+Each ParticipantsGrowthDay row holds, for one date, the users first counted
+in every cohort that day and the cumulative cohort sizes, plus the same pair
+for the deduplicated totals (all participants, and contributors without the
+waitlist). The endpoint reads these rows; it no longer derives per-user
+first-seen dates across the contribution tables on every call.
+
+``refresh_participants_growth`` is incremental: it recomputes from the last
+stored day onward, for the users with a record dated in that window, and
+appends the days since. Cumulative counts carry on from the stored day
+before the window. A late-arriving record dated before the window (a
+backdated contribution, a graduation recorded afterwards, a MEE6 match)
+is picked up by the full rebuild (``full=True``), which rewrites only the
+days whose numbers changed; the scheduled workflow runs one daily. The
+scans never run on the public request: the ``sync-participants-growth``
+workflow refreshes through the cron-token endpoint (the
+``refresh_participants_growth`` command does the same by hand, and
+startup.sh seeds an empty table with it), and the endpoint serves the
+stored rows, carried forward to today.
+"""
+
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from .models import ParticipantsGrowthDay
+
+COHORTS = ('validators', 'waitlist', 'builders', 'community_members')
+CONTRIBUTOR_COHORTS = ('validators', 'builders', 'community_members')
+
+# Welcome/auto-award builder types do not make someone a builder.
+EXCLUDED_BUILDER_SLUGS = ('builder-welcome', 'builder', 'project-review-reward')
+
+# Count fields per row; `total` and `unique_contributors` are deduplicated.
+SERIES_FIELDS = COHORTS + ('unique_contributors', 'total')
+
+
+def _validator_first_dates(user_ids=None):
+    # Validators are users with a visible Validator profile AND at least
+    # one recorded validator graduation date. Graduation is first taken
+    # from the frozen graduation leaderboard, then backfilled from the
+    # validator auto-award contribution for older data.
+    from contributions.models import Contribution
+    from leaderboard.models import LeaderboardEntry
+    from validators.models import Validator
+
+    validators = Validator.objects.filter(user__visible=True)
+    if user_ids is not None:
+        validators = validators.filter(user_id__in=user_ids)
+    validator_user_ids = set(validators.values_list('user_id', flat=True))
+    if not validator_user_ids:
+        return {}
+
+    graduation_dates = {}
+    graduation_entries = (
+        LeaderboardEntry.objects
+        .filter(
+            type='validator-waitlist-graduation',
+            user_id__in=validator_user_ids,
+            graduation_date__isnull=False,
+        )
+        .values_list('user_id', 'graduation_date')
+    )
+    for user_id, graduation_date in graduation_entries:
+        graduation_dates[user_id] = graduation_date.date()
+
+    validator_graduations = (
+        Contribution.objects
+        .filter(user_id__in=validator_user_ids)
+        .filter(contribution_type__slug='validator')
+        .exclude(contribution_date__isnull=True)
+        .values('user_id')
+        .annotate(graduation_date=Min('contribution_date'))
+        .values_list('user_id', 'graduation_date')
+    )
+    for user_id, graduation_date in validator_graduations:
+        graduation_dates.setdefault(user_id, graduation_date.date())
+
+    return graduation_dates
+
+
+def _waitlist_first_dates(user_ids=None):
+    # First waitlist contribution per user, so repeat submissions do not
+    # inflate counts.
+    from contributions.models import Contribution
+
+    contributions = Contribution.objects.filter(contribution_type__slug='validator-waitlist')
+    if user_ids is not None:
+        contributions = contributions.filter(user_id__in=user_ids)
+    entries = (
+        contributions
+        .values('user_id')
+        .annotate(first_contribution=Min('contribution_date'))
+        .values_list('user_id', 'first_contribution')
+    )
+    return {user_id: first.date() for user_id, first in entries if first}
+
+
+def _builder_first_dates(user_ids=None):
+    # Builders are users with a visible Builder profile AND at least one
+    # accepted contribution in the `builder` category (excluding the
+    # welcome/auto-award), matching the Dashboard `?type=builder` rule.
+    from builders.models import Builder
+    from contributions.models import Contribution
+
+    builders = Builder.objects.filter(user__visible=True)
+    if user_ids is not None:
+        builders = builders.filter(user_id__in=user_ids)
+    builder_user_ids = set(builders.values_list('user_id', flat=True))
+    if not builder_user_ids:
+        return {}
+
+    entries = (
+        Contribution.objects
+        .filter(user_id__in=builder_user_ids)
+        .filter(contribution_type__category__slug='builder')
+        .exclude(contribution_type__slug__in=EXCLUDED_BUILDER_SLUGS)
+        .values('user_id')
+        .annotate(first_contribution=Min('contribution_date'))
+        .values_list('user_id', 'first_contribution')
+    )
+    return {user_id: first.date() for user_id, first in entries if first}
+
+
+def _community_first_dates(user_ids=None):
+    # First-seen dates are kept on the persisted member set; see
+    # community_xp.membership for the sources behind them.
+    from community_xp.membership import community_membership_queryset
+
+    memberships = community_membership_queryset(visible_only=True)
+    if user_ids is not None:
+        memberships = memberships.filter(user_id__in=user_ids)
+    memberships = memberships.values_list('user_id', 'first_seen_at')
+    return {user_id: first_seen_at.date() for user_id, first_seen_at in memberships}
+
+
+def _users_with_records_since(since):
+    """Ids of users with a cohort record dated on or after `since`.
+
+    A superset of everyone whose first date in any cohort is `since` or
+    later: contributions of any type, graduations and community first-seen
+    dates in the window.
+    """
+    from community_xp.models import CommunityMembership
+    from contributions.models import Contribution
+    from leaderboard.models import LeaderboardEntry
+
+    start = datetime.combine(since, time.min, tzinfo=dt_timezone.utc)
+    user_ids = set(
+        Contribution.objects
+        .filter(contribution_date__gte=start)
+        .values_list('user_id', flat=True)
+        .distinct()
+    )
+    user_ids.update(
+        LeaderboardEntry.objects
+        .filter(type='validator-waitlist-graduation', graduation_date__gte=start)
+        .values_list('user_id', flat=True)
+    )
+    user_ids.update(
+        CommunityMembership.objects
+        .filter(first_seen_at__gte=start)
+        .values_list('user_id', flat=True)
+    )
+    return user_ids
+
+
+def cohort_first_dates(since=None):
+    """Return {cohort: {user_id: date the user joined the cohort}}.
+
+    With `since`, only users with a record dated on or after it are looked
+    at; their dates still come from all their records, so a user who joined
+    a cohort earlier keeps that earlier date.
+    """
+    user_ids = None if since is None else _users_with_records_since(since)
+    if user_ids is not None and not user_ids:
+        return {cohort: {} for cohort in COHORTS}
+    return {
+        'validators': _validator_first_dates(user_ids),
+        'waitlist': _waitlist_first_dates(user_ids),
+        'builders': _builder_first_dates(user_ids),
+        'community_members': _community_first_dates(user_ids),
+    }
+
+
+def _first_of(first_dates, cohorts):
+    first = {}
+    for cohort in cohorts:
+        for user_id, joined in first_dates[cohort].items():
+            if user_id not in first or joined < first[user_id]:
+                first[user_id] = joined
+    return first
+
+
+def build_growth_days(first_dates, end_date=None, start_date=None, initial=None):
+    """Return one {field: (new, cumulative)} dict per date, oldest first.
+
+    With `start_date`, the days run from it and users first seen earlier are
+    left out; `initial` holds the cumulative counts of the day before.
+    """
+    new_by_field = {cohort: Counter(first_dates[cohort].values()) for cohort in COHORTS}
+    new_by_field['unique_contributors'] = Counter(
+        _first_of(first_dates, CONTRIBUTOR_COHORTS).values()
+    )
+    new_by_field['total'] = Counter(_first_of(first_dates, COHORTS).values())
+
+    if start_date is None:
+        all_dates = set(new_by_field['total'])
+        if not all_dates:
+            return []
+        start_date = min(all_dates)
+        end_date = max(max(all_dates), end_date or timezone.localdate())
+    else:
+        end_date = end_date or timezone.localdate()
+
+    days = []
+    cumulative = dict(initial or dict.fromkeys(SERIES_FIELDS, 0))
+    current_date = start_date
+    while current_date <= end_date:
+        day = {'date': current_date}
+        for field in SERIES_FIELDS:
+            new = new_by_field[field].get(current_date, 0)
+            cumulative[field] += new
+            day[field] = (new, cumulative[field])
+        days.append(day)
+        current_date += timedelta(days=1)
+    return days
+
+
+def _row_values(day):
+    values = {}
+    for field in SERIES_FIELDS:
+        values[f'{field}_new'], values[field] = day[field]
+    return values
+
+
+def refresh_participants_growth(today=None, full=False):
+    """Bring the stored series up to today and write the days that changed.
+
+    Recomputes from the last stored day onward (see the module docstring);
+    with `full`, or while nothing is stored, rebuilds the whole series.
+    Returns (days_written, days_removed).
+    """
+    today = today or timezone.localdate()
+    value_fields = [name for field in SERIES_FIELDS for name in (f'{field}_new', field)]
+    last_date = None if full else (
+        ParticipantsGrowthDay.objects.order_by('-date').values_list('date', flat=True).first()
+    )
+
+    if last_date is None:
+        days = build_growth_days(cohort_first_dates(), end_date=today)
+        stored_rows = ParticipantsGrowthDay.objects.all()
+    else:
+        start_date = min(last_date, today)
+        previous = (
+            ParticipantsGrowthDay.objects
+            .filter(date__lt=start_date)
+            .order_by('-date')
+            .values(*SERIES_FIELDS)
+            .first()
+        )
+        days = build_growth_days(
+            cohort_first_dates(since=start_date),
+            end_date=today,
+            start_date=start_date,
+            initial=previous,
+        )
+        stored_rows = ParticipantsGrowthDay.objects.filter(date__gte=start_date)
+
+    computed_at = timezone.now()
+    stored = {row['date']: row for row in stored_rows.values('date', *value_fields)}
+
+    changed = []
+    for day in days:
+        values = _row_values(day)
+        previous_values = stored.pop(day['date'], None)
+        if day['date'] == today or previous_values is None or any(
+            previous_values[name] != value for name, value in values.items()
+        ):
+            changed.append(ParticipantsGrowthDay(date=day['date'], computed_at=computed_at, **values))
+
+    with transaction.atomic():
+        if changed:
+            ParticipantsGrowthDay.objects.bulk_create(
+                changed,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['date'],
+                update_fields=[*value_fields, 'computed_at'],
+            )
+        # Days outside the new range (the earliest participant went away).
+        if stored:
+            ParticipantsGrowthDay.objects.filter(date__in=list(stored)).delete()
+
+    return len(changed), len(stored)
+
+
+def participants_growth_series(today=None):
+    """Return the endpoint's `data` list from the stored rows.
+
+    Days after the last stored row repeat its cumulative counts up to today,
+    so the chart does not stop at the last refresh.
+    """
+    today = today or timezone.localdate()
+    data = []
+    row = None
+    for row in ParticipantsGrowthDay.objects.order_by('date'):
+        data.append(_series_point(row, row.date))
+    if row is not None:
+        current_date = row.date + timedelta(days=1)
+        while current_date <= today:
+            data.append(_series_point(row, current_date))
+            current_date += timedelta(days=1)
+    return data
+
+
+def _series_point(row, date):
+    cohort_total = sum(getattr(row, cohort) for cohort in COHORTS)
+    contributor_cohort_total = sum(getattr(row, cohort) for cohort in CONTRIBUTOR_COHORTS)
+    return {
+        'date': date.isoformat(),
+        'validators': row.validators,
+        'waitlist': row.waitlist,
+        'builders': row.builders,
+        'community_members': row.community_members,
+        'unique_contributors': row.unique_contributors,
+        'total': row.total,
+        'cohort_total': cohort_total,
+        'overlap_count': cohort_total - row.total,
+        'contributor_cohort_total': contributor_cohort_total,
+        'contributor_overlap_count': contributor_cohort_total - row.unique_contributors,
+    }
@@ -1,22 +1,30 @@
 from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import partial
+from io import StringIO
+import threading
 from unittest.mock import patch
 
 from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase, override_settings
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from api.models import MetricSnapshot
+from api.models import MetricSnapshot, ParticipantsGrowthDay
+from api import participants_growth
+from api.participants_growth import refresh_participants_growth
 from builders.models import Builder
+from community_xp.membership import refresh_community_memberships
 from community_xp.models import Mee6CurrentXP, Mee6SyncRun
 from contributions.models import Category, Contribution, ContributionType
+from leaderboard.models import GlobalLeaderboardMultiplier
 from social_tasks.models import SocialTask, SocialTaskCompletion
 from users.models import User
 from validators.models import Validator, ValidatorWallet
 
 
-class ParticipantsGrowthViewTests(TestCase):
+class ParticipantsGrowthFixtureMixin:
     def setUp(self):
         self.client = APIClient()
         self.authenticated_user = User.objects.create_user(
@@ -130,6 +138,8 @@ class ParticipantsGrowthViewTests(TestCase):
             synced_at=synced_at,
         )
 
+
+class ParticipantsGrowthViewTests(ParticipantsGrowthFixtureMixin, TestCase):
     @override_settings(MEE6_GUILD_ID='main-guild', DISCORD_GUILD_ID='discord-guild')
     def test_participants_growth_scopes_mee6_members_to_default_guild(self):
         base = timezone.now() - timedelta(days=2)
@@ -158,6 +168,7 @@ class ParticipantsGrowthViewTests(TestCase):
             base,
         )
 
+        refresh_participants_growth()
         response = self.client.get('/api/v1/metrics/participants-growth/')
 
         self.assertEqual(response.status_code, 200)
@@ -198,6 +209,7 @@ class ParticipantsGrowthViewTests(TestCase):
             id__in=[completion.id for completion in completions]
         ).update(completed_at=completed_at)
 
+        refresh_participants_growth()
         response = self.client.get('/api/v1/metrics/participants-growth/')
 
         self.assertEqual(response.status_code, 200)
@@ -336,6 +348,10 @@ class ParticipantsGrowthViewTests(TestCase):
             ),
         ])
 
+        # bulk_create skips the membership receivers.
+        refresh_community_memberships()
+
+        refresh_participants_growth()
         response = self.client.get('/api/v1/metrics/participants-growth/')
 
         self.assertEqual(response.status_code, 200)
@@ -362,6 +378,140 @@ class ParticipantsGrowthViewTests(TestCase):
         self.assertEqual(final_point['contributor_overlap_count'], 2)
 
 
+class ParticipantsGrowthSeriesTests(ParticipantsGrowthFixtureMixin, TestCase):
+    """The series is served from ParticipantsGrowthDay rows."""
+
+    def setUp(self):
+        super().setUp()
+        GlobalLeaderboardMultiplier.objects.create(
+            contribution_type=self.community_real_type,
+            multiplier_value=1,
+            valid_from=timezone.now() - timedelta(days=30),
+        )
+
+    def _add_community_contribution(self, user, days_ago):
+        return Contribution.objects.create(
+            user=user,
+            contribution_type=self.community_real_type,
+            points=10,
+            contribution_date=timezone.now() - timedelta(days=days_ago),
+        )
+
+    @override_settings(CRON_SYNC_TOKEN='growth-secret')
+    def test_series_is_served_as_stored_and_refreshed_by_cron(self):
+        member = self._create_user('series@example.com', '0x0000000000000000000000000000000000000201')
+        self._add_community_contribution(member, days_ago=3)
+
+        with patch('api.participants_growth.cohort_first_dates') as rebuild:
+            empty = self.client.get('/api/v1/metrics/participants-growth/')
+        rebuild.assert_not_called()
+        self.assertEqual(empty.data, {'data': []})
+
+        blocked = self.client.post('/api/v1/metrics/participants-growth/refresh/')
+        self.assertEqual(blocked.status_code, status.HTTP_403_FORBIDDEN)
+        refreshed = self.client.post(
+            '/api/v1/metrics/participants-growth/refresh/',
+            HTTP_X_CRON_TOKEN='growth-secret',
+        )
+        self.assertEqual(refreshed.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(refreshed.data, {'days_written': 4, 'days_removed': 0})
+
+        self._add_community_contribution(
+            self._create_user('later@example.com', '0x0000000000000000000000000000000000000204'),
+            days_ago=1,
+        )
+        with patch('api.participants_growth.cohort_first_dates') as rebuild:
+            response = self.client.get('/api/v1/metrics/participants-growth/')
+        rebuild.assert_not_called()
+        self.assertEqual(len(response.data['data']), 4)
+        self.assertEqual(response.data['data'][-1]['community_members'], 1)
+
+    def test_refresh_patches_days_changed_by_late_data(self):
+        early = self._create_user('early@example.com', '0x0000000000000000000000000000000000000202')
+        late = self._create_user('late@example.com', '0x0000000000000000000000000000000000000203')
+        self._add_community_contribution(early, days_ago=6)
+        refresh_participants_growth()
+        untouched = ParticipantsGrowthDay.objects.order_by('date')[:2]
+        untouched_computed_at = [row.computed_at for row in untouched]
+
+        self._add_community_contribution(late, days_ago=4)
+        # Dated before the last stored day, so only the full rebuild sees it.
+        self.assertEqual(refresh_participants_growth(), (1, 0))
+        written, removed = refresh_participants_growth(full=True)
+
+        # Every day from the backdated contribution through today.
+        self.assertEqual((written, removed), (5, 0))
+        rows = list(ParticipantsGrowthDay.objects.order_by('date'))
+        self.assertEqual([row.computed_at for row in rows[:2]], untouched_computed_at)
+        self.assertEqual([row.community_members for row in rows], [1, 1, 2, 2, 2, 2, 2])
+        self.assertEqual(rows[2].community_members_new, 1)
+        self.assertEqual(rows[2].total_new, 1)
+
+
+    def test_refresh_recomputes_from_the_last_stored_day(self):
+        today = timezone.localdate()
+        member = self._create_user('steady@example.com', '0x0000000000000000000000000000000000000205')
+        self._add_community_contribution(member, days_ago=5)
+        refresh_participants_growth(today=today - timedelta(days=2))
+
+        # Already a community member; a builder record in the window must not
+        # count them again in the deduplicated totals.
+        Builder.objects.create(user=member)
+        GlobalLeaderboardMultiplier.objects.create(
+            contribution_type=self.builder_real_type,
+            multiplier_value=1,
+            valid_from=timezone.now() - timedelta(days=30),
+        )
+        Contribution.objects.create(
+            user=member,
+            contribution_type=self.builder_real_type,
+            points=10,
+            contribution_date=timezone.now(),
+        )
+        newcomer = self._create_user('newcomer@example.com', '0x0000000000000000000000000000000000000206')
+        self._add_community_contribution(newcomer, days_ago=0)
+
+        with patch(
+            'api.participants_growth.cohort_first_dates',
+            wraps=participants_growth.cohort_first_dates,
+        ) as first_dates:
+            written, removed = refresh_participants_growth(today=today)
+
+        first_dates.assert_called_once_with(since=today - timedelta(days=2))
+        # The last stored day is unchanged; the two days since are appended.
+        self.assertEqual((written, removed), (2, 0))
+        rows = list(ParticipantsGrowthDay.objects.order_by('date'))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(
+            [(row.community_members, row.builders, row.total) for row in rows[-3:]],
+            [(1, 0, 1), (1, 0, 1), (2, 1, 2)],
+        )
+        self.assertEqual(rows[-1].total_new, 1)
+        self.assertEqual(rows[-1].builders_new, 1)
+
+    def test_series_is_carried_forward_to_today(self):
+        member = self._create_user('stale@example.com', '0x0000000000000000000000000000000000000207')
+        self._add_community_contribution(member, days_ago=4)
+        refresh_participants_growth(today=timezone.localdate() - timedelta(days=2))
+
+        data = self.client.get('/api/v1/metrics/participants-growth/').data['data']
+
+        self.assertEqual(len(data), 5)
+        self.assertEqual(data[-1]['date'], timezone.localdate().isoformat())
+        self.assertEqual(data[-1]['community_members'], 1)
+        self.assertEqual(data[-1]['total'], 1)
+
+    def test_command_seeds_an_empty_series_once(self):
+        member = self._create_user('seeded@example.com', '0x0000000000000000000000000000000000000208')
+        self._add_community_contribution(member, days_ago=2)
+
+        call_command('refresh_participants_growth', '--if-empty', stdout=StringIO())
+        self.assertEqual(ParticipantsGrowthDay.objects.count(), 3)
+
+        with patch('api.participants_growth.cohort_first_dates') as first_dates:
+            call_command('refresh_participants_growth', '--if-empty', stdout=StringIO())
+        first_dates.assert_not_called()
+
 class OverviewMetricsViewTests(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -433,6 +583,7 @@ class OverviewMetricsViewTests(TestCase):
                 contribution_date=timezone.now(),
             )
         ])
+        refresh_community_memberships()
 
         ValidatorWallet.objects.create(
             operator=validator,
@@ -555,6 +706,7 @@ class OverviewMetricsViewTests(TestCase):
                 contribution_date=timezone.now(),
             )
         ])
+        refresh_community_memberships()
         MetricSnapshot.objects.create(metric_key='discord_members', source='discord', value=111)
 
         response = self.client.get('/api/v1/metrics/overview/')
@@ -590,7 +742,7 @@ class OverviewMetricsViewTests(TestCase):
 
 class OverviewMetricCollectorTests(TestCase):
     @override_settings(SORSA_API_KEY='sorsa-secret', SORSA_API_BASE_URL='https://sorsa.test/v3', X_METRICS_USERNAME='GenLayer')
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_collect_x_followers_uses_sorsa_profile_api(self, mock_get):
         from api.overview_metrics import collect_x_followers
 
@@ -616,7 +768,7 @@ class OverviewMetricCollectorTests(TestCase):
         )
 
     @override_settings(TELEGRAM_BOT_TOKEN='', TELEGRAM_CHAT_ID='', TELEGRAM_MEMBERS='')
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_collect_telegram_members_defaults_to_curated_value_without_bot_token(self, mock_get):
         from api.overview_metrics import collect_telegram_members
 
@@ -628,14 +780,14 @@ class OverviewMetricCollectorTests(TestCase):
         mock_get.assert_not_called()
 
     @patch('api.overview_metrics.collect_network_activity')
-    @patch('api.overview_metrics.collect_external_metrics')
+    @patch('api.overview_metrics.store_testnet_totals')
+    @patch('api.overview_metrics.run_metric_sources')
     @patch('api.overview_metrics.collect_portal_metrics')
-    @patch('api.overview_metrics.collect_testnet_metrics')
     def test_refresh_overview_metrics_stores_composite_overview_payload(
         self,
-        collect_testnet_mock,
         collect_portal_mock,
-        collect_external_mock,
+        run_sources_mock,
+        store_totals_mock,
         collect_network_mock,
     ):
         from api.overview_metrics import OVERVIEW_PAYLOAD_METRIC_KEY, refresh_overview_metrics
@@ -647,9 +799,9 @@ class OverviewMetricCollectorTests(TestCase):
         MetricSnapshot.objects.create(metric_key='x_followers', source='sorsa', value=222)
         MetricSnapshot.objects.create(metric_key='github_boilerplate_stars', source='github', value=333)
 
-        collect_testnet_mock.return_value = []
         collect_portal_mock.return_value = []
-        collect_external_mock.return_value = []
+        run_sources_mock.return_value = []
+        store_totals_mock.return_value = []
         collect_network_mock.return_value = MetricSnapshot(
             metric_key='network_activity',
             source='composite',
@@ -669,6 +821,185 @@ class OverviewMetricCollectorTests(TestCase):
         self.assertEqual(payload['metrics']['github_boilerplate_stars']['value'], 333.0)
 
 
+class OverviewMetricSourceTests(TestCase):
+    """Concurrent upstream collection, with local stand-ins for every provider."""
+
+    def _source(self, name, fetch, stored, deadline=5):
+        from api.overview_metrics import MetricSource
+
+        def store(value):
+            stored.append((name, value))
+            return [MetricSnapshot.objects.create(metric_key=name, source='test', value=value)]
+
+        def fail(exc):
+            stored.append((name, exc))
+            return [MetricSnapshot.objects.create(
+                metric_key=name,
+                source='test',
+                status=MetricSnapshot.STATUS_ERROR,
+                error=str(exc),
+            )]
+
+        return MetricSource(name, fetch, store, fail, deadline)
+
+    def test_sources_are_fetched_concurrently(self):
+        from api.overview_metrics import run_metric_sources
+
+        # Each stand-in only returns once all three are in flight together.
+        barrier = threading.Barrier(3, timeout=5)
+        stored = []
+
+        def fetch(value):
+            barrier.wait()
+            return value
+
+        results = run_metric_sources(
+            [self._source(f'metric_{i}', partial(fetch, i), stored) for i in range(3)],
+            concurrency=3,
+        )
+
+        self.assertEqual(sorted(stored), [('metric_0', 0), ('metric_1', 1), ('metric_2', 2)])
+        self.assertEqual({item.status for item in results}, {MetricSnapshot.STATUS_OK})
+
+    def test_each_source_is_stored_as_soon_as_it_resolves(self):
+        from api.overview_metrics import run_metric_sources
+
+        fast_stored = threading.Event()
+        stored = []
+
+        def slow_fetch():
+            # Resolves only after the fast source has been persisted.
+            if not fast_stored.wait(timeout=5):
+                raise RuntimeError('fast source was not stored first')
+            return 2
+
+        fast = self._source('fast', lambda: 1, stored)
+        fast_store = fast.store
+
+        def store_fast(value):
+            snapshots = fast_store(value)
+            fast_stored.set()
+            return snapshots
+
+        run_metric_sources(
+            [self._source('slow', slow_fetch, stored), fast._replace(store=store_fast)],
+            concurrency=2,
+        )
+
+        self.assertEqual(stored, [('fast', 1), ('slow', 2)])
+        self.assertTrue(MetricSnapshot.objects.filter(metric_key='slow', status=MetricSnapshot.STATUS_OK).exists())
+
+    def test_source_past_its_deadline_is_recorded_as_failed(self):
+        from api.overview_metrics import run_metric_sources
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+        stored = []
+
+        results = run_metric_sources([
+            self._source('hung', lambda: release.wait(timeout=5), stored, deadline=0.2),
+            self._source('quick', lambda: 7, stored),
+        ], concurrency=2)
+
+        by_key = {item.metric_key: item for item in results}
+        self.assertEqual(by_key['quick'].status, MetricSnapshot.STATUS_OK)
+        self.assertEqual(by_key['hung'].status, MetricSnapshot.STATUS_ERROR)
+        self.assertIn('did not respond within 0.2s', by_key['hung'].error)
+
+    def test_failed_source_does_not_stop_the_others(self):
+        from api.overview_metrics import run_metric_sources
+
+        def broken():
+            raise RuntimeError('upstream down')
+
+        stored = []
+        results = run_metric_sources([
+            self._source('broken', broken, stored),
+            self._source('working', lambda: 3, stored),
+        ])
+
+        by_key = {item.metric_key: item for item in results}
+        self.assertEqual(by_key['broken'].error, 'upstream down')
+        self.assertEqual(float(by_key['working'].value), 3.0)
+
+    @override_settings(
+        DISCORD_BOT_TOKEN='discord-token',
+        DISCORD_GUILD_ID='42',
+        TELEGRAM_BOT_TOKEN='telegram-token',
+        TELEGRAM_CHAT_ID='-100',
+        SORSA_API_KEY='sorsa-secret',
+        SORSA_API_BASE_URL='https://sorsa.test/v3',
+        DEFILLAMA_FEES_RANK='15',
+        STUDIO_METRICS_URL='https://studio.test/api/metrics/executive',
+    )
+    def test_refresh_overview_metrics_collects_every_upstream(self):
+        from api.overview_metrics import OVERVIEW_PAYLOAD_METRIC_KEY, refresh_overview_metrics
+
+        requested = []
+
+        class FakeResponse:
+            def __init__(self, payload):
+                self._payload = payload
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return self._payload
+
+        def fake_get(url, params=None, **kwargs):
+            requested.append(url)
+            if 'discord.com' in url:
+                return FakeResponse({'approximate_member_count': 111})
+            if 'api.telegram.org' in url:
+                return FakeResponse({'ok': True, 'result': 222})
+            if 'sorsa.test' in url:
+                return FakeResponse({'users': [{'followers_count': 333}]})
+            if 'api.github.com' in url:
+                return FakeResponse({'stargazers_count': 444})
+            if 'general-kpis' in url:
+                return FakeResponse({'total_finalized_transactions': 10, 'total_rollup_transactions': 20})
+            if 'kpi-histories' in url:
+                return FakeResponse({'histories': [
+                    {'timestamp': params['from_timestamp'] + i * 86400, 'value': '5'}
+                    for i in range(28)
+                ]})
+            if 'studio.test' in url:
+                return FakeResponse({'metrics': [
+                    {'id': 'total-decisions', 'sparkline': [1] * 28},
+                    {'id': 'chain-transactions', 'sparkline': [2] * 28},
+                ]})
+            raise AssertionError(f'unexpected upstream {url}')
+
+        with patch('api.overview_metrics.http_get', new=fake_get):
+            results = refresh_overview_metrics()
+
+        # 2 explorer KPI calls, 2 x 2 history calls, Studio, and 4 providers.
+        self.assertEqual(len(requested), 11)
+        self.assertEqual(
+            [item.metric_key for item in results if item.status != MetricSnapshot.STATUS_OK],
+            [],
+        )
+        latest = {
+            item.metric_key: float(item.value)
+            for item in results
+            if item.value is not None and item.dimensions.get('network') in (None, 'all')
+        }
+        self.assertEqual(latest['discord_members'], 111.0)
+        self.assertEqual(latest['telegram_members'], 222.0)
+        self.assertEqual(latest['x_followers'], 333.0)
+        self.assertEqual(latest['github_boilerplate_stars'], 444.0)
+        self.assertEqual(latest['defillama_fees_rank'], 15.0)
+        self.assertEqual(latest['decisions_made'], 20.0)
+        network_activity = next(item for item in results if item.metric_key == 'network_activity')
+        self.assertEqual(
+            [series['key'] for series in network_activity.raw_payload['series']],
+            ['studio', 'asimov', 'bradbury'],
+        )
+        self.assertEqual(results[-1].metric_key, OVERVIEW_PAYLOAD_METRIC_KEY)
+        self.assertEqual(results[-1].raw_payload['metrics']['discord_members']['value'], 111.0)
+
+
 class NetworkActivityViewTests(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -710,7 +1041,7 @@ class NetworkActivityViewTests(TestCase):
             ]})
         return FakeResp({}, ok=False)
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_build_network_activity_aggregates_three_weekly_curves(self, mock_get):
         mock_get.side_effect = self._fake_get
         MetricSnapshot.objects.create(metric_key='defillama_fees_rank', source='defillama', value=15, unit='rank')
@@ -763,7 +1094,7 @@ class NetworkActivityViewTests(TestCase):
             self.assertEqual(call.kwargs['params']['from_timestamp'], expected_from)
             self.assertEqual(call.kwargs['params']['to_timestamp'], int(self.fixed_now.timestamp()))
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_build_network_activity_degrades_when_studio_fails(self, mock_get):
         def partial(url, params=None, timeout=None, **kwargs):
             if 'executive' in url or 'studio' in url:
@@ -779,7 +1110,7 @@ class NetworkActivityViewTests(TestCase):
         self.assertEqual(payload['totals']['decisions_made'], 1708)
         self.assertEqual(payload['totals']['daily_decisions_made'], 244)
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_build_network_activity_keeps_explorer_curves_when_chain_history_fails(self, mock_get):
         def partial(url, params=None, timeout=None, **kwargs):
             if 'kpi-histories' in url and (params or {}).get('metric') == 'total_rollup_transactions':
@@ -798,7 +1129,7 @@ class NetworkActivityViewTests(TestCase):
         self.assertEqual(payload['totals']['decisions_made'], 1869)
         self.assertEqual(payload['totals']['chain_transactions'], 161)
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_collect_network_activity_persists_snapshot(self, mock_get):
         from api.overview_metrics import collect_network_activity
         mock_get.side_effect = self._fake_get
@@ -812,7 +1143,7 @@ class NetworkActivityViewTests(TestCase):
         self.assertEqual([s['key'] for s in snap.raw_payload['series']], ['studio', 'asimov', 'bradbury'])
         self.assertEqual(snap.raw_payload['totals']['decisions_made'], 1869)
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_network_activity_served_from_snapshot_without_fetching(self, mock_get):
         # A stored snapshot must be served straight from the DB (no upstream calls),
         # and null padding in a curve must survive the JSON round-trip.
@@ -860,7 +1191,7 @@ class NetworkActivityViewTests(TestCase):
         self.assertEqual(resp.data['activity'][0]['date'], '2026-06-15')
         mock_get.assert_not_called()
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_v3_weekly_snapshot_keeps_graph_available_until_v4_refresh(self, mock_get):
         mock_get.side_effect = AssertionError('public read must not fetch upstreams')
         stored = {
@@ -895,7 +1226,7 @@ class NetworkActivityViewTests(TestCase):
         self.assertEqual(resp.data['latest_week_by_source'], {})
         mock_get.assert_not_called()
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_network_activity_without_valid_snapshot_does_not_fetch_live(self, mock_get):
         mock_get.side_effect = AssertionError('public read must not fetch upstreams')
 
@@ -909,7 +1240,7 @@ class NetworkActivityViewTests(TestCase):
         self.assertIsNone(resp.data['totals']['decisions_made'])
         mock_get.assert_not_called()
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_legacy_daily_snapshot_is_ignored_without_live_rebuild(self, mock_get):
         mock_get.side_effect = AssertionError('public read must not fetch upstreams')
         stored = {
@@ -932,7 +1263,7 @@ class NetworkActivityViewTests(TestCase):
         self.assertEqual(resp.data['series'], [])
         mock_get.assert_not_called()
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_total_source_failure_does_not_clobber_good_snapshot(self, mock_get):
         # A good snapshot exists; a cron run where every source fails must NOT
         # overwrite it — it records an error snapshot and the OK one keeps serving.
@@ -968,7 +1299,7 @@ class NetworkActivityViewTests(TestCase):
         # The latest *OK* snapshot is still the good one.
         self.assertEqual(latest_network_activity()['totals']['decisions_made'], 1234)
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_partial_source_failure_is_saved_as_error_and_keeps_complete_snapshot(self, mock_get):
         good = {
             'labels': ['Jun 1'],
@@ -1047,7 +1378,7 @@ class NetworkActivityViewTests(TestCase):
             (self.fixed_now - timedelta(minutes=15)).isoformat(),
         )
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_partial_source_failure_uses_only_sources_that_resolved_this_run(self, mock_get):
         # Rolling-week totals should not backfill stale all-time figures from an
         # older snapshot; they reflect the sources that resolved for this run.
@@ -1083,7 +1414,7 @@ class NetworkActivityViewTests(TestCase):
         # The chart curves still only include the sources that resolved.
         self.assertEqual([s['key'] for s in payload['series']], ['asimov', 'bradbury'])
 
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_first_run_no_previous_snapshot_does_not_invent_missing_source(self, mock_get):
         # First ever run (no prior snapshot), studio down: its weekly totals must
         # NOT be invented — totals come from the two testnets only.
@@ -1102,7 +1433,7 @@ class NetworkActivityViewTests(TestCase):
         self.assertEqual(payload['totals']['chain_transactions'], 3108)
 
     @override_settings(CRON_SYNC_TOKEN='na-secret')
-    @patch('api.overview_metrics.requests.get')
+    @patch('api.overview_metrics.http_get')
     def test_refresh_endpoint_invalidates_network_activity_cache(self, mock_get):
         mock_get.side_effect = AssertionError('served from DB, no upstream calls expected')
         first = {
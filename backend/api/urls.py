@@ -7,13 +7,14 @@ from partners.views import PartnerViewSet
 from projects.views import ProjectViewSet
 from gen_tv.views import StreamCategoryViewSet, StreamViewSet
 from poaps.views import PoapDropViewSet
-from notifications.views import NotificationViewSet, WhatsNewAnnouncementViewSet
+from notifications.views import NotificationViewSet, SendQueuedCampaignsView, WhatsNewAnnouncementViewSet
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView, TokenVerifyView
 from .metrics_views import (
     NetworkActivityView,
     OverviewMetricsView,
     ParticipantsGrowthView,
     RefreshOverviewMetricsView,
+    RefreshParticipantsGrowthView,
 )
 
 # Create a router and register our viewsets with it
@@ -59,6 +60,10 @@ urlpatterns = [
     path('metrics/overview/network-activity/', NetworkActivityView.as_view(), name='overview-network-activity'),
     path('metrics/overview/refresh/', RefreshOverviewMetricsView.as_view(), name='refresh-overview-metrics'),
     path('metrics/participants-growth/', ParticipantsGrowthView.as_view(), name='participants-growth'),
+    path('metrics/participants-growth/refresh/', RefreshParticipantsGrowthView.as_view(), name='refresh-participants-growth'),
+
+    # Cron-triggered delivery of queued notification campaigns
+    path('notification-campaigns/send/', SendQueuedCampaignsView.as_view(), name='send-notification-campaigns'),
 
     # Cron-triggered community XP maintenance
     path('community-xp/', include('community_xp.urls')),
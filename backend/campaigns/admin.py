@@ -1,5 +1,6 @@
 from django.contrib import admin
-from django.db.models import Count, Q
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
 from django.utils.html import format_html, format_html_join
 
 from .models import CampaignLink, CampaignRedirectHit, MarketingCampaign, UserAcquisitionAttribution
@@ -94,10 +95,11 @@ class CampaignLinkAdmin(admin.ModelAdmin):
     search_fields = ('alias', 'campaign__name', 'campaign__tracking_key', 'utm_source', 'utm_medium')
 
     def get_queryset(self, request):
+        # Summed from the daily rollups rather than counted from raw hits.
         return super().get_queryset(request).annotate(
-            human_hit_count=Count('hits', filter=Q(hits__is_probable_bot=False), distinct=True),
-            bot_hit_count=Count('hits', filter=Q(hits__is_probable_bot=True), distinct=True),
-            signup_count=Count('acquisitions', distinct=True),
+            human_hit_count=Coalesce(Sum('daily_stats__human_hits'), 0),
+            bot_hit_count=Coalesce(Sum('daily_stats__bot_hits'), 0),
+            signup_count=Coalesce(Sum('daily_stats__signups'), 0),
         )
 
     @admin.display(ordering='human_hit_count', description='Hits (human)')
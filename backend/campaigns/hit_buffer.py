@@ -0,0 +1,140 @@
+"""
+Per-process buffer for campaign redirect hits.
+
+The /join redirect is public and anonymous, and ad traffic and bots hit it in
+bursts, so a redirect must not wait on a database insert. record_redirect_hit
+appends an unsaved CampaignRedirectHit here and a daemon writer thread
+bulk-inserts the buffer every ``CAMPAIGN_HIT_FLUSH_INTERVAL_SECONDS``, as soon
+as ``CAMPAIGN_HIT_FLUSH_BATCH_SIZE`` hits are waiting, and once more when the
+interpreter exits.
+
+Hits are analytics, not records. A worker killed with hits still buffered
+loses them, a flush that fails is logged and dropped, and while the database
+is unavailable the buffer keeps only the newest
+``CAMPAIGN_HIT_FLUSH_BATCH_SIZE * MAX_PENDING_BATCHES`` hits.
+
+With the interval set to 0 there is no writer thread: the request that fills
+the batch writes it inline. The test settings use that with a batch size of 1,
+so every hit is written before the redirect returns.
+
+Each flush also adds its hits to the CampaignLinkDailyStats rollups in the
+same transaction, one UPDATE per link and day in the batch.
+"""
+
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+MAX_PENDING_BATCHES = 20
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+class RedirectHitBuffer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = []
+        self._dropped = 0
+        self._wake = threading.Event()
+        self._writer = None
+
+    @property
+    def batch_size(self):
+        return max(settings.CAMPAIGN_HIT_FLUSH_BATCH_SIZE, 1)
+
+    def add(self, hit):
+        batch_size = self.batch_size
+        with self._lock:
+            self._pending.append(hit)
+            overflow = len(self._pending) - batch_size * MAX_PENDING_BATCHES
+            if overflow > 0:
+                del self._pending[:overflow]
+                self._dropped += overflow
+            full = len(self._pending) >= batch_size
+
+        if settings.CAMPAIGN_HIT_FLUSH_INTERVAL_SECONDS <= 0:
+            if full:
+                self.flush()
+            return
+        self._ensure_writer()
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """Write every buffered hit; returns how many were written."""
+        from .models import CampaignRedirectHit, add_hits_to_daily_stats
+
+        with self._lock:
+            hits, self._pending = self._pending, []
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            logger.warning('Dropped %s buffered campaign redirect hit(s) while the buffer was full', dropped)
+        if not hits:
+            return 0
+        try:
+            with transaction.atomic():
+                CampaignRedirectHit.objects.bulk_create(hits, batch_size=self.batch_size)
+                add_hits_to_daily_stats(hits)
+        except Exception:
+            logger.warning('Campaign redirect hit flush failed; dropping %s hit(s)', len(hits), exc_info=True)
+            return 0
+        return len(hits)
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    def _ensure_writer(self):
+        if self._writer is not None:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name='campaign-hit-writer', daemon=True)
+                self._writer.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(settings.CAMPAIGN_HIT_FLUSH_INTERVAL_SECONDS)
+            self._wake.clear()
+            try:
+                close_old_connections()
+                self.flush()
+            except Exception:
+                logger.exception('Campaign redirect hit writer failed')
+
+
+def get_buffer():
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = RedirectHitBuffer()
+    return _buffer
+
+
+def buffer_redirect_hit(hit):
+    get_buffer().add(hit)
+
+
+def flush_redirect_hits():
+    """Write this process's buffered hits now; returns how many were written."""
+    return _buffer.flush() if _buffer is not None else 0
+
+
+def _discard_inherited_buffer():
+    # A forked worker must not share the parent's pending list or lock, and
+    # the parent's writer thread does not exist in the child.
+    global _buffer, _buffer_lock
+    _buffer = None
+    _buffer_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_discard_inherited_buffer)
+atexit.register(flush_redirect_hits)
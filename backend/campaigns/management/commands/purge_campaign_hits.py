@@ -1,3 +1,4 @@
+import time
 from datetime import timedelta
 
 from django.conf import settings
@@ -8,7 +9,10 @@ from campaigns.models import CampaignRedirectHit
 
 
 class Command(BaseCommand):
-    help = 'Delete campaign redirect hits older than the retention window (default 90 days).'
+    help = (
+        'Delete campaign redirect hits older than the retention window (default 90 days), '
+        'in short chunks so the redirect keeps inserting while the purge runs.'
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -18,13 +22,40 @@ class Command(BaseCommand):
             help='Retention window in days.',
         )
         parser.add_argument('--dry-run', action='store_true', help='Only report what would be deleted.')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Rows deleted per statement.',
+        )
+        parser.add_argument(
+            '--max-seconds',
+            type=float,
+            default=0,
+            help='Stop starting new chunks after this many seconds (0 = no limit). '
+                 'The next run resumes where this one stopped.',
+        )
 
     def handle(self, *args, **options):
         cutoff = timezone.now() - timedelta(days=options['days'])
         queryset = CampaignRedirectHit.objects.filter(occurred_at__lt=cutoff)
-        count = queryset.count()
         if options['dry_run']:
+            count = queryset.count()
             self.stdout.write(f'Would delete {count} redirect hits older than {cutoff.isoformat()}.')
             return
-        queryset.delete()
-        self.stdout.write(self.style.SUCCESS(f'Deleted {count} redirect hits older than {cutoff.isoformat()}.'))
+
+        chunk_size = max(options['chunk_size'], 1)
+        deadline = time.monotonic() + options['max_seconds'] if options['max_seconds'] > 0 else None
+        deleted = 0
+        while True:
+            if deadline is not None and time.monotonic() >= deadline:
+                self.stdout.write(self.style.WARNING(
+                    f'Stopped after {options["max_seconds"]:g}s; older hits remain for the next run.'
+                ))
+                break
+            chunk_ids = list(queryset.order_by().values_list('pk', flat=True)[:chunk_size])
+            if not chunk_ids:
+                break
+            CampaignRedirectHit.objects.filter(pk__in=chunk_ids).delete()
+            deleted += len(chunk_ids)
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} redirect hits older than {cutoff.isoformat()}.'))
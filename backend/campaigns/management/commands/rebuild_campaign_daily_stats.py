@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from campaigns.models import rebuild_campaign_daily_stats
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the campaign funnel rollups (CampaignLinkDailyStats) and attribution activation '
+        'timestamps from source. Hit counts older than the retention window are kept as they are.'
+    )
+
+    def handle(self, *args, **options):
+        cells = rebuild_campaign_daily_stats()
+        self.stdout.write(self.style.SUCCESS(f'Campaign daily stats rebuilt: {cells} cell(s).'))
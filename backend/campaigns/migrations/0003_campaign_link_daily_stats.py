@@ -0,0 +1,153 @@
+# Generated by Django 6.0.6 on 2026-10-19 13:18
+
+import datetime
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import TruncDate
+
+ACTIVATION_SOURCES = {
+    'builder': (
+        'contributions', 'SubmittedContribution', {'contribution_type__category__slug': 'builder'}, 'created_at',
+    ),
+    'validator': (
+        'contributions', 'Contribution', {'contribution_type__slug': 'validator-waitlist'}, 'created_at',
+    ),
+    'community': (
+        'social_tasks', 'SocialTaskCompletion', {'task__counts_as_activation': True}, 'completed_at',
+    ),
+}
+
+
+def _daily_counts(queryset, tracking_id_field, time_field):
+    return (
+        queryset.filter(**{f'{time_field}__isnull': False})
+        .order_by()
+        .annotate(day=TruncDate(time_field, tzinfo=datetime.timezone.utc))
+        .values(tracking_id_field, 'day')
+        .annotate(total=Count('pk'))
+        .values_list(tracking_id_field, 'day', 'total')
+    )
+
+
+def backfill_campaign_daily_stats(apps, schema_editor):
+    CampaignLink = apps.get_model('campaigns', 'CampaignLink')
+    CampaignRedirectHit = apps.get_model('campaigns', 'CampaignRedirectHit')
+    CampaignLinkDailyStats = apps.get_model('campaigns', 'CampaignLinkDailyStats')
+    UserAcquisitionAttribution = apps.get_model('campaigns', 'UserAcquisitionAttribution')
+    PendingWalletSignup = apps.get_model('ethereum_auth', 'PendingWalletSignup')
+
+    for role, (app_label, model_name, filters, time_field) in ACTIVATION_SOURCES.items():
+        UserAcquisitionAttribution.objects.update(**{
+            f'{role}_activated_at': Subquery(
+                apps.get_model(app_label, model_name).objects
+                .filter(user_id=OuterRef('user_id'), **filters)
+                .order_by(time_field)
+                .values(time_field)[:1]
+            ),
+        })
+
+    cells = defaultdict(dict)
+    for row in (
+        CampaignRedirectHit.objects
+        .order_by()
+        .annotate(day=TruncDate('occurred_at', tzinfo=datetime.timezone.utc))
+        .values('campaign_link__tracking_id', 'day')
+        .annotate(
+            human_hits=Count('pk', filter=Q(is_probable_bot=False)),
+            bot_hits=Count('pk', filter=Q(is_probable_bot=True)),
+        )
+    ):
+        cells[(row['campaign_link__tracking_id'], row['day'])].update(
+            human_hits=row['human_hits'], bot_hits=row['bot_hits'],
+        )
+    sources = [
+        ('wallet_connects', PendingWalletSignup.objects.all(),
+         'acquisition_campaign_link__tracking_id', 'acquisition_captured_at'),
+        ('signups', UserAcquisitionAttribution.objects.all(), 'link_tracking_id', 'registered_at'),
+    ] + [
+        (f'{role}_activations', UserAcquisitionAttribution.objects.all(), 'link_tracking_id', f'{role}_activated_at')
+        for role in ACTIVATION_SOURCES
+    ]
+    for column, queryset, tracking_id_field, time_field in sources:
+        for tracking_id, day, total in _daily_counts(queryset, tracking_id_field, time_field):
+            if tracking_id:
+                cells[(tracking_id, day)][column] = total
+
+    identities = {
+        tracking_id: (link_id, campaign_key)
+        for tracking_id, link_id, campaign_key in CampaignLink.objects.values_list(
+            'tracking_id', 'pk', 'campaign__tracking_key',
+        )
+    }
+    for tracking_id, campaign_key in UserAcquisitionAttribution.objects.values_list(
+        'link_tracking_id', 'campaign_key',
+    ):
+        identities.setdefault(tracking_id, (None, campaign_key))
+    CampaignLinkDailyStats.objects.bulk_create(
+        [
+            CampaignLinkDailyStats(
+                campaign_link_id=identities.get(tracking_id, (None, ''))[0],
+                link_tracking_id=tracking_id,
+                campaign_key=identities.get(tracking_id, (None, ''))[1],
+                day=day,
+                **values,
+            )
+            for (tracking_id, day), values in cells.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0002_marketing_group'),
+        ('contributions', '0089_contribution_type_statistics'),
+        ('ethereum_auth', '0005_pendingwalletsignup_acquisition_campaign_link_and_more'),
+        ('social_tasks', '0007_socialtask_counts_as_activation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='useracquisitionattribution',
+            name='builder_activated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='useracquisitionattribution',
+            name='community_activated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='useracquisitionattribution',
+            name='validator_activated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='CampaignLinkDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('link_tracking_id', models.CharField(max_length=20)),
+                ('campaign_key', models.CharField(max_length=64)),
+                ('day', models.DateField()),
+                ('human_hits', models.PositiveIntegerField(default=0)),
+                ('bot_hits', models.PositiveIntegerField(default=0)),
+                ('wallet_connects', models.PositiveIntegerField(default=0)),
+                ('signups', models.PositiveIntegerField(default=0)),
+                ('builder_activations', models.PositiveIntegerField(default=0)),
+                ('validator_activations', models.PositiveIntegerField(default=0)),
+                ('community_activations', models.PositiveIntegerField(default=0)),
+                ('campaign_link', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='daily_stats', to='campaigns.campaignlink')),
+            ],
+            options={
+                'verbose_name_plural': 'Campaign link daily stats',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['campaign_key', 'day'], name='campaign_stats_key_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('link_tracking_id', 'day'), name='unique_campaign_link_day')],
+            },
+        ),
+        migrations.RunPython(backfill_campaign_daily_stats, migrations.RunPython.noop),
+    ]
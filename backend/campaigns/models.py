@@ -5,13 +5,20 @@ always {FRONTEND_URL}/join/<role-segment>/<alias>, reverse-proxied by Amplify
 to the resolver in views.py. Creating a campaign is data only: no route,
 Amplify, or DNS change is ever needed per campaign.
 """
+import datetime
 import secrets
+from collections import Counter, defaultdict
 from urllib.parse import urlencode
 
+from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Min, OuterRef, Q, Subquery
+from django.db.models.functions import TruncDate
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
 from django.utils import timezone
 
 from utils.models import BaseModel
@@ -299,9 +306,448 @@ class UserAcquisitionAttribution(BaseModel):
     landing_path = models.CharField(max_length=MAX_DESTINATION_LENGTH, blank=True)
     captured_at = models.DateTimeField(null=True, blank=True)
     registered_at = models.DateTimeField()
+    # First qualifying outcome per role (see ACTIVATION_SOURCES), kept by
+    # refresh_user_activations so the daily rollups can count activations by
+    # day without joining the source tables.
+    builder_activated_at = models.DateTimeField(null=True, blank=True, editable=False)
+    validator_activated_at = models.DateTimeField(null=True, blank=True, editable=False)
+    community_activated_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     class Meta:
         ordering = ['-registered_at']
 
     def __str__(self):
         return f'{self.user_id} <- {self.campaign_key}'
+
+
+class CampaignLinkDailyStats(models.Model):
+    """One campaign link's funnel on one UTC day, summed by campaign_report.
+
+    Keyed by the link's tracking ID rather than the FK so a day's numbers
+    survive link deletion, like the attribution snapshot columns. Hit counts
+    are added as hits are written and outlive the raw hits' retention window;
+    every other column is recomputed from its source rows by
+    refresh_campaign_daily_stats. A user counts once per stage, on the day
+    they first reached it.
+    """
+
+    campaign_link = models.ForeignKey(
+        CampaignLink, null=True, blank=True, on_delete=models.SET_NULL, related_name='daily_stats',
+    )
+    link_tracking_id = models.CharField(max_length=20)
+    campaign_key = models.CharField(max_length=64)
+    day = models.DateField()
+    human_hits = models.PositiveIntegerField(default=0)
+    bot_hits = models.PositiveIntegerField(default=0)
+    wallet_connects = models.PositiveIntegerField(default=0)
+    signups = models.PositiveIntegerField(default=0)
+    builder_activations = models.PositiveIntegerField(default=0)
+    validator_activations = models.PositiveIntegerField(default=0)
+    community_activations = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-day']
+        verbose_name_plural = 'Campaign link daily stats'
+        constraints = [
+            models.UniqueConstraint(fields=['link_tracking_id', 'day'], name='unique_campaign_link_day'),
+        ]
+        indexes = [
+            models.Index(fields=['campaign_key', 'day'], name='campaign_stats_key_day_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.link_tracking_id} on {self.day:%Y-%m-%d}'
+
+
+# role -> (source model, filter, timestamp) of the event that activates a
+# signup in that role. The user's earliest matching row is the activation.
+ACTIVATION_SOURCES = {
+    ROLE_BUILDER: (
+        'contributions.SubmittedContribution', {'contribution_type__category__slug': 'builder'}, 'created_at',
+    ),
+    ROLE_VALIDATOR: (
+        'contributions.Contribution', {'contribution_type__slug': 'validator-waitlist'}, 'created_at',
+    ),
+    ROLE_COMMUNITY: (
+        'social_tasks.SocialTaskCompletion', {'task__counts_as_activation': True}, 'completed_at',
+    ),
+}
+
+HIT_COLUMNS = ['human_hits', 'bot_hits']
+# Columns recomputed from source rows, never incremented.
+STATE_COLUMNS = [
+    'wallet_connects',
+    'signups',
+    *(f'{role}_activations' for role in ACTIVATION_SOURCES),
+]
+
+
+def _utc_day(value):
+    return value.astimezone(datetime.timezone.utc).date()
+
+
+def _day_start(day):
+    return datetime.datetime.combine(day, datetime.time.min, tzinfo=datetime.timezone.utc)
+
+
+def _state_counts(tracking_ids=None, start=None, end=None):
+    """{(link_tracking_id, day): {column: count}} for the recomputed columns,
+    optionally limited to some links and an inclusive day range."""
+    from ethereum_auth.models import PendingWalletSignup
+
+    counts = defaultdict(dict)
+
+    def collect(column, queryset, tracking_id_field, time_field):
+        queryset = queryset.filter(**{f'{time_field}__isnull': False})
+        if tracking_ids is not None:
+            queryset = queryset.filter(**{f'{tracking_id_field}__in': tracking_ids})
+        if start is not None:
+            queryset = queryset.filter(**{f'{time_field}__gte': _day_start(start)})
+        if end is not None:
+            queryset = queryset.filter(**{f'{time_field}__lt': _day_start(end + datetime.timedelta(days=1))})
+        rows = (
+            queryset.order_by()
+            .annotate(day=TruncDate(time_field, tzinfo=datetime.timezone.utc))
+            .values(tracking_id_field, 'day')
+            .annotate(total=Count('pk'))
+            .values_list(tracking_id_field, 'day', 'total')
+        )
+        for tracking_id, day, total in rows:
+            if tracking_id:
+                counts[(tracking_id, day)][column] = total
+
+    collect(
+        'wallet_connects',
+        PendingWalletSignup.objects.all(),
+        'acquisition_campaign_link__tracking_id',
+        'acquisition_captured_at',
+    )
+    collect('signups', UserAcquisitionAttribution.objects.all(), 'link_tracking_id', 'registered_at')
+    for role in ACTIVATION_SOURCES:
+        collect(
+            f'{role}_activations',
+            UserAcquisitionAttribution.objects.all(),
+            'link_tracking_id',
+            f'{role}_activated_at',
+        )
+    return counts
+
+
+def _link_identities(tracking_ids):
+    """{tracking_id: (campaign_link_id, campaign_key)}, falling back to the
+    attribution snapshot for links that no longer exist."""
+    identities = {
+        tracking_id: (link_id, campaign_key)
+        for tracking_id, link_id, campaign_key in CampaignLink.objects.filter(
+            tracking_id__in=tracking_ids,
+        ).values_list('tracking_id', 'pk', 'campaign__tracking_key')
+    }
+    missing = set(tracking_ids) - set(identities)
+    if missing:
+        for tracking_id, campaign_key in UserAcquisitionAttribution.objects.filter(
+            link_tracking_id__in=missing,
+        ).values_list('link_tracking_id', 'campaign_key'):
+            identities.setdefault(tracking_id, (None, campaign_key))
+    return identities
+
+
+def refresh_campaign_daily_stats(keys, create=True):
+    """
+    Recompute the wallet connect, signup and activation columns of the
+    (link_tracking_id, day) cells in ``keys`` from their source rows.
+
+    The cells are created if needed and locked (in key order) before the
+    source rows are counted, so under READ COMMITTED each recount is a fresh
+    statement that sees what an earlier writer of the same cell committed,
+    and two writers cannot overwrite each other's counts. Hit columns are
+    never touched here. With create=False cells are only updated, never
+    added; the delete receivers use that because they also run inside
+    cascades. Writes that skip model signals must call this (or the
+    ``rebuild_campaign_daily_stats`` command) themselves.
+    """
+    keys = sorted({(tracking_id, day) for tracking_id, day in keys if tracking_id and day})
+    if not keys:
+        return
+    tracking_ids = {tracking_id for tracking_id, _ in keys}
+    days = {day for _, day in keys}
+    cells = Q()
+    for tracking_id, day in keys:
+        cells |= Q(link_tracking_id=tracking_id, day=day)
+
+    with transaction.atomic():
+        if create:
+            identities = _link_identities(tracking_ids)
+            rows = []
+            for tracking_id, day in keys:
+                link_id, campaign_key = identities.get(tracking_id, (None, ''))
+                rows.append(CampaignLinkDailyStats(
+                    campaign_link_id=link_id,
+                    link_tracking_id=tracking_id,
+                    campaign_key=campaign_key,
+                    day=day,
+                ))
+            CampaignLinkDailyStats.objects.bulk_create(rows, ignore_conflicts=True)
+        locked = list(
+            CampaignLinkDailyStats.objects.select_for_update()
+            .filter(cells)
+            .order_by('link_tracking_id', 'day')
+            .values_list('link_tracking_id', 'day')
+        )
+        if not locked:
+            return
+        counts = _state_counts(tracking_ids, min(days), max(days))
+        for tracking_id, day in locked:
+            values = counts.get((tracking_id, day), {})
+            CampaignLinkDailyStats.objects.filter(link_tracking_id=tracking_id, day=day).update(
+                **{column: values.get(column, 0) for column in STATE_COLUMNS}
+            )
+
+
+def add_hits_to_daily_stats(hits):
+    """Add newly written redirect hits to their links' daily cells.
+
+    Hits are the one incremented column: they are append-only and purged
+    after the retention window, so their rollup cannot be recomputed later.
+    One UPDATE per (link, day) cell in the batch; a cell's first hit creates
+    it inside a savepoint, and a concurrent creator makes that an update.
+    """
+    cells = {}
+    for hit in hits:
+        link = hit.campaign_link
+        key = (link.tracking_id, _utc_day(hit.occurred_at))
+        _, counts = cells.setdefault(key, (link, Counter()))
+        counts['bot_hits' if hit.is_probable_bot else 'human_hits'] += 1
+
+    for (tracking_id, day), (link, counts) in cells.items():
+        cell = CampaignLinkDailyStats.objects.filter(link_tracking_id=tracking_id, day=day)
+        increments = {column: F(column) + counts[column] for column in HIT_COLUMNS if counts[column]}
+        if cell.update(**increments):
+            continue
+        try:
+            with transaction.atomic():
+                CampaignLinkDailyStats.objects.create(
+                    campaign_link=link,
+                    link_tracking_id=tracking_id,
+                    campaign_key=link.campaign.tracking_key,
+                    day=day,
+                    **counts,
+                )
+        except IntegrityError:
+            cell.update(**increments)
+
+
+def first_activation_at(user_id, role):
+    model_label, filters, time_field = ACTIVATION_SOURCES[role]
+    return (
+        apps.get_model(model_label).objects
+        .filter(user_id=user_id, **filters)
+        .aggregate(first=Min(time_field))['first']
+    )
+
+
+def refresh_user_activations(user_id, roles=tuple(ACTIVATION_SOURCES)):
+    """Recompute an attributed user's activation timestamps for ``roles``
+    and refresh the daily cells the old and new timestamps fall on."""
+    attribution = UserAcquisitionAttribution.objects.filter(user_id=user_id).first()
+    if attribution is None:
+        return
+    changes = {}
+    keys = set()
+    for role in roles:
+        field = f'{role}_activated_at'
+        previous = getattr(attribution, field)
+        current = first_activation_at(user_id, role)
+        if previous == current:
+            continue
+        changes[field] = current
+        keys.update((attribution.link_tracking_id, _utc_day(value)) for value in (previous, current) if value)
+    if changes:
+        UserAcquisitionAttribution.objects.filter(pk=attribution.pk).update(**changes)
+        refresh_campaign_daily_stats(keys)
+
+
+def rebuild_campaign_daily_stats():
+    """
+    Recompute every attribution's activation timestamps and every daily
+    stats cell from source. Returns the number of cells written.
+
+    Hit counts are recomputed only for days after the hit retention cutoff;
+    older days keep their counts because their raw hits are gone.
+    """
+    hits_from = _utc_day(timezone.now() - datetime.timedelta(days=settings.CAMPAIGN_HIT_RETENTION_DAYS))
+    hits_from += datetime.timedelta(days=1)
+    with transaction.atomic():
+        for role, (model_label, filters, time_field) in ACTIVATION_SOURCES.items():
+            UserAcquisitionAttribution.objects.update(**{
+                f'{role}_activated_at': Subquery(
+                    apps.get_model(model_label).objects
+                    .filter(user_id=OuterRef('user_id'), **filters)
+                    .order_by(time_field)
+                    .values(time_field)[:1]
+                ),
+            })
+
+        counts = _state_counts()
+        hit_rows = (
+            CampaignRedirectHit.objects
+            .filter(occurred_at__gte=_day_start(hits_from))
+            .order_by()
+            .annotate(day=TruncDate('occurred_at', tzinfo=datetime.timezone.utc))
+            .values('campaign_link__tracking_id', 'day')
+            .annotate(
+                human_hits=Count('pk', filter=Q(is_probable_bot=False)),
+                bot_hits=Count('pk', filter=Q(is_probable_bot=True)),
+            )
+        )
+        for row in hit_rows:
+            counts[(row['campaign_link__tracking_id'], row['day'])].update(
+                human_hits=row['human_hits'], bot_hits=row['bot_hits'],
+            )
+
+        CampaignLinkDailyStats.objects.update(**{column: 0 for column in STATE_COLUMNS})
+        CampaignLinkDailyStats.objects.filter(day__gte=hits_from).update(
+            **{column: 0 for column in HIT_COLUMNS}
+        )
+        identities = _link_identities({tracking_id for tracking_id, _ in counts})
+        recent, older = [], []
+        for (tracking_id, day), values in counts.items():
+            link_id, campaign_key = identities.get(tracking_id, (None, ''))
+            (recent if day >= hits_from else older).append(CampaignLinkDailyStats(
+                campaign_link_id=link_id,
+                link_tracking_id=tracking_id,
+                campaign_key=campaign_key,
+                day=day,
+                **values,
+            ))
+        for rows, update_fields in ((recent, [*HIT_COLUMNS, *STATE_COLUMNS]), (older, STATE_COLUMNS)):
+            CampaignLinkDailyStats.objects.bulk_create(
+                rows,
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=['link_tracking_id', 'day'],
+                update_fields=update_fields,
+            )
+    return len(counts)
+
+
+# Rollup receivers. Hits written by the buffer skip signals; the buffer calls
+# add_hits_to_daily_stats itself.
+
+@receiver(post_save, sender=CampaignRedirectHit)
+def add_saved_hit_to_daily_stats(sender, instance, created, **kwargs):
+    if created and not kwargs.get('raw', False):
+        add_hits_to_daily_stats([instance])
+
+
+@receiver(post_save, sender=UserAcquisitionAttribution)
+def refresh_daily_stats_on_attribution_save(sender, instance, created, **kwargs):
+    if not created or kwargs.get('raw', False):
+        return
+    refresh_campaign_daily_stats([(instance.link_tracking_id, _utc_day(instance.registered_at))])
+    refresh_user_activations(instance.user_id)
+
+
+@receiver(post_delete, sender=UserAcquisitionAttribution)
+def refresh_daily_stats_on_attribution_delete(sender, instance, **kwargs):
+    timestamps = [instance.registered_at]
+    timestamps += [getattr(instance, f'{role}_activated_at') for role in ACTIVATION_SOURCES]
+    refresh_campaign_daily_stats(
+        [(instance.link_tracking_id, _utc_day(value)) for value in timestamps if value],
+        create=False,
+    )
+
+
+# PendingWalletSignup fields whose change moves a wallet connect.
+WALLET_CONNECT_FIELDS = frozenset({'acquisition_campaign_link', 'acquisition_captured_at'})
+
+
+def _wallet_connect_cells(pairs):
+    pairs = {(link_id, captured_at) for link_id, captured_at in pairs if link_id and captured_at}
+    if not pairs:
+        return []
+    tracking_ids = dict(
+        CampaignLink.objects.filter(pk__in={link_id for link_id, _ in pairs}).values_list('pk', 'tracking_id')
+    )
+    return [(tracking_ids.get(link_id), _utc_day(captured_at)) for link_id, captured_at in pairs]
+
+
+@receiver(pre_save, sender='ethereum_auth.PendingWalletSignup')
+def remember_wallet_connect(sender, instance, **kwargs):
+    """Load the stored attribution so post_save can tell what moved."""
+    instance._wallet_connect_previous = None
+    update_fields = kwargs.get('update_fields')
+    if (
+        kwargs.get('raw', False)
+        or instance._state.adding
+        or (update_fields is not None and not WALLET_CONNECT_FIELDS.intersection(update_fields))
+    ):
+        return
+    instance._wallet_connect_previous = sender.objects.filter(pk=instance.pk).values_list(
+        'acquisition_campaign_link_id', 'acquisition_captured_at',
+    ).first()
+
+
+@receiver(post_save, sender='ethereum_auth.PendingWalletSignup')
+def refresh_daily_stats_on_wallet_connect(sender, instance, created, **kwargs):
+    if kwargs.get('raw', False):
+        return
+    current = (instance.acquisition_campaign_link_id, instance.acquisition_captured_at)
+    previous = getattr(instance, '_wallet_connect_previous', None)
+    if (not created and (previous is None or previous == current)) or (created and not all(current)):
+        return
+    refresh_campaign_daily_stats(_wallet_connect_cells([current] if created else [previous, current]))
+
+
+@receiver(post_delete, sender='ethereum_auth.PendingWalletSignup')
+def refresh_daily_stats_on_wallet_connect_delete(sender, instance, **kwargs):
+    refresh_campaign_daily_stats(
+        _wallet_connect_cells([(instance.acquisition_campaign_link_id, instance.acquisition_captured_at)]),
+        create=False,
+    )
+
+
+def _activation_role(instance):
+    """The role an activation source row counts toward, or None."""
+    if instance._meta.label == 'social_tasks.SocialTaskCompletion':
+        return ROLE_COMMUNITY if instance.task.counts_as_activation else None
+    # Read from the database, not the process-local catalog: a type created
+    # or recategorized on another worker must count here straight away.
+    slugs = (
+        apps.get_model('contributions.ContributionType').objects
+        .filter(pk=instance.contribution_type_id)
+        .values_list('slug', 'category__slug')
+        .first()
+    )
+    if slugs is None:
+        return None
+    type_slug, category_slug = slugs
+    if instance._meta.label == 'contributions.Contribution':
+        return ROLE_VALIDATOR if type_slug == 'validator-waitlist' else None
+    return ROLE_BUILDER if category_slug == 'builder' else None
+
+
+# Fields whose change can move an activation. Retyping a row away from a
+# qualifying type leaves the old activation until the next rebuild.
+ACTIVATION_FIELDS = frozenset({'user', 'contribution_type', 'task'})
+
+
+def refresh_activation_on_save(sender, instance, created, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if kwargs.get('raw', False):
+        return
+    if not created and update_fields is not None and not ACTIVATION_FIELDS.intersection(update_fields):
+        return
+    role = _activation_role(instance)
+    if role is not None:
+        refresh_user_activations(instance.user_id, [role])
+
+
+def refresh_activation_on_delete(sender, instance, **kwargs):
+    role = _activation_role(instance)
+    if role is not None:
+        refresh_user_activations(instance.user_id, [role])
+
+
+for _source_label, _, _ in ACTIVATION_SOURCES.values():
+    post_save.connect(refresh_activation_on_save, sender=_source_label)
+    post_delete.connect(refresh_activation_on_delete, sender=_source_label)
@@ -4,15 +4,20 @@ from urllib.parse import urlencode, urlparse
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Sum
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
+from .hit_buffer import buffer_redirect_hit
 from .models import (
+    ACTIVATION_SOURCES,
     CLICK_ID_FORWARD_PARAMS,
+    HIT_COLUMNS,
     MAX_DESTINATION_LENGTH,
     ROLE_SEGMENT_TO_ROLE,
+    STATE_COLUMNS,
     CampaignLink,
+    CampaignLinkDailyStats,
     CampaignRedirectHit,
     UserAcquisitionAttribution,
 )
@@ -82,20 +87,23 @@ def resolve_campaign_link(role_segment, alias):
 
 
 def record_redirect_hit(link, request):
-    """Best effort: a failed hit insert must never block the redirect."""
+    """Best effort: a failed hit insert must never block the redirect.
+
+    The hit is buffered and bulk-inserted off the request path (hit_buffer).
+    """
     try:
         referrer_host = ''
         referer = request.META.get('HTTP_REFERER', '')
         if referer:
             referrer_host = (urlparse(referer).hostname or '')[:100]
         family, device, is_bot = classify_user_agent(request.META.get('HTTP_USER_AGENT', ''))
-        CampaignRedirectHit.objects.create(
+        buffer_redirect_hit(CampaignRedirectHit(
             campaign_link=link,
             referrer_host=referrer_host,
             user_agent_family=family,
             device_category=device,
             is_probable_bot=is_bot,
-        )
+        ))
     except Exception:
         logger.warning('Campaign redirect hit logging failed for link %s', link.pk, exc_info=True)
 
@@ -219,46 +227,32 @@ def record_user_acquisition(user, pending_signup):
         logger.exception('Failed to record acquisition attribution for user %s', user.pk)
 
 
-def campaign_report(campaign):
+def campaign_report(campaign, start=None, end=None):
     """Campaign funnel numbers from durable portal records, for the admin
     change page (and, later, the internal dashboard staff API).
 
-    All user-level numbers are distinct users reaching their first qualifying
-    outcome, never event counts. Source: Portal DB only; GA remains the
-    session/multi-touch layer.
+    Summed from the CampaignLinkDailyStats rollups, optionally over an
+    inclusive range of UTC days. All user-level numbers are distinct users
+    reaching their first qualifying outcome within the range, never event
+    counts. Source: Portal DB only; GA remains the session/multi-touch layer.
     """
-    from contributions.models import Contribution, SubmittedContribution
-    from ethereum_auth.models import PendingWalletSignup
-    from social_tasks.models import SocialTaskCompletion
-
-    hit_counts = CampaignRedirectHit.objects.filter(campaign_link__campaign=campaign).aggregate(
-        human=Count('id', filter=Q(is_probable_bot=False)),
-        bot=Count('id', filter=Q(is_probable_bot=True)),
-    )
-    wallet_connects = PendingWalletSignup.objects.filter(
-        acquisition_campaign_link__campaign=campaign,
-    ).count()
     # Filter on the snapshot key so acquisitions survive link deletion.
-    user_ids = list(
-        UserAcquisitionAttribution.objects.filter(
-            Q(campaign_link__campaign=campaign) | Q(campaign_key=campaign.tracking_key)
-        ).values_list('user_id', flat=True).distinct()
-    )
+    cells = CampaignLinkDailyStats.objects.filter(campaign_key=campaign.tracking_key)
+    if start is not None:
+        cells = cells.filter(day__gte=start)
+    if end is not None:
+        cells = cells.filter(day__lte=end)
+    totals = cells.aggregate(**{
+        column: Sum(column) for column in (*HIT_COLUMNS, *STATE_COLUMNS)
+    })
+    totals = {column: value or 0 for column, value in totals.items()}
     return {
         'source': 'portal_db',
-        'redirect_hits_human': hit_counts['human'] or 0,
-        'redirect_hits_bot': hit_counts['bot'] or 0,
-        'wallet_connects': wallet_connects,
-        'signups': len(user_ids),
+        'redirect_hits_human': totals['human_hits'],
+        'redirect_hits_bot': totals['bot_hits'],
+        'wallet_connects': totals['wallet_connects'],
+        'signups': totals['signups'],
         'activations': {
-            'builder': SubmittedContribution.objects.filter(
-                user_id__in=user_ids, contribution_type__category__slug='builder',
-            ).values('user_id').distinct().count(),
-            'validator': Contribution.objects.filter(
-                user_id__in=user_ids, contribution_type__slug='validator-waitlist',
-            ).values('user_id').distinct().count(),
-            'community': SocialTaskCompletion.objects.filter(
-                user_id__in=user_ids, task__counts_as_activation=True,
-            ).values('user_id').distinct().count(),
+            role: totals[f'{role}_activations'] for role in ACTIVATION_SOURCES
         },
     }
@@ -1,10 +1,15 @@
+from datetime import timedelta
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
 from django.utils import timezone
 
-from campaigns.models import CampaignRedirectHit, UserAcquisitionAttribution
+from campaigns.models import CampaignLinkDailyStats, CampaignRedirectHit, UserAcquisitionAttribution
 from campaigns.services import campaign_report
 from campaigns.tests.test_models import make_campaign, make_link
+from contributions.catalog import get_catalog
 from contributions.models import Category, Contribution, ContributionType, SubmittedContribution
 from ethereum_auth.models import PendingWalletSignup
 from leaderboard.models import GlobalLeaderboardMultiplier
@@ -47,14 +52,14 @@ class CampaignReportTests(TestCase):
             action_url='https://x.com',
         )
 
-    def _attributed_user(self, email):
+    def _attributed_user(self, email, registered_at=None):
         user = User.objects.create_user(email=email, password='x', visible=True)
         UserAcquisitionAttribution.objects.create(
             user=user,
             campaign_link=self.link,
             link_tracking_id=self.link.tracking_id,
             campaign_key=self.campaign.tracking_key,
-            registered_at=timezone.now(),
+            registered_at=registered_at or timezone.now(),
         )
         return user
 
@@ -71,6 +76,22 @@ class CampaignReportTests(TestCase):
         self.assertEqual(report['activations']['builder'], 1)
         self.assertEqual(report['source'], 'portal_db')
 
+    def test_builder_activation_for_type_the_local_catalog_has_not_seen(self):
+        get_catalog()
+        # bulk_create skips the signals that would retire this process's catalog,
+        # like a type created on another worker.
+        [unseen_type] = ContributionType.objects.bulk_create([ContributionType(
+            name='Unseen Project', slug='unseen-project', category=self.builder_category,
+            min_points=0, max_points=100,
+        )])
+        user = self._attributed_user('unseen@example.com')
+        SubmittedContribution.objects.create(
+            user=user,
+            contribution_type=unseen_type,
+            contribution_date=timezone.now(),
+        )
+        self.assertEqual(campaign_report(self.campaign)['activations']['builder'], 1)
+
     def test_validator_activation_from_waitlist_contribution(self):
         user = self._attributed_user('validator@example.com')
         Contribution.objects.create(
@@ -124,3 +145,48 @@ class CampaignReportTests(TestCase):
         self.assertEqual(report['redirect_hits_human'], 1)
         self.assertEqual(report['redirect_hits_bot'], 1)
         self.assertEqual(report['wallet_connects'], 1)
+
+    def test_date_range_counts_each_stage_on_its_own_day(self):
+        today = timezone.now().date()
+        user = self._attributed_user('ranged@example.com', registered_at=timezone.now() - timedelta(days=3))
+        SubmittedContribution.objects.create(
+            user=user, contribution_type=self.builder_type, contribution_date=timezone.now(),
+        )
+
+        signup_day = campaign_report(self.campaign, start=today - timedelta(days=3), end=today - timedelta(days=3))
+        self.assertEqual(signup_day['signups'], 1)
+        self.assertEqual(signup_day['activations']['builder'], 0)
+        activation_day = campaign_report(self.campaign, start=today)
+        self.assertEqual(activation_day['signups'], 0)
+        self.assertEqual(activation_day['activations']['builder'], 1)
+        self.assertEqual(campaign_report(self.campaign)['activations']['builder'], 1)
+
+    def test_hit_counts_outlive_purged_hits(self):
+        CampaignRedirectHit.objects.create(campaign_link=self.link)
+        CampaignRedirectHit.objects.create(campaign_link=self.link)
+        CampaignRedirectHit.objects.all().delete()
+        self.assertEqual(campaign_report(self.campaign)['redirect_hits_human'], 2)
+
+    def test_deleted_attribution_leaves_the_funnel(self):
+        user = self._attributed_user('removed@example.com')
+        SocialTaskCompletion.objects.create(user=user, task=self.flagged_task, points_awarded=10)
+        user.delete()
+        report = campaign_report(self.campaign)
+        self.assertEqual(report['signups'], 0)
+        self.assertEqual(report['activations']['community'], 0)
+
+    def test_rebuild_command_matches_incremental_rollups(self):
+        user = self._attributed_user('rebuild@example.com')
+        SubmittedContribution.objects.create(
+            user=user, contribution_type=self.builder_type, contribution_date=timezone.now(),
+        )
+        CampaignRedirectHit.objects.create(campaign_link=self.link, is_probable_bot=True)
+        before = campaign_report(self.campaign)
+
+        CampaignLinkDailyStats.objects.all().delete()
+        UserAcquisitionAttribution.objects.update(builder_activated_at=None)
+        out = StringIO()
+        call_command('rebuild_campaign_daily_stats', stdout=out)
+
+        self.assertIn('1 cell(s)', out.getvalue())
+        self.assertEqual(campaign_report(self.campaign), before)
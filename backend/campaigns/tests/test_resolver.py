@@ -7,6 +7,7 @@ from django.test import TestCase, override_settings
 from django.utils import timezone
 from rest_framework.test import APIClient
 
+from campaigns.hit_buffer import flush_redirect_hits, get_buffer
 from campaigns.models import CampaignLink, CampaignRedirectHit
 from campaigns.tests.test_models import make_campaign, make_link
 
@@ -112,7 +113,7 @@ class CampaignRedirectResolverTests(TestCase):
 
     def test_hit_logging_failure_does_not_block_redirect(self):
         with mock.patch(
-            'campaigns.services.CampaignRedirectHit.objects.create',
+            'campaigns.models.CampaignRedirectHit.objects.bulk_create',
             side_effect=RuntimeError('db down'),
         ):
             response = self._get()
@@ -133,10 +134,55 @@ class CampaignRedirectResolverTests(TestCase):
         self.assertNotIn('x' * 101, response['Location'])
 
     def test_resolver_query_count_is_bounded(self):
-        with self.assertNumQueries(2):  # link lookup + hit insert
+        self._get()  # the day's first hit also creates its rollup row
+        # link lookup, then savepoint + hit insert + daily rollup update + release
+        with self.assertNumQueries(5):
             self._get()
 
 
+@override_settings(CAMPAIGN_HIT_FLUSH_BATCH_SIZE=3)
+class BufferedRedirectHitTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.link = make_link()
+        self.addCleanup(flush_redirect_hits)
+
+    def _get(self):
+        return self.client.get('/join/builders/ethcc', HTTP_USER_AGENT=BROWSER_UA)
+
+    def test_redirect_does_not_wait_for_the_hit_insert(self):
+        with self.assertNumQueries(1):  # link lookup only
+            self.assertEqual(self._get().status_code, 302)
+        self.assertEqual(CampaignRedirectHit.objects.count(), 0)
+
+        self.assertEqual(flush_redirect_hits(), 1)
+        hit = CampaignRedirectHit.objects.get()
+        self.assertEqual(hit.campaign_link, self.link)
+        self.assertEqual(hit.user_agent_family, 'chrome')
+
+    def test_full_batch_is_written_in_one_insert(self):
+        flush_redirect_hits()
+        CampaignRedirectHit.objects.create(campaign_link=self.link)  # creates the day's rollup row
+        self._get()
+        self._get()
+        # link lookup, then savepoint + one bulk insert + one rollup update + release
+        with self.assertNumQueries(5):
+            self._get()
+        self.assertEqual(CampaignRedirectHit.objects.count(), 4)
+        self.assertEqual(get_buffer().pending_count(), 0)
+        self.assertEqual(self.link.daily_stats.get().human_hits, 4)
+
+    def test_failed_flush_drops_the_batch(self):
+        self._get()
+        with mock.patch(
+            'campaigns.models.CampaignRedirectHit.objects.bulk_create',
+            side_effect=RuntimeError('db down'),
+        ):
+            self.assertEqual(flush_redirect_hits(), 0)
+        self.assertEqual(get_buffer().pending_count(), 0)
+        self.assertEqual(CampaignRedirectHit.objects.count(), 0)
+
+
 class PurgeCampaignHitsCommandTests(TestCase):
     def setUp(self):
         self.link = make_link(make_campaign(tracking_key='purge_test'))
@@ -161,3 +207,22 @@ class PurgeCampaignHitsCommandTests(TestCase):
     def test_days_override(self):
         call_command('purge_campaign_hits', '--days', '365', stdout=StringIO())
         self.assertEqual(CampaignRedirectHit.objects.count(), 2)
+
+    def test_purges_in_chunks(self):
+        CampaignRedirectHit.objects.bulk_create([
+            CampaignRedirectHit(campaign_link=self.link, occurred_at=timezone.now() - timedelta(days=100))
+            for _ in range(4)
+        ])
+        out = StringIO()
+        with self.assertNumQueries(7):  # 3 chunks of select + delete, then an empty select
+            call_command('purge_campaign_hits', '--chunk-size', '2', stdout=out)
+        self.assertEqual(CampaignRedirectHit.objects.count(), 1)
+        self.assertIn('Deleted 5', out.getvalue())
+
+    def test_time_budget_stops_between_chunks(self):
+        out = StringIO()
+        with mock.patch('campaigns.management.commands.purge_campaign_hits.time.monotonic', side_effect=[0, 0, 10]):
+            call_command('purge_campaign_hits', '--chunk-size', '1', '--max-seconds', '5', stdout=out)
+        self.assertEqual(CampaignRedirectHit.objects.count(), 1)
+        self.assertIn('Stopped after 5s', out.getvalue())
+        self.assertIn('Deleted 1', out.getvalue())
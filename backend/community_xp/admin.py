@@ -5,6 +5,7 @@ from django.shortcuts import redirect
 from django.urls import path
 
 from .models import (
+    CommunityMembership,
     Mee6CurrentXP,
     Mee6PlayerSnapshot,
     Mee6SyncLock,
@@ -39,6 +40,7 @@ class Mee6SyncRunAdmin(admin.ModelAdmin):
         'completed_at',
         'applied_at',
         'applied_by',
+        'compacted_at',
     )
 
     def get_urls(self):
@@ -137,7 +139,9 @@ class Mee6SyncRunAdmin(admin.ModelAdmin):
                 f"Applied MEE6 sync #{run.id}: "
                 f"{result['players_applied']} players, "
                 f"{result['matched_players']} matched, "
-                f"{result['unmatched_players']} unmatched."
+                f"{result['unmatched_players']} unmatched "
+                f"({result['players_created']} new, {result['players_changed']} changed, "
+                f"{result['players_unchanged']} unchanged, {result['players_removed']} removed)."
             ),
             level=messages.SUCCESS,
         )
@@ -152,8 +156,9 @@ class Mee6PlayerSnapshotAdmin(admin.ModelAdmin):
         'discord_id',
         'xp',
         'level',
+        'departed',
     )
-    list_filter = ('guild_id', 'run__status')
+    list_filter = ('guild_id', 'run__status', 'departed')
     search_fields = (
         'discord_id',
         'username',
@@ -186,3 +191,12 @@ class Mee6CurrentXPAdmin(admin.ModelAdmin):
 class Mee6SyncLockAdmin(admin.ModelAdmin):
     list_display = ('name', 'owner_token', 'acquired_at', 'heartbeat_at', 'released_at')
     readonly_fields = ('name', 'owner_token', 'acquired_at', 'heartbeat_at', 'released_at')
+
+
+@admin.register(CommunityMembership)
+class CommunityMembershipAdmin(admin.ModelAdmin):
+    list_display = ('user', 'first_seen_at', 'sources', 'updated_at')
+    list_select_related = ('user',)
+    search_fields = ('user__email', 'user__name', 'user__address')
+    date_hierarchy = 'first_seen_at'
+    readonly_fields = ('user', 'first_seen_at', 'sources', 'updated_at')
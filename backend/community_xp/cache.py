@@ -10,11 +10,11 @@ a set of member ids plus a points total. Everything personalized (search,
 user_rank, profile_context, hydration) is still computed per request from the
 cached snapshot.
 
-The project configures no CACHES backend, so this is Django's per-process
-LocMemCache: each Gunicorn worker on each container keeps its own copy. That
-caps ranking scans at roughly (workers x containers) per TTL rather than one per
-request, which helps most at steady state and least at maximum fan-out. Making
-the relief independent of container count would need a shared cache tier.
+This uses the default cache, Django's per-process LocMemCache: each Gunicorn
+worker on each container keeps its own copy. That caps ranking scans at
+roughly (workers x containers) per TTL rather than one per request, which
+helps most at steady state and least at maximum fan-out. Making the relief
+independent of container count would need a shared cache tier.
 
 Staleness is bounded rather than invalidated: MEE6 XP already lags by hours, so
 a 60 second lag on ranks sits well inside the existing freshness envelope.
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from community_xp.membership import refresh_community_memberships
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the persisted community member set (CommunityMembership) from contributions, '
+        'social tasks, MEE6 XP, creators and POAP claims'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='Only refresh this user (repeatable). Default: every user.',
+        )
+
+    def handle(self, *args, **options):
+        members, removed = refresh_community_memberships(options.get('user_ids'))
+        self.stdout.write(self.style.SUCCESS(
+            f'Community membership refreshed: {members} member(s) stored, {removed} removed.'
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from community_xp.services import compact_snapshots, get_snapshot_full_retention_runs
+
+
+class Command(BaseCommand):
+    help = (
+        'Reduce MEE6 snapshot runs older than the retention window to per-player XP/rank changes '
+        'without raw JSON'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--guild-id', default=None, help='Discord guild ID to compact')
+        parser.add_argument(
+            '--keep-runs',
+            type=int,
+            default=None,
+            help='Newest successful runs to keep in full (default: MEE6_SNAPSHOT_FULL_RETENTION_RUNS)',
+        )
+
+    def handle(self, *args, **options):
+        keep_runs = options.get('keep_runs')
+        if keep_runs is None:
+            keep_runs = get_snapshot_full_retention_runs()
+        if keep_runs < 1:
+            raise CommandError('--keep-runs must be at least 1')
+
+        compacted = compact_snapshots(guild_id=options.get('guild_id'), keep_runs=keep_runs)
+        self.stdout.write(self.style.SUCCESS(
+            f'Compacted {compacted} MEE6 sync run(s); the newest {keep_runs} keep full snapshots.'
+        ))
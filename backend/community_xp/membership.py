@@ -0,0 +1,172 @@
+"""
+Persisted community member set (CommunityMembership).
+
+A user is a community member while any of these holds in the default guild:
+an accepted community contribution (link-only types excluded), a community
+social task completion whose points are not yet in the MEE6 baseline,
+positive current MEE6 XP, or a POAP claim. That is the rule
+``get_community_member_user_ids`` evaluates live; this module stores its
+result together with the first-seen date the participants-growth chart uses:
+the earliest of the member contribution date, any community social task
+completion, the MEE6 match, the creator profile (for MEE6 members) and the
+POAP claim.
+
+Rows are refreshed per user from the sources' write paths (the receivers in
+community_xp.signals) and after each applied MEE6 run, which moves both XP
+and the social-task baseline, for the users whose XP row changed or whose
+social-task points the new baseline absorbed. Bulk writes that skip model
+signals (``bulk_create``, ``update``) must call
+``refresh_community_memberships`` for the users they touch; the
+``backfill_community_memberships`` command rebuilds the whole table.
+"""
+
+from django.db import transaction
+from django.db.models import Min
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import CommunityMembership, Mee6CurrentXP
+from .services import get_default_guild_id
+from .utils import (
+    _community_member_contributions,
+    _community_social_task_completions,
+    get_community_member_user_ids,
+)
+
+REFRESH_BATCH_SIZE = 1000
+
+
+def compute_community_memberships(user_ids=None):
+    """Return {user_id: (first_seen_at, sources)} for current members."""
+    from creators.models import Creator
+    from poaps.models import PoapClaim
+
+    if user_ids is not None:
+        user_ids = list(user_ids)
+    member_ids = get_community_member_user_ids(user_ids=user_ids, visible_only=False)
+    if not member_ids:
+        return {}
+
+    guild_id = str(get_default_guild_id())
+    first_seen = {user_id: {} for user_id in member_ids}
+
+    def add(source, rows):
+        for user_id, seen_at in rows:
+            if seen_at is not None and user_id in first_seen:
+                first_seen[user_id][source] = seen_at
+
+    add(
+        CommunityMembership.SOURCE_CONTRIBUTION,
+        _community_member_contributions(user_ids=user_ids)
+        .values('user_id')
+        .annotate(first_seen=Min(Coalesce('contribution_date', 'created_at')))
+        .values_list('user_id', 'first_seen'),
+    )
+    add(
+        CommunityMembership.SOURCE_SOCIAL_TASK,
+        _community_social_task_completions(user_ids=user_ids)
+        .values('user_id')
+        .annotate(first_seen=Min('completed_at'))
+        .values_list('user_id', 'first_seen'),
+    )
+    # Source queries are scoped like the member query (everyone on a full
+    # refresh); rows of non-members are dropped by add().
+    positive_xp = Mee6CurrentXP.objects.filter(
+        guild_id=guild_id,
+        matched_user__isnull=False,
+        xp__gt=0,
+    )
+    creators = Creator.objects.all()
+    poap_claims = PoapClaim.objects.filter(user__isnull=False)
+    if user_ids is not None:
+        positive_xp = positive_xp.filter(matched_user_id__in=user_ids)
+        creators = creators.filter(user_id__in=user_ids)
+        poap_claims = poap_claims.filter(user_id__in=user_ids)
+
+    add(
+        CommunityMembership.SOURCE_MEE6,
+        positive_xp
+        .values('matched_user_id')
+        .annotate(first_seen=Min(Coalesce('matched_at', 'synced_at', 'created_at')))
+        .values_list('matched_user_id', 'first_seen'),
+    )
+    add(
+        CommunityMembership.SOURCE_CREATOR,
+        (
+            (user_id, created_at)
+            for user_id, created_at in creators.values_list('user_id', 'created_at')
+            if CommunityMembership.SOURCE_MEE6 in first_seen.get(user_id, ())
+        ),
+    )
+    add(
+        CommunityMembership.SOURCE_POAP,
+        poap_claims
+        .values('user_id')
+        .annotate(first_seen=Min('claimed_at'))
+        .values_list('user_id', 'first_seen'),
+    )
+
+    now = timezone.now()
+    return {
+        user_id: (min(sources.values(), default=now), sorted(sources))
+        for user_id, sources in first_seen.items()
+    }
+
+
+def refresh_community_memberships(user_ids=None, create=True):
+    """Recompute membership rows for `user_ids` (everyone when None).
+
+    With create=False existing rows are only updated or removed, never
+    added; delete receivers use that because they also run while a user
+    row itself is being deleted. Returns (members, removed).
+    """
+    if user_ids is not None:
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if not user_ids:
+            return 0, 0
+
+    memberships = compute_community_memberships(user_ids)
+    existing = CommunityMembership.objects.all()
+    if user_ids is not None:
+        existing = existing.filter(user_id__in=user_ids)
+    existing_ids = set(existing.values_list('user_id', flat=True))
+    removed_ids = existing_ids - memberships.keys()
+    if not create:
+        memberships = {
+            user_id: membership
+            for user_id, membership in memberships.items()
+            if user_id in existing_ids
+        }
+
+    rows = [
+        CommunityMembership(user_id=user_id, first_seen_at=first_seen_at, sources=sources)
+        for user_id, (first_seen_at, sources) in memberships.items()
+    ]
+    with transaction.atomic():
+        if rows:
+            CommunityMembership.objects.bulk_create(
+                rows,
+                batch_size=REFRESH_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=['user'],
+                update_fields=['first_seen_at', 'sources', 'updated_at'],
+            )
+        removed_ids = sorted(removed_ids)
+        for start in range(0, len(removed_ids), REFRESH_BATCH_SIZE):
+            CommunityMembership.objects.filter(
+                user_id__in=removed_ids[start:start + REFRESH_BATCH_SIZE],
+            ).delete()
+
+    return len(rows), len(removed_ids)
+
+
+def community_membership_queryset(visible_only=True):
+    queryset = CommunityMembership.objects.all()
+    if visible_only:
+        queryset = queryset.filter(user__visible=True)
+    return queryset
+
+
+def community_member_user_ids(visible_only=True):
+    """Member ids from the persisted table (see get_community_member_user_ids)."""
+    return set(community_membership_queryset(visible_only).values_list('user_id', flat=True))
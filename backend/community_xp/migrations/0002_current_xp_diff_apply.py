@@ -0,0 +1,24 @@
+# Generated by Django 6.0.6 on 2026-10-19 10:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_xp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mee6currentxp',
+            name='sync_run',
+            field=models.ForeignKey(help_text='Applied run that last changed this row.', on_delete=django.db.models.deletion.PROTECT, related_name='current_xp_rows', to='community_xp.mee6syncrun'),
+        ),
+        migrations.AlterField(
+            model_name='mee6currentxp',
+            name='synced_at',
+            field=models.DateTimeField(help_text='Completion time of the run that last changed this row.'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.6 on 2026-10-19 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_xp', '0002_current_xp_diff_apply'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mee6syncrun',
+            name='compacted_at',
+            field=models.DateTimeField(blank=True, help_text='Set once the run was reduced to players whose XP or rank changed since the previous run, without raw JSON. Compacted runs cannot be applied.', null=True),
+        ),
+    ]
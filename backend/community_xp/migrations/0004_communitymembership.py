@@ -0,0 +1,28 @@
+# Generated by Django 6.0.6 on 2026-10-19 10:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_xp', '0003_mee6syncrun_compacted_at'),
+        ('users', '0022_user_address_upper_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommunityMembership',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='community_membership', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('first_seen_at', models.DateTimeField(db_index=True)),
+                ('sources', models.JSONField(blank=True, default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'community_xp_community_membership',
+            },
+        ),
+    ]
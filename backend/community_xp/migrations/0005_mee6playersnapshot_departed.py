@@ -0,0 +1,23 @@
+# Generated by Django 6.0.6 on 2026-10-19 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community_xp', '0004_communitymembership'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mee6playersnapshot',
+            name='departed',
+            field=models.BooleanField(default=False, help_text='Compacted runs only: marks a player who left the leaderboard in this run.'),
+        ),
+        migrations.AlterField(
+            model_name='mee6syncrun',
+            name='compacted_at',
+            field=models.DateTimeField(blank=True, help_text='Set once the run was reduced to players whose XP or rank changed since the previous run, plus departure markers, without raw JSON. Compacted runs cannot be applied.', null=True),
+        ),
+    ]
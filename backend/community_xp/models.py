@@ -35,6 +35,15 @@ class Mee6SyncRun(BaseModel):
         blank=True,
         related_name='applied_mee6_sync_runs',
     )
+    compacted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=(
+            'Set once the run was reduced to players whose XP or rank changed since the '
+            'previous run, plus departure markers, without raw JSON. Compacted runs '
+            'cannot be applied.'
+        ),
+    )
     error_message = models.TextField(blank=True)
 
     class Meta:
@@ -65,6 +74,10 @@ class Mee6PlayerSnapshot(BaseModel):
     message_count = models.PositiveIntegerField(default=0)
     detailed_xp = models.JSONField(default=list, blank=True)
     raw_player = models.JSONField(default=dict, blank=True)
+    departed = models.BooleanField(
+        default=False,
+        help_text='Compacted runs only: marks a player who left the leaderboard in this run.',
+    )
 
     class Meta:
         ordering = ['run', 'rank']
@@ -93,6 +106,7 @@ class Mee6CurrentXP(BaseModel):
         Mee6SyncRun,
         on_delete=models.PROTECT,
         related_name='current_xp_rows',
+        help_text='Applied run that last changed this row.',
     )
     source_snapshot = models.ForeignKey(
         Mee6PlayerSnapshot,
@@ -109,7 +123,7 @@ class Mee6CurrentXP(BaseModel):
         related_name='mee6_current_xp_rows',
     )
     matched_at = models.DateTimeField(null=True, blank=True)
-    synced_at = models.DateTimeField()
+    synced_at = models.DateTimeField(help_text='Completion time of the run that last changed this row.')
 
     class Meta:
         ordering = ['rank']
@@ -137,3 +151,34 @@ class Mee6SyncLock(models.Model):
 
     def __str__(self):
         return f"Mee6SyncLock({self.name}, acquired={self.acquired_at})"
+
+
+class CommunityMembership(models.Model):
+    """Persisted community member set, one row per member.
+
+    Maintained from the write paths of the membership sources (see
+    community_xp.membership) so counts and growth series are indexed reads.
+    Visibility is applied when reading, not stored.
+    """
+
+    SOURCE_CONTRIBUTION = 'contribution'
+    SOURCE_SOCIAL_TASK = 'social_task'
+    SOURCE_MEE6 = 'mee6'
+    SOURCE_CREATOR = 'creator'
+    SOURCE_POAP = 'poap'
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='community_membership',
+    )
+    first_seen_at = models.DateTimeField(db_index=True)
+    sources = models.JSONField(default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'community_xp_community_membership'
+
+    def __str__(self):
+        return f"CommunityMembership({self.user_id}, since {self.first_seen_at:%Y-%m-%d})"
@@ -1,12 +1,16 @@
 import random
 import secrets
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
 from email.utils import parsedate_to_datetime
 
 import requests
 from django.conf import settings
 from django.db import IntegrityError, transaction
+from django.db.models import Exists, F, OuterRef, Subquery
 from django.utils import timezone
 from requests import RequestException
 
@@ -20,6 +24,7 @@ logger = get_app_logger('community_xp')
 
 DEFAULT_GUILD_ID = '1237055789441487021'
 DEFAULT_PAGE_SIZE = 1000
+DEFAULT_SNAPSHOT_FULL_RETENTION_RUNS = 5
 LOCK_NAME = 'mee6_xp_sync'
 
 
@@ -109,6 +114,7 @@ class Mee6Client:
         base_delay=None,
         max_delay=None,
         inter_page_delay=None,
+        concurrency=None,
         sleep_func=time.sleep,
     ):
         self.session = session or requests.Session()
@@ -121,7 +127,16 @@ class Mee6Client:
             if inter_page_delay is not None
             else float(getattr(settings, 'MEE6_INTER_PAGE_DELAY', 0.25))
         )
+        self.concurrency = max(1, int(
+            concurrency
+            if concurrency is not None
+            else getattr(settings, 'MEE6_FETCH_CONCURRENCY', 1)
+        ))
         self.sleep_func = sleep_func
+        # Shared by all page workers: a Retry-After from any response pauses
+        # every request until it has elapsed, not just the one retrying.
+        self._rate_limit_lock = threading.Lock()
+        self._paused_until = 0.0
 
     def fetch_all_players(self, guild_id, page_size):
         players = []
@@ -130,39 +145,36 @@ class Mee6Client:
         pages_fetched = 0
         guild_name = ''
 
-        page = 0
-        while True:
-            payload = self.fetch_page(guild_id, page, page_size)
-            guild = payload.get('guild') or {}
-            response_guild_id = str(guild.get('id') or guild_id)
-            if response_guild_id != str(guild_id):
-                raise Mee6SyncError(
-                    f'MEE6 response guild mismatch: expected {guild_id}, got {response_guild_id}'
-                )
-
-            if guild.get('name'):
-                guild_name = str(guild['name'])[:255]
-
-            page_players = payload.get('players')
-            if not isinstance(page_players, list):
-                raise Mee6SyncError('Malformed MEE6 response: players must be a list')
-            if page == 0 and not page_players:
-                raise Mee6SyncError('MEE6 returned no players on the first page')
-
-            pages_fetched += 1
-            for index, raw_player in enumerate(page_players):
-                player = self.normalize_player(raw_player, rank=(page * page_size) + index + 1)
-                if player.discord_id in seen_discord_ids:
-                    duplicate_players += 1
-                    continue
-                seen_discord_ids.add(player.discord_id)
-                players.append(player)
-
-            if len(page_players) < page_size:
-                break
-            if self.inter_page_delay > 0:
-                self.sleep_func(self.inter_page_delay)
-            page += 1
+        # closing() stops outstanding page requests as soon as the last page is seen.
+        with closing(self._iter_pages(guild_id, page_size)) as pages:
+            for page, payload in pages:
+                guild = payload.get('guild') or {}
+                response_guild_id = str(guild.get('id') or guild_id)
+                if response_guild_id != str(guild_id):
+                    raise Mee6SyncError(
+                        f'MEE6 response guild mismatch: expected {guild_id}, got {response_guild_id}'
+                    )
+
+                if guild.get('name'):
+                    guild_name = str(guild['name'])[:255]
+
+                page_players = payload.get('players')
+                if not isinstance(page_players, list):
+                    raise Mee6SyncError('Malformed MEE6 response: players must be a list')
+                if page == 0 and not page_players:
+                    raise Mee6SyncError('MEE6 returned no players on the first page')
+
+                pages_fetched += 1
+                for index, raw_player in enumerate(page_players):
+                    player = self.normalize_player(raw_player, rank=(page * page_size) + index + 1)
+                    if player.discord_id in seen_discord_ids:
+                        duplicate_players += 1
+                        continue
+                    seen_discord_ids.add(player.discord_id)
+                    players.append(player)
+
+                if len(page_players) < page_size:
+                    break
 
         return Mee6FetchResult(
             guild_id=str(guild_id),
@@ -173,12 +185,52 @@ class Mee6Client:
             duplicate_players=duplicate_players,
         )
 
+    def _iter_pages(self, guild_id, page_size):
+        """Yield (page, payload) in page order until the caller stops.
+
+        With concurrency 1 pages are fetched one at a time with
+        inter_page_delay between them. Otherwise up to `concurrency` pages
+        are in flight: the page count is unknown up front, so the window
+        runs ahead of the page being consumed and the (at most
+        concurrency - 1) requests past the last page are discarded.
+        """
+        if self.concurrency == 1:
+            page = 0
+            while True:
+                yield page, self.fetch_page(guild_id, page, page_size)
+                if self.inter_page_delay > 0:
+                    self.sleep_func(self.inter_page_delay)
+                page += 1
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='mee6-page')
+        in_flight = {}
+        next_page = 0
+        try:
+            page = 0
+            while True:
+                while next_page < page + self.concurrency:
+                    in_flight[next_page] = executor.submit(self.fetch_page, guild_id, next_page, page_size)
+                    next_page += 1
+                yield page, in_flight.pop(page).result()
+                page += 1
+        finally:
+            for future in in_flight.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _wait_for_rate_limit(self):
+        with self._rate_limit_lock:
+            remaining = self._paused_until - time.monotonic()
+        if remaining > 0:
+            self.sleep_func(remaining)
+
     def fetch_page(self, guild_id, page, page_size):
         url = f'{self.base_url}/{guild_id}'
         params = {'page': page, 'limit': page_size}
         last_error = None
 
         for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit()
             try:
                 response = self.session.get(url, params=params, timeout=self.timeout)
             except RequestException as exc:
@@ -208,6 +260,9 @@ class Mee6Client:
     def _sleep_before_retry(self, attempt, response=None):
         retry_after = _retry_after_seconds(response.headers.get('Retry-After')) if response is not None else None
         delay = retry_after
+        if retry_after is not None:
+            with self._rate_limit_lock:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
         if delay is None:
             delay = min(self.max_delay, self.base_delay * (2 ** attempt))
             delay += random.uniform(0, 0.25)
@@ -295,28 +350,25 @@ def refresh_sync_lock(owner_token):
     ).update(heartbeat_at=timezone.now()))
 
 
-def _connection_map(discord_ids):
+def _matched_user_ids(discord_ids):
+    """Map discord id -> portal user id, oldest connection first."""
     connections = (
         DiscordConnection.objects
         .filter(platform_user_id__in=discord_ids)
-        .select_related('user')
         .order_by('id')
+        .values_list('platform_user_id', 'user_id')
     )
 
     by_discord_id = {}
-    for connection in connections:
-        by_discord_id.setdefault(str(connection.platform_user_id), connection)
+    for platform_user_id, user_id in connections:
+        by_discord_id.setdefault(str(platform_user_id), user_id)
     return by_discord_id
 
 
 def store_fetch_result(run, fetch_result):
     now = timezone.now()
     discord_ids = [player.discord_id for player in fetch_result.players]
-    connections_by_discord_id = _connection_map(discord_ids)
-    matched_user_ids = {
-        connection.user_id
-        for connection in connections_by_discord_id.values()
-    }
+    matched_user_ids = set(_matched_user_ids(discord_ids).values())
     snapshots = []
 
     for player in fetch_result.players:
@@ -402,50 +454,51 @@ def _validate_xp_state_before_applying(run):
         )
 
 
+# Columns copied from the run's snapshot onto Mee6CurrentXP. A current row is
+# only rewritten when one of these (or its matched user) differs.
+CURRENT_XP_SNAPSHOT_FIELDS = (
+    'username',
+    'discriminator',
+    'avatar_hash',
+    'rank',
+    'xp',
+    'level',
+    'message_count',
+    'detailed_xp',
+)
+
+
 def _apply_sync_run_locked(run, applied_by=None):
+    """Make `run` the guild's current XP baseline by diffing, not rewriting.
+
+    Only rows whose XP, rank, profile fields or match changed are upserted,
+    players missing from the run are deleted, and everything else is left
+    untouched, so the write (and lock) window scales with churn rather than
+    guild size. sync_run/source_snapshot/synced_at on a current row record
+    the run that last changed it; every remaining row is confirmed by the
+    applied run.
+    """
     if run.status != Mee6SyncRun.STATUS_SUCCESS:
         raise Mee6SyncError('Only successful MEE6 sync runs can be applied as the baseline')
     if not run.completed_at:
         raise Mee6SyncError('Cannot apply a MEE6 sync run before it has completed')
+    if run.compacted_at:
+        raise Mee6SyncError(
+            f'Cannot apply MEE6 sync #{run.id}; its snapshots were compacted to changes only'
+        )
 
-    now = timezone.now()
+    # raw_player is never copied to current rows, so it is never loaded.
     snapshots = list(
         Mee6PlayerSnapshot.objects
         .filter(run=run)
         .order_by('rank')
+        .values_list('id', 'discord_id', *CURRENT_XP_SNAPSHOT_FIELDS, named=True)
     )
     if not snapshots:
         raise Mee6SyncError('Cannot apply a MEE6 sync run with no player snapshots')
 
-    discord_ids = [snapshot.discord_id for snapshot in snapshots]
-    connections_by_discord_id = _connection_map(discord_ids)
-    matched_user_ids = set()
-    current_rows = []
-
-    for snapshot in snapshots:
-        connection = connections_by_discord_id.get(str(snapshot.discord_id))
-        matched_user = connection.user if connection else None
-        matched_at = now if matched_user else None
-        if matched_user:
-            matched_user_ids.add(matched_user.id)
-
-        current_rows.append(Mee6CurrentXP(
-            guild_id=snapshot.guild_id,
-            discord_id=snapshot.discord_id,
-            username=snapshot.username,
-            discriminator=snapshot.discriminator,
-            avatar_hash=snapshot.avatar_hash,
-            rank=snapshot.rank,
-            xp=snapshot.xp,
-            level=snapshot.level,
-            message_count=snapshot.message_count,
-            detailed_xp=snapshot.detailed_xp,
-            sync_run=run,
-            source_snapshot=snapshot,
-            matched_user=matched_user,
-            matched_at=matched_at,
-            synced_at=run.completed_at,
-        ))
+    user_ids_by_discord_id = _matched_user_ids([snapshot.discord_id for snapshot in snapshots])
+    matched_user_ids = set(user_ids_by_discord_id.values())
 
     with transaction.atomic():
         _ensure_sync_lock_row()
@@ -470,8 +523,75 @@ def _apply_sync_run_locked(run, applied_by=None):
 
         _validate_xp_state_before_applying(run)
 
-        Mee6CurrentXP.objects.filter(guild_id=run.guild_id).delete()
-        Mee6CurrentXP.objects.bulk_create(current_rows, batch_size=1000)
+        now = timezone.now()
+        current_by_discord_id = {
+            row.discord_id: row
+            for row in (
+                Mee6CurrentXP.objects
+                .filter(guild_id=run.guild_id)
+                .values_list(
+                    'id', 'discord_id', *CURRENT_XP_SNAPSHOT_FIELDS, 'matched_user_id', 'matched_at',
+                    named=True,
+                )
+            )
+        }
+
+        upserts = []
+        created = 0
+        # Users whose current XP row is added, changed, re-matched or removed.
+        changed_user_ids = set()
+        for snapshot in snapshots:
+            matched_user_id = user_ids_by_discord_id.get(str(snapshot.discord_id))
+            current = current_by_discord_id.pop(snapshot.discord_id, None)
+            if current is not None:
+                unchanged = (
+                    current.matched_user_id == matched_user_id
+                    and all(
+                        getattr(current, field) == getattr(snapshot, field)
+                        for field in CURRENT_XP_SNAPSHOT_FIELDS
+                    )
+                )
+                if unchanged:
+                    continue
+                matched_at = current.matched_at if current.matched_user_id == matched_user_id else None
+                changed_user_ids.add(current.matched_user_id)
+            else:
+                created += 1
+                matched_at = None
+            changed_user_ids.add(matched_user_id)
+
+            upserts.append(Mee6CurrentXP(
+                guild_id=run.guild_id,
+                discord_id=snapshot.discord_id,
+                **{field: getattr(snapshot, field) for field in CURRENT_XP_SNAPSHOT_FIELDS},
+                sync_run=run,
+                source_snapshot_id=snapshot.id,
+                matched_user_id=matched_user_id,
+                matched_at=(matched_at or now) if matched_user_id else None,
+                synced_at=run.completed_at,
+                created_at=now,
+                updated_at=now,
+            ))
+
+        departed_ids = [row.id for row in current_by_discord_id.values()]
+        changed_user_ids.update(row.matched_user_id for row in current_by_discord_id.values())
+        for start in range(0, len(departed_ids), 1000):
+            Mee6CurrentXP.objects.filter(id__in=departed_ids[start:start + 1000]).delete()
+        Mee6CurrentXP.objects.bulk_create(
+            upserts,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['guild_id', 'discord_id'],
+            update_fields=[
+                *CURRENT_XP_SNAPSHOT_FIELDS,
+                'sync_run',
+                'source_snapshot',
+                'matched_user',
+                'matched_at',
+                'synced_at',
+                'updated_at',
+            ],
+        )
 
         run.matched_players = len(matched_user_ids)
         run.unmatched_players = len(snapshots) - len(matched_user_ids)
@@ -485,15 +605,34 @@ def _apply_sync_run_locked(run, applied_by=None):
             'updated_at',
         ])
 
+        # The new baseline absorbs social-task points distributed since the
+        # previous one, which can end a completion's membership.
+        from contributions.models import ContributionDiscordXPState
+        from social_tasks.models import SocialTaskCompletion
+
+        absorbed = SocialTaskCompletion.objects.filter(
+            task__category__slug='community',
+            discord_xp_state__status=ContributionDiscordXPState.STATUS_DISTRIBUTED,
+            discord_xp_state__distributed_at__lte=run.completed_at,
+        )
+        if latest_applied_run:
+            absorbed = absorbed.filter(discord_xp_state__distributed_at__gt=latest_applied_run.completed_at)
+        changed_user_ids.update(absorbed.values_list('user_id', flat=True).distinct())
+        changed_user_ids.discard(None)
+
     return {
         'run_id': run.id,
         'guild_id': run.guild_id,
         'status': run.status,
         'players_applied': len(snapshots),
+        'players_created': created,
+        'players_changed': len(upserts) - created,
+        'players_unchanged': len(snapshots) - len(upserts),
+        'players_removed': len(departed_ids),
         'matched_players': run.matched_players,
         'unmatched_players': run.unmatched_players,
         'applied_at': run.applied_at,
-    }
+    }, changed_user_ids
 
 
 def apply_sync_run(run, applied_by=None, lock_owner_token=None):
@@ -515,11 +654,128 @@ def apply_sync_run(run, applied_by=None, lock_owner_token=None):
         acquired_here = True
 
     try:
-        return _apply_sync_run_locked(run, applied_by=applied_by)
+        result, changed_user_ids = _apply_sync_run_locked(run, applied_by=applied_by)
     finally:
         if acquired_here:
             release_sync_lock(owner_token)
 
+    if run.guild_id == str(get_default_guild_id()):
+        from .membership import REFRESH_BATCH_SIZE, refresh_community_memberships
+
+        try:
+            # Only users whose XP row changed or whose social-task points the
+            # new baseline absorbed can gain or lose membership.
+            changed_user_ids = sorted(changed_user_ids)
+            with transaction.atomic():
+                for start in range(0, len(changed_user_ids), REFRESH_BATCH_SIZE):
+                    refresh_community_memberships(changed_user_ids[start:start + REFRESH_BATCH_SIZE])
+        except Exception as exc:
+            logger.warning("Community membership refresh failed: %s", exc, exc_info=True)
+    return result
+
+
+def get_snapshot_full_retention_runs():
+    return int(
+        getattr(settings, 'MEE6_SNAPSHOT_FULL_RETENTION_RUNS', DEFAULT_SNAPSHOT_FULL_RETENTION_RUNS)
+        or DEFAULT_SNAPSHOT_FULL_RETENTION_RUNS
+    )
+
+
+def compact_snapshots(guild_id=None, keep_runs=None):
+    """Reduce older successful runs to per-player changes.
+
+    The newest `keep_runs` successful runs of the guild, and the applied
+    baseline, keep full snapshots. Every older run drops the snapshot rows
+    whose (xp, rank) equal the player's nearest earlier stored row, gains a
+    `departed` row for each player whose nearest earlier stored row is live
+    but who is missing from the run, and loses raw_player/detailed_xp on the
+    rows it keeps. A player's value in a compacted run is therefore its row
+    there or, failing that, its nearest earlier stored row, and a `departed`
+    row means the player was not on the leaderboard. Snapshots still
+    referenced by a current XP row are never deleted.
+
+    Returns the number of runs compacted.
+    """
+    guild_id = str(guild_id or get_default_guild_id())
+    keep_runs = get_snapshot_full_retention_runs() if keep_runs is None else keep_runs
+
+    runs = list(
+        Mee6SyncRun.objects
+        .filter(
+            guild_id=guild_id,
+            status=Mee6SyncRun.STATUS_SUCCESS,
+            completed_at__isnull=False,
+        )
+        .order_by('-completed_at', '-id')
+        .values_list('id', 'compacted_at', 'applied_at', named=True)
+    )
+    applied_runs = [run for run in runs if run.applied_at]
+    latest_applied_id = max(applied_runs, key=lambda run: run.applied_at).id if applied_runs else None
+
+    compacted = 0
+    # Oldest first, so a player who left stays marked by a single departed row.
+    for index, run in reversed(list(enumerate(runs))):
+        if index < keep_runs or run.compacted_at or run.id == latest_applied_id:
+            continue
+
+        with transaction.atomic():
+            snapshots = Mee6PlayerSnapshot.objects.filter(run_id=run.id)
+            earlier_rows = Mee6PlayerSnapshot.objects.filter(
+                guild_id=guild_id,
+                run_id__lt=run.id,
+                run__status=Mee6SyncRun.STATUS_SUCCESS,
+            )
+            nearest_earlier_run = Subquery(
+                earlier_rows
+                .filter(discord_id=OuterRef('discord_id'))
+                .order_by('-run_id')
+                .values('run_id')[:1]
+            )
+
+            unchanged_ids = list(
+                snapshots
+                .annotate(previous_run_id=nearest_earlier_run)
+                .filter(Exists(
+                    Mee6PlayerSnapshot.objects.filter(
+                        run_id=OuterRef('previous_run_id'),
+                        discord_id=OuterRef('discord_id'),
+                        xp=OuterRef('xp'),
+                        rank=OuterRef('rank'),
+                        departed=False,
+                    )
+                ))
+                .exclude(current_xp_rows__isnull=False)
+                .values_list('id', flat=True)
+            )
+            departed_ids = list(
+                earlier_rows
+                .annotate(latest_run_id=nearest_earlier_run)
+                .filter(run_id=F('latest_run_id'), departed=False)
+                .exclude(discord_id__in=snapshots.values('discord_id'))
+                .values_list('discord_id', flat=True)
+            )
+
+            for start in range(0, len(unchanged_ids), 1000):
+                Mee6PlayerSnapshot.objects.filter(id__in=unchanged_ids[start:start + 1000]).delete()
+            Mee6PlayerSnapshot.objects.bulk_create(
+                [
+                    Mee6PlayerSnapshot(
+                        run_id=run.id,
+                        guild_id=guild_id,
+                        discord_id=discord_id,
+                        rank=0,
+                        departed=True,
+                    )
+                    for discord_id in departed_ids
+                ],
+                batch_size=1000,
+            )
+            snapshots.update(raw_player={}, detailed_xp=[])
+            Mee6SyncRun.objects.filter(id=run.id).update(compacted_at=timezone.now())
+        compacted += 1
+
+    return compacted
+
 
 def run_mee6_sync(guild_id=None, page_size=None, client=None, use_lock=True):
     guild_id = str(guild_id or get_default_guild_id())
@@ -547,7 +803,7 @@ def run_mee6_sync(guild_id=None, page_size=None, client=None, use_lock=True):
         fetch_result = client.fetch_all_players(guild_id, page_size)
         if not fetch_result.players:
             raise Mee6SyncError('MEE6 returned no players')
-        return store_fetch_result(run, fetch_result)
+        result = store_fetch_result(run, fetch_result)
     except Exception as exc:
         run.status = Mee6SyncRun.STATUS_FAILED
         run.completed_at = timezone.now()
@@ -555,6 +811,13 @@ def run_mee6_sync(guild_id=None, page_size=None, client=None, use_lock=True):
         run.save(update_fields=['status', 'completed_at', 'error_message', 'updated_at'])
         logger.error("MEE6 XP sync failed: %s", exc, exc_info=True)
         raise
+    else:
+        try:
+            compact_snapshots(guild_id)
+        except Exception as exc:
+            # Retention is housekeeping; the fetched run is already stored.
+            logger.warning("MEE6 snapshot compaction failed: %s", exc, exc_info=True)
+        return result
     finally:
         if owner_token:
             release_sync_lock(owner_token)
@@ -1,9 +1,21 @@
-from django.db.models.signals import post_delete, post_save, pre_save
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
 from django.dispatch import receiver
 
+from contributions.catalog import get_catalog
+from contributions.models import Contribution, ContributionType
+from creators.models import Creator
+from poaps.models import PoapClaim
 from social_connections.models import DiscordConnection
+from social_tasks.models import SocialTask, SocialTaskCompletion
 
-from .services import clear_current_xp_match_for_connection, match_current_xp_for_connection
+from .constants import COMMUNITY_MEMBER_EXCLUDED_TYPE_SLUGS
+from .membership import refresh_community_memberships
+from .models import Mee6CurrentXP
+from .services import (
+    clear_current_xp_match_for_connection,
+    get_default_guild_id,
+    match_current_xp_for_connection,
+)
 
 
 @receiver(pre_save, sender=DiscordConnection)
@@ -29,8 +41,102 @@ def match_mee6_xp_after_discord_link(sender, instance, created, **kwargs):
     if not created and not getattr(instance, '_mee6_platform_user_id_changed', False):
         return
     match_current_xp_for_connection(instance)
+    if not created:
+        # A relink cleared the old match with update(), which sends no signal.
+        refresh_community_memberships([instance.user_id])
 
 
 @receiver(post_delete, sender=DiscordConnection)
 def clear_mee6_xp_after_discord_unlink(sender, instance, **kwargs):
-    clear_current_xp_match_for_connection(instance)
+    if clear_current_xp_match_for_connection(instance):
+        refresh_community_memberships([instance.user_id], create=False)
+
+
+# Community membership follows its sources' write paths. Each receiver only
+# recomputes the affected users.
+
+def _refresh_membership(signal, user_id):
+    refresh_community_memberships([user_id], create=signal is post_save)
+
+
+def _is_member_type(contribution_type_id):
+    contribution_type = get_catalog().types_by_id.get(contribution_type_id)
+    if contribution_type is None:
+        # Created since this worker loaded its catalog.
+        contribution_type = (
+            ContributionType.objects.select_related('category')
+            .filter(pk=contribution_type_id)
+            .first()
+        )
+    return (
+        contribution_type is not None
+        and contribution_type.category is not None
+        and contribution_type.category.slug == 'community'
+        and contribution_type.slug not in COMMUNITY_MEMBER_EXCLUDED_TYPE_SLUGS
+    )
+
+
+@receiver(post_init, sender=Contribution)
+def remember_contribution_membership_owner(sender, instance, **kwargs):
+    """Note the loaded type and user, so a move away from them is refreshed too.
+
+    Read from __dict__ so deferred fields are not fetched; this runs for
+    every Contribution instantiated.
+    """
+    instance._membership_loaded = (
+        instance.__dict__.get('contribution_type_id'),
+        instance.__dict__.get('user_id'),
+    )
+
+
+@receiver(post_save, sender=Contribution)
+@receiver(post_delete, sender=Contribution)
+def refresh_membership_for_contribution(sender, instance, signal, raw=False, created=False, **kwargs):
+    if raw:
+        return
+    current = (instance.contribution_type_id, instance.user_id)
+    owners = {current}
+    loaded = getattr(instance, '_membership_loaded', None)
+    if signal is post_save:
+        if not created and loaded and None not in loaded:
+            owners.add(loaded)
+        instance._membership_loaded = current
+
+    # {user_id: create}. The user a contribution moved away from can only
+    # lose membership by it, so it is never created on their behalf.
+    # Contributions of types that cannot make anyone a member stop here,
+    # before any query.
+    user_ids = {}
+    for owner in owners:
+        contribution_type_id, user_id = owner
+        if _is_member_type(contribution_type_id):
+            user_ids[user_id] = user_ids.get(user_id, False) or (signal is post_save and owner == current)
+    for user_id, create in user_ids.items():
+        refresh_community_memberships([user_id], create=create)
+
+
+@receiver(post_save, sender=SocialTaskCompletion)
+@receiver(post_delete, sender=SocialTaskCompletion)
+def refresh_membership_for_social_task(sender, instance, signal, raw=False, **kwargs):
+    if raw:
+        return
+    if SocialTask.objects.filter(pk=instance.task_id, category__slug='community').exists():
+        _refresh_membership(signal, instance.user_id)
+
+
+@receiver(post_save, sender=PoapClaim)
+@receiver(post_delete, sender=PoapClaim)
+@receiver(post_save, sender=Creator)
+@receiver(post_delete, sender=Creator)
+def refresh_membership_for_user_record(sender, instance, signal, raw=False, **kwargs):
+    if raw:
+        return
+    _refresh_membership(signal, instance.user_id)
+
+
+@receiver(post_save, sender=Mee6CurrentXP)
+@receiver(post_delete, sender=Mee6CurrentXP)
+def refresh_membership_for_current_xp(sender, instance, signal, raw=False, **kwargs):
+    if raw or instance.guild_id != str(get_default_guild_id()):
+        return
+    _refresh_membership(signal, instance.matched_user_id)
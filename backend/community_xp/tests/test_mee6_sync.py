@@ -1,3 +1,4 @@
+import threading
 from datetime import timedelta
 from unittest.mock import Mock, patch
 
@@ -13,12 +14,14 @@ from community_xp.models import (
     Mee6SyncRun,
 )
 from community_xp.services import (
+    Mee6Client,
     Mee6SyncAlreadyRunning,
     Mee6FetchResult,
     Mee6SyncError,
     NormalizedMee6Player,
     acquire_sync_lock,
     apply_sync_run,
+    compact_snapshots,
     refresh_sync_lock,
     release_sync_lock,
     run_mee6_sync,
@@ -76,6 +79,43 @@ def mee6_player(discord_id, xp, rank=1, username='discord-user'):
     )
 
 
+class FakeMee6Response:
+    def __init__(self, payload=None, status_code=200, headers=None):
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self.payload
+
+
+class FakeMee6Session:
+    """Serves `players` in pages; `throttled_pages` answer 429 once first."""
+
+    def __init__(self, players, throttled_pages=(), retry_after='7'):
+        self.players = players
+        self.throttled_pages = set(throttled_pages)
+        self.retry_after = retry_after
+        self.requested_pages = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params, timeout):
+        page, limit = params['page'], params['limit']
+        with self.lock:
+            self.requested_pages.append(page)
+            if page in self.throttled_pages:
+                self.throttled_pages.discard(page)
+                return FakeMee6Response(status_code=429, headers={'Retry-After': self.retry_after})
+        return FakeMee6Response({
+            'guild': {'id': 'guild-1', 'name': 'GenLayer'},
+            'players': self.players[page * limit:(page + 1) * limit],
+        })
+
+
+def raw_player(discord_id, xp):
+    return {'id': discord_id, 'username': discord_id, 'xp': xp, 'level': 1, 'message_count': 1}
+
+
 @override_settings(DISCORD_GUILD_ID='guild-1')
 class Mee6SyncTest(TestCase):
     def setUp(self):
@@ -509,6 +549,35 @@ class Mee6SyncTest(TestCase):
         self.assertEqual(data['mee6_rank'], 7)
         self.assertIsNotNone(data['mee6_synced_at'])
 
+    def test_discord_connection_list_looks_up_latest_sync_once(self):
+        from community_xp import utils as community_xp_utils
+
+        other = User.objects.create_user(
+            email='second-discord@example.com',
+            password='pass',
+            address='0x0000000000000000000000000000000000000003',
+            name='Second User',
+        )
+        connections = [
+            self.link_discord(self.user, discord_id='discord-1'),
+            self.link_discord(other, discord_id='discord-2'),
+        ]
+        self.fetch_and_apply_mee6_run([
+            mee6_player('discord-1', 100),
+            mee6_player('discord-2', 50),
+        ])
+
+        with patch.object(
+            community_xp_utils,
+            'get_latest_applied_sync',
+            wraps=community_xp_utils.get_latest_applied_sync,
+        ) as lookup:
+            data = DiscordConnectionSerializer(connections, many=True).data
+
+        self.assertEqual(lookup.call_count, 1)
+        self.assertEqual(data[0]['mee6_synced_at'], data[1]['mee6_synced_at'])
+        self.assertIsNotNone(data[0]['mee6_synced_at'])
+
     def test_failed_run_does_not_apply_current_xp(self):
         self.link_discord(self.user)
         self.fetch_and_apply_mee6_run([mee6_player('discord-1', 100)])
@@ -539,6 +608,61 @@ class Mee6SyncTest(TestCase):
         self.assertEqual(breakdown['discord_xp'], 0)
         self.assertEqual(breakdown['total_points'], 0)
 
+    def test_apply_only_rewrites_changed_rows(self):
+        self.link_discord(self.user, discord_id='discord-1')
+        self.fetch_and_apply_mee6_run([
+            mee6_player('discord-1', 100, rank=1),
+            mee6_player('steady', 50, rank=2),
+            mee6_player('departed', 10, rank=3),
+        ])
+        steady = Mee6CurrentXP.objects.get(discord_id='steady')
+        linked = Mee6CurrentXP.objects.get(discord_id='discord-1')
+
+        second_run = self.fetch_mee6_run([
+            mee6_player('discord-1', 150, rank=1),
+            mee6_player('steady', 50, rank=2),
+            mee6_player('newcomer', 5, rank=3),
+        ])
+        result = apply_sync_run(second_run)
+
+        self.assertEqual(result['players_created'], 1)
+        self.assertEqual(result['players_changed'], 1)
+        self.assertEqual(result['players_unchanged'], 1)
+        self.assertEqual(result['players_removed'], 1)
+        self.assertFalse(Mee6CurrentXP.objects.filter(discord_id='departed').exists())
+
+        unchanged = Mee6CurrentXP.objects.get(discord_id='steady')
+        self.assertEqual(unchanged.updated_at, steady.updated_at)
+        self.assertNotEqual(unchanged.sync_run_id, second_run.id)
+
+        changed = Mee6CurrentXP.objects.get(discord_id='discord-1')
+        self.assertEqual(changed.pk, linked.pk)
+        self.assertEqual(changed.xp, 150)
+        self.assertEqual(changed.sync_run_id, second_run.id)
+        # The match itself did not change, so its timestamp is kept.
+        self.assertEqual(changed.matched_at, linked.matched_at)
+
+        breakdown = get_effective_community_points(self.user)
+        self.assertEqual(breakdown['discord_xp'], 150)
+        self.assertEqual(breakdown['discord_xp_synced_at'], second_run.completed_at)
+
+    def test_apply_picks_up_new_discord_link_for_unchanged_xp(self):
+        self.fetch_and_apply_mee6_run([mee6_player('discord-1', 100)])
+        # Linked behind the signal's back, e.g. by a bulk import.
+        DiscordConnection.objects.bulk_create([DiscordConnection(
+            user=self.user,
+            platform_user_id='discord-1',
+            platform_username='user-discord-1',
+            linked_at=timezone.now(),
+        )])
+
+        result = apply_sync_run(self.fetch_mee6_run([mee6_player('discord-1', 100)]))
+
+        self.assertEqual(result['players_changed'], 1)
+        current = Mee6CurrentXP.objects.get(discord_id='discord-1')
+        self.assertEqual(current.matched_user, self.user)
+        self.assertIsNotNone(current.matched_at)
+
     def test_discord_relink_uses_current_connection_and_clears_old_cached_match(self):
         connection = self.link_discord(self.user, discord_id='old-discord')
         self.fetch_and_apply_mee6_run([
@@ -740,3 +864,107 @@ class Mee6SyncTest(TestCase):
             apply_sync_run_mock.call_args.kwargs,
             {'lock_owner_token': 'lock-token'},
         )
+
+
+class Mee6ClientConcurrencyTest(TestCase):
+    def test_concurrent_fetch_keeps_page_order_and_stops_at_last_page(self):
+        session = FakeMee6Session([raw_player(f'p{index}', 100 - index) for index in range(5)])
+        client = Mee6Client(session=session, concurrency=3, sleep_func=lambda seconds: None)
+
+        result = client.fetch_all_players('guild-1', page_size=2)
+
+        self.assertEqual([player.discord_id for player in result.players], ['p0', 'p1', 'p2', 'p3', 'p4'])
+        self.assertEqual([player.rank for player in result.players], [1, 2, 3, 4, 5])
+        self.assertEqual(result.pages_fetched, 3)
+        # The window never runs more than concurrency - 1 pages past the end.
+        self.assertLessEqual(max(session.requested_pages), 4)
+
+    def test_retry_after_pauses_and_retries_the_throttled_page(self):
+        session = FakeMee6Session(
+            [raw_player(f'p{index}', 10) for index in range(4)],
+            throttled_pages={1},
+        )
+        sleeps = []
+        client = Mee6Client(session=session, concurrency=2, sleep_func=sleeps.append)
+
+        result = client.fetch_all_players('guild-1', page_size=2)
+
+        self.assertEqual(len(result.players), 4)
+        self.assertIn(7.0, sleeps)
+        self.assertEqual(session.requested_pages.count(1), 2)
+
+
+@override_settings(DISCORD_GUILD_ID='guild-1')
+class Mee6SnapshotCompactionTest(TestCase):
+    def fetch_run(self, players):
+        result = run_mee6_sync(client=FakeMee6Client(players=players), use_lock=False)
+        return Mee6SyncRun.objects.get(pk=result['run_id'])
+
+    def rebuilt_board(self, run):
+        board = {}
+        for row in Mee6PlayerSnapshot.objects.filter(run_id__lte=run.id).order_by('run_id'):
+            if row.departed:
+                board.pop(row.discord_id, None)
+            else:
+                board[row.discord_id] = row.xp
+        return board
+
+    @override_settings(MEE6_SNAPSHOT_FULL_RETENTION_RUNS=1)
+    def test_compacting_each_run_as_it_ages_out_keeps_only_changes(self):
+        boards = [
+            {'x': 100, 'y': 50, 'z': 10},
+            {'x': 150, 'y': 50, 'z': 10},
+            {'x': 150, 'y': 50, 'z': 10},
+            {'x': 150, 'y': 60},
+            {'x': 150, 'y': 60},
+            {'x': 150, 'y': 60, 'z': 20},
+        ]
+        runs = [
+            self.fetch_run([
+                mee6_player(discord_id, xp, rank=rank)
+                for rank, (discord_id, xp) in enumerate(board.items(), start=1)
+            ])
+            for board in boards
+        ]
+
+        self.assertEqual(
+            [Mee6PlayerSnapshot.objects.filter(run=run).count() for run in runs],
+            [3, 1, 0, 2, 0, 3],
+        )
+        self.assertEqual(
+            list(Mee6PlayerSnapshot.objects.filter(departed=True).values_list('run_id', 'discord_id')),
+            [(runs[3].id, 'z')],
+        )
+        for run, board in zip(runs[:-1], boards):
+            self.assertEqual(self.rebuilt_board(run), board)
+
+    def test_older_runs_keep_only_changes_and_baseline_stays_full(self):
+        baseline = self.fetch_run([mee6_player('x', 100, rank=1), mee6_player('y', 50, rank=2)])
+        apply_sync_run(baseline)
+        middle = self.fetch_run([mee6_player('x', 150, rank=1), mee6_player('y', 50, rank=2)])
+        self.fetch_run([mee6_player('x', 150, rank=1), mee6_player('y', 60, rank=2)])
+
+        self.assertEqual(compact_snapshots(keep_runs=1), 1)
+
+        middle.refresh_from_db()
+        self.assertIsNotNone(middle.compacted_at)
+        kept = Mee6PlayerSnapshot.objects.get(run=middle)
+        self.assertEqual((kept.discord_id, kept.xp), ('x', 150))
+        self.assertEqual(kept.raw_player, {})
+        self.assertEqual(kept.detailed_xp, [])
+
+        baseline.refresh_from_db()
+        self.assertIsNone(baseline.compacted_at)
+        self.assertEqual(Mee6PlayerSnapshot.objects.filter(run=baseline).exclude(raw_player={}).count(), 2)
+
+        with self.assertRaises(Mee6SyncError):
+            apply_sync_run(middle)
+
+    @override_settings(MEE6_SNAPSHOT_FULL_RETENTION_RUNS=2)
+    def test_fetch_enforces_retention(self):
+        runs = [self.fetch_run([mee6_player('x', xp)]) for xp in (10, 20, 30)]
+
+        self.assertEqual(
+            list(Mee6SyncRun.objects.filter(compacted_at__isnull=False).values_list('id', flat=True)),
+            [runs[0].id],
+        )
@@ -1,9 +1,20 @@
 from datetime import timedelta
+from io import StringIO
 
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_init, post_save
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from community_xp.models import Mee6CurrentXP, Mee6SyncRun
+from community_xp.membership import community_member_user_ids, refresh_community_memberships
+from community_xp.models import CommunityMembership, Mee6CurrentXP, Mee6PlayerSnapshot, Mee6SyncRun
+from community_xp.services import apply_sync_run
+from community_xp.signals import (
+    refresh_membership_for_contribution,
+    remember_contribution_membership_owner,
+)
 from community_xp.utils import get_community_member_user_ids
 from contributions.models import (
     Category,
@@ -14,12 +25,12 @@ from contributions.models import (
 from creators.models import Creator
 from leaderboard.models import GlobalLeaderboardMultiplier
 from poaps.models import PoapClaim, PoapDrop
+from social_connections.models import DiscordConnection
 from social_tasks.models import SocialTask, SocialTaskCompletion
 from users.models import User
 
 
-@override_settings(MEE6_GUILD_ID='guild-1')
-class CommunityMembershipTest(TestCase):
+class CommunityMembershipFixtureMixin:
     def setUp(self):
         self.community_category, _ = Category.objects.get_or_create(
             slug='community',
@@ -113,6 +124,9 @@ class CommunityMembershipTest(TestCase):
             contribution_date=timezone.now(),
         )
 
+
+@override_settings(MEE6_GUILD_ID='guild-1')
+class CommunityMembershipTest(CommunityMembershipFixtureMixin, TestCase):
     def test_positive_xp_uses_selected_guild_visibility_and_user_ids(self):
         selected = self.create_user()
         other_guild = self.create_user()
@@ -264,3 +278,178 @@ class CommunityMembershipTest(TestCase):
             creator_only.id,
             get_community_member_user_ids(since=since),
         )
+
+
+@override_settings(MEE6_GUILD_ID='guild-1')
+class PersistedCommunityMembershipTest(CommunityMembershipFixtureMixin, TestCase):
+    def assert_table_matches_live_rule(self):
+        self.assertEqual(
+            community_member_user_ids(visible_only=False),
+            get_community_member_user_ids(visible_only=False),
+        )
+
+    def test_write_paths_maintain_membership_and_first_seen(self):
+        contributor = self.create_user()
+        contribution = self.create_contribution(contributor)
+        early = timezone.now() - timedelta(days=10)
+        claim = PoapClaim.objects.create(
+            drop=self.drop,
+            user=contributor,
+            claim_method=PoapClaim.CLAIM_ADMIN,
+            claimed_at=early,
+        )
+
+        membership = CommunityMembership.objects.get(user=contributor)
+        self.assertEqual(membership.first_seen_at, early)
+        self.assertEqual(
+            membership.sources,
+            [CommunityMembership.SOURCE_CONTRIBUTION, CommunityMembership.SOURCE_POAP],
+        )
+
+        claim.delete()
+        membership.refresh_from_db()
+        self.assertEqual(membership.first_seen_at, contribution.contribution_date)
+        contribution.delete()
+        self.assertFalse(CommunityMembership.objects.filter(user=contributor).exists())
+
+        link_only = self.create_user()
+        self.create_contribution(link_only, contribution_type=self.link_type)
+        xp_member = self.create_user()
+        self.create_xp(xp_member)
+        completer = self.create_completion(self.create_user()).user
+        self.assertEqual(community_member_user_ids(), {xp_member.id, completer.id})
+        self.assert_table_matches_live_rule()
+
+    def test_moving_a_contribution_refreshes_its_previous_owner(self):
+        first = self.create_user()
+        second = self.create_user()
+        contribution = self.create_contribution(first)
+        self.assertTrue(CommunityMembership.objects.filter(user=first).exists())
+
+        contribution.user = second
+        contribution.save()
+        self.assertFalse(CommunityMembership.objects.filter(user=first).exists())
+        self.assertTrue(CommunityMembership.objects.filter(user=second).exists())
+
+        contribution.contribution_type = self.link_type
+        contribution.save(update_fields=['contribution_type'])
+        self.assertFalse(CommunityMembership.objects.filter(user=second).exists())
+        self.assert_table_matches_live_rule()
+
+    def test_hidden_members_are_stored_but_filtered_on_read(self):
+        hidden = self.create_user(visible=False)
+        PoapClaim.objects.create(drop=self.drop, user=hidden, claim_method=PoapClaim.CLAIM_ADMIN)
+
+        self.assertEqual(community_member_user_ids(), set())
+        self.assertEqual(community_member_user_ids(visible_only=False), {hidden.id})
+
+    def test_deleting_a_member_user_cascades_cleanly(self):
+        member = self.create_user()
+        self.create_contribution(member)
+        self.create_completion(member)
+        PoapClaim.objects.create(drop=self.drop, user=member, claim_method=PoapClaim.CLAIM_ADMIN)
+        self.assertTrue(CommunityMembership.objects.filter(user=member).exists())
+
+        member.delete()
+
+        self.assertFalse(CommunityMembership.objects.exists())
+
+    def test_backfill_command_rebuilds_after_bulk_writes(self):
+        bulk_member = self.create_user()
+        Contribution.objects.bulk_create([
+            Contribution(
+                user=bulk_member,
+                contribution_type=self.community_type,
+                points=10,
+                contribution_date=timezone.now(),
+            ),
+        ])
+        stale = self.create_user()
+        CommunityMembership.objects.create(user=stale, first_seen_at=timezone.now())
+        self.assertNotIn(bulk_member.id, community_member_user_ids())
+
+        call_command('backfill_community_memberships', stdout=StringIO())
+
+        self.assertEqual(community_member_user_ids(), {bulk_member.id})
+        self.assert_table_matches_live_rule()
+
+    def test_new_baseline_retires_distributed_social_task_members(self):
+        completion = self.create_completion(self.create_user())
+        state = completion.discord_xp_state
+        state.status = ContributionDiscordXPState.STATUS_DISTRIBUTED
+        state.awarded_amount = completion.points_awarded
+        state.distributed_at = timezone.now()
+        state.save(update_fields=['status', 'awarded_amount', 'distributed_at', 'updated_at'])
+        self.assertEqual(community_member_user_ids(), {completion.user_id})
+
+        self.create_sync(completed_at=timezone.now() + timedelta(minutes=1))
+        refresh_community_memberships()
+
+        self.assertEqual(community_member_user_ids(), set())
+
+    def test_applied_run_refreshes_only_the_users_it_changed(self):
+        completion = self.create_completion(self.create_user())
+        state = completion.discord_xp_state
+        state.status = ContributionDiscordXPState.STATUS_DISTRIBUTED
+        state.awarded_amount = completion.points_awarded
+        state.distributed_at = timezone.now()
+        state.save(update_fields=['status', 'awarded_amount', 'distributed_at', 'updated_at'])
+        player = self.create_user()
+        # A row the run has no reason to touch; a full recompute would drop it.
+        bystander = self.create_user()
+        CommunityMembership.objects.create(user=bystander, first_seen_at=timezone.now(), sources=[])
+
+        started_at = timezone.now() + timedelta(minutes=1)
+        run = Mee6SyncRun.objects.create(
+            guild_id='guild-1',
+            status=Mee6SyncRun.STATUS_SUCCESS,
+            started_at=started_at,
+            completed_at=started_at + timedelta(minutes=1),
+        )
+        Mee6PlayerSnapshot.objects.create(run=run, guild_id='guild-1', discord_id='player-1', rank=1, xp=50)
+        DiscordConnection.objects.create(
+            user=player,
+            platform_user_id='player-1',
+            platform_username='player',
+            linked_at=timezone.now(),
+        )
+
+        apply_sync_run(run)
+
+        self.assertEqual(community_member_user_ids(), {player.id, bystander.id})
+
+    def test_saving_a_non_member_contribution_skips_the_refresh(self):
+        builder_category, _ = Category.objects.get_or_create(
+            slug='builder',
+            defaults={'name': 'Builder'},
+        )
+        builder_type = ContributionType.objects.create(
+            name='Builder Work',
+            slug='builder-work',
+            category=builder_category,
+            max_points=1_000,
+        )
+        GlobalLeaderboardMultiplier.objects.get_or_create(
+            contribution_type=builder_type,
+            defaults={'multiplier_value': 1, 'valid_from': timezone.now() - timedelta(days=30)},
+        )
+        contribution_id = self.create_contribution(self.create_user(), contribution_type=builder_type).pk
+
+        def count_save_queries():
+            contribution = Contribution.objects.get(pk=contribution_id)
+            contribution.notes = 'Edited'
+            with CaptureQueriesContext(connection) as queries:
+                contribution.save()
+            return len(queries)
+
+        with_receivers = count_save_queries()
+        post_init.disconnect(remember_contribution_membership_owner, sender=Contribution)
+        post_save.disconnect(refresh_membership_for_contribution, sender=Contribution)
+        try:
+            without_receivers = count_save_queries()
+        finally:
+            post_init.connect(remember_contribution_membership_owner, sender=Contribution)
+            post_save.connect(refresh_membership_for_contribution, sender=Contribution)
+
+        self.assertEqual(with_receivers, without_receivers)
+        self.assertFalse(CommunityMembership.objects.exists())
@@ -3,6 +3,7 @@ from django.db.models import (
     Case,
     Count,
     DateTimeField,
+    Exists,
     F,
     IntegerField,
     OuterRef,
@@ -206,8 +207,15 @@ def _build_effective_community_scores_queryset(
             .values('count')[:1]
         )
         annotations.update({
-            'discord_xp_synced_at': Subquery(
-                current_xp_queryset.values('synced_at')[:1],
+            # Every current row is confirmed by the applied baseline, even
+            # rows the diff-based apply left untouched (their synced_at is
+            # when they last changed).
+            'discord_xp_synced_at': Case(
+                When(
+                    Exists(current_xp_queryset),
+                    then=Value(latest_sync.completed_at if latest_sync else None),
+                ),
+                default=Value(None),
                 output_field=DateTimeField(),
             ),
             'current_xp_row_id': Subquery(
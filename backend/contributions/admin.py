@@ -9,11 +9,9 @@ from django.utils import timezone
 from django.utils.html import format_html
 from django.db import transaction
 from django.db.models import (
-    Count,
     DecimalField,
     Exists,
     F,
-    IntegerField,
     OuterRef,
     Subquery,
     Value,
@@ -51,9 +49,6 @@ from notifications.admin_mixins import BroadcastNotificationAdminMixin
 
 User = get_user_model()
 
-NON_CAPACITY_STATES = ['rejected', 'canceled']
-
-
 class FeaturedContentAdminForm(forms.ModelForm):
     hero_placements = forms.MultipleChoiceField(
         choices=FeaturedContent.HERO_PLACEMENT_CHOICES,
@@ -75,26 +70,6 @@ class FeaturedContentAdminForm(forms.ModelForm):
         )
 
 
-def active_submission_count_subquery(fk_name):
-    return SubmittedContribution.objects.exclude(
-        state__in=NON_CAPACITY_STATES
-    ).filter(
-        **{fk_name: OuterRef('pk')}
-    ).values(
-        fk_name
-    ).annotate(
-        count=Count('pk')
-    ).values('count')
-
-
-def coalesced_count(subquery):
-    return Coalesce(
-        Subquery(subquery, output_field=IntegerField()),
-        Value(0),
-        output_field=IntegerField(),
-    )
-
-
 class ContributionTypeListFilter(admin.SimpleListFilter):
     title = 'contribution type'
     parameter_name = 'contribution_type__id__exact'
@@ -238,9 +213,6 @@ class ContributionTypeAdmin(BroadcastNotificationAdminMixin, admin.ModelAdmin):
         ).order_by('-valid_from').values('multiplier_value')[:1]
 
         return qs.select_related('category').annotate(
-            submission_count=coalesced_count(
-                active_submission_count_subquery('contribution_type_id')
-            ),
             current_multiplier_value=Coalesce(
                 Subquery(current_multiplier, output_field=multiplier_field),
                 Value(1.0, output_field=multiplier_field),
@@ -1195,11 +1167,7 @@ class MissionAdmin(BroadcastNotificationAdminMixin, admin.ModelAdmin):
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related('contribution_type').annotate(
-            submission_count=coalesced_count(
-                active_submission_count_subquery('mission_id')
-            )
-        ).order_by('-created_at', '-id')
+        return qs.select_related('contribution_type').order_by('-created_at', '-id')
 
     def get_status(self, obj):
         if obj.is_active():
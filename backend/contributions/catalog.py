@@ -0,0 +1,215 @@
+"""
+Process-wide catalog of categories, contribution types and multipliers.
+
+These rows change only when someone edits them in the admin, but they are
+read on nearly every hot path: each Contribution.save looks up the multiplier
+active on its date, contribution serializers show the current multiplier of
+every type, and profile code resolves types and categories by slug. The
+catalog loads all three tables once (three queries) and answers those
+lookups from memory. Each type's multiplier history is kept sorted by
+``valid_from``, so the multiplier active at any date is a bisect.
+
+Freshness is versioned. Any save or delete of a Category, ContributionType or
+GlobalLeaderboardMultiplier replaces a version token in the 'shared' cache
+(now and again on commit), and a catalog built under an older token is
+rebuilt on its next use. Every worker reads the same token, so a committed
+write retires the catalog everywhere before the next lookup. Writes that
+skip model signals (``QuerySet.update``, ``bulk_create``, raw SQL) must call
+``invalidate_catalog``.
+
+A transaction that writes one of these models may roll back, so a catalog
+read after such a write is only trusted while that transaction is still
+open. A catalog read inside any other transaction sees only committed rows
+and outlives it.
+
+Lookups return copies of the cached instances, so callers may modify them
+freely.
+"""
+
+import copy
+import threading
+import time
+import uuid
+from bisect import bisect_right
+from datetime import datetime
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from django.utils.connection import ConnectionProxy
+from django.utils.dateparse import parse_date, parse_datetime
+
+cache = ConnectionProxy(caches, 'shared')
+
+# Bump the version suffix whenever the catalog's contents change shape.
+CATALOG_VERSION_KEY = 'contributions:catalog-version:v1'
+CATALOG_MAX_AGE_SECONDS = 300
+CATALOG_MODELS = (
+    'contributions.Category',
+    'contributions.ContributionType',
+    'leaderboard.GlobalLeaderboardMultiplier',
+)
+
+_catalog = None
+_catalog_lock = threading.Lock()
+# Per thread: the outermost atomic block of the transaction that last wrote a
+# catalog model, so reads after that write stay bound to the transaction.
+_local = threading.local()
+
+
+class ContributionCatalog:
+    def __init__(self, categories, contribution_types, multipliers, version, atomic_block=None):
+        self.version = version
+        self.atomic_block = atomic_block
+        self.loaded_at = time.monotonic()
+        self.categories_by_id = {category.pk: category for category in categories}
+        self.categories_by_slug = {category.slug: category for category in categories}
+        self.types_by_id = {contribution_type.pk: contribution_type for contribution_type in contribution_types}
+        self.types_by_slug = {
+            contribution_type.slug: contribution_type
+            for contribution_type in contribution_types
+            if contribution_type.slug
+        }
+        # {type_id: ([valid_from, ...], [multiplier, ...])}, oldest first.
+        timelines = {}
+        for multiplier in sorted(multipliers, key=lambda item: (item.valid_from, item.pk)):
+            dates, items = timelines.setdefault(multiplier.contribution_type_id, ([], []))
+            dates.append(multiplier.valid_from)
+            items.append(multiplier)
+        self.multiplier_timelines = timelines
+
+    @classmethod
+    def load(cls, version, atomic_block=None):
+        from contributions.models import Category, ContributionType
+        from leaderboard.models import GlobalLeaderboardMultiplier
+
+        categories = list(Category.objects.all())
+        categories_by_id = {category.pk: category for category in categories}
+        contribution_types = list(ContributionType.objects.all())
+        for contribution_type in contribution_types:
+            category = categories_by_id.get(contribution_type.category_id)
+            if category is not None:
+                contribution_type.category = category
+        types_by_id = {contribution_type.pk: contribution_type for contribution_type in contribution_types}
+        multipliers = list(GlobalLeaderboardMultiplier.objects.all())
+        for multiplier in multipliers:
+            multiplier.contribution_type = types_by_id[multiplier.contribution_type_id]
+        return cls(categories, contribution_types, multipliers, version, atomic_block)
+
+    def is_current(self, version, connection):
+        if self.version != version:
+            return False
+        if time.monotonic() - self.loaded_at > CATALOG_MAX_AGE_SECONDS:
+            return False
+        if self.atomic_block is not None:
+            return any(block is self.atomic_block for block in connection.atomic_blocks)
+        return True
+
+    def multiplier_at(self, contribution_type_id, at_date):
+        """Return the multiplier active at `at_date`, or None."""
+        dates, items = self.multiplier_timelines.get(contribution_type_id, ((), ()))
+        index = bisect_right(dates, at_date)
+        return items[index - 1] if index else None
+
+    def latest_multiplier(self, contribution_type_id):
+        """Return the multiplier with the latest valid_from, or None."""
+        _, items = self.multiplier_timelines.get(contribution_type_id, ((), ()))
+        return items[-1] if items else None
+
+
+def _as_datetime(value):
+    # Match how the ORM compares a date, a naive datetime or an ISO string
+    # against valid_from.
+    if isinstance(value, str):
+        value = parse_datetime(value) or parse_date(value)
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def _current_version():
+    return cache.get_or_set(CATALOG_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_catalog():
+    """Return the current catalog, rebuilding it if a write retired it."""
+    global _catalog
+    version = _current_version()
+    connection = transaction.get_connection()
+    catalog = _catalog
+    if catalog is not None and catalog.is_current(version, connection):
+        return catalog
+
+    atomic_block = None
+    if connection.in_atomic_block and getattr(_local, 'written_in', None) is connection.atomic_blocks[0]:
+        atomic_block = connection.atomic_blocks[-1]
+    catalog = ContributionCatalog.load(version, atomic_block)
+    with _catalog_lock:
+        _catalog = catalog
+    return catalog
+
+
+def invalidate_catalog():
+    """Retire the catalog in this process now and again when the write commits."""
+    def bump():
+        global _catalog
+        cache.set(CATALOG_VERSION_KEY, uuid.uuid4().hex, None)
+        with _catalog_lock:
+            _catalog = None
+
+    def committed():
+        _local.written_in = None
+        bump()
+
+    bump()
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        _local.written_in = connection.atomic_blocks[0]
+        transaction.on_commit(committed)
+
+
+def get_category(slug):
+    """Category by slug; raises Category.DoesNotExist like objects.get()."""
+    from contributions.models import Category
+
+    category = get_catalog().categories_by_slug.get(slug)
+    if category is None:
+        raise Category.DoesNotExist(f"No category with slug '{slug}'")
+    return copy.copy(category)
+
+
+def get_contribution_type(slug):
+    """ContributionType by slug; raises ContributionType.DoesNotExist like objects.get()."""
+    from contributions.models import ContributionType
+
+    contribution_type = get_catalog().types_by_slug.get(slug)
+    if contribution_type is None:
+        raise ContributionType.DoesNotExist(f"No contribution type with slug '{slug}'")
+    return copy.copy(contribution_type)
+
+
+def get_active_multiplier(contribution_type, at_date):
+    """Multiplier active for the type at `at_date`, or None."""
+    multiplier = get_catalog().multiplier_at(
+        getattr(contribution_type, 'pk', contribution_type),
+        _as_datetime(at_date),
+    )
+    return copy.copy(multiplier) if multiplier is not None else None
+
+
+def get_latest_multiplier(contribution_type):
+    """Most recent multiplier for the type, whatever its date, or None."""
+    multiplier = get_catalog().latest_multiplier(getattr(contribution_type, 'pk', contribution_type))
+    return copy.copy(multiplier) if multiplier is not None else None
+
+
+def _invalidate_on_write(sender, **kwargs):
+    invalidate_catalog()
+
+
+for _model in CATALOG_MODELS:
+    post_save.connect(_invalidate_on_write, sender=_model, dispatch_uid=f'catalog-save-{_model}')
+    post_delete.connect(_invalidate_on_write, sender=_model, dispatch_uid=f'catalog-delete-{_model}')
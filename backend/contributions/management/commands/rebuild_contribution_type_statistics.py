@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from contributions.models import rebuild_contribution_type_statistics
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the contribution type statistics rollups (ContributionTypeStatistics and '
+        'ContributionTypeParticipant) from contributions'
+    )
+
+    def handle(self, *args, **options):
+        types, participants = rebuild_contribution_type_statistics()
+        self.stdout.write(self.style.SUCCESS(
+            f'Contribution type statistics rebuilt: {types} type(s), {participants} participant row(s).'
+        ))
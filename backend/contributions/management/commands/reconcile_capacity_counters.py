@@ -0,0 +1,112 @@
+"""Repair drift in the maintained submission capacity counters.
+
+ContributionType.active_submission_count, Mission.active_submission_count and
+UserWeeklySubmissionCount rows are kept current by the SubmittedContribution
+receivers. Writes that skip model signals (fixtures, raw SQL, a bulk update
+that forgot to adjust them) leave them stale; this command recounts every
+counter from the submissions and rewrites only the ones that differ.
+"""
+import datetime
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncWeek
+
+from contributions.models import (
+    NON_CAPACITY_STATES,
+    ContributionType,
+    Mission,
+    SubmittedContribution,
+    UserWeeklySubmissionCount,
+    refresh_capacity_counters,
+)
+
+
+def _drifted_ids(model, fk_name):
+    expected = dict(
+        SubmittedContribution.objects
+        .exclude(state__in=NON_CAPACITY_STATES)
+        .filter(**{f'{fk_name}__isnull': False})
+        .order_by()
+        .values(fk_name)
+        .annotate(count=Count('pk'))
+        .values_list(fk_name, 'count')
+    )
+    return [
+        pk
+        for pk, stored in model.objects.values_list('pk', 'active_submission_count')
+        if stored != expected.get(pk, 0)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Recount submission capacity counters and fix the ones that drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted counters without writing them.',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        type_ids = _drifted_ids(ContributionType, 'contribution_type_id')
+        mission_ids = _drifted_ids(Mission, 'mission_id')
+
+        expected_weekly = {
+            (row['user_id'], row['contribution_type_id'], row['week'].date()): row['count']
+            for row in (
+                SubmittedContribution.objects
+                .annotate(week=TruncWeek('created_at', tzinfo=datetime.timezone.utc))
+                .order_by()
+                .values('user_id', 'contribution_type_id', 'week')
+                .annotate(count=Count('pk'))
+            )
+        }
+        stored_weekly = {
+            (user_id, contribution_type_id, week_start): (pk, count)
+            for pk, user_id, contribution_type_id, week_start, count in (
+                UserWeeklySubmissionCount.objects.values_list(
+                    'pk', 'user_id', 'contribution_type_id', 'week_start', 'submission_count',
+                )
+            )
+        }
+        weekly_rows = [
+            UserWeeklySubmissionCount(
+                user_id=user_id,
+                contribution_type_id=contribution_type_id,
+                week_start=week_start,
+                submission_count=count,
+            )
+            for (user_id, contribution_type_id, week_start), count in expected_weekly.items()
+            if stored_weekly.get((user_id, contribution_type_id, week_start), (None, None))[1] != count
+        ]
+        stale_weekly_ids = [
+            pk for key, (pk, _) in stored_weekly.items() if key not in expected_weekly
+        ]
+
+        summary = (
+            f"{len(type_ids)} contribution type(s), {len(mission_ids)} mission(s), "
+            f"{len(weekly_rows) + len(stale_weekly_ids)} weekly count(s)"
+        )
+        if dry_run:
+            self.stdout.write(f"Drifted: {summary}. Dry run, nothing written.")
+            return
+
+        with transaction.atomic():
+            refresh_capacity_counters(contribution_type_ids=type_ids, mission_ids=mission_ids)
+            if weekly_rows:
+                UserWeeklySubmissionCount.objects.bulk_create(
+                    weekly_rows,
+                    batch_size=500,
+                    update_conflicts=True,
+                    unique_fields=['user', 'contribution_type', 'week_start'],
+                    update_fields=['submission_count'],
+                )
+            if stale_weekly_ids:
+                UserWeeklySubmissionCount.objects.filter(pk__in=stale_weekly_ids).delete()
+
+        self.stdout.write(self.style.SUCCESS(f"Reconciled: {summary}."))
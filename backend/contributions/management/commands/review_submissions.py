@@ -18,11 +18,25 @@ Usage:
 
     # Process a specific submission
     python manage.py review_submissions --submission-id <uuid>
+
+    # Evaluate rules across 4 worker processes
+    python manage.py review_submissions --workers 4
+
+The run is a staged pipeline. The read stage loads pending submissions and
+their evidence in chunks as plain tuples, the evaluate stage runs the rules on
+that data (in a process pool with --workers > 1), and the write stage applies
+rejections and gate marks in bulk, one transaction per chunk. Per-stage
+throughput is printed in the summary.
 """
 
 import logging
-from collections import defaultdict
+import multiprocessing
+import time
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
+import django
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.db.models import Count, Q
@@ -36,6 +50,8 @@ from contributions.models import (
     SubmissionNote,
     SubmissionStateTransition,
     SubmittedContribution,
+    refresh_submission_counters,
+    release_capacity_for_submissions,
 )
 from stewards.models import ReviewTemplate, Steward, StewardPermission
 from users.models import User
@@ -44,6 +60,29 @@ logger = logging.getLogger(__name__)
 
 MISSING_TEMPLATE = object()
 
+# Max normalized URLs per IN (...) clause when loading the duplicate lookup.
+LOOKUP_CHUNK_SIZE = 500
+
+# Submissions per read query, per pool task, and per write transaction.
+READ_CHUNK_SIZE = 500
+EVALUATE_CHUNK_SIZE = 250
+WRITE_CHUNK_SIZE = 500
+
+REVIEWABLE_STATES = ('pending', 'more_info_needed')
+
+
+# ─── Plain Data ──────────────────────────────────────────────────────────────
+# The rules only read these attributes, so they accept either model instances
+# or these picklable tuples. ``allow_duplicate`` is resolved during the read
+# stage (stored url_type or the compiled matcher), so evaluation never needs
+# the database.
+
+SubmissionData = namedtuple('SubmissionData', [
+    'id', 'created_at', 'has_appeal', 'contribution_type_name',
+    'notes_length', 'evidence',
+])
+EvidenceData = namedtuple('EvidenceData', ['url', 'allow_duplicate'])
+
 
 # ─── URL Helpers ─────────────────────────────────────────────────────────────
 
@@ -160,23 +199,32 @@ def rule_duplicate_evidence_url(submission, evidence_items,
     return duplicate_reasons[0]
 
 
-def _check_single_url_duplicate(submission, evidence, normalized,
-                                url_to_sub_ids, accepted_urls,
-                                skip_pending, submitted_created_at):
-    """Check whether a single normalized URL is a duplicate.
-
-    Returns (template_label, crm_reason) if duplicate, or None if unique.
-    """
+def _evidence_allows_duplicate(evidence):
+    """Whether the evidence's URL type is exempt from duplicate checks."""
+    if isinstance(evidence, EvidenceData):
+        return evidence.allow_duplicate
     # URL types flagged as duplicate-allowed are exempt. Fall back to
     # pattern detection when url_type is missing (legacy rows or evidence
     # copied via bulk_create paths that didn't populate the FK).
     if evidence.url_type_id and evidence.url_type and evidence.url_type.allow_duplicate:
-        return None
+        return True
     if not evidence.url_type_id and evidence.url:
         from contributions.url_utils import detect_url_type
         detected = detect_url_type(evidence.url)
         if detected and detected.allow_duplicate:
-            return None
+            return True
+    return False
+
+
+def _check_single_url_duplicate(submission, evidence, normalized,
+                                url_to_sub_ids, accepted_urls,
+                                skip_pending, submitted_created_at):
+    """Check whether a single normalized URL is a duplicate.
+
+    Returns (template_label, crm_reason) if duplicate, or None if unique.
+    """
+    if _evidence_allows_duplicate(evidence):
+        return None
     # Check converted/accepted contributions (always deterministic)
     if normalized in accepted_urls:
         return (
@@ -227,6 +275,47 @@ def _check_single_url_duplicate(submission, evidence, normalized,
     return None
 
 
+def evaluate_tier1(submission, evidence_items, url_to_sub_ids, accepted_urls,
+                   submitted_created_at, blocklist,
+                   skip_pending_duplicates=False):
+    """Run Tier 1 rules in order. Returns (template_label, crm_reason) or None."""
+    # Rule 1: No evidence URL
+    result = rule_no_evidence_url(submission, evidence_items)
+    if result:
+        return result
+
+    # Rule 2: Blocklisted URL
+    result = rule_blocklisted_url(submission, evidence_items, blocklist)
+    if result:
+        return result
+
+    # Rule 3: Duplicate evidence URL
+    # For --submission-id runs, only check against accepted contributions
+    # (deterministic) and skip the pending lookup (order-dependent).
+    return rule_duplicate_evidence_url(
+        submission, evidence_items, url_to_sub_ids, accepted_urls,
+        skip_pending=skip_pending_duplicates,
+        submitted_created_at=submitted_created_at,
+    )
+
+
+def _evaluate_chunk(submissions, rule_context):
+    """Pool task: evaluate a chunk of SubmissionData against shared lookups."""
+    url_to_sub_ids, accepted_urls, submitted_created_at, blocklist = rule_context
+    return [
+        evaluate_tier1(
+            submission, submission.evidence, url_to_sub_ids, accepted_urls,
+            submitted_created_at, blocklist,
+        )
+        for submission in submissions
+    ]
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
 # ─── Command ─────────────────────────────────────────────────────────────────
 
 class Command(BaseCommand):
@@ -254,10 +343,17 @@ class Command(BaseCommand):
             type=str,
             help='Process a specific submission by UUID',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Processes used to evaluate rules (1 = evaluate in-process)',
+        )
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         batch_size = options['batch_size']
+        workers = max(1, options['workers'] or 1)
 
         if dry_run:
             self.stdout.write(self.style.WARNING('=== DRY RUN MODE ==='))
@@ -265,16 +361,7 @@ class Command(BaseCommand):
         ai_user = self._ensure_ai_steward()
 
         # Build queryset
-        qs = (
-            SubmittedContribution.objects
-            .filter(state__in=['pending', 'more_info_needed'])
-            .select_related(
-                'contribution_type',
-                'contribution_type__category',
-                'user',
-            )
-            .prefetch_related('evidence_items')
-        )
+        qs = SubmittedContribution.objects.filter(state__in=REVIEWABLE_STATES)
 
         if options['submission_id']:
             qs = qs.filter(id=options['submission_id'])
@@ -295,30 +382,33 @@ class Command(BaseCommand):
         if batch_size > 0:
             qs = qs[:batch_size]
 
-        submissions = list(qs)
-        self.stdout.write(f'Found {len(submissions)} submissions to process')
+        stage_timings = {}
+
+        # ── Read stage ──
+        started = time.monotonic()
+        submission_ids = list(qs.values_list('id', flat=True))
+        self.stdout.write(f'Found {len(submission_ids)} submissions to process')
+        submissions = []
+        for chunk in _chunks(submission_ids, READ_CHUNK_SIZE):
+            submissions.extend(self._read_chunk(chunk))
+        stage_timings['read'] = (len(submissions), time.monotonic() - started)
 
         stats = defaultdict(int)
         appealed_submissions = [
             submission for submission in submissions
             if submission.has_appeal
         ]
+        total = len(submissions)
 
         # Appeals do not require templates and must remain pending for a human.
         for i, submission in enumerate(appealed_submissions, 1):
-            evidence_items = list(submission.evidence_items.all())
-            self.stdout.write(
-                f'\n[{i}/{len(submissions)}] {submission.id} '
-                f'| {submission.contribution_type.name} '
-                f'| evidence: {len(evidence_items)} '
-                f'| notes: {len((submission.notes or ""))}chars'
-            )
+            self._write_submission_line(i, total, submission)
             stats['appeals_reviewed'] += 1
             self.stdout.write(self.style.WARNING(
                 '  -> HUMAN REVIEW: appealed submission preserved'
             ))
-            if not dry_run:
-                self._mark_gate_reviewed(submission)
+        if not dry_run:
+            self._mark_gate_reviewed([s.id for s in appealed_submissions])
 
         submissions = [
             submission for submission in submissions
@@ -334,9 +424,17 @@ class Command(BaseCommand):
                 self._write_summary(stats, dry_run)
             return
 
-        # Pre-load all evidence URLs for O(1) duplicate checking
+        # ── Evaluate stage ──
+        started = time.monotonic()
+        # Load only the indexed evidence sharing a URL with this batch.
+        # Rules only ever reject against an *older* duplicate and the batch
+        # is walked newest first, so a rejection never changes the outcome
+        # for a later (older) submission: every submission can be evaluated
+        # against the same snapshot, in any order or process.
         url_to_sub_ids, accepted_urls, submitted_created_at = (
-            self._build_url_lookup()
+            self._build_url_lookup(
+                e for submission in submissions for e in submission.evidence
+            )
         )
 
         # Load blocklisted URL prefixes from database
@@ -347,160 +445,251 @@ class Command(BaseCommand):
         # only older submitted duplicates count so the outcome is deterministic.
         skip_pending_duplicates = bool(options['submission_id'])
 
-        for i, submission in enumerate(
-            submissions, len(appealed_submissions) + 1,
-        ):
-            evidence_items = list(submission.evidence_items.all())
-            self.stdout.write(
-                f'\n[{i}/{len(submissions) + len(appealed_submissions)}] '
-                f'{submission.id} '
-                f'| {submission.contribution_type.name} '
-                f'| evidence: {len(evidence_items)} '
-                f'| notes: {len((submission.notes or ""))}chars'
-            )
-
-            result = self._run_tier1(
-                submission, evidence_items, templates,
-                url_to_sub_ids, accepted_urls, submitted_created_at, blocklist,
-                skip_pending_duplicates=skip_pending_duplicates,
+        rule_context = (url_to_sub_ids, accepted_urls, submitted_created_at, blocklist)
+        if workers > 1 and len(submissions) > 1 and not skip_pending_duplicates:
+            outcomes = self._evaluate_in_pool(
+                submissions, rule_context, templates, workers,
             )
+        else:
+            outcomes = [
+                self._run_tier1(
+                    submission, submission.evidence, templates,
+                    url_to_sub_ids, accepted_urls, submitted_created_at,
+                    blocklist,
+                    skip_pending_duplicates=skip_pending_duplicates,
+                )
+                for submission in submissions
+            ]
+        stage_timings['evaluate'] = (len(submissions), time.monotonic() - started)
+
+        rejections = []
+        passed_ids = []
+        for i, (submission, result) in enumerate(
+            zip(submissions, outcomes), len(appealed_submissions) + 1,
+        ):
+            self._write_submission_line(i, total, submission)
             if result is MISSING_TEMPLATE:
                 stats['errors'] += 1
-                continue
             elif result:
                 template, crm_reason = result
                 stats['rejected'] += 1
                 self.stdout.write(self.style.WARNING(
                     f'  -> REJECT: {template.label}'
                 ))
-                if not dry_run:
-                    self._apply_reject(
-                        submission, ai_user, template, crm_reason,
-                    )
-                # Remove rejected submission from URL lookup so later
-                # submissions sharing the same URL aren't falsely rejected
-                self._remove_from_url_lookup(
-                    submission, evidence_items, url_to_sub_ids,
-                )
+                rejections.append((submission.id, template, crm_reason))
             else:
                 stats['passed'] += 1
-                if not dry_run:
-                    self._mark_gate_reviewed(submission)
+                passed_ids.append(submission.id)
+
+        # ── Write stage ──
+        if not dry_run:
+            started = time.monotonic()
+            for chunk in _chunks(rejections, WRITE_CHUNK_SIZE):
+                skipped = len(chunk) - self._apply_rejections(chunk, ai_user)
+                if skipped:
+                    stats['changed_during_run'] += skipped
+            self._mark_gate_reviewed(passed_ids)
+            stage_timings['write'] = (
+                len(rejections) + len(passed_ids), time.monotonic() - started,
+            )
 
         # Auto-ban check
+        started = time.monotonic()
         banned_count = self._check_auto_bans(ai_user, dry_run)
         stats['auto_banned'] = banned_count
+        stage_timings['auto_ban'] = (banned_count, time.monotonic() - started)
+
+        self._write_summary(stats, dry_run, stage_timings)
+
+    def _read_chunk(self, submission_ids):
+        """Load one chunk of submissions and their evidence as plain data."""
+        from contributions.url_utils import get_url_type_matcher
+
+        evidence_by_sub = defaultdict(list)
+        matcher = get_url_type_matcher()
+        for sub_id, url, allow_duplicate in (
+            Evidence.objects
+            .filter(submitted_contribution_id__in=submission_ids)
+            .order_by('created_at', 'id')
+            .values_list('submitted_contribution_id', 'url', 'url_type__allow_duplicate')
+        ):
+            if allow_duplicate is None and url:
+                detected = matcher.match(url)
+                allow_duplicate = bool(detected and detected.allow_duplicate)
+            evidence_by_sub[sub_id].append(
+                EvidenceData(url=url, allow_duplicate=bool(allow_duplicate)),
+            )
+
+        rows = {
+            row['id']: row
+            for row in SubmittedContribution.objects
+            .filter(id__in=submission_ids)
+            .values('id', 'created_at', 'has_appeal', 'contribution_type__name', 'notes')
+        }
+        return [
+            SubmissionData(
+                id=sub_id,
+                created_at=rows[sub_id]['created_at'],
+                has_appeal=rows[sub_id]['has_appeal'],
+                contribution_type_name=rows[sub_id]['contribution_type__name'],
+                notes_length=len(rows[sub_id]['notes'] or ''),
+                evidence=tuple(evidence_by_sub[sub_id]),
+            )
+            for sub_id in submission_ids
+            if sub_id in rows
+        ]
+
+    def _write_submission_line(self, i, total, submission):
+        self.stdout.write(
+            f'\n[{i}/{total}] {submission.id} '
+            f'| {submission.contribution_type_name} '
+            f'| evidence: {len(submission.evidence)} '
+            f'| notes: {submission.notes_length}chars'
+        )
 
-        self._write_summary(stats, dry_run)
+    def _evaluate_in_pool(self, submissions, rule_context, templates, workers):
+        """Evaluate rules across worker processes and resolve templates."""
+        if multiprocessing.current_process().daemon:
+            # Daemonic processes (e.g. a parallel test runner) cannot fork
+            # children; evaluate in-process instead.
+            results = _evaluate_chunk(submissions, rule_context)
+        else:
+            # Spawned workers only run pure rule code on pickled tuples;
+            # django.setup() lets them import this module.
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=django.setup,
+            ) as pool:
+                results = [
+                    result
+                    for chunk_results in pool.map(
+                        _evaluate_chunk,
+                        _chunks(submissions, EVALUATE_CHUNK_SIZE),
+                        repeat(rule_context),
+                    )
+                    for result in chunk_results
+                ]
+        return [
+            self._resolve_template(result, templates) if result else None
+            for result in results
+        ]
 
-    def _write_summary(self, stats, dry_run):
+    def _write_summary(self, stats, dry_run, stage_timings=None):
         self.stdout.write('\n' + '=' * 60)
         self.stdout.write(self.style.SUCCESS('SUMMARY'))
         for key, count in sorted(stats.items()):
             if count > 0:
                 self.stdout.write(f'  {key}: {count}')
 
+        if stage_timings:
+            self.stdout.write('\nSTAGES')
+            for stage, (count, elapsed) in stage_timings.items():
+                rate = count / elapsed if elapsed > 0 else 0
+                self.stdout.write(
+                    f'  {stage}: {count} in {elapsed:.2f}s ({rate:.0f}/s)'
+                )
+
         if dry_run:
             self.stdout.write(self.style.WARNING(
                 '\nDry run complete. No changes made.'
             ))
 
-    def _build_url_lookup(self):
-        """Pre-load all evidence URLs for O(1) duplicate checking.
+    def _build_url_lookup(self, evidence_items=None):
+        """Load indexed evidence URLs for O(1) duplicate checking.
 
-        URLs are normalized (query params, fragments, trailing slashes
-        stripped) so that cosmetic variants map to the same key.
+        Evidence rows carry an indexed ``normalized_url`` maintained on every
+        write. Given ``evidence_items``, only rows sharing a normalized URL
+        with those items are loaded, so a run costs time proportional to the
+        batch under review rather than to all evidence ever submitted.
+        Without it every evidence URL is loaded.
 
         Returns:
             url_to_sub_ids: dict mapping normalized URL → set of submission IDs
             accepted_urls: set of normalized URLs from accepted contributions
             submitted_created_at: dict mapping submission ID → created_at
         """
-        # URLs from pending/accepted submitted contributions.
         # Evidence whose url_type allows duplicates is excluded so those
-        # URLs never participate in duplicate detection.
-        from contributions.url_utils import detect_url_type
-
-        submitted = (
-            Evidence.objects
-            .filter(
-                submitted_contribution__state__in=[
+        # URLs never participate in duplicate detection. Rows with no stored
+        # url_type are classified in one batch against the compiled matcher.
+        from contributions.url_utils import detect_url_types
+
+        if evidence_items is None:
+            url_chunks = [None]
+        else:
+            normalized_urls = sorted({
+                _normalize_url(e.url) for e in evidence_items if e.url
+            })
+            url_chunks = [
+                normalized_urls[i:i + LOOKUP_CHUNK_SIZE]
+                for i in range(0, len(normalized_urls), LOOKUP_CHUNK_SIZE)
+            ]
+
+        submitted = []
+        accepted = []
+        for chunk in url_chunks:
+            evidence_qs = Evidence.objects.filter(url__gt='')
+            if chunk is not None:
+                evidence_qs = evidence_qs.filter(normalized_url__in=chunk)
+            # URLs from pending/accepted submitted contributions.
+            submitted.extend(
+                evidence_qs
+                .filter(submitted_contribution__state__in=[
                     'pending', 'accepted', 'more_info_needed',
-                ],
-                url__gt='',
+                ])
+                .values_list(
+                    'normalized_url',
+                    'url',
+                    'submitted_contribution_id',
+                    'submitted_contribution__created_at',
+                    'url_type__allow_duplicate',
+                )
             )
-            .values_list(
-                'url',
-                'submitted_contribution_id',
-                'submitted_contribution__created_at',
-                'url_type__allow_duplicate',
+            # URLs from converted/accepted contributions
+            accepted.extend(
+                evidence_qs
+                .filter(contribution__isnull=False)
+                .values_list('normalized_url', 'url', 'url_type__allow_duplicate')
             )
-        )
+
+        detected = detect_url_types({
+            row[1] for row in (*submitted, *accepted) if row[-1] is None
+        })
+
+        def _allows_duplicate(url, allow_duplicate):
+            if allow_duplicate is None:
+                url_type = detected[url]
+                return bool(url_type and url_type.allow_duplicate)
+            return allow_duplicate
+
         url_to_sub_ids = defaultdict(set)
         submitted_created_at = {}
-        for url, sub_id, created_at, allow_duplicate in submitted:
-            if allow_duplicate:
+        for normalized, url, sub_id, created_at, allow_duplicate in submitted:
+            if _allows_duplicate(url, allow_duplicate):
                 continue
-            if allow_duplicate is None:
-                detected = detect_url_type(url)
-                if detected and detected.allow_duplicate:
-                    continue
-            url_to_sub_ids[_normalize_url(url)].add(sub_id)
+            url_to_sub_ids[normalized or _normalize_url(url)].add(sub_id)
             submitted_created_at.setdefault(sub_id, created_at)
 
-        # URLs from converted/accepted contributions
-        accepted_urls = set()
-        for url, allow_duplicate in (
-            Evidence.objects
-            .filter(contribution__isnull=False, url__gt='')
-            .values_list('url', 'url_type__allow_duplicate')
-        ):
-            if allow_duplicate:
-                continue
-            if allow_duplicate is None:
-                detected = detect_url_type(url)
-                if detected and detected.allow_duplicate:
-                    continue
-            accepted_urls.add(_normalize_url(url))
+        accepted_urls = {
+            normalized or _normalize_url(url)
+            for normalized, url, allow_duplicate in accepted
+            if not _allows_duplicate(url, allow_duplicate)
+        }
 
         return url_to_sub_ids, accepted_urls, submitted_created_at
 
-    def _remove_from_url_lookup(self, submission, evidence_items,
-                                url_to_sub_ids):
-        """Remove a rejected submission from the URL lookup so later
-        submissions sharing the same URL aren't falsely rejected."""
-        for e in evidence_items:
-            if e.url:
-                normalized = _normalize_url(e.url)
-                if normalized in url_to_sub_ids:
-                    url_to_sub_ids[normalized].discard(submission.id)
-
     def _run_tier1(self, submission, evidence_items, templates,
                    url_to_sub_ids, accepted_urls, submitted_created_at,
                    blocklist,
                    skip_pending_duplicates=False):
         """Run Tier 1 rules in order. Returns result tuple, sentinel, or None."""
-        # Rule 1: No evidence URL
-        result = rule_no_evidence_url(submission, evidence_items)
-        if result:
-            return self._resolve_template(result, templates)
-
-        # Rule 2: Blocklisted URL
-        result = rule_blocklisted_url(submission, evidence_items, blocklist)
-        if result:
-            return self._resolve_template(result, templates)
-
-        # Rule 3: Duplicate evidence URL
-        # For --submission-id runs, only check against accepted contributions
-        # (deterministic) and skip the pending lookup (order-dependent).
-        result = rule_duplicate_evidence_url(
+        result = evaluate_tier1(
             submission, evidence_items, url_to_sub_ids, accepted_urls,
-            skip_pending=skip_pending_duplicates,
-            submitted_created_at=submitted_created_at,
+            submitted_created_at, blocklist,
+            skip_pending_duplicates=skip_pending_duplicates,
         )
         if result:
             return self._resolve_template(result, templates)
-
         return None
 
     def _resolve_template(self, rule_result, templates):
@@ -515,63 +704,117 @@ class Command(BaseCommand):
         return template, crm_reason
 
     @transaction.atomic
-    def _apply_reject(self, submission, ai_user, template, crm_reason):
-        """Apply a direct rejection."""
-        previous_state = submission.state
-        submission.state = 'rejected'
-        submission.staff_reply = template.text
-        submission.reviewed_by = ai_user
-        submission.reviewed_at = timezone.now()
-        submission.gate_reviewed = True
-        # Clear any existing proposal fields
-        submission.proposed_action = None
-        submission.proposed_points = None
-        submission.proposed_contribution_type = None
-        submission.proposed_user = None
-        submission.proposed_staff_reply = ''
-        submission.proposed_create_highlight = False
-        submission.proposed_highlight_title = ''
-        submission.proposed_highlight_description = ''
-        submission.proposed_by = None
-        submission.proposed_at = None
-        submission.proposed_confidence = None
-        submission.proposed_template = None
-        submission.proposal_review_status = None
-        submission.proposal_review_feedback = ''
-        submission.proposal_questioned_by = None
-        submission.proposal_questioned_at = None
-        submission.escalated_at = None
-        submission.save()
-
-        SubmissionNote.objects.create(
-            submitted_contribution=submission,
-            user=ai_user,
-            message=crm_reason,
-            is_proposal=False,
-            data={
-                'action': 'reject',
-                'points': None,
-                'staff_reply': template.text,
-                'template_id': template.id,
-                'confidence': 'high',
-                'flags': [],
-                'reasoning': crm_reason,
-            },
+    def _apply_rejections(self, rejections, ai_user):
+        """Apply a chunk of direct rejections in one transaction.
+
+        ``rejections`` is a list of (submission_id, template, crm_reason).
+        Rows that left the reviewable set since the read stage (a steward
+        acted, or a proposal landed) are skipped. Returns the number applied.
+        """
+        # Lock the rows so the captured pre-reject states can't change
+        # before the update lands.
+        previous_states = dict(
+            SubmittedContribution.objects
+            .select_for_update()
+            .filter(
+                id__in=[submission_id for submission_id, _, _ in rejections],
+                state__in=REVIEWABLE_STATES,
+                gate_reviewed=False,
+                proposed_action__isnull=True,
+            )
+            .values_list('id', 'state')
         )
+        rejections = [r for r in rejections if r[0] in previous_states]
+        if not rejections:
+            return 0
+
+        ids_by_template = defaultdict(list)
+        templates = {}
+        for submission_id, template, _ in rejections:
+            ids_by_template[template.id].append(submission_id)
+            templates[template.id] = template
+
+        # Queryset update bypasses auto_now, so bump updated_at explicitly.
+        now = timezone.now()
+        for template_id, submission_ids in ids_by_template.items():
+            SubmittedContribution.objects.filter(id__in=submission_ids).update(
+                state='rejected',
+                staff_reply=templates[template_id].text,
+                reviewed_by=ai_user,
+                reviewed_at=now,
+                gate_reviewed=True,
+                # Clear any existing proposal fields
+                proposed_action=None,
+                proposed_points=None,
+                proposed_contribution_type=None,
+                proposed_user=None,
+                proposed_staff_reply='',
+                proposed_create_highlight=False,
+                proposed_highlight_title='',
+                proposed_highlight_description='',
+                proposed_by=None,
+                proposed_at=None,
+                proposed_confidence=None,
+                proposed_template=None,
+                proposal_review_status=None,
+                proposal_review_feedback='',
+                proposal_questioned_by=None,
+                proposal_questioned_at=None,
+                escalated_at=None,
+                updated_at=now,
+            )
 
-        SubmissionStateTransition.record(
-            submission,
-            SubmissionStateTransition.EVENT_GATE_REJECT,
-            from_state=previous_state,
-            actor=ai_user,
+        SubmissionNote.objects.bulk_create([
+            SubmissionNote(
+                submitted_contribution_id=submission_id,
+                user=ai_user,
+                message=crm_reason,
+                is_proposal=False,
+                data={
+                    'action': 'reject',
+                    'points': None,
+                    'staff_reply': template.text,
+                    'template_id': template.id,
+                    'confidence': 'high',
+                    'flags': [],
+                    'reasoning': crm_reason,
+                },
+            )
+            for submission_id, template, crm_reason in rejections
+        ])
+        refresh_submission_counters(
+            submission_id for submission_id, _, _ in rejections
         )
+        release_capacity_for_submissions({
+            submission_id: previous_states[submission_id]
+            for submission_id, _, _ in rejections
+        })
+
+        SubmissionStateTransition.objects.bulk_create([
+            SubmissionStateTransition(
+                submitted_contribution_id=submission_id,
+                event=SubmissionStateTransition.EVENT_GATE_REJECT,
+                from_state=previous_states[submission_id],
+                to_state='rejected',
+                actor=ai_user,
+            )
+            for submission_id, _, _ in rejections
+        ])
+        return len(rejections)
 
-    def _mark_gate_reviewed(self, submission):
-        """Record that Tier 1 evaluated this submission and found no reject."""
-        if submission.gate_reviewed:
-            return
-        submission.gate_reviewed = True
-        submission.save(update_fields=['gate_reviewed', 'updated_at'])
+    def _apply_reject(self, submission, ai_user, template, crm_reason):
+        """Apply a single direct rejection."""
+        return self._apply_rejections(
+            [(submission.id, template, crm_reason)], ai_user,
+        )
+
+    def _mark_gate_reviewed(self, submission_ids):
+        """Record that Tier 1 evaluated these submissions and found no reject."""
+        now = timezone.now()
+        for chunk in _chunks(submission_ids, WRITE_CHUNK_SIZE):
+            SubmittedContribution.objects.filter(
+                id__in=chunk, gate_reviewed=False,
+            ).update(gate_reviewed=True, updated_at=now)
 
     def _ensure_ai_steward(self):
         """Get or create the AI steward user with full steward permissions."""
@@ -0,0 +1,67 @@
+# Generated by Django 6.0.6 on 2026-10-19 11:02
+
+from django.db import migrations, models
+from django.db.models import Count, Exists, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_submission_counters(apps, schema_editor):
+    SubmittedContribution = apps.get_model('contributions', 'SubmittedContribution')
+    Evidence = apps.get_model('contributions', 'Evidence')
+    SubmissionNote = apps.get_model('contributions', 'SubmissionNote')
+    ReviewProposal = apps.get_model('contributions', 'ReviewProposal')
+
+    def _count(model):
+        return Coalesce(
+            Subquery(
+                model.objects.filter(submitted_contribution_id=OuterRef('pk'))
+                .order_by()
+                .values('submitted_contribution_id')
+                .annotate(count=Count('pk'))
+                .values('count'),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+            output_field=IntegerField(),
+        )
+
+    submission_ids = list(SubmittedContribution.objects.values_list('pk', flat=True))
+    for start in range(0, len(submission_ids), 500):
+        SubmittedContribution.objects.filter(
+            pk__in=submission_ids[start:start + 500],
+        ).update(
+            evidence_count=_count(Evidence),
+            internal_notes_count=_count(SubmissionNote),
+            has_ai_proposal=Exists(
+                ReviewProposal.objects.filter(
+                    submitted_contribution_id=OuterRef('pk'),
+                    source='ai',
+                )
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0085_submissionmoreinforesponse'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submittedcontribution',
+            name='evidence_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of evidence items attached to this submission.'),
+        ),
+        migrations.AddField(
+            model_name='submittedcontribution',
+            name='internal_notes_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of internal steward notes on this submission.'),
+        ),
+        migrations.AddField(
+            model_name='submittedcontribution',
+            name='has_ai_proposal',
+            field=models.BooleanField(default=False, help_text='True once an AI review proposal has been recorded for this submission.'),
+        ),
+        migrations.RunPython(backfill_submission_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 6.0.6 on 2026-10-19 12:08
+
+import datetime
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, TruncWeek
+
+
+def backfill_capacity_counters(apps, schema_editor):
+    ContributionType = apps.get_model('contributions', 'ContributionType')
+    Mission = apps.get_model('contributions', 'Mission')
+    SubmittedContribution = apps.get_model('contributions', 'SubmittedContribution')
+    UserWeeklySubmissionCount = apps.get_model('contributions', 'UserWeeklySubmissionCount')
+
+    def _active_count(fk_name):
+        return Coalesce(
+            Subquery(
+                SubmittedContribution.objects.filter(**{fk_name: OuterRef('pk')})
+                .exclude(state__in=['rejected', 'canceled'])
+                .order_by()
+                .values(fk_name)
+                .annotate(count=Count('pk'))
+                .values('count'),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+            output_field=IntegerField(),
+        )
+
+    ContributionType.objects.update(active_submission_count=_active_count('contribution_type_id'))
+    Mission.objects.update(active_submission_count=_active_count('mission_id'))
+
+    weekly = (
+        SubmittedContribution.objects
+        .annotate(week=TruncWeek('created_at', tzinfo=datetime.timezone.utc))
+        .order_by()
+        .values('user_id', 'contribution_type_id', 'week')
+        .annotate(count=Count('pk'))
+    )
+    UserWeeklySubmissionCount.objects.bulk_create(
+        (
+            UserWeeklySubmissionCount(
+                user_id=row['user_id'],
+                contribution_type_id=row['contribution_type_id'],
+                week_start=row['week'].date(),
+                submission_count=row['count'],
+            )
+            for row in weekly.iterator()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0087_submission_list_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contributiontype',
+            name='active_submission_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Non-rejected, non-canceled submissions of this type. Maintained by the submission receivers; see refresh_capacity_counters.'),
+        ),
+        migrations.AddField(
+            model_name='mission',
+            name='active_submission_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Non-rejected, non-canceled submissions for this mission. Maintained by the submission receivers; see refresh_capacity_counters.'),
+        ),
+        migrations.CreateModel(
+            name='UserWeeklySubmissionCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField(help_text='Monday (UTC) the week starts on.')),
+                ('submission_count', models.PositiveIntegerField(default=0)),
+                ('contribution_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_submission_counts', to='contributions.contributiontype')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_submission_counts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Weekly Submission Count',
+                'verbose_name_plural': 'User Weekly Submission Counts',
+                'constraints': [models.UniqueConstraint(fields=('user', 'contribution_type', 'week_start'), name='unique_user_type_week_submission_count')],
+            },
+        ),
+        migrations.RunPython(backfill_capacity_counters, migrations.RunPython.noop),
+    ]
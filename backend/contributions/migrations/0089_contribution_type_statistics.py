@@ -0,0 +1,110 @@
+# Generated by Django 6.0.6 on 2026-10-19 12:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+
+
+def backfill_contribution_type_statistics(apps, schema_editor):
+    Contribution = apps.get_model('contributions', 'Contribution')
+    ContributionTypeParticipant = apps.get_model('contributions', 'ContributionTypeParticipant')
+    ContributionTypeStatistics = apps.get_model('contributions', 'ContributionTypeStatistics')
+
+    ContributionTypeParticipant.objects.bulk_create(
+        [
+            ContributionTypeParticipant(**row)
+            for row in (
+                Contribution.objects
+                .order_by()
+                .values('contribution_type_id', 'user_id')
+                .annotate(
+                    contribution_count=Count('pk'),
+                    total_points=Sum('frozen_global_points'),
+                    last_earned=Max('contribution_date'),
+                )
+            )
+        ],
+        batch_size=1000,
+    )
+    now = timezone.now()
+    ContributionTypeStatistics.objects.bulk_create(
+        [
+            ContributionTypeStatistics(updated_at=now, **row)
+            for row in (
+                ContributionTypeParticipant.objects
+                .order_by()
+                .values('contribution_type_id')
+                .annotate(
+                    participants_count=Count('pk'),
+                    contribution_count=Sum('contribution_count'),
+                    total_points=Sum('total_points'),
+                    last_earned=Max('last_earned'),
+                )
+            )
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0088_capacity_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContributionTypeParticipant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contribution_count', models.PositiveIntegerField(default=0)),
+                ('total_points', models.PositiveBigIntegerField(default=0)),
+                ('last_earned', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Contribution Type Participant',
+                'verbose_name_plural': 'Contribution Type Participants',
+            },
+        ),
+        migrations.CreateModel(
+            name='ContributionTypeStatistics',
+            fields=[
+                ('contribution_type', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='statistics_rollup', serialize=False, to='contributions.contributiontype')),
+                ('contribution_count', models.PositiveIntegerField(default=0)),
+                ('participants_count', models.PositiveIntegerField(default=0)),
+                ('total_points', models.PositiveBigIntegerField(default=0)),
+                ('last_earned', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Contribution Type Statistics',
+                'verbose_name_plural': 'Contribution Type Statistics',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['contribution_type', '-contribution_date'], name='contrib_type_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='contributiontypeparticipant',
+            name='contribution_type',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='participant_rollups', to='contributions.contributiontype'),
+        ),
+        migrations.AddField(
+            model_name='contributiontypeparticipant',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contribution_type_rollups', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='contributiontypeparticipant',
+            index=models.Index(fields=['contribution_type', '-total_points'], name='type_participant_points_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='contributiontypeparticipant',
+            constraint=models.UniqueConstraint(fields=('contribution_type', 'user'), name='unique_contribution_type_participant'),
+        ),
+        migrations.RunPython(backfill_contribution_type_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.6 on 2026-10-19 15:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0089_contribution_type_statistics'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='submittedcontribution',
+            name='evidence_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of evidence items attached to this submission.'),
+        ),
+        migrations.AlterField(
+            model_name='submittedcontribution',
+            name='has_ai_proposal',
+            field=models.BooleanField(default=False, editable=False, help_text='True once an AI review proposal has been recorded for this submission.'),
+        ),
+        migrations.AlterField(
+            model_name='submittedcontribution',
+            name='internal_notes_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of internal steward notes on this submission.'),
+        ),
+    ]
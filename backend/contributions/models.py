@@ -1,13 +1,14 @@
-from django.db import models
+from django.db import DatabaseError, models, transaction
 from django.db.models import Q
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 from utils.models import BaseModel
 from utils.dates import utc_week_bounds
+import datetime
 import decimal
 import os
 import uuid
@@ -21,6 +22,49 @@ def default_featured_hero_placements():
     return ['overview', 'builder', 'community']
 
 
+# Submissions in these states do not consume type or mission capacity.
+NON_CAPACITY_STATES = ('rejected', 'canceled')
+
+
+class CounterFieldsMixin:
+    """
+    Leave the model's COUNTER_FIELDS out of a full save of an existing row,
+    so a stale instance does not write back counters that the receivers
+    bumped since it was loaded. The counters are only written through
+    QuerySet.update.
+
+    Saves that name their own update_fields are left alone, and a full save
+    whose row has gone is inserted again.
+    """
+
+    COUNTER_FIELDS = ()
+
+    def _non_counter_update_fields(self):
+        return [
+            field.name for field in self._meta.concrete_fields
+            if not field.primary_key and field.name not in self.COUNTER_FIELDS
+        ]
+
+    def save(self, *args, **kwargs):
+        if (
+            args
+            or self._state.adding
+            or kwargs.get('force_insert')
+            or kwargs.get('update_fields') is not None
+        ):
+            return super().save(*args, **kwargs)
+
+        try:
+            # Savepoint: a restricted save of a vanished row raises, and the
+            # enclosing transaction has to stay usable for the INSERT below.
+            with transaction.atomic(using=kwargs.get('using')):
+                return super().save(update_fields=self._non_counter_update_fields(), **kwargs)
+        except DatabaseError:
+            if type(self)._base_manager.using(kwargs.get('using')).filter(pk=self.pk).exists():
+                raise
+        return super().save(**kwargs)
+
+
 class Category(BaseModel):
     """
     Defines a user category (Validator, Builder, Steward).
@@ -71,7 +115,7 @@ def evidence_file_path(instance, filename):
     return os.path.join(folder, filename)
 
 
-class ContributionType(BaseModel):
+class ContributionType(CounterFieldsMixin, BaseModel):
     """
     Represents different types of contributions that participants can make.
     Examples: Node Runner, Uptime, Asimov, Blog Post, etc.
@@ -165,6 +209,14 @@ class ContributionType(BaseModel):
             "Leave blank for unlimited."
         ),
     )
+    active_submission_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text=(
+            "Non-rejected, non-canceled submissions of this type. Maintained "
+            "by the submission receivers; see refresh_capacity_counters."
+        ),
+    )
     requires_ai_review = models.BooleanField(
         default=False,
         help_text="Require AI review before tier-1 stewards can review pending submissions.",
@@ -229,6 +281,8 @@ class ContributionType(BaseModel):
         ),
     )
 
+    COUNTER_FIELDS = ('active_submission_count',)
+
     class Meta:
         ordering = ['category__name', 'name']
 
@@ -240,12 +294,7 @@ class ContributionType(BaseModel):
         """
         Count submissions that consume this contribution type's capacity.
         """
-        annotated_count = getattr(self, 'submission_count', None)
-        if annotated_count is not None:
-            return annotated_count
-        return self.submitted_contributions.exclude(
-            state__in=['rejected', 'canceled']
-        ).count()
+        return self.active_submission_count
 
     def submissions_remaining(self):
         if self.max_submissions is None:
@@ -269,12 +318,12 @@ class ContributionType(BaseModel):
         annotated_count = getattr(self, 'user_weekly_submission_count', None)
         if annotated_count is not None and now is None:
             return annotated_count
-        week_start, week_end = utc_week_bounds(now)
-        return self.submitted_contributions.filter(
+        week_start, _ = utc_week_bounds(now)
+        return UserWeeklySubmissionCount.objects.filter(
             user=user,
-            created_at__gte=week_start,
-            created_at__lt=week_end,
-        ).count()
+            contribution_type=self,
+            week_start=week_start.date(),
+        ).values_list('submission_count', flat=True).first() or 0
 
     def user_weekly_submissions_remaining(self, user, now=None):
         if self.max_submissions_per_user_per_week is None:
@@ -415,6 +464,10 @@ class Contribution(BaseModel):
     class Meta:
         indexes = [
             models.Index(fields=['created_at'], name='contrib_created_idx'),
+            models.Index(
+                fields=['contribution_type', '-contribution_date'],
+                name='contrib_type_date_idx',
+            ),
         ]
 
     def _points_require_current_range_validation(self):
@@ -547,6 +600,267 @@ def ensure_validator_profile_for_graduation_contribution(sender, instance, **kwa
     ensure_validator_profile(instance.user)
 
 
+class ContributionTypeParticipant(models.Model):
+    """
+    One user's contributions of one type, rolled up. These rows back a
+    type's participant count and its top contributors. Maintained by the
+    Contribution receivers; see refresh_contribution_type_statistics.
+    """
+    contribution_type = models.ForeignKey(
+        ContributionType,
+        on_delete=models.CASCADE,
+        related_name='participant_rollups',
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='contribution_type_rollups',
+    )
+    contribution_count = models.PositiveIntegerField(default=0)
+    total_points = models.PositiveBigIntegerField(default=0)
+    last_earned = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Contribution Type Participant"
+        verbose_name_plural = "Contribution Type Participants"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['contribution_type', 'user'],
+                name='unique_contribution_type_participant',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['contribution_type', '-total_points'],
+                name='type_participant_points_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.contribution_type}: {self.total_points} points"
+
+
+class ContributionTypeStatistics(models.Model):
+    """
+    Per-type totals behind ContributionTypeViewSet.statistics. Each change
+    to one of the type's ContributionTypeParticipant rows is added to it.
+    """
+    contribution_type = models.OneToOneField(
+        ContributionType,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='statistics_rollup',
+    )
+    contribution_count = models.PositiveIntegerField(default=0)
+    participants_count = models.PositiveIntegerField(default=0)
+    total_points = models.PositiveBigIntegerField(default=0)
+    last_earned = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Contribution Type Statistics"
+        verbose_name_plural = "Contribution Type Statistics"
+
+    def __str__(self):
+        return f"{self.contribution_type}: {self.contribution_count} contribution(s)"
+
+
+def _participant_totals(contributions):
+    from django.db.models import Count, Max, Sum
+
+    return contributions.aggregate(
+        contribution_count=Count('pk'),
+        total_points=Sum('frozen_global_points'),
+        last_earned=Max('contribution_date'),
+    )
+
+
+def refresh_contribution_type_statistics(keys, create=True):
+    """
+    Recompute the participant rollups for (contribution_type_id, user_id)
+    keys and apply each rollup's change to its type's statistics row.
+
+    A participant row is locked before its small aggregate runs, so writers
+    for the same user and type recount one after the other. The type row
+    only takes F() deltas of that change, so writers for different users
+    never overwrite each other and no type-wide aggregate runs on the hot
+    path; last_earned is re-derived from the participant rows only when a
+    user's latest contribution moves back. With create=False rows are only
+    updated or removed, never added; the delete receiver uses that because
+    it also runs while the user or the contribution type itself is being
+    deleted. Writes that skip model signals must call this (or the
+    ``rebuild_contribution_type_statistics`` command) themselves.
+    """
+    from django.db import transaction
+    from django.db.models import F, OuterRef, Q, Subquery
+
+    keys = sorted({
+        (contribution_type_id, user_id)
+        for contribution_type_id, user_id in keys
+        if contribution_type_id and user_id
+    })
+    with transaction.atomic():
+        for contribution_type_id, user_id in keys:
+            rollup = ContributionTypeParticipant.objects.filter(
+                contribution_type_id=contribution_type_id,
+                user_id=user_id,
+            )
+            statistics = ContributionTypeStatistics.objects.filter(
+                contribution_type_id=contribution_type_id,
+            )
+            if create:
+                ContributionTypeParticipant.objects.bulk_create(
+                    [ContributionTypeParticipant(contribution_type_id=contribution_type_id, user_id=user_id)],
+                    ignore_conflicts=True,
+                )
+                ContributionTypeStatistics.objects.bulk_create(
+                    [ContributionTypeStatistics(contribution_type_id=contribution_type_id)],
+                    ignore_conflicts=True,
+                )
+            previous = rollup.select_for_update().values(
+                'contribution_count', 'total_points', 'last_earned',
+            ).first()
+            if previous is None:
+                continue
+
+            totals = _participant_totals(Contribution.objects.filter(
+                contribution_type_id=contribution_type_id,
+                user_id=user_id,
+            ))
+            totals['total_points'] = totals['total_points'] or 0
+            if totals['contribution_count']:
+                rollup.update(**totals)
+            else:
+                rollup.delete()
+
+            statistics.update(
+                updated_at=timezone.now(),
+                contribution_count=F('contribution_count')
+                + (totals['contribution_count'] - previous['contribution_count']),
+                participants_count=F('participants_count')
+                + (bool(totals['contribution_count']) - bool(previous['contribution_count'])),
+                total_points=F('total_points') + (totals['total_points'] - previous['total_points']),
+            )
+            last_earned, previous_last_earned = totals['last_earned'], previous['last_earned']
+            if last_earned is not None and (previous_last_earned is None or last_earned >= previous_last_earned):
+                statistics.filter(
+                    Q(last_earned__isnull=True) | Q(last_earned__lt=last_earned),
+                ).update(last_earned=last_earned)
+            elif previous_last_earned is not None:
+                # The user's latest contribution moved back; if it was the
+                # type's latest, take the newest remaining one.
+                statistics.filter(last_earned__lte=previous_last_earned).update(
+                    last_earned=Subquery(
+                        ContributionTypeParticipant.objects
+                        .filter(
+                            contribution_type_id=OuterRef('contribution_type_id'),
+                            last_earned__isnull=False,
+                        )
+                        .order_by('-last_earned')
+                        .values('last_earned')[:1]
+                    ),
+                )
+
+
+def rebuild_contribution_type_statistics():
+    """
+    Rebuild every participant rollup and statistics row from Contribution.
+
+    Returns (types, participants) written.
+    """
+    from django.db import transaction
+    from django.db.models import Count, Max, Sum
+
+    participants = [
+        ContributionTypeParticipant(**row)
+        for row in (
+            Contribution.objects
+            .order_by()
+            .values('contribution_type_id', 'user_id')
+            .annotate(
+                contribution_count=Count('pk'),
+                total_points=Sum('frozen_global_points'),
+                last_earned=Max('contribution_date'),
+            )
+        )
+    ]
+    now = timezone.now()
+    with transaction.atomic():
+        ContributionTypeParticipant.objects.all().delete()
+        ContributionTypeParticipant.objects.bulk_create(participants, batch_size=1000)
+        statistics = [
+            ContributionTypeStatistics(updated_at=now, **row)
+            for row in (
+                ContributionTypeParticipant.objects
+                .order_by()
+                .values('contribution_type_id')
+                .annotate(
+                    participants_count=Count('pk'),
+                    contribution_count=Sum('contribution_count'),
+                    total_points=Sum('total_points'),
+                    last_earned=Max('last_earned'),
+                )
+            )
+        ]
+        ContributionTypeStatistics.objects.all().delete()
+        ContributionTypeStatistics.objects.bulk_create(statistics, batch_size=1000)
+    return len(statistics), len(participants)
+
+
+# Fields whose change alters a type's statistics.
+STATISTICS_FIELDS = frozenset({'user', 'contribution_type', 'frozen_global_points', 'contribution_date'})
+
+
+def _statistics_snapshot(values):
+    return {
+        'contribution_type_id': values['contribution_type_id'],
+        'user_id': values['user_id'],
+        'frozen_global_points': values['frozen_global_points'],
+        'contribution_date': values['contribution_date'],
+    }
+
+
+@receiver(pre_save, sender=Contribution)
+def remember_contribution_statistics(sender, instance, **kwargs):
+    """Load the stored statistics fields so post_save can tell what moved."""
+    instance._statistics_previous = None
+    update_fields = kwargs.get('update_fields')
+    if (
+        kwargs.get('raw', False)
+        or instance._state.adding
+        or (update_fields is not None and not STATISTICS_FIELDS.intersection(update_fields))
+    ):
+        return
+    stored = Contribution.objects.filter(pk=instance.pk).values(
+        'contribution_type_id', 'user_id', 'frozen_global_points', 'contribution_date',
+    ).first()
+    if stored is not None:
+        instance._statistics_previous = _statistics_snapshot(stored)
+
+
+@receiver(post_save, sender=Contribution)
+def refresh_statistics_on_contribution_save(sender, instance, created, **kwargs):
+    """Keep the type statistics rollups current as contributions change."""
+    if kwargs.get('raw', False):
+        return
+    current = _statistics_snapshot(vars(instance))
+    previous = getattr(instance, '_statistics_previous', None)
+    if not created and (previous is None or previous == current):
+        return
+    snapshots = [current] if created else [previous, current]
+    refresh_contribution_type_statistics(
+        (snapshot['contribution_type_id'], snapshot['user_id']) for snapshot in snapshots
+    )
+
+
+@receiver(post_delete, sender=Contribution)
+def refresh_statistics_on_contribution_delete(sender, instance, **kwargs):
+    refresh_contribution_type_statistics(
+        [(instance.contribution_type_id, instance.user_id)],
+        create=False,
+    )
+
+
 def is_community_contribution(contribution):
     """Return whether a contribution belongs to the community category."""
     contribution_type = getattr(contribution, 'contribution_type', None)
@@ -804,7 +1118,7 @@ def sync_social_task_completion_discord_xp_state(sender, instance, **kwargs):
     sync_discord_xp_state_for_social_task_completion(instance)
 
 
-class SubmittedContribution(BaseModel):
+class SubmittedContribution(CounterFieldsMixin, BaseModel):
     """
     Represents a contribution submission that needs staff review.
     Once accepted, it will be converted to an actual Contribution.
@@ -1042,10 +1356,31 @@ class SubmittedContribution(BaseModel):
 
     # Edit tracking
     last_edited_at = models.DateTimeField(null=True, blank=True)
-    
+
+    # Denormalized counters for the steward list view. Maintained by the
+    # Evidence/SubmissionNote/ReviewProposal signal receivers below (and by
+    # refresh_submission_counters() after bulk writes), never by save().
+    evidence_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of evidence items attached to this submission."
+    )
+    internal_notes_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of internal steward notes on this submission."
+    )
+    has_ai_proposal = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="True once an AI review proposal has been recorded for this submission."
+    )
+
+    COUNTER_FIELDS = ('evidence_count', 'internal_notes_count', 'has_ai_proposal')
+
     def __str__(self):
         return f"{self.user} - {self.contribution_type} - {self.state}"
-    
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Submitted Contribution"
@@ -1061,6 +1396,40 @@ class SubmittedContribution(BaseModel):
         ]
 
 
+class UserWeeklySubmissionCount(models.Model):
+    """
+    Submissions a user created for a contribution type in one Monday-Sunday
+    UTC week, every state included. Backs the weekly per-user limit so the
+    capacity check and the catalog listing read one row instead of counting.
+    Maintained by the submission receivers; see adjust_weekly_submission_counts.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='weekly_submission_counts',
+    )
+    contribution_type = models.ForeignKey(
+        ContributionType,
+        on_delete=models.CASCADE,
+        related_name='weekly_submission_counts',
+    )
+    week_start = models.DateField(help_text="Monday (UTC) the week starts on.")
+    submission_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "User Weekly Submission Count"
+        verbose_name_plural = "User Weekly Submission Counts"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'contribution_type', 'week_start'],
+                name='unique_user_type_week_submission_count',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.contribution_type} - {self.week_start}: {self.submission_count}"
+
+
 class SubmissionNote(BaseModel):
     """
     Internal CRM note on a submitted contribution.
@@ -1614,6 +1983,73 @@ class EvidenceURLType(BaseModel):
         return self.name
 
 
+@receiver(post_save, sender=EvidenceURLType)
+@receiver(post_delete, sender=EvidenceURLType)
+def invalidate_evidence_url_type_matcher(sender, **kwargs):
+    """Drop the compiled URL type matcher whenever a type changes."""
+    from .url_utils import invalidate_url_type_matcher
+    invalidate_url_type_matcher()
+
+
+def refresh_submission_counters(submission_ids):
+    """
+    Recompute the denormalized list counters for the given submissions.
+
+    Counts are recomputed from the child tables in a single UPDATE rather
+    than incremented, so concurrent writers converge on the right value.
+    ``updated_at`` is left alone: it backs the stewards' optimistic
+    concurrency checks and a new note is not an edit of the submission.
+    """
+    from django.db.models import Count, Exists, IntegerField, OuterRef, Subquery, Value
+    from django.db.models.functions import Coalesce
+
+    submission_ids = {submission_id for submission_id in submission_ids if submission_id}
+    if not submission_ids:
+        return 0
+
+    def _count(model):
+        return Coalesce(
+            Subquery(
+                model.objects.filter(submitted_contribution_id=OuterRef('pk'))
+                .order_by()
+                .values('submitted_contribution_id')
+                .annotate(count=Count('pk'))
+                .values('count'),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+            output_field=IntegerField(),
+        )
+
+    return SubmittedContribution.objects.filter(pk__in=submission_ids).update(
+        evidence_count=_count(Evidence),
+        internal_notes_count=_count(SubmissionNote),
+        has_ai_proposal=Exists(
+            ReviewProposal.objects.filter(
+                submitted_contribution_id=OuterRef('pk'),
+                source=ReviewProposal.SOURCE_AI,
+            )
+        ),
+    )
+
+
+@receiver(post_save, sender=Evidence)
+@receiver(post_save, sender=SubmissionNote)
+@receiver(post_save, sender=ReviewProposal)
+def refresh_counters_on_child_save(sender, instance, created, **kwargs):
+    """Keep SubmittedContribution list counters current as children are added."""
+    if created and not kwargs.get('raw', False):
+        refresh_submission_counters([instance.submitted_contribution_id])
+
+
+@receiver(post_delete, sender=Evidence)
+@receiver(post_delete, sender=SubmissionNote)
+@receiver(post_delete, sender=ReviewProposal)
+def refresh_counters_on_child_delete(sender, instance, **kwargs):
+    """Keep SubmittedContribution list counters current as children are removed."""
+    refresh_submission_counters([instance.submitted_contribution_id])
+
+
 class BlocklistedURL(BaseModel):
     """
     URL prefixes that are not valid evidence for submissions.
@@ -1654,7 +2090,7 @@ class BlocklistedURL(BaseModel):
         return self.url_prefix
 
 
-class Mission(BaseModel):
+class Mission(CounterFieldsMixin, BaseModel):
     """
     Represents a mission to be featured on the dashboard and contribution type pages.
     Staff can create missions with custom descriptions and time periods.
@@ -1698,6 +2134,16 @@ class Mission(BaseModel):
             "per user for this mission. Leave blank for unlimited."
         ),
     )
+    active_submission_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text=(
+            "Non-rejected, non-canceled submissions for this mission. Maintained "
+            "by the submission receivers; see refresh_capacity_counters."
+        ),
+    )
+
+    COUNTER_FIELDS = ('active_submission_count',)
 
     class Meta:
         ordering = ['-created_at']
@@ -1728,12 +2174,7 @@ class Mission(BaseModel):
         Rejected and canceled submissions do not consume capacity so a bad or
         withdrawn submission can reopen a slot.
         """
-        annotated_count = getattr(self, 'submission_count', None)
-        if annotated_count is not None:
-            return annotated_count
-        return self.submissions.exclude(
-            state__in=['rejected', 'canceled']
-        ).count()
+        return self.active_submission_count
 
     def submissions_remaining(self):
         if self.max_submissions is None:
@@ -1756,7 +2197,7 @@ class Mission(BaseModel):
         if annotated_count is not None:
             return annotated_count
         return self.submissions.filter(user=user).exclude(
-            state__in=['rejected', 'canceled']
+            state__in=NON_CAPACITY_STATES
         ).count()
 
     def user_submissions_remaining(self, user):
@@ -1783,6 +2224,250 @@ class Mission(BaseModel):
         return f"{self.name} - {self.contribution_type.name}"
 
 
+def _active_submission_count(fk_name):
+    from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+    from django.db.models.functions import Coalesce
+
+    return Coalesce(
+        Subquery(
+            SubmittedContribution.objects.filter(**{fk_name: OuterRef('pk')})
+            .exclude(state__in=NON_CAPACITY_STATES)
+            .order_by()
+            .values(fk_name)
+            .annotate(count=Count('pk'))
+            .values('count'),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+        output_field=IntegerField(),
+    )
+
+
+def refresh_capacity_counters(contribution_type_ids=(), mission_ids=()):
+    """
+    Recompute active_submission_count for the given types and missions.
+
+    This is the repair path used by ``reconcile_capacity_counters``; normal
+    writes move the counters with adjust_capacity_counters instead. The rows
+    are locked (in pk order) before their counts are read, so a recount
+    cannot interleave with a delta another writer is applying.
+    """
+    from django.db import transaction
+
+    contribution_type_ids = sorted({pk for pk in contribution_type_ids if pk})
+    mission_ids = sorted({pk for pk in mission_ids if pk})
+    with transaction.atomic():
+        if contribution_type_ids:
+            locked = ContributionType.objects.select_for_update().filter(pk__in=contribution_type_ids)
+            list(locked.order_by('pk').values_list('pk', flat=True))
+            ContributionType.objects.filter(pk__in=contribution_type_ids).update(
+                active_submission_count=_active_submission_count('contribution_type_id'),
+            )
+        if mission_ids:
+            locked = Mission.objects.select_for_update().filter(pk__in=mission_ids)
+            list(locked.order_by('pk').values_list('pk', flat=True))
+            Mission.objects.filter(pk__in=mission_ids).update(
+                active_submission_count=_active_submission_count('mission_id'),
+            )
+
+
+def _apply_counter_deltas(queryset, field, deltas):
+    from django.db.models import F, Value
+    from django.db.models.functions import Greatest
+
+    for pk, delta in sorted(deltas.items()):
+        if delta:
+            queryset.filter(pk=pk).update(**{field: Greatest(F(field) + delta, Value(0))})
+
+
+def adjust_capacity_counters(changes):
+    """
+    Move active_submission_count by (contribution_type_id, mission_id, delta)
+    changes.
+
+    Each counter is one ``UPDATE ... SET n = n + delta`` in pk order, so a
+    submission only holds its type and mission rows for that statement and
+    never recounts the type's submissions. Deltas for the same row are
+    netted first, so moving a submission between states that both consume
+    capacity touches nothing. Counters never go below zero; drift from
+    writes that skip the receivers is repaired by ``reconcile_capacity_counters``.
+    """
+    from collections import Counter
+
+    from django.db import transaction
+
+    type_deltas = Counter()
+    mission_deltas = Counter()
+    for contribution_type_id, mission_id, delta in changes:
+        if contribution_type_id:
+            type_deltas[contribution_type_id] += delta
+        if mission_id:
+            mission_deltas[mission_id] += delta
+    if not any(type_deltas.values()) and not any(mission_deltas.values()):
+        return
+    with transaction.atomic():
+        _apply_counter_deltas(ContributionType.objects, 'active_submission_count', type_deltas)
+        _apply_counter_deltas(Mission.objects, 'active_submission_count', mission_deltas)
+
+
+def release_capacity_for_submissions(previous_states):
+    """
+    Release capacity for submissions a bulk ``QuerySet.update`` moved into a
+    non-capacity state.
+
+    ``previous_states`` maps submission id to its state before the update;
+    only the ones that were consuming capacity give a slot back.
+    """
+    released = [
+        pk for pk, state in previous_states.items()
+        if state not in NON_CAPACITY_STATES
+    ]
+    if not released:
+        return
+    adjust_capacity_counters(
+        (contribution_type_id, mission_id, -1)
+        for contribution_type_id, mission_id in (
+            SubmittedContribution.objects.filter(pk__in=released)
+            .order_by()
+            .values_list('contribution_type_id', 'mission_id')
+        )
+    )
+
+
+def weekly_submission_count_key(user_id, contribution_type_id, created_at):
+    week_start, _ = utc_week_bounds(created_at)
+    return user_id, contribution_type_id, week_start.date()
+
+
+def adjust_weekly_submission_counts(changes, create=True):
+    """
+    Move UserWeeklySubmissionCount rows by
+    ((user_id, contribution_type_id, week_start), delta) changes.
+
+    A row gaining a submission is created at zero first if it is the user's
+    first submission of the week, then incremented in place. With
+    create=False existing rows are only updated, never added; the delete
+    receiver uses that because it also runs while the user or the
+    contribution type itself is being deleted.
+    """
+    from collections import Counter
+
+    from django.db import transaction
+    from django.db.models import F, Value
+    from django.db.models.functions import Greatest
+
+    deltas = Counter()
+    for key, delta in changes:
+        deltas[key] += delta
+    with transaction.atomic():
+        for (user_id, contribution_type_id, week_start), delta in sorted(deltas.items()):
+            if not delta:
+                continue
+            if create and delta > 0:
+                UserWeeklySubmissionCount.objects.bulk_create(
+                    [UserWeeklySubmissionCount(
+                        user_id=user_id,
+                        contribution_type_id=contribution_type_id,
+                        week_start=week_start,
+                    )],
+                    ignore_conflicts=True,
+                )
+            UserWeeklySubmissionCount.objects.filter(
+                user_id=user_id,
+                contribution_type_id=contribution_type_id,
+                week_start=week_start,
+            ).update(submission_count=Greatest(F('submission_count') + delta, Value(0)))
+
+
+# Fields whose change moves a submission between capacity counters.
+CAPACITY_FIELDS = frozenset({'state', 'user', 'contribution_type', 'mission'})
+
+
+def _capacity_snapshot(values):
+    return {
+        'consumes_capacity': values['state'] not in NON_CAPACITY_STATES,
+        'user_id': values['user_id'],
+        'contribution_type_id': values['contribution_type_id'],
+        'mission_id': values['mission_id'],
+        'created_at': values['created_at'],
+    }
+
+
+def _capacity_change(snapshot, delta):
+    if not snapshot['consumes_capacity']:
+        return []
+    return [(snapshot['contribution_type_id'], snapshot['mission_id'], delta)]
+
+
+def _weekly_change(snapshot, delta):
+    return [(
+        weekly_submission_count_key(
+            snapshot['user_id'],
+            snapshot['contribution_type_id'],
+            snapshot['created_at'],
+        ),
+        delta,
+    )]
+
+
+@receiver(pre_save, sender=SubmittedContribution)
+def remember_submission_capacity(sender, instance, **kwargs):
+    """Load the stored capacity fields so post_save can tell what moved."""
+    instance._capacity_previous = None
+    update_fields = kwargs.get('update_fields')
+    if (
+        kwargs.get('raw', False)
+        or instance._state.adding
+        or (update_fields is not None and not CAPACITY_FIELDS.intersection(update_fields))
+    ):
+        return
+    stored = SubmittedContribution.objects.filter(pk=instance.pk).values(
+        'state', 'user_id', 'contribution_type_id', 'mission_id', 'created_at',
+    ).first()
+    if stored is not None:
+        instance._capacity_previous = _capacity_snapshot(stored)
+
+
+@receiver(post_save, sender=SubmittedContribution)
+def refresh_capacity_on_submission_save(sender, instance, created, **kwargs):
+    """
+    Move type, mission and weekly counters by the submission's transition:
+    -1 where it stopped counting, +1 where it started.
+    """
+    if kwargs.get('raw', False):
+        return
+    current = _capacity_snapshot(vars(instance))
+    previous = getattr(instance, '_capacity_previous', None)
+    if created:
+        adjust_capacity_counters(_capacity_change(current, 1))
+        adjust_weekly_submission_counts(_weekly_change(current, 1))
+        return
+    if previous is None or previous == current:
+        return
+
+    adjust_capacity_counters(
+        _capacity_change(previous, -1) + _capacity_change(current, 1)
+    )
+    if any(
+        previous[field] != current[field]
+        for field in ('user_id', 'contribution_type_id', 'created_at')
+    ):
+        adjust_weekly_submission_counts(
+            _weekly_change(previous, -1) + _weekly_change(current, 1)
+        )
+
+
+@receiver(post_delete, sender=SubmittedContribution)
+def refresh_capacity_on_submission_delete(sender, instance, **kwargs):
+    """Release the deleted submission's capacity and weekly quota."""
+    deleted = _capacity_snapshot({
+        field: getattr(instance, field)
+        for field in ('state', 'user_id', 'contribution_type_id', 'mission_id', 'created_at')
+    })
+    adjust_capacity_counters(_capacity_change(deleted, -1))
+    adjust_weekly_submission_counts(_weekly_change(deleted, -1), create=False)
+
+
 class ContributionHighlight(BaseModel):
     """
     Represents a highlighted contribution to be featured on the dashboard and contribution type pages.
@@ -49,7 +49,15 @@ def project_contribution_display_title(contribution):
 
 def project_contribution_github_url(contribution):
     """First GitHub evidence URL of a Projects contribution (the reviewed repo)."""
-    for evidence in contribution.evidence_items.filter(url__gt='').order_by('created_at'):
+    prefetched = getattr(contribution, '_prefetched_objects_cache', {}).get('evidence_items')
+    if prefetched is not None:
+        evidence_items = sorted(
+            (evidence for evidence in prefetched if evidence.url),
+            key=lambda evidence: evidence.created_at,
+        )
+    else:
+        evidence_items = contribution.evidence_items.filter(url__gt='').order_by('created_at')
+    for evidence in evidence_items:
         if 'github.com' in evidence.url.lower():
             return evidence.url
     return ''
@@ -9,6 +9,7 @@ from .models import (
     DiscordXPDistributionEvent, ProjectMilestoneReview, ReviewProposal,
     AIReviewFeedback, SubmissionMoreInfoResponse,
 )
+from . import catalog
 from .ai_attribution import AI_STEWARD_EMAIL
 from .ai_feedback import normalize_feedback_payload
 from .rubric_review import (
@@ -849,8 +850,7 @@ class SubmittedContributionSerializer(MoreInfoRequestsMixin, serializers.ModelSe
         checking, and handle ownership validation.
         """
         from .url_utils import (
-            detect_url_type, normalize_url, check_duplicate_url,
-            validate_handle_ownership,
+            check_duplicate_urls, detect_url_types, validate_handle_ownership,
         )
 
         if evidence_items_data is None:
@@ -917,6 +917,14 @@ class SubmittedContributionSerializer(MoreInfoRequestsMixin, serializers.ModelSe
                     accepted_qs.values_list('id', flat=True)
                 ) | required_type_ids | group_type_ids
 
+        # Classify and duplicate-check every URL up front: one in-memory
+        # pass plus a single evidence query, however many items there are.
+        urls = [item['url'] for item in evidence_validated if item.get('url')]
+        url_types = detect_url_types(urls)
+        duplicate_messages = check_duplicate_urls(
+            urls, exclude_submission_id=exclude_submission_id,
+        )
+
         errors = []
         has_required_match = not required_type_ids  # satisfied if none required
         for i, item in enumerate(evidence_validated):
@@ -925,7 +933,7 @@ class SubmittedContributionSerializer(MoreInfoRequestsMixin, serializers.ModelSe
                 continue
 
             # 1. Auto-detect URL type
-            url_type = detect_url_type(url)
+            url_type = url_types[url]
             item['_detected_url_type'] = url_type
 
             # Track whether any URL satisfies the required-type rule
@@ -961,7 +969,7 @@ class SubmittedContributionSerializer(MoreInfoRequestsMixin, serializers.ModelSe
                 continue  # Skip further checks for this URL
 
             # 3. Duplicate URL check
-            dup_msg = check_duplicate_url(url, exclude_submission_id=exclude_submission_id)
+            dup_msg = duplicate_messages[url]
             if dup_msg:
                 errors.append({
                     'index': i,
@@ -1223,7 +1231,7 @@ class ContributionHighlightSerializer(serializers.ModelSerializer):
     def get_user_has_validator_waitlist(self, obj):
         """Check if user has validator-waitlist contribution."""
         try:
-            waitlist_type = ContributionType.objects.get(slug='validator-waitlist')
+            waitlist_type = catalog.get_contribution_type('validator-waitlist')
             return Contribution.objects.filter(
                 user=obj.contribution.user,
                 contribution_type=waitlist_type
@@ -1234,7 +1242,7 @@ class ContributionHighlightSerializer(serializers.ModelSerializer):
     def get_user_has_builder_welcome(self, obj):
         """Check if user has builder-welcome contribution."""
         try:
-            welcome_type = ContributionType.objects.get(slug='builder-welcome')
+            welcome_type = catalog.get_contribution_type('builder-welcome')
             return Contribution.objects.filter(
                 user=obj.contribution.user,
                 contribution_type=welcome_type
@@ -1669,7 +1677,7 @@ class StewardSubmissionSerializer(MoreInfoRequestsMixin, serializers.ModelSerial
                   'proposal_questioned_by', 'proposal_questioned_by_details',
                   'proposal_questioned_at',
                   'rubric_review', 'ai_analysis',
-                  'notes_count', 'is_interesting', 'gate_reviewed', 'escalated_at',
+                  'notes_count', 'evidence_count', 'has_ai_proposal', 'is_interesting', 'gate_reviewed', 'escalated_at',
                   'has_appeal', 'appeal_reason', 'appealed_at', 'more_info_requests',
                   'created_at', 'updated_at', 'last_edited_at', 'converted_contribution', 'contribution',
                   'mission', 'project_contribution', 'milestone_version']
@@ -1688,7 +1696,8 @@ class StewardSubmissionSerializer(MoreInfoRequestsMixin, serializers.ModelSerial
                             'created_at', 'updated_at', 'last_edited_at', 'proposed_points',
                             'is_interesting', 'gate_reviewed', 'escalated_at',
                             'has_appeal', 'appeal_reason', 'appealed_at',
-                            'converted_contribution', 'mission', 'milestone_version']
+                            'converted_contribution', 'mission', 'milestone_version',
+                            'evidence_count', 'has_ai_proposal']
 
     def get_user_details(self, obj):
         use_light = self.context.get('use_light_serializers', False)
@@ -1723,17 +1732,33 @@ class StewardSubmissionSerializer(MoreInfoRequestsMixin, serializers.ModelSerial
     def get_contribution_type_details(self, obj):
         use_light = self.context.get('use_light_serializers', False)
         if use_light:
+            annotated_multiplier = getattr(
+                obj,
+                'contribution_type_current_multiplier_value',
+                None,
+            )
+            if annotated_multiplier is not None:
+                obj.contribution_type.current_multiplier_value = annotated_multiplier
             return LightContributionTypeSerializer(obj.contribution_type).data
         return ContributionTypeSerializer(obj.contribution_type, context=self.context).data
 
     def get_evidence_items(self, obj):
-        evidence_items = obj.evidence_items.all().order_by('-created_at')
+        evidence_items = getattr(obj, 'evidence_rows', None)
+        if evidence_items is None:
+            evidence_items = obj.evidence_items.all().order_by('-created_at')
         return EvidenceSerializer(evidence_items, many=True, context=self.context).data
 
     def get_contribution(self, obj):
         if obj.converted_contribution:
             if self.context.get('use_light_serializers', False):
                 contribution = obj.converted_contribution
+                annotated_multiplier = getattr(
+                    obj,
+                    'converted_type_current_multiplier_value',
+                    None,
+                )
+                if annotated_multiplier is not None:
+                    contribution.contribution_type.current_multiplier_value = annotated_multiplier
                 highlight = next(iter(contribution.highlights.all()), None)
                 return {
                     'id': contribution.id,
@@ -1872,13 +1897,8 @@ class StewardSubmissionSerializer(MoreInfoRequestsMixin, serializers.ModelSerial
         }
 
     def get_notes_count(self, obj):
-        if hasattr(obj, 'internal_notes_count'):
-            return obj.internal_notes_count
-
-        # Use prefetched data if available
-        if hasattr(obj, '_prefetched_objects_cache') and 'internal_notes' in obj._prefetched_objects_cache:
-            return len(obj._prefetched_objects_cache['internal_notes'])
-        return obj.internal_notes.count()
+        # Denormalized counter maintained by the SubmissionNote receivers.
+        return obj.internal_notes_count
 
     def to_representation(self, instance):
         ret = super().to_representation(instance)
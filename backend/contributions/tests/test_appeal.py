@@ -253,6 +253,29 @@ class AppealEndpointTest(TestCase):
         self.assertIsNone(submission.reviewed_by)
         self.assertIsNone(submission.reviewed_at)
 
+    def test_add_evidence_rejects_duplicate_url(self):
+        other_submission = SubmittedContribution.objects.create(
+            user=self.other,
+            contribution_type=self.contribution_type,
+            contribution_date=timezone.now(),
+        )
+        Evidence.objects.create(
+            submitted_contribution=other_submission,
+            url='https://example.com/already-submitted',
+        )
+        submission = self._make_submission(state='more_info_needed')
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.post(
+            f'/api/v1/submissions/{submission.id}/add-evidence/',
+            {'url': 'https://example.com/already-submitted/'},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('already been submitted', response.data['error'])
+        self.assertFalse(submission.evidence_items.exists())
+
     def test_appealed_more_info_needed_submission_can_be_patched(self):
         """Once a steward asks for more info on an appealed submission,
         the submitter can edit it to respond."""
@@ -0,0 +1,125 @@
+from datetime import timedelta
+
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from contributions import catalog
+from contributions.models import Category, ContributionType
+from leaderboard.models import GlobalLeaderboardMultiplier
+
+
+class ContributionCatalogTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.category = Category.objects.create(name='Catalog', slug='catalog')
+        self.contribution_type = ContributionType.objects.create(
+            name='Catalog Type',
+            slug='catalog-type',
+            category=self.category,
+            min_points=1,
+            max_points=10,
+        )
+        for days_ago, value in ((30, 1), (10, 2), (1, 3)):
+            GlobalLeaderboardMultiplier.objects.create(
+                contribution_type=self.contribution_type,
+                multiplier_value=value,
+                valid_from=self.now - timedelta(days=days_ago),
+            )
+
+    def test_active_multiplier_is_the_latest_started_at_each_date(self):
+        def value_at(at_date):
+            _, value = GlobalLeaderboardMultiplier.get_active_for_type(self.contribution_type, at_date)
+            return value
+
+        self.assertEqual(value_at(self.now - timedelta(days=20)), 1)
+        self.assertEqual(value_at(self.now - timedelta(days=10)), 2)
+        self.assertEqual(value_at(self.now), 3)
+        self.assertEqual(value_at((self.now - timedelta(days=5)).date()), 2)
+        with self.assertRaises(GlobalLeaderboardMultiplier.DoesNotExist):
+            value_at(self.now - timedelta(days=31))
+
+    def test_version_bump_from_another_worker_retires_the_catalog(self):
+        self.assertEqual(GlobalLeaderboardMultiplier.get_current_multiplier_value(self.contribution_type), 3)
+        # Written by another worker: the row is new to this process, and only
+        # the shared version token tells it so.
+        GlobalLeaderboardMultiplier.objects.bulk_create([GlobalLeaderboardMultiplier(
+            contribution_type=self.contribution_type,
+            multiplier_value=7,
+            valid_from=self.now,
+        )])
+        _, value = GlobalLeaderboardMultiplier.get_active_for_type(self.contribution_type)
+        self.assertEqual(value, 3)
+
+        caches['shared'].set(catalog.CATALOG_VERSION_KEY, 'bumped-by-another-worker', None)
+
+        _, value = GlobalLeaderboardMultiplier.get_active_for_type(self.contribution_type)
+        self.assertEqual(value, 7)
+
+    def test_warm_lookups_run_no_queries(self):
+        catalog.get_catalog()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(catalog.get_category('catalog').pk, self.category.pk)
+            contribution_type = catalog.get_contribution_type('catalog-type')
+            self.assertEqual(contribution_type.category.slug, 'catalog')
+            self.assertEqual(
+                GlobalLeaderboardMultiplier.get_current_multiplier_value(contribution_type),
+                3,
+            )
+
+        self.assertEqual(len(queries), 0)
+
+    def test_unknown_slugs_raise_does_not_exist(self):
+        with self.assertRaises(Category.DoesNotExist):
+            catalog.get_category('missing')
+        with self.assertRaises(ContributionType.DoesNotExist):
+            catalog.get_contribution_type('missing')
+
+    def test_saving_a_multiplier_retires_the_catalog(self):
+        self.assertEqual(GlobalLeaderboardMultiplier.get_current_multiplier_value(self.contribution_type), 3)
+
+        GlobalLeaderboardMultiplier.objects.create(
+            contribution_type=self.contribution_type,
+            multiplier_value=5,
+            valid_from=self.now,
+        )
+
+        self.assertEqual(GlobalLeaderboardMultiplier.get_current_multiplier_value(self.contribution_type), 5)
+
+    def test_lookups_return_copies(self):
+        catalog.get_contribution_type('catalog-type').name = 'Changed'
+
+        self.assertEqual(catalog.get_contribution_type('catalog-type').name, 'Catalog Type')
+
+    def test_catalog_read_in_a_rolled_back_block_is_not_served(self):
+        class Rollback(Exception):
+            pass
+
+        with self.assertRaises(Rollback):
+            with transaction.atomic():
+                ContributionType.objects.create(
+                    name='Rolled Back',
+                    slug='rolled-back',
+                    category=self.category,
+                )
+                catalog.get_contribution_type('rolled-back')
+                raise Rollback
+
+        with self.assertRaises(ContributionType.DoesNotExist):
+            catalog.get_contribution_type('rolled-back')
+
+
+class ContributionCatalogTransactionTests(TransactionTestCase):
+    def test_catalog_read_in_a_transaction_without_catalog_writes_is_kept(self):
+        Category.objects.create(name='Committed', slug='committed')
+
+        with transaction.atomic():
+            loaded = catalog.get_catalog()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertIs(catalog.get_catalog(), loaded)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(catalog.get_category('committed').name, 'Committed')
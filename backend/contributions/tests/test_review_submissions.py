@@ -543,6 +543,58 @@ class RuleDuplicateUrlNormalizationTest(Tier1RuleTestBase):
         )
 
 
+class NormalizedUrlLookupTest(Tier1RuleTestBase):
+    """The command loads only index rows sharing a URL with its batch."""
+
+    def _build_lookup(self, evidence_items=None):
+        from contributions.management.commands.review_submissions import Command
+        return Command()._build_url_lookup(evidence_items)
+
+    def test_targeted_lookup_loads_only_batch_urls(self):
+        older = self._create_submission(
+            user=self.other_user,
+            created_at=timezone.now() - timezone.timedelta(hours=2),
+        )
+        self._add_evidence(older, url='https://example.com/shared')
+        self._add_evidence(older, url='https://example.com/unrelated')
+
+        new = self._create_submission()
+        ev = self._add_evidence(new, url='https://example.com/shared/')
+
+        url_to_sub_ids, accepted_urls, created_at = self._build_lookup([ev])
+        self.assertEqual(
+            set(url_to_sub_ids), {_normalize_url('https://example.com/shared')},
+        )
+        self.assertEqual(
+            url_to_sub_ids[_normalize_url('https://example.com/shared')],
+            {older.id, new.id},
+        )
+        result = rule_duplicate_evidence_url(
+            new, [ev], url_to_sub_ids, accepted_urls,
+            submitted_created_at=created_at,
+        )
+        self.assertIsNotNone(result)
+
+    def test_targeted_lookup_includes_accepted_contributions(self):
+        contribution = Contribution.objects.create(
+            user=self.other_user,
+            contribution_type=self.ctype,
+            points=10,
+            multiplier_at_creation=1,
+            frozen_global_points=10,
+        )
+        Evidence.objects.create(
+            contribution=contribution, url='https://example.com/accepted',
+        )
+        new = self._create_submission()
+        ev = self._add_evidence(new, url='https://example.com/accepted')
+
+        _, accepted_urls, _ = self._build_lookup([ev])
+        self.assertEqual(
+            accepted_urls, {_normalize_url('https://example.com/accepted')},
+        )
+
+
 class AutoBanTest(TestCase):
     """Test the auto-ban functionality in the review_submissions command."""
 
@@ -857,6 +909,88 @@ class GateReviewedCommandTest(Tier1RuleTestBase):
         self.assertIn('errors: 1', out.getvalue())
 
 
+class PipelineCommandTest(Tier1RuleTestBase):
+    """Staged read / evaluate / write pipeline of the Tier 1 command."""
+
+    def setUp(self):
+        super().setUp()
+        for label in (
+            'Reject: No Evidence',
+            'Reject: Duplicate Submission',
+            'Reject: Invalid Evidence URL',
+        ):
+            ReviewTemplate.objects.create(label=label, text=label, action='reject')
+        self.original = self._create_submission(
+            notes='Original',
+            created_at=timezone.now() - timezone.timedelta(hours=2),
+        )
+        self._add_evidence(self.original, url='https://example.com/original')
+        self.copy = self._create_submission(user=self.other_user, notes='Copy')
+        self._add_evidence(self.copy, url='https://example.com/original/')
+        self.empty = self._create_submission(notes='No evidence')
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command('review_submissions', '--batch-size', '0', *args, stdout=out)
+        for submission in (self.original, self.copy, self.empty):
+            submission.refresh_from_db()
+        return out.getvalue()
+
+    def test_rejections_write_notes_and_transitions(self):
+        from contributions.models import SubmissionNote, SubmissionStateTransition
+        self._run()
+
+        self.assertEqual(self.original.state, 'pending')
+        self.assertTrue(self.original.gate_reviewed)
+        for submission, label in (
+            (self.copy, 'Reject: Duplicate Submission'),
+            (self.empty, 'Reject: No Evidence'),
+        ):
+            self.assertEqual(submission.state, 'rejected')
+            self.assertEqual(submission.staff_reply, label)
+            self.assertTrue(submission.gate_reviewed)
+            self.assertIsNotNone(submission.reviewed_by)
+            note = SubmissionNote.objects.get(submitted_contribution=submission)
+            self.assertEqual(note.data['staff_reply'], label)
+            transition = SubmissionStateTransition.objects.get(
+                submitted_contribution=submission,
+                event=SubmissionStateTransition.EVENT_GATE_REJECT,
+            )
+            self.assertEqual(
+                (transition.from_state, transition.to_state),
+                ('pending', 'rejected'),
+            )
+
+    def test_worker_pool_matches_in_process_results(self):
+        out = self._run('--workers', '2')
+
+        self.assertEqual(self.original.state, 'pending')
+        self.assertEqual(self.copy.state, 'rejected')
+        self.assertEqual(self.empty.state, 'rejected')
+        self.assertIn('rejected: 2', out)
+        self.assertIn('passed: 1', out)
+
+    def test_summary_reports_stage_throughput(self):
+        out = self._run()
+        self.assertIn('STAGES', out)
+        for stage in ('read: 3', 'evaluate: 3', 'write: 3'):
+            self.assertIn(stage, out)
+
+    def test_submission_changed_after_read_is_not_overwritten(self):
+        from contributions.management.commands.review_submissions import Command
+
+        template = ReviewTemplate.objects.get(label='Reject: No Evidence')
+        SubmittedContribution.objects.filter(pk=self.empty.pk).update(
+            state='accepted',
+        )
+        applied = Command()._apply_rejections(
+            [(self.empty.id, template, 'reason')], self.user,
+        )
+        self.assertEqual(applied, 0)
+        self.empty.refresh_from_db()
+        self.assertEqual(self.empty.state, 'accepted')
+
+
 class SubmissionIdDuplicateDeterminismTest(Tier1RuleTestBase):
     """Targeted review runs should keep duplicate handling deterministic."""
 
@@ -201,7 +201,7 @@ class SubmissionStateTransitionTest(TestCase):
 
         response = self.client.post(
             f'/api/v1/submissions/{fresh.id}/add-evidence/',
-            {'url': 'https://example.com/proof'},
+            {'url': 'https://example.com/other-proof'},
             format='json',
         )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
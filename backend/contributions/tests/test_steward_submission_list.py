@@ -0,0 +1,237 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from contributions.models import (
+    Category,
+    Contribution,
+    ContributionType,
+    Evidence,
+    ReviewProposal,
+    SubmissionNote,
+    SubmittedContribution,
+    refresh_submission_counters,
+)
+from leaderboard.models import GlobalLeaderboardMultiplier
+from stewards.models import Steward, StewardPermission
+
+
+User = get_user_model()
+
+
+class StewardListFixtureMixin:
+    def setUp(self):
+        self.category = Category.objects.create(
+            name='List Category',
+            slug='list-category',
+            description='List category',
+        )
+        self.contribution_type = ContributionType.objects.create(
+            name='List Type',
+            slug='list-type',
+            description='List contribution type',
+            category=self.category,
+            min_points=0,
+            max_points=100,
+        )
+        GlobalLeaderboardMultiplier.objects.create(
+            contribution_type=self.contribution_type,
+            multiplier_value=1,
+            valid_from=timezone.now() - timezone.timedelta(days=1),
+        )
+        self.submitter = User.objects.create_user(
+            email='list-submitter@test.com',
+            address='0x1111111111111111111111111111111111111111',
+            password='testpass123',
+        )
+        self.steward_user = User.objects.create_user(
+            email='list-steward@test.com',
+            address='0x2222222222222222222222222222222222222222',
+            password='testpass123',
+        )
+        self.steward = Steward.objects.create(user=self.steward_user)
+        StewardPermission.objects.create(
+            steward=self.steward,
+            contribution_type=self.contribution_type,
+            action='accept',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.steward_user)
+
+    def _make_submission(self, index, *, accepted=False):
+        contribution = None
+        if accepted:
+            contribution = Contribution.objects.create(
+                user=self.submitter,
+                contribution_type=self.contribution_type,
+                contribution_date=timezone.now(),
+                points=10,
+                title=f'Accepted {index}',
+            )
+        submission = SubmittedContribution.objects.create(
+            user=self.submitter,
+            contribution_type=self.contribution_type,
+            contribution_date=timezone.now(),
+            notes=f'Submission {index}',
+            state='accepted' if accepted else 'pending',
+            converted_contribution=contribution,
+        )
+        Evidence.objects.create(
+            submitted_contribution=submission,
+            url=f'https://example.com/list/{index}/a',
+        )
+        Evidence.objects.create(
+            submitted_contribution=submission,
+            url=f'https://example.com/list/{index}/b',
+        )
+        SubmissionNote.objects.create(
+            submitted_contribution=submission,
+            user=self.steward_user,
+            message=f'Note {index}',
+        )
+        ReviewProposal.objects.create(
+            submitted_contribution=submission,
+            source=ReviewProposal.SOURCE_AI,
+            action='accept',
+            points=5,
+        )
+        return submission
+
+
+class SubmissionCounterTests(StewardListFixtureMixin, TestCase):
+    def test_counters_follow_child_writes(self):
+        submission = self._make_submission(1)
+        submission.refresh_from_db()
+        self.assertEqual(submission.evidence_count, 2)
+        self.assertEqual(submission.internal_notes_count, 1)
+        self.assertTrue(submission.has_ai_proposal)
+
+        submission.evidence_items.first().delete()
+        submission.internal_notes.all().delete()
+        submission.review_proposals.all().delete()
+        submission.refresh_from_db()
+        self.assertEqual(submission.evidence_count, 1)
+        self.assertEqual(submission.internal_notes_count, 0)
+        self.assertFalse(submission.has_ai_proposal)
+
+    def test_full_save_of_stale_instance_keeps_counters(self):
+        submission = SubmittedContribution.objects.create(
+            user=self.submitter,
+            contribution_type=self.contribution_type,
+            contribution_date=timezone.now(),
+        )
+        SubmissionNote.objects.create(
+            submitted_contribution_id=submission.id,
+            user=self.steward_user,
+            message='Added behind the instance',
+        )
+
+        submission.notes = 'Edited'
+        submission.save()
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.notes, 'Edited')
+        self.assertEqual(submission.internal_notes_count, 1)
+
+    def test_full_save_of_deleted_row_inserts_it_again(self):
+        submission = SubmittedContribution.objects.create(
+            user=self.submitter,
+            contribution_type=self.contribution_type,
+            contribution_date=timezone.now(),
+        )
+        SubmittedContribution.objects.filter(pk=submission.pk).delete()
+
+        submission.notes = 'Restored'
+        submission.save()
+
+        self.assertEqual(SubmittedContribution.objects.get(pk=submission.pk).notes, 'Restored')
+
+    def test_refresh_recomputes_after_bulk_create(self):
+        submission = SubmittedContribution.objects.create(
+            user=self.submitter,
+            contribution_type=self.contribution_type,
+            contribution_date=timezone.now(),
+        )
+        SubmissionNote.objects.bulk_create([
+            SubmissionNote(
+                submitted_contribution=submission,
+                user=self.steward_user,
+                message=f'Bulk note {index}',
+            )
+            for index in range(3)
+        ])
+        previous_updated_at = SubmittedContribution.objects.get(pk=submission.pk).updated_at
+
+        self.assertEqual(refresh_submission_counters([submission.id]), 1)
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.internal_notes_count, 3)
+        self.assertEqual(submission.updated_at, previous_updated_at)
+
+
+class StewardSubmissionListQueryTests(StewardListFixtureMixin, TestCase):
+    """
+    Benchmark for the steward list page: query count and render time of a
+    full 50-item page against a 5-item page.
+    """
+
+    def _fetch_page(self, page_size):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = self.client.get(
+                '/api/v1/steward-submissions/',
+                {'page_size': page_size},
+            )
+            elapsed = time.perf_counter() - started
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), page_size)
+        return response, len(queries), elapsed
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        for index in range(50):
+            self._make_submission(index, accepted=index % 2 == 0)
+
+        _, small_queries, _ = self._fetch_page(5)
+        response, full_queries, elapsed = self._fetch_page(50)
+
+        self.assertEqual(full_queries, small_queries)
+        # Generous ceiling: a 50-item page must stay interactive even on CI.
+        self.assertLess(elapsed, 5)
+
+        item = response.data['results'][0]
+        self.assertEqual(item['evidence_count'], 2)
+        self.assertEqual(len(item['evidence_items']), 2)
+        self.assertEqual(item['notes_count'], 1)
+        self.assertTrue(item['has_ai_proposal'])
+        self.assertIsNotNone(item['ai_analysis'])
+
+    def test_full_page_query_count(self):
+        for index in range(50):
+            self._make_submission(index)
+
+        with self.assertNumQueries(8):
+            response = self.client.get('/api/v1/steward-submissions/', {'page_size': 50})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 50)
+
+    def test_list_does_not_join_profiles_it_never_renders(self):
+        self._make_submission(1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/steward-submissions/')
+
+        self.assertEqual(response.status_code, 200)
+        page_sql = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT')
+            and '"contributions_submittedcontribution"."evidence_count"' in query['sql']
+        ]
+        self.assertEqual(len(page_sql), 1)
+        self.assertNotIn('"validators_validator"', page_sql[0])
+        self.assertNotIn('github_access_token', page_sql[0])
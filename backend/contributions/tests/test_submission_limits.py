@@ -1,7 +1,9 @@
 from datetime import timedelta, timezone as datetime_timezone
+from io import StringIO
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.db import connection
 from django.test import TestCase
 from django.test.utils import CaptureQueriesContext
@@ -9,7 +11,14 @@ from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from contributions.models import Category, ContributionType, Mission, SubmittedContribution
+from contributions.models import (
+    Category,
+    ContributionType,
+    Mission,
+    SubmittedContribution,
+    UserWeeklySubmissionCount,
+    release_capacity_for_submissions,
+)
 from utils.dates import utc_week_bounds
 
 User = get_user_model()
@@ -65,6 +74,14 @@ class SubmissionLimitTest(TestCase):
             state=state,
         )
 
+    def _backdate(self, submissions, created_at):
+        # QuerySet.update skips the counter receivers; reconcile like an
+        # operator would after a bulk write.
+        SubmittedContribution.objects.filter(
+            pk__in=[submission.pk for submission in submissions],
+        ).update(created_at=created_at)
+        call_command('reconcile_capacity_counters', stdout=StringIO())
+
     def _post_submission(self, contribution_type=None, mission=None):
         payload = {
             'contribution_type': (contribution_type or self.contribution_type).id,
@@ -325,9 +342,7 @@ class SubmissionLimitTest(TestCase):
             user=self.user,
         )
         week_start, _ = utc_week_bounds()
-        SubmittedContribution.objects.filter(pk=old_submission.pk).update(
-            created_at=week_start - timedelta(microseconds=1),
-        )
+        self._backdate([old_submission], week_start - timedelta(microseconds=1))
 
         response = self._post_submission()
 
@@ -387,9 +402,7 @@ class SubmissionLimitTest(TestCase):
         )
         week_start, _ = utc_week_bounds()
         previous_week = week_start - timedelta(days=1)
-        SubmittedContribution.objects.filter(
-            pk__in=[existing_target.pk, source_submission.pk],
-        ).update(created_at=previous_week)
+        self._backdate([existing_target, source_submission], previous_week)
 
         response = self.client.patch(
             f'/api/v1/submissions/{source_submission.id}/',
@@ -421,9 +434,7 @@ class SubmissionLimitTest(TestCase):
             contribution_type=source_type,
         )
         week_start, _ = utc_week_bounds()
-        SubmittedContribution.objects.filter(pk=source_submission.pk).update(
-            created_at=week_start - timedelta(days=1),
-        )
+        self._backdate([source_submission], week_start - timedelta(days=1))
 
         response = self.client.patch(
             f'/api/v1/submissions/{source_submission.id}/',
@@ -452,3 +463,131 @@ class SubmissionLimitTest(TestCase):
 
         self.assertEqual(week_start.isoformat(), '2026-07-20T00:00:00+00:00')
         self.assertEqual(week_end.isoformat(), '2026-07-27T00:00:00+00:00')
+
+
+class CapacityCounterTest(TestCase):
+    """Tests the maintained capacity counters behind the submission limits."""
+
+    def setUp(self):
+        category = Category.objects.create(name='Counters', slug='counters')
+        self.contribution_type = ContributionType.objects.create(
+            name='Counted Type',
+            slug='counted-type',
+            category=category,
+            min_points=1,
+            max_points=10,
+        )
+        self.mission = Mission.objects.create(
+            name='Counted Mission',
+            description='Test mission',
+            contribution_type=self.contribution_type,
+        )
+        self.user = User.objects.create_user(
+            email='counter@test.com',
+            address='0x3333333333333333333333333333333333333333',
+            password='testpass123',
+        )
+
+    def _create_submission(self, state='pending'):
+        return SubmittedContribution.objects.create(
+            user=self.user,
+            contribution_type=self.contribution_type,
+            mission=self.mission,
+            contribution_date=timezone.now(),
+            notes='Counted submission',
+            state=state,
+        )
+
+    def _counts(self):
+        self.contribution_type.refresh_from_db()
+        self.mission.refresh_from_db()
+        return (
+            self.contribution_type.get_submission_count(),
+            self.mission.get_submission_count(),
+            self.contribution_type.get_user_weekly_submission_count(self.user),
+        )
+
+    def test_counters_follow_state_transitions_and_deletes(self):
+        submission = self._create_submission()
+        self._create_submission(state='canceled')
+        self.assertEqual(self._counts(), (1, 1, 2))
+
+        submission.state = 'rejected'
+        submission.save()
+        self.assertEqual(self._counts(), (0, 0, 2))
+
+        submission.state = 'pending'
+        submission.save()
+        self.assertEqual(self._counts(), (1, 1, 2))
+
+        submission.delete()
+        self.assertEqual(self._counts(), (0, 0, 1))
+
+    def test_retyping_moves_the_submission_between_counters(self):
+        other_type = ContributionType.objects.create(
+            name='Other Counted Type',
+            slug='other-counted-type',
+            category=self.contribution_type.category,
+            min_points=1,
+            max_points=10,
+        )
+        submission = self._create_submission()
+
+        submission.contribution_type = other_type
+        submission.mission = None
+        submission.save()
+
+        other_type.refresh_from_db()
+        self.assertEqual(self._counts(), (0, 0, 0))
+        self.assertEqual(other_type.get_submission_count(), 1)
+        self.assertEqual(other_type.get_user_weekly_submission_count(self.user), 1)
+
+    def test_transitions_move_counters_without_recounting(self):
+        submission = self._create_submission()
+        self._create_submission()
+
+        submission.state = 'rejected'
+        with CaptureQueriesContext(connection) as queries:
+            submission.save()
+
+        counter_updates = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('UPDATE') and 'active_submission_count' in query['sql']
+        ]
+        self.assertEqual(len(counter_updates), 2)
+        self.assertFalse(any('COUNT(' in sql for sql in counter_updates))
+        self.assertEqual(self._counts(), (1, 1, 2))
+
+    def test_bulk_rejection_releases_only_consuming_submissions(self):
+        pending = self._create_submission()
+        canceled = self._create_submission(state='canceled')
+        previous_states = {pending.pk: 'pending', canceled.pk: 'canceled'}
+        SubmittedContribution.objects.filter(pk__in=previous_states).update(state='rejected')
+
+        release_capacity_for_submissions(previous_states)
+
+        self.assertEqual(self._counts(), (0, 0, 2))
+
+    def test_full_save_of_a_type_keeps_its_counter(self):
+        stale_type = ContributionType.objects.get(pk=self.contribution_type.pk)
+        self._create_submission()
+
+        stale_type.description = 'Edited in admin'
+        stale_type.save()
+
+        self.assertEqual(self._counts()[0], 1)
+
+    def test_reconcile_command_repairs_drift(self):
+        self._create_submission()
+        self._create_submission()
+        SubmittedContribution.objects.update(state='rejected')
+        UserWeeklySubmissionCount.objects.update(submission_count=7)
+        self.assertEqual(self._counts(), (2, 2, 7))
+
+        out = StringIO()
+        call_command('reconcile_capacity_counters', '--dry-run', stdout=out)
+        self.assertIn('1 contribution type(s), 1 mission(s), 1 weekly count(s)', out.getvalue())
+        self.assertEqual(self._counts(), (2, 2, 7))
+
+        call_command('reconcile_capacity_counters', stdout=StringIO())
+        self.assertEqual(self._counts(), (0, 0, 2))
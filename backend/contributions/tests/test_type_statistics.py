@@ -0,0 +1,155 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from contributions.models import (
+    Category,
+    Contribution,
+    ContributionType,
+    ContributionTypeParticipant,
+    ContributionTypeStatistics,
+)
+from leaderboard.models import GlobalLeaderboardMultiplier
+
+User = get_user_model()
+
+
+class ContributionTypeStatisticsTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.category = Category.objects.create(name='Statistics', slug='statistics')
+        self.contribution_type = ContributionType.objects.create(
+            name='Counted Type',
+            slug='counted-type',
+            category=self.category,
+            min_points=1,
+            max_points=100,
+        )
+        self.other_type = ContributionType.objects.create(
+            name='Other Type',
+            slug='other-type',
+            category=self.category,
+            min_points=1,
+            max_points=100,
+        )
+        for contribution_type in (self.contribution_type, self.other_type):
+            GlobalLeaderboardMultiplier.objects.create(
+                contribution_type=contribution_type,
+                multiplier_value=2,
+                valid_from=self.now - timedelta(days=30),
+            )
+        self.alice = User.objects.create_user(
+            email='alice@test.com',
+            address='0x4444444444444444444444444444444444444444',
+            password='testpass123',
+        )
+        self.bob = User.objects.create_user(
+            email='bob@test.com',
+            address='0x5555555555555555555555555555555555555555',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.alice)
+
+    def _contribute(self, user, points, days_ago=0, contribution_type=None):
+        return Contribution.objects.create(
+            user=user,
+            contribution_type=contribution_type or self.contribution_type,
+            points=points,
+            contribution_date=self.now - timedelta(days=days_ago),
+        )
+
+    def _statistics(self):
+        response = self.client.get('/api/v1/contribution-types/statistics/', {
+            'category': 'statistics',
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {item['id']: item for item in response.json()}
+
+    def test_statistics_follow_contribution_writes(self):
+        first = self._contribute(self.alice, 10, days_ago=5)
+        self._contribute(self.alice, 5, days_ago=3)
+        latest = self._contribute(self.bob, 20, days_ago=1)
+
+        stats = self._statistics()[self.contribution_type.id]
+        self.assertEqual(stats['count'], 3)
+        self.assertEqual(stats['participants_count'], 2)
+        self.assertEqual(stats['total_points_given'], 70)
+        self.assertEqual(stats['current_multiplier'], 2.0)
+
+        latest.delete()
+        first.contribution_type = self.other_type
+        first.save()
+
+        stats = self._statistics()
+        self.assertEqual(stats[self.contribution_type.id]['count'], 1)
+        self.assertEqual(stats[self.contribution_type.id]['participants_count'], 1)
+        self.assertEqual(stats[self.contribution_type.id]['total_points_given'], 10)
+        self.assertEqual(stats[self.other_type.id]['count'], 1)
+        self.assertEqual(stats[self.other_type.id]['total_points_given'], 20)
+        rollup = ContributionTypeStatistics.objects.get(contribution_type=self.contribution_type)
+        self.assertEqual(rollup.last_earned, self.now - timedelta(days=3))
+
+    def test_type_row_takes_deltas_instead_of_a_type_wide_recount(self):
+        self._contribute(self.alice, 10, days_ago=2)
+        ContributionTypeStatistics.objects.filter(contribution_type=self.contribution_type).update(
+            contribution_count=100,
+            participants_count=50,
+        )
+
+        self._contribute(self.bob, 5, days_ago=1)
+        later = self._contribute(self.bob, 5)
+
+        rollup = ContributionTypeStatistics.objects.get(contribution_type=self.contribution_type)
+        self.assertEqual((rollup.contribution_count, rollup.participants_count), (102, 51))
+        self.assertEqual(rollup.total_points, 40)
+        self.assertEqual(rollup.last_earned, self.now)
+
+        later.delete()
+        rollup.refresh_from_db()
+        self.assertEqual((rollup.contribution_count, rollup.participants_count), (101, 51))
+        self.assertEqual(rollup.last_earned, self.now - timedelta(days=1))
+
+    def test_top_contributors_come_from_participant_rollups(self):
+        self._contribute(self.alice, 10)
+        self._contribute(self.alice, 10)
+        self._contribute(self.bob, 30)
+
+        response = self.client.get(
+            f'/api/v1/contribution-types/{self.contribution_type.id}/top_contributors/'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item['id'], item['total_points'], item['contribution_count']) for item in response.data],
+            [(self.bob.id, 60, 1), (self.alice.id, 40, 2)],
+        )
+
+    def test_rebuild_command_matches_incremental_rollups(self):
+        self._contribute(self.alice, 10, days_ago=2)
+        self._contribute(self.bob, 20, days_ago=1)
+        self._contribute(self.bob, 5, contribution_type=self.other_type)
+
+        def snapshot():
+            return (
+                sorted(ContributionTypeParticipant.objects.values_list(
+                    'contribution_type_id', 'user_id', 'contribution_count', 'total_points', 'last_earned',
+                )),
+                sorted(ContributionTypeStatistics.objects.values_list(
+                    'contribution_type_id', 'contribution_count', 'participants_count', 'total_points', 'last_earned',
+                )),
+            )
+
+        incremental = snapshot()
+        ContributionTypeStatistics.objects.all().delete()
+        ContributionTypeParticipant.objects.all().delete()
+
+        call_command('rebuild_contribution_type_statistics', stdout=StringIO())
+
+        self.assertEqual(snapshot(), incremental)
@@ -2,11 +2,14 @@ from django.test import TestCase
 
 from contributions.models import EvidenceURLType
 from contributions.url_utils import (
+    clear_url_type_matcher,
     normalize_url,
     detect_url_type,
+    detect_url_types,
     extract_handle,
     validate_handle_ownership,
     check_duplicate_url,
+    check_duplicate_urls,
 )
 
 
@@ -263,6 +266,66 @@ class DetectUrlTypeTests(EvidenceURLTypeSeededTestCase):
         self.assertEqual(result.slug, 'other')
 
 
+class UrlTypeMatcherCacheTests(TestCase):
+    """The compiled matcher is shared across calls and dropped on writes."""
+
+    def setUp(self):
+        self.addCleanup(clear_url_type_matcher)
+        # Run the on-commit invalidation so the matcher becomes cacheable,
+        # as it would after the admin transaction commits.
+        with self.captureOnCommitCallbacks(execute=True):
+            for data in EVIDENCE_URL_TYPES:
+                EvidenceURLType.objects.update_or_create(
+                    slug=data['slug'],
+                    defaults=data,
+                )
+
+    def test_repeat_detection_costs_no_queries(self):
+        detect_url_type('https://x.com/genlayer/status/1')
+        with self.assertNumQueries(0):
+            result = detect_url_type('https://github.com/genlayer/studio/pull/42')
+            results = detect_url_types([
+                'https://x.com/genlayer/status/2',
+                'https://random-site.com/page',
+            ])
+        self.assertEqual(result.slug, 'github-pr')
+        self.assertEqual(results['https://x.com/genlayer/status/2'].slug, 'x-post')
+        self.assertTrue(results['https://random-site.com/page'].is_generic)
+
+    def test_save_invalidates_matcher(self):
+        url = 'https://medium.com/@user/post'
+        self.assertTrue(detect_url_type(url).is_generic)
+        with self.captureOnCommitCallbacks(execute=True):
+            EvidenceURLType.objects.create(
+                name='Medium Article',
+                slug='medium-article',
+                url_patterns=[r'^https?://(www\.)?medium\.com/'],
+                order=0,
+            )
+        self.assertEqual(detect_url_type(url).slug, 'medium-article')
+
+    def test_delete_invalidates_matcher(self):
+        url = 'https://x.com/genlayer/status/3'
+        self.assertEqual(detect_url_type(url).slug, 'x-post')
+        with self.captureOnCommitCallbacks(execute=True):
+            EvidenceURLType.objects.get(slug='x-post').delete()
+        self.assertTrue(detect_url_type(url).is_generic)
+
+    def test_uncommitted_write_is_not_cached(self):
+        """A matcher built mid-transaction after a type write must not be
+        reused, since the write could still roll back."""
+        EvidenceURLType.objects.filter(slug='x-post').delete()
+        EvidenceURLType.objects.create(
+            name='Medium Article',
+            slug='medium-article',
+            url_patterns=[r'^https?://(www\.)?medium\.com/'],
+        )
+        url = 'https://medium.com/@user/post'
+        self.assertEqual(detect_url_type(url).slug, 'medium-article')
+        with self.assertNumQueries(1):
+            detect_url_type(url)
+
+
 class ExtractHandleTests(EvidenceURLTypeSeededTestCase):
     """Tests for handle extraction from URLs."""
 
@@ -470,6 +533,46 @@ class CheckDuplicateUrlTests(EvidenceURLTypeSeededTestCase):
         )
         self.assertIsNone(result)
 
+    def test_batch_returns_per_url_results(self):
+        from contributions.models import Contribution, Evidence
+        contribution = Contribution.objects.create(
+            user=self.user,
+            contribution_type=self.ctype,
+            points=10,
+            multiplier_at_creation=1,
+            frozen_global_points=10,
+        )
+        Evidence.objects.create(
+            contribution=contribution,
+            url='https://github.com/user/accepted',
+            description='accepted evidence',
+        )
+        results = check_duplicate_urls([
+            'https://github.com/user/repo/',
+            'https://github.com/user/accepted',
+            'https://github.com/other/different-repo',
+        ])
+        self.assertEqual(results['https://github.com/user/repo/'], (
+            'This URL has already been submitted.'
+        ))
+        self.assertIn(
+            'accepted contribution',
+            results['https://github.com/user/accepted'],
+        )
+        self.assertIsNone(results['https://github.com/other/different-repo'])
+
+    def test_batch_query_count_is_independent_of_url_count(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as single:
+            check_duplicate_urls(['https://github.com/user/repo'])
+        urls = [f'https://github.com/user/repo-{i}' for i in range(10)]
+        with CaptureQueriesContext(connection) as many:
+            results = check_duplicate_urls(urls)
+        self.assertEqual(len(many), len(single))
+        self.assertEqual(results, {url: None for url in urls})
+
 
 class CheckDuplicateUrlAllowDuplicateTests(EvidenceURLTypeSeededTestCase):
     """Tests for the ``allow_duplicate`` exemption in ``check_duplicate_url``.
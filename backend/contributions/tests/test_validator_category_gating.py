@@ -335,6 +335,7 @@ class ValidatorCategorySubmitGatingTest(TestCase):
             notes='Original notes',
             state='pending',
         )
+        self.capacity_limited_type.refresh_from_db()
         self.assertTrue(self.capacity_limited_type.is_full())
         self.client.force_authenticate(user=self.plain_user)
 
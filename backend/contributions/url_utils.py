@@ -1,6 +1,11 @@
 import re
+import threading
+import time
 from urllib.parse import urlparse, urlencode, parse_qs
 
+from django.db import transaction
+from django.db.models import Q
+
 
 # Query params to always strip during normalization
 TRACKING_PARAMS = {'utm_source', 'utm_medium', 'utm_campaign', 'utm_term',
@@ -85,26 +90,127 @@ def normalize_url(url):
     return f"{scheme}://{host}{path}{query_string}"
 
 
+# EvidenceURLType rows only change through the admin, so the compiled
+# pattern list is built once per process and dropped by the post_save /
+# post_delete receivers in models.py. Receivers only reach the worker that
+# handled the write; other workers pick up admin edits within the TTL.
+URL_TYPE_MATCHER_TTL_SECONDS = 300
+
+_url_type_matcher = None
+_url_type_matcher_built_at = 0.0
+_url_type_matcher_lock = threading.Lock()
+_url_type_state = threading.local()
+
+
+class EvidenceURLTypeMatcher:
+    """Ordered, pre-compiled EvidenceURLType patterns.
+
+    Holds the non-generic types in match order plus the generic fallback.
+    Patterns that fail to compile are skipped, as ``detect_url_type`` always
+    did. Matching never touches the database.
+    """
+
+    def __init__(self, url_types):
+        self.rules = []
+        self.generic = None
+        for url_type in url_types:
+            if url_type.is_generic:
+                if self.generic is None:
+                    self.generic = url_type
+                continue
+            for pattern in url_type.url_patterns or []:
+                try:
+                    compiled = re.compile(pattern, re.IGNORECASE)
+                except (re.error, TypeError):
+                    continue
+                self.rules.append((compiled, url_type))
+
+    @classmethod
+    def load(cls):
+        from .models import EvidenceURLType
+        return cls(EvidenceURLType.objects.order_by('order', 'name'))
+
+    def match(self, url):
+        """Return the first matching type, or the generic type."""
+        for compiled, url_type in self.rules:
+            if compiled.search(url):
+                return url_type
+        return self.generic
+
+    def match_many(self, urls):
+        """Classify several URLs at once. Returns ``{url: EvidenceURLType}``."""
+        return {url: self.match(url) for url in urls}
+
+
+def _matcher_is_cacheable():
+    # A matcher built inside a transaction that has itself written
+    # EvidenceURLType rows would outlive a rollback, so only cache once those
+    # writes are committed (see invalidate_url_type_matcher).
+    if not transaction.get_connection().in_atomic_block:
+        _url_type_state.uncommitted_change = False
+        return True
+    return not getattr(_url_type_state, 'uncommitted_change', False)
+
+
+def get_url_type_matcher():
+    """Return the process-level EvidenceURLTypeMatcher, building it on a miss."""
+    global _url_type_matcher, _url_type_matcher_built_at
+
+    if not _matcher_is_cacheable():
+        return EvidenceURLTypeMatcher.load()
+
+    now = time.monotonic()
+    matcher = _url_type_matcher
+    if matcher is not None and now - _url_type_matcher_built_at < URL_TYPE_MATCHER_TTL_SECONDS:
+        return matcher
+
+    with _url_type_matcher_lock:
+        if (
+            _url_type_matcher is None
+            or now - _url_type_matcher_built_at >= URL_TYPE_MATCHER_TTL_SECONDS
+        ):
+            _url_type_matcher = EvidenceURLTypeMatcher.load()
+            _url_type_matcher_built_at = time.monotonic()
+        return _url_type_matcher
+
+
+def clear_url_type_matcher():
+    """Drop the cached matcher. Intended for tests and management commands."""
+    global _url_type_matcher
+    with _url_type_matcher_lock:
+        _url_type_matcher = None
+
+
+def _clear_after_commit():
+    _url_type_state.uncommitted_change = False
+    clear_url_type_matcher()
+
+
+def invalidate_url_type_matcher():
+    """Drop the matcher after an EvidenceURLType write.
+
+    Inside a transaction the matcher is also kept out of the cache until the
+    write commits, and dropped once more on commit.
+    """
+    clear_url_type_matcher()
+    if transaction.get_connection().in_atomic_block:
+        _url_type_state.uncommitted_change = True
+        transaction.on_commit(_clear_after_commit)
+
+
 def detect_url_type(url):
     """Detect the EvidenceURLType for a URL by matching against stored patterns.
 
     Returns the first matching EvidenceURLType, or the generic type if none match.
-    Results are cached per-request via the caller; this function always queries the DB.
+    Matching runs against the process-level compiled matcher, so repeated
+    calls cost no queries.
     """
-    from .models import EvidenceURLType
-
-    url_types = EvidenceURLType.objects.filter(is_generic=False).order_by('order')
-    for url_type in url_types:
-        for pattern in url_type.url_patterns:
-            try:
-                if re.search(pattern, url, re.IGNORECASE):
-                    return url_type
-            except re.error:
-                continue
+    return get_url_type_matcher().match(url)
+
 
-    # Fallback to generic type
-    generic = EvidenceURLType.objects.filter(is_generic=True).first()
-    return generic
+def detect_url_types(urls):
+    """Batch form of ``detect_url_type``. Returns ``{url: EvidenceURLType}``."""
+    return get_url_type_matcher().match_many(urls)
 
 
 def extract_handle(url, evidence_url_type):
@@ -190,54 +296,87 @@ def validate_handle_ownership(url, evidence_url_type, user):
     return None
 
 
-def check_duplicate_url(url, exclude_submission_id=None):
-    """Check if a normalized URL already exists in evidence for active submissions.
+DUPLICATE_SUBMISSION_MESSAGE = "This URL has already been submitted."
+DUPLICATE_CONTRIBUTION_MESSAGE = (
+    "This URL has already been submitted in an accepted contribution."
+)
+ACTIVE_SUBMISSION_STATES = ('pending', 'accepted', 'more_info_needed')
 
-    Checks against submissions with state: pending, accepted, more_info_needed.
-    Also checks against accepted contributions (Evidence linked to Contribution).
 
-    URL types flagged with ``allow_duplicate=True`` are exempt — both the
-    incoming URL and any stored evidence of such a type are skipped.
+def check_duplicate_urls(urls, exclude_submission_id=None):
+    """Batch form of ``check_duplicate_url``.
 
-    Uses the indexed normalized_url field for fast lookups.
+    Normalizes and classifies every URL in memory, then resolves duplicates
+    against both submitted and accepted evidence with a single
+    ``normalized_url__in`` query.
 
-    Returns a description string if duplicate found, or None.
+    Returns ``{url: description or None}`` with one entry per input URL.
     """
     from .models import Evidence
 
-    normalized = normalize_url(url)
-    if not normalized:
-        return None
+    results = {url: None for url in urls}
+    matcher = get_url_type_matcher()
+    normalized_by_url = {}
+    for url in results:
+        normalized = normalize_url(url)
+        if not normalized:
+            continue
+        # If the incoming URL itself maps to a permissive type, skip the check.
+        incoming_type = matcher.match(url)
+        if incoming_type and incoming_type.allow_duplicate:
+            continue
+        normalized_by_url[url] = normalized
+
+    if not normalized_by_url:
+        return results
+
+    # A Contribution row only exists once the submission has been accepted,
+    # so contribution__isnull=False is sufficient. Filtering on
+    # frozen_global_points would incorrectly skip legitimate zero-point
+    # accepted contributions. Evidence whose stored url_type allows
+    # duplicates never counts.
+    active_submission = Q(submitted_contribution__state__in=ACTIVE_SUBMISSION_STATES)
+    if exclude_submission_id:
+        active_submission &= ~Q(submitted_contribution_id=exclude_submission_id)
+    rows = (
+        Evidence.objects
+        .filter(normalized_url__in=set(normalized_by_url.values()))
+        .filter(active_submission | Q(contribution__isnull=False))
+        .exclude(url_type__allow_duplicate=True)
+        .values_list('normalized_url', 'contribution_id')
+    )
+    submitted = set()
+    accepted = set()
+    for normalized, contribution_id in rows:
+        if contribution_id is None:
+            submitted.add(normalized)
+        else:
+            accepted.add(normalized)
+
+    for url, normalized in normalized_by_url.items():
+        if normalized in submitted:
+            results[url] = DUPLICATE_SUBMISSION_MESSAGE
+        elif normalized in accepted:
+            results[url] = DUPLICATE_CONTRIBUTION_MESSAGE
+    return results
 
-    # If the incoming URL itself maps to a permissive type, skip the check.
-    incoming_type = detect_url_type(url)
-    if incoming_type and incoming_type.allow_duplicate:
-        return None
 
-    # Check evidence on submitted contributions (pending/accepted/more_info_needed).
-    # Exclude evidence whose stored url_type allows duplicates.
-    submission_qs = Evidence.objects.filter(
-        normalized_url=normalized,
-        submitted_contribution__isnull=False,
-        submitted_contribution__state__in=['pending', 'accepted', 'more_info_needed'],
-    ).exclude(url_type__allow_duplicate=True)
+def check_duplicate_url(url, exclude_submission_id=None):
+    """Check if a normalized URL already exists in evidence for active submissions.
 
-    if exclude_submission_id:
-        submission_qs = submission_qs.exclude(
-            submitted_contribution__id=exclude_submission_id,
-        )
+    Checks against submissions with state: pending, accepted, more_info_needed.
+    Also checks against accepted contributions (Evidence linked to Contribution).
 
-    if submission_qs.exists():
-        return "This URL has already been submitted."
+    URL types flagged with ``allow_duplicate=True`` are exempt — both the
+    incoming URL and any stored evidence of such a type are skipped.
 
-    # Check evidence on accepted contributions. A Contribution row only
-    # exists once the submission has been accepted, so contribution__isnull=False
-    # is sufficient. Filtering on frozen_global_points would incorrectly
-    # skip legitimate zero-point accepted contributions.
-    if Evidence.objects.filter(
-        normalized_url=normalized,
-        contribution__isnull=False,
-    ).exclude(url_type__allow_duplicate=True).exists():
-        return "This URL has already been submitted in an accepted contribution."
+    Uses the indexed normalized_url field for fast lookups. Callers with
+    several URLs should use ``check_duplicate_urls``.
 
-    return None
+    Returns a description string if duplicate found, or None.
+    """
+    if not url:
+        return None
+    return check_duplicate_urls(
+        [url], exclude_submission_id=exclude_submission_id,
+    )[url]
@@ -32,7 +32,10 @@ from .models import (
     Mission, StartupRequest,
     FeaturedContent, Alert, ContributionDiscordXPState,
     DiscordXPDistributionEvent, ProjectMilestoneReview, ReviewProposal,
-    AIReviewFeedback,
+    AIReviewFeedback, UserWeeklySubmissionCount, ContributionTypeParticipant,
+    NON_CAPACITY_STATES,
+    refresh_submission_counters,
+    release_capacity_for_submissions,
     sync_discord_xp_state_for_contribution,
 )
 from .ai_feedback import fetch_reviewed_commit_sha, resolve_proposal_binding
@@ -77,7 +80,7 @@ from .project_milestones import (
     project_contribution_github_url,
 )
 from .ai_attribution import AI_STEWARD_EMAIL
-from .url_utils import normalize_url
+from .url_utils import check_duplicate_urls, normalize_url
 from leaderboard.models import GlobalLeaderboardMultiplier
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from ethereum_auth.authentication import EthereumAuthentication
@@ -100,25 +103,14 @@ class ContributionTypeViewSet(viewsets.ReadOnlyModelViewSet):
     ordering_fields = ['name', 'created_at']
     
     def get_queryset(self):
-        active_submissions = SubmittedContribution.objects.exclude(
-            state__in=['rejected', 'canceled']
-        )
-        submission_count = active_submissions.filter(
-            contribution_type_id=OuterRef('pk')
-        ).values('contribution_type_id').annotate(
-            count=Count('pk')
-        ).values('count')
+        # Capacity comes from the maintained active_submission_count and
+        # UserWeeklySubmissionCount rows; nothing is aggregated per request.
         multiplier_field = DecimalField(max_digits=10, decimal_places=2)
         current_multiplier = GlobalLeaderboardMultiplier.objects.filter(
             contribution_type_id=OuterRef('pk')
         ).order_by('-valid_from').values('multiplier_value')[:1]
 
         annotations = {
-            'submission_count': Coalesce(
-                Subquery(submission_count, output_field=IntegerField()),
-                Value(0),
-                output_field=IntegerField(),
-            ),
             'current_multiplier_value': Coalesce(
                 Subquery(current_multiplier, output_field=multiplier_field),
                 Value(1.0, output_field=multiplier_field),
@@ -127,15 +119,12 @@ class ContributionTypeViewSet(viewsets.ReadOnlyModelViewSet):
         }
         user = getattr(self.request, 'user', None)
         if user and getattr(user, 'is_authenticated', False):
-            week_start, week_end = utc_week_bounds()
-            user_weekly_submission_count = SubmittedContribution.objects.filter(
+            week_start, _ = utc_week_bounds()
+            user_weekly_submission_count = UserWeeklySubmissionCount.objects.filter(
                 contribution_type_id=OuterRef('pk'),
                 user_id=user.id,
-                created_at__gte=week_start,
-                created_at__lt=week_end,
-            ).values('contribution_type_id').annotate(
-                count=Count('pk')
-            ).values('count')
+                week_start=week_start.date(),
+            ).values('submission_count')[:1]
             annotations['user_weekly_submission_count'] = Coalesce(
                 Subquery(user_weekly_submission_count, output_field=IntegerField()),
                 Value(0),
@@ -198,30 +187,23 @@ class ContributionTypeViewSet(viewsets.ReadOnlyModelViewSet):
                 }) from err
             queryset = queryset.filter(pk=contribution_type)
         
-        multiplier_field = DecimalField(max_digits=10, decimal_places=2)
-        current_multiplier = GlobalLeaderboardMultiplier.objects.filter(
-            contribution_type_id=OuterRef('pk')
-        ).order_by('-valid_from').values('multiplier_value')[:1]
-
-        types_with_stats = queryset.annotate(
+        # Totals come from the ContributionTypeStatistics rollups maintained
+        # by contribution writes; multipliers from the catalog.
+        types_with_stats = list(queryset.annotate(
             category_slug=F('category__slug'),
-            count=Count('contributions'),
-            participants_count=Count('contributions__user', distinct=True),
-            last_earned=Coalesce(Max('contributions__contribution_date'), timezone.now()),
-            total_points_given=Coalesce(Sum('contributions__frozen_global_points'), 0),
-            current_multiplier=Coalesce(
-                Subquery(current_multiplier, output_field=multiplier_field),
-                Value(1.0, output_field=multiplier_field),
-                output_field=multiplier_field,
-            ),
+            count=Coalesce(F('statistics_rollup__contribution_count'), 0),
+            participants_count=Coalesce(F('statistics_rollup__participants_count'), 0),
+            last_earned=Coalesce(F('statistics_rollup__last_earned'), timezone.now()),
+            total_points_given=Coalesce(F('statistics_rollup__total_points'), 0),
         ).values(
             'id', 'name', 'description', 'min_points', 'max_points', 'count',
             'participants_count', 'last_earned', 'total_points_given',
-            'is_submittable', 'show_in_contributions', 'current_multiplier',
-            'category_slug',
-        )
-            
-        return Response(list(types_with_stats))
+            'is_submittable', 'show_in_contributions', 'category_slug',
+        ))
+        for row in types_with_stats:
+            row['current_multiplier'] = GlobalLeaderboardMultiplier.get_current_multiplier_value(row['id'])
+
+        return Response(types_with_stats)
     
     @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def top_contributors(self, request, pk=None):
@@ -229,18 +211,14 @@ class ContributionTypeViewSet(viewsets.ReadOnlyModelViewSet):
         Get top 10 contributors for a specific contribution type.
         Returns users with the most points for this contribution type.
         """
-        from django.db.models import Sum
         from users.serializers import LightUserSerializer
 
         contribution_type = self.get_object()
 
-        # Get top contributors by summing their frozen global points for this type
-        top_contributors = Contribution.objects.filter(
+        # Per-user totals for this type are kept in ContributionTypeParticipant.
+        top_contributors = ContributionTypeParticipant.objects.filter(
             contribution_type=contribution_type
-        ).values('user').annotate(
-            total_points=Sum('frozen_global_points'),
-            contribution_count=Count('id')
-        ).order_by('-total_points')[:10]
+        ).values('user', 'total_points', 'contribution_count').order_by('-total_points', 'user')[:10]
 
         # Fetch users directly with optimization
         user_ids = [c['user'] for c in top_contributors]
@@ -1565,6 +1543,17 @@ class SubmittedContributionViewSet(viewsets.ModelViewSet):
         serializer = SubmittedEvidenceSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
+        url = serializer.validated_data.get('url')
+        if url:
+            dup_msg = check_duplicate_urls(
+                [url], exclude_submission_id=submission.id,
+            )[url]
+            if dup_msg:
+                return Response(
+                    {'error': dup_msg},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
         # Create evidence linked to this submission
         evidence = Evidence.objects.create(
             submitted_contribution=submission,
@@ -2552,18 +2541,124 @@ class StewardSubmissionViewSet(viewsets.ReadOnlyModelViewSet):
 
         return queryset
 
+    # Wide user columns the list cards never render; deferring them keeps
+    # the joined rows of a 50-item page small.
+    LIST_DEFERRED_USER_FIELDS = ('description', 'github_access_token', 'ban_reason')
+
+    def _shared_prefetches(self):
+        """Prefetches rendered by both the list cards and the detail view."""
+        return (
+            Prefetch(
+                'evidence_items',
+                queryset=Evidence.objects.select_related('url_type').order_by('-created_at'),
+                to_attr='evidence_rows',
+            ),
+            'converted_contribution__highlights',
+            Prefetch(
+                'internal_notes',
+                queryset=SubmissionNote.objects.filter(
+                    is_proposal=False,
+                    data__action='more_info',
+                ).select_related('user').order_by('-created_at', '-id'),
+                to_attr='more_info_request_notes',
+            ),
+            Prefetch(
+                'more_info_responses',
+                queryset=SubmissionMoreInfoResponse.objects.select_related(
+                    'request_note',
+                    'requested_by',
+                    'responder',
+                ).order_by('-created_at', '-id'),
+                to_attr='more_info_response_rows',
+            ),
+            Prefetch(
+                'review_proposals',
+                queryset=ReviewProposal.objects.filter(
+                    source=ReviewProposal.SOURCE_AI,
+                ).order_by('-created_at', '-id'),
+                to_attr='ai_proposal_rows',
+            ),
+        )
+
+    def _list_queryset(self, queryset):
+        """
+        Query shape for the paginated list.
+
+        Only joins what the light serializers render: no validator/builder
+        profiles, no reviewer/assignee rows (rendered as ids), and the
+        notes/evidence/AI-proposal counts come from the denormalized
+        counter columns instead of per-row subqueries.
+        """
+        deferred = [
+            f'{prefix}__{field}'
+            for prefix in (
+                'user',
+                'converted_contribution__user',
+                'proposed_by',
+                'proposed_user',
+                'proposal_questioned_by',
+                'project_milestone_review__proposer',
+            )
+            for field in self.LIST_DEFERRED_USER_FIELDS
+        ]
+        multiplier_field = DecimalField(max_digits=10, decimal_places=2)
+
+        def current_multiplier(type_ref):
+            return Coalesce(
+                Subquery(
+                    GlobalLeaderboardMultiplier.objects.filter(
+                        contribution_type_id=OuterRef(type_ref),
+                    ).order_by('-valid_from').values('multiplier_value')[:1],
+                    output_field=multiplier_field,
+                ),
+                Value(1.0, output_field=multiplier_field),
+                output_field=multiplier_field,
+            )
+
+        return queryset.annotate(
+            contribution_type_current_multiplier_value=current_multiplier(
+                'contribution_type_id',
+            ),
+            converted_type_current_multiplier_value=current_multiplier(
+                'converted_contribution__contribution_type_id',
+            ),
+        ).select_related(
+            'user',
+            'user__githubconnection',
+            'user__twitterconnection',
+            'user__discordconnection',
+            'contribution_type',
+            'contribution_type__category',
+            'converted_contribution',
+            'converted_contribution__user',
+            'converted_contribution__contribution_type',
+            'converted_contribution__contribution_type__category',
+            'converted_contribution__mission',
+            'converted_contribution__project_contribution',
+            'mission',
+            'project_contribution',
+            'proposed_by',
+            'proposed_user',
+            'proposed_template',
+            'proposal_questioned_by',
+            'project_milestone_review',
+            'project_milestone_review__proposer',
+        ).defer(*deferred).prefetch_related(
+            *self._shared_prefetches(),
+            Prefetch(
+                'project_contribution__evidence_items',
+                queryset=Evidence.objects.only('id', 'contribution_id', 'url', 'created_at'),
+            ),
+        )
+
     def get_queryset(self):
         """Get submissions for steward review, filtered by steward permissions."""
         queryset = self._visible_submission_queryset()
+        if self.action == 'list':
+            return self._list_queryset(queryset)
 
-        notes_count = SubmissionNote.objects.filter(
-            submitted_contribution_id=OuterRef('pk')
-        ).values('submitted_contribution_id').annotate(
-            count=Count('pk')
-        ).values('count')
-
-        # Comprehensive prefetch for optimization
-        queryset = queryset.select_related(
+        # Comprehensive prefetch for the single-submission review view
+        return queryset.select_related(
             'user',
             'user__validator',
             'user__builder',
@@ -2590,44 +2685,11 @@ class StewardSubmissionViewSet(viewsets.ReadOnlyModelViewSet):
             'project_milestone_review',
             'project_milestone_review__proposer',
         ).prefetch_related(
-            'evidence_items',
-            'converted_contribution__highlights',
+            *self._shared_prefetches(),
             'project_contribution__evidence_items',
             'converted_contribution__project_contribution__evidence_items',
-            Prefetch(
-                'internal_notes',
-                queryset=SubmissionNote.objects.filter(
-                    is_proposal=False,
-                    data__action='more_info',
-                ).select_related('user').order_by('-created_at', '-id'),
-                to_attr='more_info_request_notes',
-            ),
-            Prefetch(
-                'more_info_responses',
-                queryset=SubmissionMoreInfoResponse.objects.select_related(
-                    'request_note',
-                    'requested_by',
-                    'responder',
-                ).order_by('-created_at', '-id'),
-                to_attr='more_info_response_rows',
-            ),
-            Prefetch(
-                'review_proposals',
-                queryset=ReviewProposal.objects.filter(
-                    source=ReviewProposal.SOURCE_AI,
-                ).order_by('-created_at', '-id'),
-                to_attr='ai_proposal_rows',
-            ),
-        ).annotate(
-            internal_notes_count=Coalesce(
-                Subquery(notes_count, output_field=IntegerField()),
-                Value(0),
-                output_field=IntegerField(),
-            )
         )
 
-        return queryset
-
     def get_serializer_context(self):
         """
         Add context flags to control serializer behavior.
@@ -3905,6 +3967,8 @@ class StewardSubmissionViewSet(viewsets.ReadOnlyModelViewSet):
                 )
                 for submission_id in rejected_ids
             ])
+            refresh_submission_counters(rejected_ids)
+            release_capacity_for_submissions(previous_states)
 
         from notifications.services import notify_submission_review
         reviewed_submissions = SubmittedContribution.objects.filter(
@@ -4445,38 +4509,17 @@ class MissionViewSet(viewsets.ReadOnlyModelViewSet):
                 'created_at',
             ).order_by('-created_at', '-id')
         else:
+            # Mission and type capacity come from their maintained
+            # active_submission_count columns.
             active_submissions = SubmittedContribution.objects.exclude(
-                state__in=['rejected', 'canceled']
+                state__in=NON_CAPACITY_STATES
             )
-            mission_submission_count = active_submissions.filter(
-                mission_id=OuterRef('pk')
-            ).values('mission_id').annotate(
-                count=Count('pk')
-            ).values('count')
-            contribution_type_submission_count = active_submissions.filter(
-                contribution_type_id=OuterRef('contribution_type_id')
-            ).values('contribution_type_id').annotate(
-                count=Count('pk')
-            ).values('count')
             multiplier_field = DecimalField(max_digits=10, decimal_places=2)
             current_multiplier = GlobalLeaderboardMultiplier.objects.filter(
                 contribution_type_id=OuterRef('contribution_type_id')
             ).order_by('-valid_from').values('multiplier_value')[:1]
 
             annotations = {
-                'submission_count': Coalesce(
-                    Subquery(mission_submission_count, output_field=IntegerField()),
-                    Value(0),
-                    output_field=IntegerField(),
-                ),
-                'contribution_type_submission_count': Coalesce(
-                    Subquery(
-                        contribution_type_submission_count,
-                        output_field=IntegerField(),
-                    ),
-                    Value(0),
-                    output_field=IntegerField(),
-                ),
                 'contribution_type_current_multiplier_value': Coalesce(
                     Subquery(current_multiplier, output_field=multiplier_field),
                     Value(1.0, output_field=multiplier_field),
@@ -4504,16 +4547,13 @@ class MissionViewSet(viewsets.ReadOnlyModelViewSet):
                     Value(0),
                     output_field=IntegerField(),
                 )
-                week_start, week_end = utc_week_bounds()
+                week_start, _ = utc_week_bounds()
                 contribution_type_user_weekly_submission_count = (
-                    SubmittedContribution.objects.filter(
+                    UserWeeklySubmissionCount.objects.filter(
                         contribution_type_id=OuterRef('contribution_type_id'),
                         user_id=user.id,
-                        created_at__gte=week_start,
-                        created_at__lt=week_end,
-                    ).values('contribution_type_id').annotate(
-                        count=Count('pk')
-                    ).values('count')
+                        week_start=week_start.date(),
+                    ).values('submission_count')[:1]
                 )
                 annotations['contribution_type_user_weekly_submission_count'] = Coalesce(
                     Subquery(
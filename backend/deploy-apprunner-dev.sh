@@ -112,6 +112,7 @@ if aws apprunner describe-service --service-arn arn:aws:apprunner:$REGION:$ACCOU
           "DEBUG": "$SSM_PREFIX/$SSM_ENV/debug",
           "ALLOWED_HOSTS": "$SSM_PREFIX/$SSM_ENV/allowed_hosts",
           "DATABASE_URL": "$SSM_PREFIX/$SSM_ENV/database_url",
+          "REDIS_URL": "$SSM_PREFIX/$SSM_ENV/redis_url",
           "CORS_ALLOWED_ORIGINS": "$SSM_PREFIX/$SSM_ENV/csrf_trusted_origins",
           "CSRF_TRUSTED_ORIGINS": "$SSM_PREFIX/$SSM_ENV/csrf_trusted_origins",
           "SIWE_DOMAIN": "$SSM_PREFIX/$SSM_ENV/siwe_domain",
@@ -252,6 +253,7 @@ EOF
           "DEBUG": "$SSM_PREFIX/$SSM_ENV/debug",
           "ALLOWED_HOSTS": "$SSM_PREFIX/$SSM_ENV/allowed_hosts",
           "DATABASE_URL": "$SSM_PREFIX/$SSM_ENV/database_url",
+          "REDIS_URL": "$SSM_PREFIX/$SSM_ENV/redis_url",
           "CORS_ALLOWED_ORIGINS": "$SSM_PREFIX/$SSM_ENV/csrf_trusted_origins",
           "CSRF_TRUSTED_ORIGINS": "$SSM_PREFIX/$SSM_ENV/csrf_trusted_origins",
           "SIWE_DOMAIN": "$SSM_PREFIX/$SSM_ENV/siwe_domain",
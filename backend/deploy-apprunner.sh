@@ -194,6 +194,7 @@ if aws apprunner describe-service --service-arn arn:aws:apprunner:$REGION:$ACCOU
           "DEBUG": "$SSM_PREFIX/prod/debug",
           "ALLOWED_HOSTS": "$SSM_PREFIX/prod/allowed_hosts",
           "DATABASE_URL": "$SSM_PREFIX/prod/database_url",
+          "REDIS_URL": "$SSM_PREFIX/prod/redis_url",
           "CORS_ALLOWED_ORIGINS": "$SSM_PREFIX/prod/csrf_trusted_origins",
           "CSRF_TRUSTED_ORIGINS": "$SSM_PREFIX/prod/csrf_trusted_origins",
           "SIWE_DOMAIN": "$SSM_PREFIX/prod/siwe_domain",
@@ -312,6 +313,7 @@ else
           "DEBUG": "$SSM_PREFIX/prod/debug",
           "ALLOWED_HOSTS": "$SSM_PREFIX/prod/allowed_hosts",
           "DATABASE_URL": "$SSM_PREFIX/prod/database_url",
+          "REDIS_URL": "$SSM_PREFIX/prod/redis_url",
           "CORS_ALLOWED_ORIGINS": "$SSM_PREFIX/prod/csrf_trusted_origins",
           "CSRF_TRUSTED_ORIGINS": "$SSM_PREFIX/prod/csrf_trusted_origins",
           "SIWE_DOMAIN": "$SSM_PREFIX/prod/siwe_domain",
@@ -3,7 +3,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.db import transaction
 from leaderboard.models import GlobalLeaderboardMultiplier, recalculate_all_leaderboards
-from contributions.models import Contribution
+from contributions.models import Contribution, rebuild_contribution_type_statistics
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,10 @@ class Command(BaseCommand):
                         updated_count += 1
                 
                 self.stdout.write(f'Updated {updated_count} contributions with correct multipliers')
+
+                # The updates above skip model signals, so rebuild the
+                # per-type statistics rollups from the corrected points.
+                rebuild_contribution_type_statistics()
                 
                 # Recalculate all leaderboards using the new function
                 self.stdout.write('Recalculating all leaderboard entries...')
@@ -334,10 +334,9 @@ class GlobalLeaderboardMultiplier(BaseModel):
         Get the current multiplier value for this contribution type.
         Returns the value of the most recent period, or 1.0 if none exists.
         """
-        latest_multiplier = cls.objects.filter(
-            contribution_type=contribution_type
-        ).order_by('-valid_from').first()
-        
+        from contributions.catalog import get_latest_multiplier
+
+        latest_multiplier = get_latest_multiplier(contribution_type)
         if latest_multiplier:
             return latest_multiplier.multiplier_value
         return 1.0
@@ -352,15 +351,14 @@ class GlobalLeaderboardMultiplier(BaseModel):
         Raises DoesNotExist if no multiplier exists for the contribution type or
         if no period exists for the given date.
         """
+        from contributions.catalog import get_active_multiplier
+
         at_date = at_date or timezone.now()
-        
+
         # Find the multiplier that is valid at the given date
         # (the most recent multiplier that started before or at the given date)
-        multiplier = cls.objects.filter(
-            contribution_type=contribution_type,
-            valid_from__lte=at_date
-        ).order_by('-valid_from').first()
-            
+        multiplier = get_active_multiplier(contribution_type, at_date)
+
         if not multiplier:
             raise cls.DoesNotExist(
                 f"No multiplier exists for contribution type '{contribution_type}' at {at_date}"
@@ -11,6 +11,7 @@ from contributions.models import (
     SubmittedContribution,
 )
 from builders.models import Builder
+from community_xp.membership import refresh_community_memberships
 from community_xp.models import Mee6CurrentXP, Mee6SyncRun
 from creators.models import Creator
 from leaderboard.models import GlobalLeaderboardMultiplier, LeaderboardEntry, ReferralPoints
@@ -343,6 +344,8 @@ class LeaderboardStatsTest(TestCase):
             state='pending'
         )
 
+        refresh_community_memberships()
+
         response = self.client.get('/api/v1/leaderboard/stats/')
 
         self.assertEqual(response.status_code, 200)
@@ -895,6 +898,8 @@ class LeaderboardStatsTest(TestCase):
             created_at=timezone.now() - timezone.timedelta(days=60)
         )
 
+        refresh_community_memberships([mee6_user.id])
+
         response = self.client.get('/api/v1/leaderboard/stats/', {'type': 'community'})
 
         self.assertEqual(response.status_code, 200)
@@ -406,13 +406,11 @@ class LeaderboardViewSet(viewsets.ReadOnlyModelViewSet):
             return Validator.objects.filter(user__visible=True)
 
         def compute_effective_community_summary():
-            from community_xp.utils import (
-                effective_community_ranking_queryset,
-                get_community_member_user_ids,
-            )
+            from community_xp.membership import community_member_user_ids
+            from community_xp.utils import effective_community_ranking_queryset
 
             score_queryset = effective_community_ranking_queryset(visible_only=True)
-            member_user_ids = get_community_member_user_ids(visible_only=True)
+            member_user_ids = community_member_user_ids(visible_only=True)
             return {
                 'member_user_ids': member_user_ids,
                 'total_points': score_queryset.aggregate(
@@ -563,9 +561,11 @@ class LeaderboardViewSet(viewsets.ReadOnlyModelViewSet):
 
         community_summary = get_effective_community_summary()
         community_member_count = community_summary['member_count']
-        from community_xp.utils import get_community_member_user_ids
-        new_community_members_count = len(
-            get_community_member_user_ids(visible_only=True, since=last_month)
+        from community_xp.membership import community_membership_queryset
+        new_community_members_count = (
+            community_membership_queryset(visible_only=True)
+            .filter(first_seen_at__gte=last_month)
+            .count()
         )
 
         return Response({
@@ -838,10 +838,10 @@ class LeaderboardViewSet(viewsets.ReadOnlyModelViewSet):
         """
         from users.models import User
         from users.serializers import LightUserSerializer
+        from community_xp.membership import community_member_user_ids
         from community_xp.utils import (
             build_effective_community_ranking_queryset,
             build_effective_community_scores_queryset,
-            get_community_member_user_ids,
         )
 
         try:
@@ -857,7 +857,7 @@ class LeaderboardViewSet(viewsets.ReadOnlyModelViewSet):
         offset = max(offset, 0)
 
         def compute_ranking_snapshot():
-            member_user_ids = get_community_member_user_ids(visible_only=True)
+            member_user_ids = community_member_user_ids(visible_only=True)
             return list(
                 build_effective_community_ranking_queryset(
                     user_ids=member_user_ids,
@@ -9,6 +9,7 @@ from . import campaigns
 from .models import (
     CustomNotification,
     Notification,
+    NotificationReadMark,
     NotificationReceipt,
     WhatsNewAnnouncement,
     WhatsNewAnnouncementSeen,
@@ -53,6 +54,15 @@ class NotificationReceiptAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at')
 
 
+@admin.register(NotificationReadMark)
+class NotificationReadMarkAdmin(admin.ModelAdmin):
+    list_display = ('user', 'audience', 'read_through', 'updated_at')
+    list_filter = ('audience',)
+    search_fields = ('user__email', 'user__address')
+    raw_id_fields = ('user',)
+    readonly_fields = ('created_at', 'updated_at')
+
+
 class CustomNotificationAdminForm(forms.ModelForm):
     target_roles = forms.MultipleChoiceField(
         choices=CustomNotification.ROLE_CHOICES,
@@ -114,11 +124,13 @@ class CustomNotificationAdminForm(forms.ModelForm):
 class CustomNotificationAdmin(admin.ModelAdmin):
     form = CustomNotificationAdminForm
     autocomplete_fields = ('target_users',)
-    list_display = ('title', 'target_mode', 'status', 'sent_at', 'sent_count', 'created_at')
+    list_display = (
+        'title', 'target_mode', 'status', 'send_progress_display', 'sent_at', 'sent_count', 'created_at',
+    )
     list_filter = ('status', 'target_mode', 'priority')
     search_fields = ('title', 'body')
     readonly_fields = (
-        'audience_preview', 'channels_display', 'status', 'sent_at', 'sent_by',
+        'audience_preview', 'channels_display', 'status', 'send_progress_display', 'sent_at', 'sent_by',
         'sent_count', 'unmatched_report', 'created_at', 'updated_at',
     )
     actions = ('send_selected', 'resend_selected', 'recall_selected')
@@ -135,7 +147,9 @@ class CustomNotificationAdmin(admin.ModelAdmin):
             'fields': ('send_now', 'recall_now', 'audience_preview', 'channels_display'),
         }),
         ('Delivery record', {
-            'fields': ('status', 'sent_at', 'sent_by', 'sent_count', 'unmatched_report'),
+            'fields': (
+                'status', 'send_progress_display', 'sent_at', 'sent_by', 'sent_count', 'unmatched_report',
+            ),
             'classes': ('collapse',),
         }),
     )
@@ -150,6 +164,13 @@ class CustomNotificationAdmin(admin.ModelAdmin):
             preview += f' · {len(audience.unmatched_wallets)} wallet line(s) unmatched'
         return preview
 
+    @admin.display(description='Send progress')
+    def send_progress_display(self, obj):
+        if not obj or obj.status != CustomNotification.STATUS_SENDING:
+            return '—'
+        percent = obj.send_progress * 100 // obj.send_total if obj.send_total else 0
+        return f'{obj.send_progress} / ~{obj.send_total} delivered ({percent}%)'
+
     @admin.display(description='Channels')
     def channels_display(self, obj):
         channels = obj.channels if obj and obj.pk else ['portal']
@@ -198,7 +219,11 @@ class CustomNotificationAdmin(admin.ModelAdmin):
 
     def _send_campaign(self, request, campaign):
         try:
-            result = campaigns.send_campaign(campaign, actor=request.user)
+            result = campaigns.send_campaign(
+                campaign,
+                actor=request.user,
+                inline_limit=campaigns.INLINE_SEND_LIMIT,
+            )
         except campaigns.CampaignSendError as error:
             self.message_user(request, f'Not sent: {error} The draft was saved.', level=messages.WARNING)
             return
@@ -211,7 +236,13 @@ class CustomNotificationAdmin(admin.ModelAdmin):
             )
             return
 
-        message = f'Sent to {result.total} user(s) ({result.created} new, {result.refreshed} resurfaced).'
+        if result.queued:
+            message = (
+                f'Queued for ~{result.total} user(s). The send_campaigns job delivers it in batches; '
+                'progress is shown under Delivery record.'
+            )
+        else:
+            message = f'Sent to {result.total} user(s) ({result.created} new, {result.refreshed} resurfaced).'
         if result.unmatched_wallets:
             message += self._unmatched_summary(result.unmatched_wallets)
         self.message_user(
@@ -290,20 +321,30 @@ class CustomNotificationAdmin(admin.ModelAdmin):
 
     def _run_bulk(self, request, eligible, selected):
         sent = 0
+        queued = 0
         reached = 0
         failed = 0
         for campaign in eligible:
             try:
-                result = campaigns.send_campaign(campaign, actor=request.user)
+                result = campaigns.send_campaign(
+                    campaign,
+                    actor=request.user,
+                    inline_limit=campaigns.INLINE_SEND_LIMIT,
+                )
             except Exception:
                 logger.exception('Failed to send campaign %r', campaign)
                 failed += 1
                 continue
+            if result.queued:
+                queued += 1
+                continue
             sent += 1
             reached += result.total
 
         skipped = selected.count() - eligible.count()
         message = f'Sent {sent} custom notification(s) reaching {reached} user(s).'
+        if queued:
+            message += f' Queued {queued} large campaign(s) for background delivery.'
         if skipped:
             message += f' Skipped {skipped} with the wrong status.'
         if failed:
@@ -0,0 +1,101 @@
+"""
+Per-user badge counters for the notification bell and the What's New dialog.
+
+The frontend polls unread-count and unseen-count from every logged-in tab.
+Each poll used to rebuild the whole feed query (four role lookups plus the
+read-state checks), so the cached values here are the two counts per user.
+They are dropped where the underlying state changes instead of recomputed on
+every poll, and the next poll recomputes them:
+
+- notify(), mark-read and mark-all-read forget the user's unread count;
+- broadcasts, campaigns and recalls touch arbitrarily many users at once, so
+  they bump a generation number that is part of every unread key, which
+  retires all users' counts in one cache write. Announcement writes do the
+  same for the What's New counts.
+
+Every change is applied again once the writing transaction commits, so a poll
+that recomputed from pre-commit rows in between does not keep a count that
+misses the write.
+
+The counters and generation numbers live in the 'shared' cache (Redis), so a
+poll never touches the database on a hit, and a write handled by one worker
+retires the count every other worker serves. The TTL only covers changes no writer announces (role membership,
+scheduled publish and expiry).
+"""
+
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.connection import ConnectionProxy
+
+cache = ConnectionProxy(caches, 'shared')
+
+
+NOTIFICATION_COUNTER_TTL_SECONDS = 60
+
+# Bump the version suffix whenever a count's semantics change, so old
+# entries cannot be misread.
+UNREAD_GENERATION_KEY = 'notifications:unread-generation:v1'
+WHATS_NEW_GENERATION_KEY = 'notifications:whats-new-generation:v1'
+
+
+def _generation(key):
+    return cache.get_or_set(key, 0, None)
+
+
+def _bump_generation(key):
+    # add() only writes a missing key, and incr() is atomic on Redis, so
+    # concurrent bumps never overwrite each other.
+    cache.add(key, 0, None)
+    cache.incr(key)
+
+
+def unread_count_key(user_id):
+    return f'notifications:unread:v1:{_generation(UNREAD_GENERATION_KEY)}:{user_id}'
+
+
+def whats_new_count_key(user_id):
+    return f'notifications:whats-new:v1:{_generation(WHATS_NEW_GENERATION_KEY)}:{user_id}'
+
+
+def cached_count(key, compute):
+    """Return a cached count, computing and storing it on a miss."""
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    value = compute()
+    cache.set(key, value, NOTIFICATION_COUNTER_TTL_SECONDS)
+    return value
+
+
+def _now_and_on_commit(func):
+    # Apply now so the writer's own next poll sees it, and again on commit
+    # so a poll that recomputed from pre-commit rows in between is retired.
+    # Only used for deletes and generation bumps, where applying twice is
+    # harmless.
+    func()
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(func)
+
+
+def forget_unread_count(user_id):
+    _now_and_on_commit(lambda: cache.delete(unread_count_key(user_id)))
+
+
+def forget_whats_new_count(user_id):
+    _now_and_on_commit(lambda: cache.delete(whats_new_count_key(user_id)))
+
+
+def invalidate_unread_counts():
+    """Retire every user's cached unread count (broadcasts, campaigns, recalls)."""
+    _now_and_on_commit(lambda: _bump_generation(UNREAD_GENERATION_KEY))
+
+
+def invalidate_whats_new_counts():
+    """Retire every user's cached What's New count (announcement writes)."""
+    _now_and_on_commit(lambda: _bump_generation(WHATS_NEW_GENERATION_KEY))
+
+
+def clear_notification_counters():
+    """Retire every cached counter. Intended for tests and management commands."""
+    _bump_generation(UNREAD_GENERATION_KEY)
+    _bump_generation(WHATS_NEW_GENERATION_KEY)
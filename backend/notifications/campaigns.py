@@ -2,24 +2,47 @@
 
 resolve_recipients() is the channel-agnostic enumeration step: it turns a
 CustomNotification's targeting into a concrete user queryset. The portal
-channel fans that set out into personal Notification rows here; future email
-or Telegram channels reuse the same resolution and add their own delivery.
+channel delivers hand-picked and wallet campaigns as personal Notification
+rows, and whole-audience campaigns as a single shared broadcast row (plus a
+compact member list for roles). Future email or Telegram channels reuse the
+same resolution and add their own delivery.
+
+Fan-out is a resumable run: queue_campaign() records the audience size and
+resets the checkpoint, and send_campaign_batch() delivers the next keyset
+batch of user ids, advancing the checkpoint in the same transaction.
+send_campaign() drives a whole run inline; deliver_queued_campaigns()
+drives queued runs in the background, from the send_campaigns management
+command and the cron-triggered send endpoint.
 """
 import re
+import time
 from dataclasses import dataclass, field
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
 from django.db.models.functions import Lower
 from django.utils import timezone
 
-from .models import CustomNotification, Notification
+from . import cache as notification_cache
+from .models import CustomNotification, Notification, NotificationAudienceMember
 from .registry import get_event_type
 from .services import internal_route
 
 WALLET_RE = re.compile(r'^0[xX][0-9a-fA-F]{40}$')
 
 FANOUT_BATCH_SIZE = 500
+# Audiences up to this size are delivered inside the admin request; larger
+# ones are queued for the send_campaigns command.
+INLINE_SEND_LIMIT = FANOUT_BATCH_SIZE
+
+# Targeting modes delivered as one shared broadcast row instead of a
+# personal row per recipient: "everyone" maps onto the `all` audience,
+# roles onto a NotificationAudienceMember list.
+SHARED_ROW_TARGET_MODES = (
+    CustomNotification.TARGET_EVERYONE,
+    CustomNotification.TARGET_ROLES,
+)
 
 
 class CampaignSendError(Exception):
@@ -38,6 +61,23 @@ class CampaignSendResult:
     created: int
     refreshed: int
     unmatched_wallets: list = field(default_factory=list)
+    queued: bool = False
+
+
+@dataclass
+class CampaignBatchResult:
+    campaign: CustomNotification
+    processed: int = 0
+    created: int = 0
+    refreshed: int = 0
+    done: bool = False
+
+
+@dataclass
+class QueuedCampaignRun:
+    campaign: CustomNotification
+    batches: int = 0
+    done: bool = False
 
 
 def parse_wallet_lines(raw_text):
@@ -59,19 +99,19 @@ def parse_wallet_lines(raw_text):
     return addresses, invalid_lines
 
 
-def _role_user_ids(role):
+def _role_model(role):
     if role == 'builders':
         from builders.models import Builder
-        return Builder.objects.values('user_id')
+        return Builder
     if role == 'validators':
         from validators.models import Validator
-        return Validator.objects.values('user_id')
+        return Validator
     if role == 'stewards':
         from stewards.models import Steward
-        return Steward.objects.values('user_id')
+        return Steward
     if role == 'creators':
         from creators.models import Creator
-        return Creator.objects.values('user_id')
+        return Creator
     raise ValueError(f"Unknown campaign target role: {role}")
 
 
@@ -89,9 +129,11 @@ def resolve_recipients(campaign):
         return ResolvedAudience(users=active_users)
 
     if campaign.target_mode == CustomNotification.TARGET_ROLES:
+        # Correlated EXISTS probes on each role's user_id index, so a
+        # keyset walk over users never materialises the role tables.
         role_q = Q(pk__in=[])
         for role in campaign.target_roles:
-            role_q |= Q(pk__in=_role_user_ids(role))
+            role_q |= Q(Exists(_role_model(role).objects.filter(user_id=OuterRef('pk'))))
         return ResolvedAudience(users=active_users.filter(role_q))
 
     if campaign.target_mode == CustomNotification.TARGET_USERS:
@@ -115,22 +157,10 @@ def resolve_recipients(campaign):
     raise ValueError(f"Unknown campaign target mode: {campaign.target_mode}")
 
 
-def send_campaign(campaign, *, actor=None):
-    """Fan a campaign out as personal notification rows. Idempotent.
-
-    A resend refreshes the copy and resurfaces the notification as unread,
-    scoped to the currently resolved audience; recipients removed from the
-    targeting keep their old row untouched. The status flip happens last and
-    outside any transaction so a crash mid-fan-out leaves a resumable draft.
-    """
-    audience = resolve_recipients(campaign)
-    total = audience.users.count()
-    if total == 0:
-        raise CampaignSendError('No recipients matched the targeting.')
-
+def campaign_values(campaign, actor):
+    """Frozen copy written to every recipient's row."""
     event = get_event_type('custom.announcement')
-    now = timezone.now()
-    values = {
+    return {
         'actor': actor,
         'event_type': event.slug,
         'category': event.category,
@@ -145,13 +175,96 @@ def send_campaign(campaign, *, actor=None):
         'source_object_id': str(campaign.pk),
     }
 
-    # Resend path (no-op on first send): refresh copy and resurface as
-    # unread, but only for users still in the audience. .update() bypasses
-    # auto_now/auto_now_add, so both timestamps are set explicitly; the
-    # created_at bump moves the row back to the top of the feed.
+
+def delivers_shared_row(campaign):
+    """Whole-audience campaigns ship as one broadcast row, not a row per user."""
+    return campaign.target_mode in SHARED_ROW_TARGET_MODES
+
+
+def _shared_row(campaign):
+    return Notification.objects.filter(recipient__isnull=True, dedupe_key=campaign.dedupe_key)
+
+
+def _prepare_delivery(campaign, actor):
+    """Set up the rows a new send run writes into.
+
+    Shared-row campaigns get their broadcast row created, or refreshed and
+    resurfaced as unread on a resend (like services.broadcast()). A role
+    campaign's member list is kept while the run walks the audience again,
+    and the run drops the members it no longer reaches (see
+    _drop_stale_members), so nobody loses the row mid-run. Rows left over from the other delivery shape
+    (the targeting mode changed between sends) are removed so nobody sees
+    the campaign twice.
+    """
+    if not delivers_shared_row(campaign):
+        _shared_row(campaign).delete()
+        return
+
+    values = campaign_values(campaign, actor)
+    values['audience'] = (
+        Notification.AUDIENCE_ALL
+        if campaign.target_mode == CustomNotification.TARGET_EVERYONE
+        else Notification.AUDIENCE_LISTED
+    )
+    with transaction.atomic():
+        Notification.objects.filter(
+            recipient__isnull=False,
+            dedupe_key=campaign.dedupe_key,
+        ).delete()
+        row, created = Notification.objects.get_or_create(
+            recipient=None,
+            dedupe_key=campaign.dedupe_key,
+            defaults=values,
+        )
+        if not created:
+            now = timezone.now()
+            Notification.objects.filter(pk=row.pk).update(**values, created_at=now, updated_at=now)
+            row.receipts.all().delete()
+            if campaign.target_mode == CustomNotification.TARGET_EVERYONE:
+                # The `all` audience ignores the list; drop a stale one.
+                row.audience_members.all().delete()
+
+
+def queue_campaign(campaign, *, actor=None):
+    """Start a send run: resolve the audience and reset the checkpoint.
+
+    Delivery itself happens in send_campaign_batch() calls, normally from
+    the send_campaigns management command. Queueing a campaign that is
+    already sending restarts its run from the first recipient, which is
+    safe because delivery is idempotent per recipient.
+    """
+    audience = resolve_recipients(campaign)
+    total = audience.users.count()
+    if total == 0:
+        raise CampaignSendError('No recipients matched the targeting.')
+
+    _prepare_delivery(campaign, actor)
+    notification_cache.invalidate_unread_counts()
+
+    campaign.status = CustomNotification.STATUS_SENDING
+    campaign.sent_by = actor
+    campaign.unmatched_wallets = audience.unmatched_wallets
+    campaign.send_started_at = timezone.now()
+    campaign.send_cursor = None
+    campaign.send_total = total
+    campaign.send_progress = 0
+    campaign.save(update_fields=[
+        'status', 'sent_by', 'unmatched_wallets', 'send_started_at',
+        'send_cursor', 'send_total', 'send_progress', 'updated_at',
+    ])
+    return audience
+
+
+def _deliver_personal_rows(campaign, user_ids):
+    """Refresh existing personal rows and create the missing ones."""
+    now = timezone.now()
+    values = campaign_values(campaign, campaign.sent_by)
+    # .update() bypasses auto_now/auto_now_add, so both timestamps are set
+    # explicitly; the created_at bump moves the row back to the top of the
+    # feed.
     existing = Notification.objects.filter(
         dedupe_key=campaign.dedupe_key,
-        recipient__in=audience.users,
+        recipient_id__in=user_ids,
     )
     existing_recipient_ids = set(existing.values_list('recipient_id', flat=True))
     refreshed = existing.update(
@@ -160,41 +273,216 @@ def send_campaign(campaign, *, actor=None):
         created_at=now,
         updated_at=now,
     )
+    Notification.objects.bulk_create(
+        [
+            Notification(recipient_id=user_id, dedupe_key=campaign.dedupe_key, **values)
+            for user_id in user_ids
+            if user_id not in existing_recipient_ids
+        ],
+        ignore_conflicts=True,
+    )
+    return len(user_ids) - len(existing_recipient_ids), refreshed
+
+
+def _deliver_listed_members(campaign, user_ids):
+    """Add users to the shared row's recipient list.
+
+    Members already on the list (from an earlier send) are left as they are.
+    """
+    notification_id = _shared_row(campaign).values_list('pk', flat=True).get()
+    NotificationAudienceMember.objects.bulk_create(
+        [
+            NotificationAudienceMember(notification_id=notification_id, user_id=user_id)
+            for user_id in user_ids
+        ],
+        ignore_conflicts=True,
+    )
+    return len(user_ids), 0
 
-    missing = audience.users.exclude(pk__in=existing_recipient_ids)
-    batch = []
-    for user in missing.iterator(chunk_size=FANOUT_BATCH_SIZE):
-        batch.append(Notification(recipient=user, dedupe_key=campaign.dedupe_key, **values))
-        if len(batch) >= FANOUT_BATCH_SIZE:
-            Notification.objects.bulk_create(batch, ignore_conflicts=True)
-            batch = []
-    if batch:
-        Notification.objects.bulk_create(batch, ignore_conflicts=True)
-
-    campaign.status = CustomNotification.STATUS_SENT
-    campaign.sent_at = now
-    campaign.sent_by = actor
-    campaign.sent_count = total
-    campaign.unmatched_wallets = audience.unmatched_wallets
-    campaign.save(update_fields=[
-        'status', 'sent_at', 'sent_by', 'sent_count', 'unmatched_wallets', 'updated_at',
-    ])
 
+def _drop_stale_members(campaign, *, after, user_ids, done):
+    """Remove list members in the range a batch covered but did not deliver.
+
+    Batches walk the audience in user-id order, so every member between the
+    previous cursor and this batch's last id that is not in `user_ids` has
+    left the targeting since the last send. The final batch also covers
+    everything past its last id.
+    """
+    stale = NotificationAudienceMember.objects.filter(
+        notification__recipient__isnull=True,
+        notification__dedupe_key=campaign.dedupe_key,
+    )
+    if after is not None:
+        stale = stale.filter(user_id__gt=after)
+    if not done:
+        stale = stale.filter(user_id__lte=user_ids[-1])
+    deleted, _ = stale.exclude(user_id__in=user_ids).delete()
+    return deleted
+
+
+def send_campaign_batch(campaign, *, batch_size=FANOUT_BATCH_SIZE):
+    """Deliver the next keyset batch of a queued campaign.
+
+    Recipients are walked in user-id order from the stored cursor, so each
+    batch is one indexed range scan no matter how far the run has got.
+    The rows and the advanced cursor commit together, so a crash between
+    batches resumes at the first undelivered user; the campaign row is
+    locked for the batch so two workers never deliver the same range.
+
+    Hand-picked and wallet campaigns get personal rows (existing ones are
+    refreshed and resurfaced as unread); role campaigns get member rows on
+    their shared broadcast; "everyone" campaigns have nothing to enumerate.
+    The last batch flips the campaign to sent. Returns a
+    CampaignBatchResult; `done` is True once nothing is left.
+    """
+    with transaction.atomic():
+        campaign = CustomNotification.objects.select_for_update().get(pk=campaign.pk)
+        if campaign.status != CustomNotification.STATUS_SENDING:
+            return CampaignBatchResult(campaign=campaign, done=True)
+
+        user_ids = []
+        processed = created = refreshed = 0
+        after = campaign.send_cursor
+        if campaign.target_mode == CustomNotification.TARGET_EVERYONE:
+            # The shared `all` broadcast already reaches every user.
+            processed = created = campaign.send_total - campaign.send_progress
+            campaign.send_progress = campaign.send_total
+        else:
+            users = resolve_recipients(campaign).users
+            if campaign.send_cursor is not None:
+                users = users.filter(pk__gt=campaign.send_cursor)
+            user_ids = list(users.order_by('pk').values_list('pk', flat=True)[:batch_size])
+
+        if user_ids:
+            deliver = _deliver_listed_members if delivers_shared_row(campaign) else _deliver_personal_rows
+            created, refreshed = deliver(campaign, user_ids)
+            processed = len(user_ids)
+            campaign.send_cursor = user_ids[-1]
+            campaign.send_progress += processed
+            notification_cache.invalidate_unread_counts()
+
+        done = len(user_ids) < batch_size
+        if (
+            campaign.target_mode == CustomNotification.TARGET_ROLES
+            and _drop_stale_members(campaign, after=after, user_ids=user_ids, done=done)
+        ):
+            notification_cache.invalidate_unread_counts()
+
+        update_fields = ['send_cursor', 'send_progress', 'updated_at']
+        if done:
+            campaign.status = CustomNotification.STATUS_SENT
+            campaign.sent_at = timezone.now()
+            campaign.sent_count = campaign.send_progress
+            update_fields += ['status', 'sent_at', 'sent_count']
+        campaign.save(update_fields=update_fields)
+
+    return CampaignBatchResult(
+        campaign=campaign,
+        processed=processed,
+        created=created,
+        refreshed=refreshed,
+        done=done,
+    )
+
+
+def send_campaign(campaign, *, actor=None, batch_size=FANOUT_BATCH_SIZE, inline_limit=None):
+    """Queue a campaign and deliver it to completion in this process.
+
+    With `inline_limit`, a run that would enumerate more recipients than
+    the limit is only queued and the result has `queued` set; the
+    send_campaigns command delivers it. The admin passes INLINE_SEND_LIMIT
+    so large campaigns never hold a request for the whole fan-out. A resend
+    refreshes the copy and resurfaces the notification as unread for the
+    currently resolved audience. Hand-picked and wallet recipients removed
+    from the targeting keep their old personal row untouched; role
+    campaigns drop them from their recipient list as the run passes them.
+    """
+    resend = Notification.objects.filter(dedupe_key=campaign.dedupe_key).exists()
+    audience = queue_campaign(campaign, actor=actor)
+    if (
+        inline_limit is not None
+        and campaign.send_total > inline_limit
+        and campaign.target_mode != CustomNotification.TARGET_EVERYONE
+    ):
+        return CampaignSendResult(
+            total=campaign.send_total,
+            created=0,
+            refreshed=0,
+            unmatched_wallets=audience.unmatched_wallets,
+            queued=True,
+        )
+
+    total = created = refreshed = 0
+    while True:
+        batch = send_campaign_batch(campaign, batch_size=batch_size)
+        total += batch.processed
+        created += batch.created
+        refreshed += batch.refreshed
+        if batch.done:
+            break
+
+    campaign.refresh_from_db()
+    if delivers_shared_row(campaign) and resend:
+        # One shared row was resurfaced for everyone it reaches.
+        created, refreshed = 0, total
     return CampaignSendResult(
         total=total,
-        created=total - refreshed,
+        created=created,
         refreshed=refreshed,
         unmatched_wallets=audience.unmatched_wallets,
     )
 
 
+def deliver_queued_campaigns(*, campaign_id=None, batch_size=FANOUT_BATCH_SIZE, max_batches=None,
+                             max_seconds=None):
+    """Deliver queued (`sending`) campaigns, oldest first.
+
+    Each campaign stops after `max_batches` batches, and no new batch starts
+    once `max_seconds` have passed; whatever is left resumes from its
+    checkpoint on the next call. Returns a QueuedCampaignRun per campaign
+    this call worked on.
+    """
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+    queued = CustomNotification.objects.filter(
+        status=CustomNotification.STATUS_SENDING,
+    ).order_by('send_started_at', 'pk')
+    if campaign_id is not None:
+        queued = queued.filter(pk=campaign_id)
+
+    runs = []
+    for campaign in queued:
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        run = QueuedCampaignRun(campaign=campaign)
+        runs.append(run)
+        while max_batches is None or run.batches < max_batches:
+            if deadline is not None and run.batches and time.monotonic() >= deadline:
+                break
+            result = send_campaign_batch(run.campaign, batch_size=batch_size)
+            run.campaign = result.campaign
+            run.batches += 1
+            if result.done:
+                run.done = True
+                break
+    return runs
+
+
 def recall_campaign(campaign):
     """Delete delivered portal notifications for a custom campaign.
 
-    The campaign record is kept for audit and can be resent later. Future
+    The campaign record is kept for audit and can be resent later. A run
+    still in progress is stopped first (back to draft) so the background
+    sender does not keep delivering what was just recalled. Future
     email/Telegram channels should add their own outbox recall/cancel logic
     next to this portal-row deletion.
     """
+    stopped = CustomNotification.objects.filter(
+        pk=campaign.pk,
+        status=CustomNotification.STATUS_SENDING,
+    ).update(status=CustomNotification.STATUS_DRAFT, send_cursor=None)
+    if stopped:
+        campaign.status = CustomNotification.STATUS_DRAFT
+        campaign.send_cursor = None
     queryset = Notification.objects.filter(
         event_type='custom.announcement',
         dedupe_key=campaign.dedupe_key,
@@ -204,4 +492,6 @@ def recall_campaign(campaign):
     )
     count = queryset.count()
     queryset.delete()
+    if count:
+        notification_cache.invalidate_unread_counts()
     return count
@@ -0,0 +1,61 @@
+"""Deliver queued custom notification campaigns in keyset batches.
+
+The admin queues campaigns whose audience is too large to fan out inside a
+request (status `sending`). Each batch commits its notification rows and
+the campaign's checkpoint together, so the command can be interrupted or
+killed at any point: the next run resumes each campaign after the last
+delivered user id. Scheduled delivery goes through the cron-token endpoint
+(POST /api/v1/notification-campaigns/send/), which runs the same loop.
+"""
+from django.core.management.base import BaseCommand
+
+from notifications import campaigns
+from notifications.models import CustomNotification
+
+
+class Command(BaseCommand):
+    help = "Deliver queued custom notification campaigns, resuming from their checkpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--campaign', type=int, default=None, help='Only deliver this campaign id.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=campaigns.FANOUT_BATCH_SIZE,
+            help='Recipients per batch (one transaction each).',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=None,
+            help='Stop each campaign after this many batches; the next run resumes it.',
+        )
+        parser.add_argument(
+            '--max-seconds',
+            type=float,
+            default=None,
+            help='Start no new batch after this many seconds; the next run resumes.',
+        )
+
+    def handle(self, *args, **options):
+        runs = campaigns.deliver_queued_campaigns(
+            campaign_id=options['campaign'],
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+            max_seconds=options['max_seconds'],
+        )
+        for run in runs:
+            campaign = run.campaign
+            progress = f"{campaign.send_progress}/{campaign.send_total}"
+            if run.done:
+                self.stdout.write(self.style.SUCCESS(
+                    f"Campaign {campaign.pk} sent: {progress} recipient(s) in {run.batches} batch(es)."
+                ))
+            else:
+                self.stdout.write(
+                    f"Campaign {campaign.pk} paused at {progress} recipient(s) "
+                    f"(cursor {campaign.send_cursor}); the next run resumes it."
+                )
+
+        if not runs:
+            self.stdout.write("No campaigns queued for delivery.")
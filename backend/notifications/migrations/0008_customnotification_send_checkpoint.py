@@ -0,0 +1,38 @@
+# Generated by Django 6.0.6 on 2026-10-19 10:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_notificationreadmark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customnotification',
+            name='send_cursor',
+            field=models.BigIntegerField(blank=True, help_text='Highest recipient user id delivered so far in the current send run.', null=True),
+        ),
+        migrations.AddField(
+            model_name='customnotification',
+            name='send_progress',
+            field=models.PositiveIntegerField(default=0, help_text='Recipients delivered so far in the current send run.'),
+        ),
+        migrations.AddField(
+            model_name='customnotification',
+            name='send_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='customnotification',
+            name='send_total',
+            field=models.PositiveIntegerField(default=0, help_text='Recipients resolved when the send was queued.'),
+        ),
+        migrations.AlterField(
+            model_name='customnotification',
+            name='status',
+            field=models.CharField(choices=[('draft', 'Draft'), ('sending', 'Sending'), ('sent', 'Sent')], db_index=True, default='draft', max_length=12),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.6 on 2026-10-19 10:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0008_customnotification_send_checkpoint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='audience',
+            field=models.CharField(choices=[('all', 'All users'), ('validators', 'Validators'), ('stewards', 'Stewards'), ('builders', 'Builders'), ('community', 'Creators'), ('listed', 'Listed recipients')], db_index=True, default='all', help_text='Only meaningful for broadcast notifications.', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='notificationreadmark',
+            name='audience',
+            field=models.CharField(choices=[('all', 'All users'), ('validators', 'Validators'), ('stewards', 'Stewards'), ('builders', 'Builders'), ('community', 'Creators'), ('listed', 'Listed recipients')], max_length=16),
+        ),
+        migrations.CreateModel(
+            name='NotificationAudienceMember',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='audience_members', to='notifications.notification')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='notification_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'notification'), name='unique_notification_audience_member')],
+            },
+        ),
+    ]
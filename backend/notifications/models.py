@@ -11,8 +11,11 @@ class Notification(BaseModel):
 
     Personal notifications have a recipient. Broadcast notifications have
     recipient=None and are visible to every user in `audience` who joined
-    before the notification was created; their per-user read state lives in
-    NotificationReceipt rows created lazily when a user reads them.
+    before the notification was created; the `listed` audience is instead
+    an explicit NotificationAudienceMember list (campaign deliveries to
+    whole roles). Their per-user read state is a
+    NotificationReadMark watermark per audience plus sparse
+    NotificationReceipt rows for broadcasts read individually above it.
     """
 
     PRIORITY_LOW = 1
@@ -46,6 +49,12 @@ class Notification(BaseModel):
         (AUDIENCE_BUILDERS, 'Builders'),
         (AUDIENCE_COMMUNITY, 'Creators'),
     ]
+    # Broadcast-only audience backed by NotificationAudienceMember rows
+    # rather than a role; not offered for What's New announcements.
+    AUDIENCE_LISTED = 'listed'
+    BROADCAST_AUDIENCE_CHOICES = AUDIENCE_CHOICES + [
+        (AUDIENCE_LISTED, 'Listed recipients'),
+    ]
 
     recipient = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -57,7 +66,7 @@ class Notification(BaseModel):
     )
     audience = models.CharField(
         max_length=16,
-        choices=AUDIENCE_CHOICES,
+        choices=BROADCAST_AUDIENCE_CHOICES,
         default=AUDIENCE_ALL,
         db_index=True,
         help_text='Only meaningful for broadcast notifications.',
@@ -129,7 +138,11 @@ class Notification(BaseModel):
 
 
 class NotificationReceipt(BaseModel):
-    """Lazy per-user read state for broadcast notifications."""
+    """Out-of-order read state for a single broadcast notification.
+
+    Only needed for broadcasts newer than the user's NotificationReadMark
+    for that audience; mark-all-read advances the watermark and drops them.
+    """
 
     notification = models.ForeignKey(
         Notification,
@@ -152,6 +165,61 @@ class NotificationReceipt(BaseModel):
         return f"receipt {self.notification_id} -> {self.user_id}"
 
 
+class NotificationReadMark(BaseModel):
+    """Per-user, per-audience broadcast read-through watermark.
+
+    Every broadcast for `audience` created at or before `read_through` is
+    read for `user`, so mark-all-read is one upsert instead of a receipt
+    per broadcast.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_read_marks',
+    )
+    audience = models.CharField(max_length=16, choices=Notification.BROADCAST_AUDIENCE_CHOICES)
+    read_through = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'audience'], name='unique_notification_read_mark'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} read {self.audience} through {self.read_through}"
+
+
+class NotificationAudienceMember(models.Model):
+    """One user on the recipient list of a `listed` broadcast.
+
+    Lets a role-targeted campaign ship as a single shared Notification row:
+    the copy is stored once and each recipient costs one narrow row here
+    instead of a full personal notification. The (user, notification)
+    unique index is what the feed query probes.
+    """
+
+    notification = models.ForeignKey(
+        Notification,
+        on_delete=models.CASCADE,
+        related_name='audience_members',
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_memberships',
+        db_index=False,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'notification'], name='unique_notification_audience_member'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} in {self.notification_id}"
+
+
 def default_channels():
     return ['portal']
 
@@ -159,8 +227,12 @@ def default_channels():
 class CustomNotification(BaseModel):
     """An admin-composed campaign: arbitrary copy targeted at a set of users.
 
-    Sending fans out personal Notification rows (one per resolved recipient,
-    snapshot semantics) via notifications.campaigns.send_campaign. The
+    Sending goes through notifications.campaigns: hand-picked and wallet
+    targeting fan out personal Notification rows (snapshot semantics), while
+    everyone/role targeting ships one shared broadcast row. Large audiences are
+    queued (status `sending`) and delivered in keyset batches by the
+    send_campaigns management command; `send_cursor` checkpoints the last
+    delivered user id so an interrupted run resumes where it stopped. The
     `channels` field is the foundation for future email/Telegram delivery;
     only the portal channel delivers today.
     """
@@ -184,9 +256,11 @@ class CustomNotification(BaseModel):
     ]
 
     STATUS_DRAFT = 'draft'
+    STATUS_SENDING = 'sending'
     STATUS_SENT = 'sent'
     STATUS_CHOICES = [
         (STATUS_DRAFT, 'Draft'),
+        (STATUS_SENDING, 'Sending'),
         (STATUS_SENT, 'Sent'),
     ]
 
@@ -242,6 +316,16 @@ class CustomNotification(BaseModel):
         help_text='Wallet lines that matched no user at last send.',
     )
 
+    # Fan-out checkpoint for the current send run (status `sending`).
+    send_started_at = models.DateTimeField(null=True, blank=True)
+    send_cursor = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text='Highest recipient user id delivered so far in the current send run.',
+    )
+    send_total = models.PositiveIntegerField(default=0, help_text='Recipients resolved when the send was queued.')
+    send_progress = models.PositiveIntegerField(default=0, help_text='Recipients delivered so far in the current send run.')
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'custom notification'
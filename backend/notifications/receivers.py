@@ -4,15 +4,24 @@ Producers that are simple model creations hook here so the notification
 trigger lives in one app; flows with more context (submission reviews,
 referrals, admin broadcasts) call notifications.services directly.
 """
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from contributions.models import ContributionHighlight
 
+from . import cache as notification_cache
 from . import services
+from .models import WhatsNewAnnouncement
 
 
 @receiver(post_save, sender=ContributionHighlight, dispatch_uid='notifications_contribution_highlighted')
 def on_contribution_highlighted(sender, instance, created, **kwargs):
     if created:
         services.notify_contribution_highlighted(instance)
+
+
+@receiver(post_save, sender=WhatsNewAnnouncement, dispatch_uid='notifications_whats_new_changed')
+@receiver(post_delete, sender=WhatsNewAnnouncement, dispatch_uid='notifications_whats_new_deleted')
+def on_whats_new_changed(sender, **kwargs):
+    # Publishing, archiving and version bumps all change who has unseen items.
+    notification_cache.invalidate_whats_new_counts()
@@ -5,18 +5,29 @@ Core entry points:
 - broadcast(event_slug, ...)               -> ONE row visible to a whole audience
 
 A user's feed merges personal rows with broadcast rows targeted at an
-audience they belong to and created after they joined. Broadcast read state
-is stored lazily in NotificationReceipt rows, so a broadcast is a single
-insert regardless of user count.
+audience they belong to and created after they joined, plus `listed`
+broadcasts whose NotificationAudienceMember list includes them. Broadcast read state
+is a per-audience NotificationReadMark watermark plus sparse
+NotificationReceipt rows for broadcasts read individually above it, so a
+broadcast is a single insert and mark-all-read a single upsert regardless
+of user count.
 """
 from urllib.parse import urlencode
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import Exists, OuterRef, Q
+from django.db.models import BooleanField, Exists, ExpressionWrapper, Max, OuterRef, Q
 from django.utils import timezone
 
-from .models import Notification, NotificationReceipt, WhatsNewAnnouncement, WhatsNewAnnouncementSeen
+from . import cache as notification_cache
+from .models import (
+    Notification,
+    NotificationAudienceMember,
+    NotificationReadMark,
+    NotificationReceipt,
+    WhatsNewAnnouncement,
+    WhatsNewAnnouncementSeen,
+)
 from .registry import get_event_type
 
 
@@ -107,9 +118,13 @@ def notify(
         if not created:
             # Same event delivered twice: refresh the copy, keep read state.
             _apply_values(notification, values)
+        else:
+            notification_cache.forget_unread_count(recipient.pk)
         return notification
 
-    return Notification.objects.create(recipient=recipient, **values)
+    notification = Notification.objects.create(recipient=recipient, **values)
+    notification_cache.forget_unread_count(recipient.pk)
+    return notification
 
 
 def broadcast(
@@ -162,9 +177,12 @@ def broadcast(
                 Notification.objects.filter(pk=notification.pk).update(created_at=timezone.now())
                 notification.receipts.all().delete()
             notification.refresh_from_db(fields=['created_at'])
+        notification_cache.invalidate_unread_counts()
         return notification
 
-    return Notification.objects.create(recipient=None, **values)
+    notification = Notification.objects.create(recipient=None, **values)
+    notification_cache.invalidate_unread_counts()
+    return notification
 
 
 def recall_broadcast(event_slug, source):
@@ -180,6 +198,8 @@ def recall_broadcast(event_slug, source):
     )
     count = queryset.count()
     queryset.delete()
+    if count:
+        notification_cache.invalidate_unread_counts()
     return count
 
 
@@ -261,6 +281,13 @@ def whats_new_unseen_count(user):
     return unseen_whats_new_for(user).count()
 
 
+def cached_whats_new_unseen_count(user):
+    return notification_cache.cached_count(
+        notification_cache.whats_new_count_key(user.pk),
+        lambda: whats_new_unseen_count(user),
+    )
+
+
 def mark_whats_new_seen(user, ids, action=WhatsNewAnnouncementSeen.ACTION_SEEN):
     """Mark visible current-version announcements as seen for a user."""
     if not ids:
@@ -282,6 +309,7 @@ def mark_whats_new_seen(user, ids, action=WhatsNewAnnouncementSeen.ACTION_SEEN):
         ],
         ignore_conflicts=True,
     )
+    notification_cache.forget_whats_new_count(user.pk)
     return len(announcements)
 
 
@@ -312,61 +340,170 @@ def audiences_for(user):
     return audiences
 
 
+def broadcast_audiences_for(user):
+    """Broadcast audiences to check for `user`, including the listed one."""
+    return [*audiences_for(user), Notification.AUDIENCE_LISTED]
+
+
+def _audience_q(audience, user):
+    if audience == Notification.AUDIENCE_LISTED:
+        return Q(
+            audience=audience,
+            pk__in=NotificationAudienceMember.objects.filter(user=user).values('notification_id'),
+        )
+    return Q(audience=audience)
+
+
 def feed_for(user):
     """Personal notifications + broadcasts for the user's audiences."""
+    audiences = broadcast_audiences_for(user)
+    broadcasts = Q()
+    for audience in audiences:
+        broadcasts |= _audience_q(audience, user)
     return Notification.objects.filter(
         Q(recipient=user)
-        | Q(
-            recipient__isnull=True,
-            audience__in=audiences_for(user),
-            created_at__gte=user.date_joined,
+        | (Q(recipient__isnull=True, created_at__gte=user.date_joined) & broadcasts)
+    )
+
+
+def read_marks_for(user):
+    """The user's broadcast read-through watermarks, keyed by audience."""
+    return dict(
+        NotificationReadMark.objects.filter(user=user).values_list('audience', 'read_through')
+    )
+
+
+def _read_receipt(user):
+    return Exists(
+        NotificationReceipt.objects.filter(
+            notification=OuterRef('pk'),
+            user=user,
+            read_at__isnull=False,
         )
     )
 
 
 def annotate_read_state(queryset, user):
+    """Annotate `receipt_read`: at or below the audience watermark, or receipted."""
+    read_through = Q()
+    for audience, mark in read_marks_for(user).items():
+        read_through |= Q(audience=audience, created_at__lte=mark)
+    if not read_through:
+        return queryset.annotate(receipt_read=_read_receipt(user))
     return queryset.annotate(
-        receipt_read=Exists(
-            NotificationReceipt.objects.filter(
-                notification=OuterRef('pk'),
-                user=user,
-                read_at__isnull=False,
-            )
+        receipt_read=ExpressionWrapper(
+            read_through | _read_receipt(user),
+            output_field=BooleanField(),
         )
     )
 
 
+def unread_broadcasts_for(user, audiences=None):
+    """Unread broadcasts: one created_at range per audience, minus receipts.
+
+    Each range starts at the later of the join date and the audience
+    watermark, so the receipt check only runs over the few rows above it.
+    """
+    if audiences is None:
+        audiences = broadcast_audiences_for(user)
+    marks = read_marks_for(user)
+    ranges = Q()
+    for audience in audiences:
+        mark = marks.get(audience)
+        if mark is not None and mark >= user.date_joined:
+            ranges |= _audience_q(audience, user) & Q(created_at__gt=mark)
+        else:
+            ranges |= _audience_q(audience, user) & Q(created_at__gte=user.date_joined)
+    return (
+        Notification.objects
+        .filter(recipient__isnull=True)
+        .filter(ranges)
+        .exclude(_read_receipt(user))
+    )
+
+
+def unread_count(user):
+    personal = Notification.objects.filter(recipient=user, read_at__isnull=True).count()
+    return personal + unread_broadcasts_for(user).count()
+
+
+def cached_unread_count(user):
+    return notification_cache.cached_count(
+        notification_cache.unread_count_key(user.pk),
+        lambda: unread_count(user),
+    )
+
+
 def mark_notification_read(notification, user):
+    """Mark one feed item read for `user`. Returns True if it was unread."""
+    changed = False
     if notification.recipient_id == user.pk:
+        changed = notification.read_at is None
         notification.mark_read()
     elif notification.is_broadcast:
-        NotificationReceipt.objects.get_or_create(
+        mark = read_marks_for(user).get(notification.audience)
+        if mark is not None and notification.created_at <= mark:
+            return False
+        _, changed = NotificationReceipt.objects.get_or_create(
             notification=notification,
             user=user,
             defaults={'read_at': timezone.now()},
         )
+    if changed:
+        notification_cache.forget_unread_count(user.pk)
+    return changed
 
 
 def mark_all_read(user):
-    now = timezone.now()
-    updated = Notification.objects.filter(
-        recipient=user,
-        read_at__isnull=True,
-    ).update(read_at=now)
+    """Read every personal row and advance each audience watermark.
 
-    unread_broadcast_ids = list(
-        annotate_read_state(feed_for(user).filter(recipient__isnull=True), user)
-        .filter(receipt_read=False)
-        .values_list('pk', flat=True)
-    )
-    NotificationReceipt.objects.bulk_create(
-        [
-            NotificationReceipt(notification_id=pk, user=user, read_at=now)
-            for pk in unread_broadcast_ids
-        ],
-        ignore_conflicts=True,
-    )
-    return updated + len(unread_broadcast_ids)
+    A watermark moves to the newest broadcast the user can see right now,
+    not to the clock, so a broadcast created after that row stays unread
+    even when it commits after this call.
+    """
+    now = timezone.now()
+    audiences = broadcast_audiences_for(user)
+    visible = Q()
+    for audience in audiences:
+        visible |= _audience_q(audience, user)
+    with transaction.atomic():
+        updated = Notification.objects.filter(
+            recipient=user,
+            read_at__isnull=True,
+        ).update(read_at=now)
+        updated += unread_broadcasts_for(user, audiences).count()
+
+        marks = read_marks_for(user)
+        read_through = {}
+        for audience, newest in (
+            Notification.objects
+            .filter(recipient__isnull=True, created_at__gte=user.date_joined)
+            .filter(visible)
+            .order_by()
+            .values('audience')
+            .annotate(newest=Max('created_at'))
+            .values_list('audience', 'newest')
+        ):
+            mark = marks.get(audience)
+            read_through[audience] = newest if mark is None else max(mark, newest)
+
+        if read_through:
+            NotificationReadMark.objects.bulk_create(
+                [
+                    NotificationReadMark(user=user, audience=audience, read_through=mark)
+                    for audience, mark in read_through.items()
+                ],
+                update_conflicts=True,
+                unique_fields=['user', 'audience'],
+                update_fields=['read_through', 'updated_at'],
+            )
+            # Receipts under the new watermarks carry no information any more.
+            covered = Q()
+            for audience, mark in read_through.items():
+                covered |= Q(notification__audience=audience, notification__created_at__lte=mark)
+            NotificationReceipt.objects.filter(covered, user=user).delete()
+        notification_cache.forget_unread_count(user.pk)
+    return updated
 
 
 # ---------------------------------------------------------------------------
@@ -580,10 +717,13 @@ def notify_email_verification_reminder(user):
 
 def clear_email_verification_reminder(user):
     """Remove the pending reminder once the user's email is verified."""
-    return Notification.objects.filter(
+    deleted = Notification.objects.filter(
         recipient=user,
         event_type='email.verify_reminder',
     ).delete()[0]
+    if deleted:
+        notification_cache.forget_unread_count(user.pk)
+    return deleted
 
 
 def notify_validator_graduated(user, actor=None):
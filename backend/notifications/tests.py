@@ -10,10 +10,13 @@ from contributions.models import Category, ContributionType, Evidence, Submitted
 from partners.models import Partner
 from validators.models import Validator
 
-from notifications import campaigns, services
+from notifications import cache as notification_cache, campaigns, services
+from notifications.cache import clear_notification_counters
 from notifications.models import (
     CustomNotification,
     Notification,
+    NotificationAudienceMember,
+    NotificationReadMark,
     NotificationReceipt,
     WhatsNewAnnouncement,
     WhatsNewAnnouncementSeen,
@@ -254,6 +257,96 @@ class ReadStateTests(TestCase):
         self.assertEqual(updated, 2)
         self.assertEqual(self.unread_count(self.user), 0)
 
+    def test_mark_all_read_advances_watermark_without_receipts(self):
+        read_early = services.broadcast_partner(self.partner)
+        services.mark_notification_read(read_early, self.user)
+        other_partner = Partner.objects.create(
+            name='Other Partner',
+            slug='other-partner-notif',
+            description='Another partner',
+            is_active=True,
+        )
+        services.broadcast_partner(other_partner)
+
+        services.mark_all_read(self.user)
+
+        self.assertEqual(NotificationReceipt.objects.count(), 0)
+        # Only audiences that had something to read get a watermark.
+        self.assertCountEqual(
+            NotificationReadMark.objects.filter(user=self.user).values_list('audience', flat=True),
+            [Notification.AUDIENCE_ALL],
+        )
+        self.assertEqual(services.unread_count(self.user), 0)
+
+        # Newer broadcasts sit above the watermark and are unread until
+        # read individually, which records a sparse receipt.
+        third_partner = Partner.objects.create(
+            name='Third Partner',
+            slug='third-partner-notif',
+            description='A third partner',
+            is_active=True,
+        )
+        newer = services.broadcast_partner(third_partner)
+        self.assertEqual(services.unread_count(self.user), 1)
+        self.assertEqual(self.unread_count(self.user), 1)
+
+        services.mark_notification_read(newer, self.user)
+        self.assertEqual(services.unread_count(self.user), 0)
+        self.assertEqual(NotificationReceipt.objects.count(), 1)
+
+        # Reading a broadcast under the watermark is a no-op.
+        services.mark_notification_read(read_early, self.user)
+        self.assertEqual(NotificationReceipt.objects.count(), 1)
+
+    def test_watermark_is_the_newest_broadcast_read_not_the_clock(self):
+        read = services.broadcast_partner(self.partner)
+
+        services.mark_all_read(self.user)
+
+        mark = NotificationReadMark.objects.get(user=self.user)
+        self.assertEqual(mark.read_through, Notification.objects.get(pk=read.pk).created_at)
+        # A broadcast stamped before mark_all_read ran but committed after it.
+        late_partner = Partner.objects.create(
+            name='Late Partner',
+            slug='late-partner-notif',
+            description='Committed late',
+            is_active=True,
+        )
+        late = services.broadcast_partner(late_partner)
+        Notification.objects.filter(pk=late.pk).update(
+            created_at=mark.read_through + timedelta(microseconds=1),
+        )
+        self.assertEqual(services.unread_count(self.user), 1)
+
+    def test_rebroadcast_resurfaces_above_watermark(self):
+        notification = services.broadcast_partner(self.partner)
+        services.mark_all_read(self.user)
+        self.assertEqual(services.unread_count(self.user), 0)
+
+        services.broadcast_partner(self.partner, message='Updated copy')
+
+        self.assertEqual(services.unread_count(self.user), 1)
+        feed = services.annotate_read_state(services.feed_for(self.user), self.user)
+        self.assertFalse(feed.get(pk=notification.pk).receipt_read)
+
+    def test_unread_count_query_count_does_not_grow_with_broadcasts(self):
+        services.broadcast_partner(self.partner)
+        services.mark_all_read(self.user)
+        with self.assertNumQueries(7):
+            services.unread_count(self.user)
+
+        for index in range(5):
+            partner = Partner.objects.create(
+                name=f'Bulk Partner {index}',
+                slug=f'bulk-partner-notif-{index}',
+                description='A partner',
+                is_active=True,
+            )
+            services.broadcast_partner(partner)
+        # audiences_for (4) + watermarks + personal count + broadcast range count.
+        with self.assertNumQueries(7):
+            self.assertEqual(services.unread_count(self.user), 5)
+
 
 class NotificationAPITests(TestCase):
     def setUp(self):
@@ -379,6 +472,104 @@ class NotificationAPITests(TestCase):
         self.assertIsNone(foreign.read_at)
 
 
+class NotificationCounterCacheTests(TestCase):
+    UNREAD_URL = '/api/v1/notifications/unread-count/'
+    WHATS_NEW_URL = '/api/v1/whats-new/unseen-count/'
+
+    def setUp(self):
+        clear_notification_counters()
+        self.user = make_user('counter@test.com', '0x6767676767676767676767676767676767676767')
+        User.objects.filter(pk=self.user.pk).update(
+            date_joined=timezone.now() - timedelta(days=1)
+        )
+        self.user.refresh_from_db()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.partner = Partner.objects.create(
+            name='Counter Partner',
+            slug='counter-partner-notif',
+            description='A partner',
+            is_active=True,
+        )
+
+    def notify_user(self):
+        return services.notify(
+            'referral.joined',
+            recipient=self.user,
+            title='Your referral joined the portal',
+        )
+
+    def test_idle_poll_is_served_from_cache_with_etag(self):
+        self.notify_user()
+        first = self.client.get(self.UNREAD_URL)
+        self.assertEqual(first.data['count'], 1)
+
+        # Served from the shared cache, no query at all.
+        with self.assertNumQueries(0):
+            second = self.client.get(self.UNREAD_URL)
+        self.assertEqual(second.data['count'], 1)
+
+        with self.assertNumQueries(0):
+            revalidated = self.client.get(self.UNREAD_URL, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+        self.notify_user()
+        changed = self.client.get(self.UNREAD_URL, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.data['count'], 2)
+
+    def test_writers_retire_the_cached_unread_count(self):
+        personal = self.notify_user()
+        self.assertEqual(self.client.get(self.UNREAD_URL).data['count'], 1)
+
+        broadcast = services.broadcast_partner(self.partner)
+        self.assertEqual(self.client.get(self.UNREAD_URL).data['count'], 2)
+
+        self.client.post(f'/api/v1/notifications/{personal.pk}/mark-read/')
+        self.assertEqual(self.client.get(self.UNREAD_URL).data['count'], 1)
+
+        # Reading an already-read item does not decrement twice.
+        self.client.post(f'/api/v1/notifications/{personal.pk}/mark-read/')
+        self.client.post(f'/api/v1/notifications/{broadcast.pk}/mark-read/')
+        self.assertEqual(self.client.get(self.UNREAD_URL).data['count'], 0)
+
+        self.notify_user()
+        self.client.post('/api/v1/notifications/mark-all-read/')
+        self.assertEqual(self.client.get(self.UNREAD_URL).data['count'], 0)
+
+    def test_count_cached_before_commit_is_retired_on_commit(self):
+        self.assertEqual(self.client.get(self.UNREAD_URL).data['count'], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.notify_user()
+            # A poll on another connection still sees the pre-commit rows.
+            notification_cache.cache.set(
+                notification_cache.unread_count_key(self.user.pk),
+                0,
+                notification_cache.NOTIFICATION_COUNTER_TTL_SECONDS,
+            )
+        self.assertEqual(self.client.get(self.UNREAD_URL).data['count'], 1)
+
+    def test_announcement_writes_refresh_whats_new_count(self):
+        self.assertEqual(self.client.get(self.WHATS_NEW_URL).data['count'], 0)
+        with self.assertNumQueries(0):
+            self.client.get(self.WHATS_NEW_URL)
+
+        announcement = WhatsNewAnnouncement.objects.create(
+            title='Fresh feature',
+            status=WhatsNewAnnouncement.STATUS_PUBLISHED,
+            published_at=timezone.now() - timedelta(minutes=1),
+        )
+        self.assertEqual(self.client.get(self.WHATS_NEW_URL).data['count'], 1)
+
+        response = self.client.post(
+            '/api/v1/whats-new/mark-seen/',
+            {'ids': [announcement.pk]},
+            format='json',
+        )
+        self.assertEqual(response.data['count'], 0)
+        self.assertEqual(self.client.get(self.WHATS_NEW_URL).data['count'], 0)
+
+
 class StewardReviewEndpointNotificationTests(TestCase):
     """The main steward review endpoint must notify the submitter."""
 
@@ -810,6 +1001,260 @@ class CampaignSendTests(TestCase):
         self.assertTrue(Notification.objects.filter(recipient=self.bob).exists())
 
 
+class CampaignBackgroundSendTests(TestCase):
+    def setUp(self):
+        self.admin = make_user('bg-sender@test.com', '0x4141414141414141414141414141414141414141')
+        self.users = [
+            make_user(f'bg-{index}@test.com', f'0x{index:040x}')
+            for index in range(1, 6)
+        ]
+        self.campaign = CustomNotification.objects.create(
+            title='Hand-picked campaign',
+            target_mode=CustomNotification.TARGET_USERS,
+        )
+        self.campaign.target_users.set([self.admin, *self.users])
+
+    def run_command(self, *args):
+        from io import StringIO
+        from django.core.management import call_command
+        out = StringIO()
+        call_command('send_campaigns', *args, stdout=out)
+        return out.getvalue()
+
+    def test_batches_checkpoint_cursor_and_finish(self):
+        campaigns.queue_campaign(self.campaign, actor=self.admin)
+
+        first = campaigns.send_campaign_batch(self.campaign, batch_size=4)
+
+        self.assertFalse(first.done)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, CustomNotification.STATUS_SENDING)
+        self.assertEqual(self.campaign.send_total, 6)
+        self.assertEqual(self.campaign.send_progress, 4)
+        delivered = list(
+            Notification.objects.order_by('recipient_id').values_list('recipient_id', flat=True)
+        )
+        self.assertEqual(self.campaign.send_cursor, delivered[-1])
+
+        second = campaigns.send_campaign_batch(self.campaign, batch_size=4)
+
+        self.assertTrue(second.done)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, CustomNotification.STATUS_SENT)
+        self.assertEqual(self.campaign.sent_count, 6)
+        self.assertEqual(self.campaign.sent_by, self.admin)
+        self.assertEqual(Notification.objects.filter(event_type='custom.announcement').count(), 6)
+
+    def test_command_resumes_after_crashed_batch(self):
+        from unittest import mock
+
+        campaigns.queue_campaign(self.campaign, actor=self.admin)
+        output = self.run_command('--batch-size', '2', '--max-batches', '1')
+        self.assertIn('paused at 2/6', output)
+        self.campaign.refresh_from_db()
+        checkpoint = self.campaign.send_cursor
+
+        with mock.patch.object(Notification.objects, 'bulk_create', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self.run_command('--batch-size', '2')
+
+        # The failed batch rolled back together with its checkpoint.
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.send_cursor, checkpoint)
+        self.assertEqual(self.campaign.send_progress, 2)
+
+        output = self.run_command('--batch-size', '2')
+
+        self.assertIn(f'Campaign {self.campaign.pk} sent: 6/6', output)
+        self.assertEqual(Notification.objects.count(), 6)
+        self.assertEqual(Notification.objects.values('recipient_id').distinct().count(), 6)
+
+    def test_recall_stops_queued_run(self):
+        campaigns.queue_campaign(self.campaign, actor=self.admin)
+        campaigns.send_campaign_batch(self.campaign, batch_size=2)
+
+        campaigns.recall_campaign(self.campaign)
+        output = self.run_command()
+
+        self.assertIn('No campaigns queued', output)
+        self.assertEqual(Notification.objects.count(), 0)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, CustomNotification.STATUS_DRAFT)
+
+    def test_cron_endpoint_requires_token_and_delivers_queue(self):
+        from django.test import override_settings
+
+        campaigns.queue_campaign(self.campaign, actor=self.admin)
+        client = APIClient()
+
+        with override_settings(CRON_SYNC_TOKEN='campaign-secret'):
+            blocked = client.post('/api/v1/notification-campaigns/send/')
+            self.assertEqual(blocked.status_code, 403)
+            self.assertEqual(Notification.objects.count(), 0)
+
+            allowed = client.post(
+                '/api/v1/notification-campaigns/send/',
+                HTTP_X_CRON_TOKEN='campaign-secret',
+            )
+
+        self.assertEqual(allowed.status_code, 200)
+        self.assertEqual(allowed.data['campaigns'], [{
+            'id': self.campaign.pk,
+            'status': CustomNotification.STATUS_SENT,
+            'batches': 1,
+            'progress': 6,
+            'total': 6,
+        }])
+        self.assertEqual(Notification.objects.count(), 6)
+
+    def test_time_budget_pauses_between_batches(self):
+        from unittest import mock
+
+        campaigns.queue_campaign(self.campaign, actor=self.admin)
+        clock = iter([0, 0, 100])
+
+        with mock.patch.object(campaigns.time, 'monotonic', side_effect=lambda: next(clock)):
+            runs = campaigns.deliver_queued_campaigns(batch_size=2, max_seconds=60)
+
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0].batches, 1)
+        self.assertFalse(runs[0].done)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, CustomNotification.STATUS_SENDING)
+        self.assertEqual(self.campaign.send_progress, 2)
+
+    def test_admin_queues_audiences_over_inline_limit(self):
+        User.objects.filter(pk=self.admin.pk).update(is_staff=True, is_superuser=True)
+        self.client.force_login(self.admin)
+        original_limit = campaigns.INLINE_SEND_LIMIT
+        campaigns.INLINE_SEND_LIMIT = 3
+        try:
+            response = self.client.post(
+                '/admin/notifications/customnotification/',
+                {'action': 'send_selected', '_selected_action': [str(self.campaign.pk)]},
+            )
+        finally:
+            campaigns.INLINE_SEND_LIMIT = original_limit
+
+        self.assertEqual(response.status_code, 302)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, CustomNotification.STATUS_SENDING)
+        self.assertEqual(Notification.objects.count(), 0)
+
+        response = self.client.get(f'/admin/notifications/customnotification/{self.campaign.pk}/change/')
+        self.assertContains(response, '0 / ~6 delivered (0%)')
+
+
+class CampaignSharedDeliveryTests(TestCase):
+    def setUp(self):
+        from stewards.models import Steward
+        self.admin = make_user('shared-sender@test.com', '0x4242424242424242424242424242424242424242')
+        self.validator = make_user('shared-validator@test.com', '0x4343434343434343434343434343434343434343')
+        self.steward = make_user('shared-steward@test.com', '0x4444444444444444444444444444444444444444')
+        self.outsider = make_user('shared-outsider@test.com', '0x4545454545454545454545454545454545454545')
+        Validator.objects.create(user=self.validator)
+        Steward.objects.create(user=self.steward)
+        self.campaign = CustomNotification.objects.create(
+            title='Role campaign',
+            body='Shared copy',
+            target_mode=CustomNotification.TARGET_ROLES,
+            target_roles=['validators', 'stewards'],
+        )
+
+    def feed_titles(self, user):
+        return list(services.feed_for(user).values_list('title', flat=True))
+
+    def test_roles_campaign_stores_one_row_plus_members(self):
+        result = campaigns.send_campaign(self.campaign, actor=self.admin, batch_size=1)
+
+        self.assertEqual(result.total, 2)
+        row = Notification.objects.get()
+        self.assertIsNone(row.recipient_id)
+        self.assertEqual(row.audience, Notification.AUDIENCE_LISTED)
+        self.assertEqual(
+            set(row.audience_members.values_list('user_id', flat=True)),
+            {self.validator.pk, self.steward.pk},
+        )
+        self.assertEqual(self.feed_titles(self.validator), ['Role campaign'])
+        self.assertEqual(self.feed_titles(self.outsider), [])
+        self.assertEqual(services.unread_count(self.steward), 1)
+        self.assertEqual(services.unread_count(self.outsider), 0)
+
+        services.mark_all_read(self.steward)
+
+        self.assertEqual(services.unread_count(self.steward), 0)
+        self.assertEqual(services.unread_count(self.validator), 1)
+
+    def test_everyone_campaign_is_a_single_all_broadcast(self):
+        self.campaign.target_mode = CustomNotification.TARGET_EVERYONE
+        self.campaign.save()
+
+        result = campaigns.send_campaign(self.campaign, actor=self.admin, inline_limit=1)
+
+        self.assertFalse(result.queued)
+        self.assertEqual(result.total, 4)
+        row = Notification.objects.get()
+        self.assertEqual(row.audience, Notification.AUDIENCE_ALL)
+        self.assertFalse(row.audience_members.exists())
+        self.assertEqual(self.feed_titles(self.outsider), ['Role campaign'])
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, CustomNotification.STATUS_SENT)
+        self.assertEqual(self.campaign.sent_count, 4)
+
+    def test_resend_drops_stale_members_and_resurfaces(self):
+        campaigns.send_campaign(self.campaign, actor=self.admin)
+        services.mark_all_read(self.validator)
+
+        self.campaign.target_roles = ['validators']
+        self.campaign.save()
+        result = campaigns.send_campaign(self.campaign, actor=self.admin)
+
+        self.assertEqual(result.refreshed, 1)
+        self.assertEqual(Notification.objects.count(), 1)
+        self.assertEqual(services.unread_count(self.validator), 1)
+        self.assertEqual(self.feed_titles(self.steward), [])
+
+    def test_queued_resend_keeps_members_until_the_run_passes_them(self):
+        campaigns.send_campaign(self.campaign, actor=self.admin)
+        self.campaign.target_roles = ['validators']
+        self.campaign.save()
+
+        campaigns.queue_campaign(self.campaign, actor=self.admin)
+        self.assertEqual(self.feed_titles(self.steward), ['Role campaign'])
+
+        batch = campaigns.send_campaign_batch(self.campaign, batch_size=1)
+        self.assertFalse(batch.done)
+        self.assertEqual(self.feed_titles(self.validator), ['Role campaign'])
+        self.assertEqual(self.feed_titles(self.steward), ['Role campaign'])
+
+        self.assertTrue(campaigns.send_campaign_batch(self.campaign, batch_size=1).done)
+        self.assertEqual(
+            list(NotificationAudienceMember.objects.values_list('user_id', flat=True)),
+            [self.validator.pk],
+        )
+        self.assertEqual(self.feed_titles(self.steward), [])
+
+    def test_switching_to_personal_targeting_replaces_shared_row(self):
+        campaigns.send_campaign(self.campaign, actor=self.admin)
+
+        self.campaign.target_mode = CustomNotification.TARGET_USERS
+        self.campaign.save()
+        self.campaign.target_users.set([self.steward])
+        campaigns.send_campaign(self.campaign, actor=self.admin)
+
+        self.assertEqual(Notification.objects.get().recipient, self.steward)
+        self.assertEqual(self.feed_titles(self.steward), ['Role campaign'])
+        self.assertEqual(self.feed_titles(self.validator), [])
+
+    def test_recall_removes_shared_row_and_members(self):
+        campaigns.send_campaign(self.campaign, actor=self.admin)
+
+        self.assertEqual(campaigns.recall_campaign(self.campaign), 1)
+
+        self.assertFalse(Notification.objects.exists())
+        self.assertFalse(NotificationAudienceMember.objects.exists())
+
+
 class CampaignFeedVisibilityTests(TestCase):
     def setUp(self):
         self.recipient = make_user('target@test.com', '0x8080808080808080808080808080808080808080')
@@ -1,9 +1,13 @@
-from rest_framework import mixins, permissions, viewsets
+from django.utils.http import parse_etags
+from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from . import services
+from validators.permissions import IsCronToken
+
+from . import campaigns, services
 from .serializers import (
     LightNotificationSerializer,
     NotificationSerializer,
@@ -12,6 +16,16 @@ from .serializers import (
 )
 
 
+def count_response(request, scope, count):
+    """Badge count with an ETag, so an unchanged count polls back as a bodyless 304."""
+    etag = f'W/"{scope}-{count}"'
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if_none_match = request.headers.get('If-None-Match', '')
+    if etag in parse_etags(if_none_match) or if_none_match.strip() == '*':
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response({'count': count}, headers=headers)
+
+
 class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -44,13 +58,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
 
     @action(detail=False, methods=['get'], url_path='unread-count')
     def unread_count(self, request):
-        user = request.user
-        count = (
-            services.annotate_read_state(services.feed_for(user), user)
-            .filter(services.UNREAD_Q)
-            .count()
-        )
-        return Response({'count': count})
+        return count_response(request, 'unread', services.cached_unread_count(request.user))
 
     @action(detail=True, methods=['post'], url_path='mark-read')
     def mark_read(self, request, pk=None):
@@ -89,7 +97,11 @@ class WhatsNewAnnouncementViewSet(mixins.ListModelMixin, viewsets.GenericViewSet
 
     @action(detail=False, methods=['get'], url_path='unseen-count')
     def unseen_count(self, request):
-        return Response({'count': services.whats_new_unseen_count(request.user)})
+        return count_response(
+            request,
+            'whats-new',
+            services.cached_whats_new_unseen_count(request.user),
+        )
 
     @action(detail=False, methods=['post'], url_path='mark-seen')
     def mark_seen(self, request):
@@ -102,5 +114,32 @@ class WhatsNewAnnouncementViewSet(mixins.ListModelMixin, viewsets.GenericViewSet
         )
         return Response({
             'updated': updated,
-            'count': services.whats_new_unseen_count(request.user),
+            'count': services.cached_whats_new_unseen_count(request.user),
+        })
+
+
+class SendQueuedCampaignsView(APIView):
+    """Cron-protected delivery of queued custom notification campaigns.
+
+    Each call spends at most SEND_BUDGET_SECONDS on batches; campaigns left
+    unfinished resume from their checkpoint on the next scheduled call.
+    """
+    SEND_BUDGET_SECONDS = 60
+    authentication_classes = []
+    permission_classes = [IsCronToken]
+
+    def post(self, request):
+        runs = campaigns.deliver_queued_campaigns(max_seconds=self.SEND_BUDGET_SECONDS)
+        return Response({
+            'count': len(runs),
+            'campaigns': [
+                {
+                    'id': run.campaign.pk,
+                    'status': run.campaign.status,
+                    'batches': run.batches,
+                    'progress': run.campaign.send_progress,
+                    'total': run.campaign.send_total,
+                }
+                for run in runs
+            ],
         })
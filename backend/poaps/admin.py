@@ -4,9 +4,8 @@ from urllib.parse import urlencode
 from django import forms
 from django.contrib import admin
 from django.contrib import messages
-from django.conf import settings
-from django.db.models import F, IntegerField, Q, Sum
-from django.http import HttpResponse
+from django.db.models import Count, F, IntegerField, Q, Sum
+from django.http import StreamingHttpResponse
 from django.urls import reverse
 from django.utils.html import format_html
 from django.utils import timezone
@@ -16,7 +15,22 @@ from notifications.admin_mixins import BroadcastNotificationAdminMixin
 from utils.admin_mixins import CloudinaryUploadMixin
 
 from .models import PoapClaim, PoapDistribution, PoapDrop, PoapImportBatch, PoapMintLink
-from .services import decrypt_token, encrypt_token, generate_mint_links, hash_secret, hash_token
+from .services import (
+    MINT_LINK_BATCH_SIZE,
+    decrypt_token,
+    encrypt_token,
+    hash_secret,
+    hash_token,
+    iter_mint_link_batches,
+    mint_link_claim_url,
+)
+
+
+class EchoBuffer:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
 
 
 def unused_mint_link_capacity(queryset):
@@ -139,7 +153,7 @@ class PoapDistributionAdminForm(forms.ModelForm):
             )
 
         if max_claims is not None and self.instance.pk:
-            minimum_max_claims = self.instance.claimed_count + existing_distribution_link_capacity
+            minimum_max_claims = self.instance.get_claimed_count() + existing_distribution_link_capacity
             if max_claims < minimum_max_claims:
                 errors['max_claims'] = (
                     f'Max claims cannot be lower than the current claimed count plus '
@@ -148,7 +162,7 @@ class PoapDistributionAdminForm(forms.ModelForm):
 
         if mint_link_count:
             requested_claims = mint_link_count * mint_link_max_uses
-            claimed_count = getattr(self.instance, 'claimed_count', 0)
+            claimed_count = self.instance.get_claimed_count()
             if max_claims is not None:
                 remaining_distribution_claims = max_claims - claimed_count - existing_distribution_link_capacity
                 if requested_claims > remaining_distribution_claims:
@@ -191,8 +205,15 @@ class PoapDistributionInline(admin.TabularInline):
     model = PoapDistribution
     form = PoapDistributionAdminForm
     extra = 0
-    fields = ('method', 'active', 'starts_at', 'ends_at', 'max_claims', 'secret_phrase', 'claimed_count')
-    readonly_fields = ('claimed_count',)
+    fields = ('method', 'active', 'starts_at', 'ends_at', 'max_claims', 'secret_phrase', 'claims_taken')
+    readonly_fields = ('claims_taken',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(claims_count_value=Count('claims'))
+
+    @admin.display(description='Claimed count')
+    def claims_taken(self, obj):
+        return obj.get_claimed_count()
 
 
 @admin.register(PoapDrop)
@@ -256,17 +277,17 @@ class PoapDropAdmin(BroadcastNotificationAdminMixin, CloudinaryUploadMixin, admi
 @admin.register(PoapDistribution)
 class PoapDistributionAdmin(admin.ModelAdmin):
     form = PoapDistributionAdminForm
-    list_display = ('drop', 'method', 'active', 'starts_at', 'ends_at', 'max_claims', 'claimed_count')
+    list_display = ('drop', 'method', 'active', 'starts_at', 'ends_at', 'max_claims', 'claims_taken')
     list_filter = ('method', 'active')
     search_fields = ('drop__title', 'drop__slug')
-    readonly_fields = ('claimed_count', 'created_at', 'updated_at')
+    readonly_fields = ('claims_taken', 'created_at', 'updated_at')
     autocomplete_fields = ('drop',)
     fieldsets = (
         (None, {
             'fields': ('drop', 'method', 'active'),
         }),
         ('Claim window and cap', {
-            'fields': ('starts_at', 'ends_at', 'max_claims', 'claimed_count'),
+            'fields': ('starts_at', 'ends_at', 'max_claims', 'claims_taken'),
         }),
         ('Secret phrase', {
             'fields': ('secret_phrase',),
@@ -282,19 +303,29 @@ class PoapDistributionAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(claims_count_value=Count('claims'))
+
+    @admin.display(description='Claimed count')
+    def claims_taken(self, obj):
+        return obj.get_claimed_count()
+
     def save_model(self, request, obj, form, change):
         super().save_model(request, obj, form, change)
         mint_link_count = form.cleaned_data.get('mint_link_count') or 0
         if not mint_link_count:
             return
 
-        created = generate_mint_links(
-            distribution=obj,
-            count=mint_link_count,
-            max_uses=form.cleaned_data.get('mint_link_max_uses') or 1,
-            expires_at=form.cleaned_data.get('mint_link_expires_at'),
+        created = sum(
+            len(batch)
+            for batch in iter_mint_link_batches(
+                distribution=obj,
+                count=mint_link_count,
+                max_uses=form.cleaned_data.get('mint_link_max_uses') or 1,
+                expires_at=form.cleaned_data.get('mint_link_expires_at'),
+            )
         )
-        messages.success(request, f'Generated {len(created)} mint link(s).')
+        messages.success(request, f'Generated {created} mint link(s).')
 
 
 @admin.register(PoapMintLink)
@@ -340,28 +371,29 @@ class PoapMintLinkAdmin(admin.ModelAdmin):
 
     @admin.action(description='Download selected claim URLs')
     def download_selected_claim_urls(self, request, queryset):
-        response = HttpResponse(content_type='text/csv')
+        # Streamed row by row so exporting a large event's links never holds
+        # every decrypted token, or the whole CSV, in memory.
+        def rows():
+            yield ['drop', 'distribution_id', 'mint_link_id', 'claim_url', 'max_uses', 'used_count', 'expires_at']
+            for link in queryset.select_related('distribution__drop').iterator(chunk_size=MINT_LINK_BATCH_SIZE):
+                token = decrypt_token(link.token_ciphertext)
+                yield [
+                    link.distribution.drop.title,
+                    link.distribution_id,
+                    link.id,
+                    self._claim_url_from_token(token) if token else '',
+                    link.max_uses,
+                    link.used_count,
+                    link.expires_at.isoformat() if link.expires_at else '',
+                ]
+
+        writer = csv.writer(EchoBuffer())
+        response = StreamingHttpResponse((writer.writerow(row) for row in rows()), content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename="poap-mint-links.csv"'
-        writer = csv.writer(response)
-        writer.writerow(['drop', 'distribution_id', 'mint_link_id', 'claim_url', 'max_uses', 'used_count', 'expires_at'])
-        for link in queryset.select_related('distribution__drop'):
-            token = decrypt_token(link.token_ciphertext)
-            writer.writerow([
-                link.distribution.drop.title,
-                link.distribution_id,
-                link.id,
-                self._claim_url_from_token(token) if token else '',
-                link.max_uses,
-                link.used_count,
-                link.expires_at.isoformat() if link.expires_at else '',
-            ])
         return response
 
     def _claim_url_from_token(self, token):
-        frontend_url = getattr(settings, 'FRONTEND_URL', '').rstrip('/')
-        if not frontend_url:
-            return f'/claim/poap/{token}'
-        return f'{frontend_url}/claim/poap/{token}'
+        return mint_link_claim_url(token)
 
 
 @admin.register(PoapClaim)
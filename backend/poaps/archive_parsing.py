@@ -0,0 +1,160 @@
+"""
+Collector export parsing for the POAP archive importer.
+
+Kept free of Django imports so ``import_poap_archive`` can run it in worker
+processes: each worker opens the archive itself and returns plain row dicts.
+XLSX sheets are read with ``iterparse`` and finished rows are dropped from the
+tree as their values are taken, so a large export never exists as a full XML
+tree.
+"""
+
+import csv
+import io
+import posixpath
+import re
+import zipfile
+from xml.etree import ElementTree
+
+MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+OFFICE_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+COLUMN_RE = re.compile(r'([A-Z]+)')
+
+
+def read_archive_rows(archive_path, data_path):
+    """Open the archive and return the cleaned rows of one collector export."""
+    with zipfile.ZipFile(archive_path) as archive:
+        return read_rows(archive, data_path)
+
+
+def read_rows(archive, path):
+    if path.lower().endswith('.xlsx'):
+        return read_xlsx_rows(io.BytesIO(archive.read(path)))
+    with archive.open(path) as data:
+        return read_csv_rows(data)
+
+
+def read_csv_rows(data):
+    stream = io.TextIOWrapper(data, encoding='utf-8-sig', newline='')
+    reader = csv.DictReader(stream)
+    if not reader.fieldnames:
+        return []
+    return [clean_row(row) for row in reader]
+
+
+def read_xlsx_rows(data):
+    matrix = iter_xlsx_matrix(data)
+    header_values = next(matrix, None)
+    if header_values is None:
+        return []
+
+    headers = [str(value or '').strip() for value in header_values]
+    rows = []
+    for values in matrix:
+        if not any(str(value or '').strip() for value in values):
+            continue
+        row = {}
+        for index, header in enumerate(headers):
+            if header:
+                row[header] = values[index] if index < len(values) else ''
+        rows.append(clean_row(row))
+    return rows
+
+
+def iter_xlsx_matrix(data):
+    """Yield the first sheet's rows as lists of cell strings, in sheet order."""
+    with zipfile.ZipFile(data) as workbook:
+        sheet_path = _xlsx_first_sheet_path(workbook)
+        if not sheet_path:
+            return
+        shared_strings = _xlsx_shared_strings(workbook)
+
+        with workbook.open(sheet_path) as sheet:
+            sheet_data = None
+            for event, element in ElementTree.iterparse(sheet, events=('start', 'end')):
+                if event == 'start':
+                    if element.tag == f'{MAIN_NS}sheetData':
+                        sheet_data = element
+                    continue
+                if element.tag != f'{MAIN_NS}row':
+                    continue
+                values = []
+                for cell in element.iterfind(f'{MAIN_NS}c'):
+                    column_index = _xlsx_column_index(cell.attrib.get('r', ''))
+                    while len(values) < column_index:
+                        values.append('')
+                    values.append(_xlsx_cell_value(cell, shared_strings))
+                # Drop finished rows so the parsed tree stays one row deep.
+                if sheet_data is not None:
+                    sheet_data.clear()
+                yield values
+
+
+def _xlsx_first_sheet_path(workbook):
+    workbook_root = ElementTree.fromstring(workbook.read('xl/workbook.xml'))
+    sheets = workbook_root.findall(f'{MAIN_NS}sheets/{MAIN_NS}sheet')
+    if not sheets:
+        return ''
+
+    rel_id = sheets[0].attrib.get(f'{OFFICE_REL_NS}id')
+    rels_root = ElementTree.fromstring(workbook.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels_root.findall(f'{REL_NS}Relationship'):
+        if rel.attrib.get('Id') == rel_id:
+            target = rel.attrib.get('Target', '')
+            return _xlsx_target_path(target) if target else ''
+    return ''
+
+
+def _xlsx_shared_strings(workbook):
+    if 'xl/sharedStrings.xml' not in workbook.namelist():
+        return []
+    strings = []
+    with workbook.open('xl/sharedStrings.xml') as source:
+        for _, element in ElementTree.iterparse(source, events=('end',)):
+            if element.tag == f'{MAIN_NS}si':
+                strings.append(''.join(text_node.text or '' for text_node in element.iter(f'{MAIN_NS}t')))
+                element.clear()
+    return strings
+
+
+def _xlsx_cell_value(cell, shared_strings):
+    cell_type = cell.attrib.get('t')
+    if cell_type == 'inlineStr':
+        return ''.join(text_node.text or '' for text_node in cell.iter(f'{MAIN_NS}t')).strip()
+
+    value_node = cell.find(f'{MAIN_NS}v')
+    if value_node is None:
+        return ''
+
+    raw = value_node.text or ''
+    if cell_type == 's':
+        try:
+            return shared_strings[int(raw)].strip()
+        except (IndexError, ValueError):
+            return ''
+    return raw.strip()
+
+
+def _xlsx_target_path(target):
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join('xl', target))
+
+
+def _xlsx_column_index(cell_reference):
+    match = COLUMN_RE.match((cell_reference or '').upper())
+    if not match:
+        return 0
+    value = 0
+    for char in match.group(1):
+        value = value * 26 + ord(char) - ord('A') + 1
+    return value - 1
+
+
+def clean_row(row):
+    return {
+        (key or '').strip(): '' if value is None else str(value).strip()
+        for key, value in row.items()
+        if key is not None
+    }
@@ -0,0 +1,80 @@
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from poaps.models import PoapDistribution
+from poaps.services import MINT_LINK_BATCH_SIZE, iter_mint_link_batches, mint_link_claim_url
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate mint links for a mint-link distribution and stream their claim URLs '
+        'to a CSV file (or stdout) as each batch is written.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('distribution_id', type=int)
+        parser.add_argument('--count', type=int, required=True)
+        parser.add_argument('--max-uses', type=int, default=1)
+        parser.add_argument('--expires-at', help='ISO 8601 datetime after which the links stop working.')
+        parser.add_argument('--batch-size', type=int, default=MINT_LINK_BATCH_SIZE)
+        parser.add_argument('--output', help='CSV file to write. Defaults to stdout.')
+
+    def handle(self, *args, **options):
+        try:
+            distribution = PoapDistribution.objects.select_related('drop').get(pk=options['distribution_id'])
+        except PoapDistribution.DoesNotExist as exc:
+            raise CommandError(f"Distribution {options['distribution_id']} does not exist.") from exc
+        if distribution.method != PoapDistribution.METHOD_MINT_LINK:
+            raise CommandError('Mint links can only be generated for a mint-link distribution.')
+        if options['count'] < 1:
+            raise CommandError('--count must be at least 1.')
+
+        expires_at = None
+        if options['expires_at']:
+            expires_at = parse_datetime(options['expires_at'])
+            if expires_at is None:
+                raise CommandError(f"Invalid --expires-at: {options['expires_at']}")
+
+        output = open(options['output'], 'w', newline='') if options['output'] else self.stdout
+        try:
+            writer = csv.writer(output)
+            writer.writerow(['drop', 'distribution_id', 'mint_link_id', 'claim_url', 'max_uses', 'expires_at'])
+            created = 0
+            started = time.monotonic()
+            # Each batch commits on its own, so an interrupted run keeps the
+            # links whose URLs were already written out.
+            batches = iter_mint_link_batches(
+                distribution=distribution,
+                count=options['count'],
+                max_uses=options['max_uses'],
+                expires_at=expires_at,
+                batch_size=options['batch_size'],
+            )
+            while True:
+                with transaction.atomic():
+                    batch = next(batches, None)
+                if batch is None:
+                    break
+                for link, token in batch:
+                    writer.writerow([
+                        distribution.drop.title,
+                        distribution.pk,
+                        link.pk,
+                        mint_link_claim_url(token),
+                        link.max_uses,
+                        expires_at.isoformat() if expires_at else '',
+                    ])
+                created += len(batch)
+            elapsed = time.monotonic() - started
+        finally:
+            if output is not self.stdout:
+                output.close()
+
+        rate = created / elapsed if elapsed else float(created)
+        summary = f'Generated {created} mint link(s) in {elapsed:.2f}s ({rate:.0f} links/sec).'
+        # Keep stdout clean for the CSV when no --output file is given.
+        (self.stdout if options['output'] else self.stderr).write(self.style.SUCCESS(summary))
@@ -1,13 +1,14 @@
-import csv
 import datetime
 import io
-import posixpath
+import multiprocessing
+import os
 import re
 import time
 import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
-from xml.etree import ElementTree
 
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
@@ -16,6 +17,7 @@ from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.text import slugify
 
+from poaps.archive_parsing import read_archive_rows
 from poaps.models import PoapClaim, PoapDrop, PoapImportBatch
 
 
@@ -81,6 +83,7 @@ class Command(BaseCommand):
         'email',
     ]
     ENS_FIELDS = ['ens', 'ens_name', 'ens name']
+    WALLET_LOOKUP_CHUNK_SIZE = 1000
     EXTERNAL_ID_FIELDS = [
         'token_id',
         'token id',
@@ -125,6 +128,18 @@ class Command(BaseCommand):
             action='store_true',
             help='Validate archive structure and report what would be imported without writing the database.',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=min(4, os.cpu_count() or 1),
+            help='Processes used to parse collector exports. 1 parses in this process.',
+        )
+        parser.add_argument(
+            '--upload-workers',
+            type=int,
+            default=4,
+            help='Concurrent artwork uploads used with --upload-artwork.',
+        )
 
     def handle(self, *args, **options):
         archive_path = Path(options['archive_path'])
@@ -153,12 +168,31 @@ class Command(BaseCommand):
             existing_drops_by_id = self._existing_drops_by_legacy_id(drops)
             self._validate_archive_artwork_sources(drops, options, existing_drops_by_id)
 
+            timings = {}
+            parsed = self._iter_parsed_drops(archive_path, drops, options['workers'])
+            # The wallet index grows as drops arrive, one lookup per new wallet.
+            user_by_wallet = {}
+            indexed_wallets = set()
+
             if options['dry_run']:
-                dry_run_stats = []
-                for drop in drops:
-                    rows = self._read_rows(archive, drop.data_path)
-                    existing_drop = existing_drops_by_id.get(drop.legacy_id)
-                    dry_run_stats.append(self._dry_run_drop_stats(drop, rows, existing_drop))
+                stats_by_id = {}
+                while True:
+                    with self._timed_stage('parse', timings):
+                        drop_entry, rows = next(parsed, (None, None))
+                    if drop_entry is None:
+                        break
+                    if isinstance(rows, Exception):
+                        raise rows
+                    entries = self._claim_entries(drop_entry, rows)
+                    with self._timed_stage('index', timings):
+                        self._index_wallets(entries, user_by_wallet, indexed_wallets)
+                    stats_by_id[drop_entry.legacy_id] = self._dry_run_drop_stats(
+                        drop_entry,
+                        entries,
+                        existing_drops_by_id.get(drop_entry.legacy_id),
+                        user_by_wallet,
+                    )
+                dry_run_stats = [stats_by_id[drop.legacy_id] for drop in drops]
 
                 total_rows = sum(stats.total_rows for stats in dry_run_stats)
                 row_errors = [
@@ -167,6 +201,7 @@ class Command(BaseCommand):
                     for error in stats.errors
                 ]
                 self._write_dry_run_report(dry_run_stats)
+                self._write_stage_timings(timings)
                 if row_errors:
                     preview = '; '.join(row_errors[:5])
                     remaining = len(row_errors) - 5
@@ -185,50 +220,163 @@ class Command(BaseCommand):
                 file_name=str(archive_path),
             )
             errors = []
-
-            for index, drop_entry in enumerate(drops, start=1):
-                started_at = time.monotonic()
-                self.stdout.write(
-                    f'[{index}/{len(drops)}] Importing POAP {drop_entry.legacy_id}: {drop_entry.title}'
-                )
-                try:
-                    existing_drop = existing_drops_by_id.get(drop_entry.legacy_id)
-                    rows = self._read_rows(archive, drop_entry.data_path)
-                    artwork = self._prepare_artwork(archive, drop_entry, options, existing_drop=existing_drop)
-                    drop = self._upsert_drop(
+            written = 0
+
+            def write(drop_entry, entries, artwork):
+                nonlocal written
+                written += 1
+                with self._timed_stage('write', timings):
+                    self._write_drop(
+                        batch,
+                        errors,
                         drop_entry,
+                        entries,
                         artwork,
                         options,
-                        row_count=len(rows),
-                        existing_drop=existing_drop,
+                        existing_drops_by_id.get(drop_entry.legacy_id),
+                        user_by_wallet,
+                        progress=f'[{written}/{len(drops)}]',
                     )
-                except Exception as exc:
-                    batch.error_count += 1
-                    errors.append({'drop': drop_entry.data_path, 'error': str(exc)})
-                    continue
 
-                try:
-                    self._import_claim_rows(batch, drop, drop_entry, rows, errors)
-                except Exception as exc:
-                    batch.error_count += 1
-                    errors.append({'drop': drop_entry.data_path, 'error': str(exc)})
-                    continue
+            # Each drop is written as soon as its rows are parsed and its
+            # artwork is ready, while later exports are still being parsed
+            # and uploaded; only the drops in flight are held in memory.
+            with ThreadPoolExecutor(max_workers=max(options['upload_workers'], 1)) as uploads:
+                pending = {}
+                while True:
+                    with self._timed_stage('parse', timings):
+                        drop_entry, rows = next(parsed, (None, None))
+                    if drop_entry is None:
+                        break
+                    if isinstance(rows, Exception):
+                        written += 1
+                        batch.error_count += 1
+                        errors.append({'drop': drop_entry.data_path, 'error': str(rows)})
+                        continue
+                    entries = self._claim_entries(drop_entry, rows)
+                    with self._timed_stage('index', timings):
+                        self._index_wallets(entries, user_by_wallet, indexed_wallets)
+                    artwork = self._start_artwork(
+                        uploads,
+                        archive,
+                        drop_entry,
+                        options,
+                        existing_drops_by_id.get(drop_entry.legacy_id),
+                    )
+                    pending[artwork] = (drop_entry, entries)
+                    for ready in [future for future in pending if future.done()]:
+                        write(*pending.pop(ready), ready)
 
-                elapsed = time.monotonic() - started_at
-                self.stdout.write(self.style.SUCCESS(
-                    f'[{index}/{len(drops)}] Imported {len(rows)} collector row(s) '
-                    f'for POAP {drop_entry.legacy_id} in {elapsed:.1f}s.'
-                ))
+                remaining = as_completed(list(pending))
+                while pending:
+                    with self._timed_stage('artwork', timings):
+                        ready = next(remaining)
+                    write(*pending.pop(ready), ready)
 
             batch.errors = errors
             batch.save()
 
+        self._write_stage_timings(timings)
         self.stdout.write(self.style.SUCCESS(
             f'Imported {batch.imported_count}/{batch.total_rows} claims across {len(drops)} POAPs '
             f'({batch.matched_count} wallet matched, {batch.unmatched_count} unmatched, '
             f'{batch.error_count} errors).'
         ))
 
+    @contextmanager
+    def _timed_stage(self, name, timings):
+        """Add the block's wall time to ``timings[name]``; stages overlap."""
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            timings[name] = timings.get(name, 0.0) + time.monotonic() - started_at
+
+    def _write_stage_timings(self, timings):
+        self.stdout.write(
+            'Stage timings: ' + ', '.join(f'{name} {elapsed:.2f}s' for name, elapsed in timings.items())
+        )
+
+    def _iter_parsed_drops(self, archive_path, drops, workers):
+        """Yield (drop, rows or the exception raised reading them) as each export is parsed."""
+        # Daemonic processes (task workers, the parallel test runner) cannot
+        # start a pool of their own.
+        if workers <= 1 or len(drops) <= 1 or multiprocessing.current_process().daemon:
+            for drop in drops:
+                try:
+                    yield drop, read_archive_rows(archive_path, drop.data_path)
+                except Exception as exc:
+                    yield drop, exc
+            return
+
+        # archive_parsing has no Django imports, so spawned workers start
+        # clean instead of forking this process's database connections.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+        ) as executor:
+            futures = {
+                executor.submit(read_archive_rows, str(archive_path), drop.data_path): drop
+                for drop in drops
+            }
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as exc:
+                    yield futures[future], exc
+
+    def _start_artwork(self, executor, archive, drop_entry, options, existing_drop):
+        """Return a future for the drop's artwork dict.
+
+        Image bytes are read from the archive here; only the upload runs on
+        the executor. Existing artwork and source errors come back as
+        already-finished futures.
+        """
+        future = Future()
+        if self._drop_has_existing_artwork(existing_drop):
+            future.set_result({
+                'artwork_url': existing_drop.artwork_url,
+                'artwork_public_id': existing_drop.artwork_public_id,
+            })
+            return future
+        try:
+            self._validate_artwork_source(drop_entry, options, existing_drop=existing_drop)
+            image_data = archive.read(drop_entry.image_path)
+        except Exception as exc:
+            future.set_exception(exc)
+            return future
+        suffix = PurePosixPath(drop_entry.image_path).suffix.lower() or '.webp'
+        return executor.submit(
+            self._upload_artwork,
+            image_data,
+            filename=f'poap-{drop_entry.legacy_id}{suffix}',
+            drop_entry=drop_entry,
+            folder=options['cloudinary_folder'],
+        )
+
+    def _write_drop(self, batch, errors, drop_entry, entries, artwork, options, existing_drop, user_by_wallet, progress):
+        started_at = time.monotonic()
+        self.stdout.write(f'{progress} Importing POAP {drop_entry.legacy_id}: {drop_entry.title}')
+        try:
+            drop = self._upsert_drop(
+                drop_entry,
+                artwork.result(),
+                options,
+                row_count=len(entries),
+                existing_drop=existing_drop,
+            )
+            self._import_claim_rows(batch, drop, drop_entry, entries, errors, user_by_wallet)
+        except Exception as exc:
+            batch.error_count += 1
+            errors.append({'drop': drop_entry.data_path, 'error': str(exc)})
+            return
+
+        elapsed = time.monotonic() - started_at
+        self.stdout.write(self.style.SUCCESS(
+            f'{progress} Imported {len(entries)} collector row(s) '
+            f'for POAP {drop_entry.legacy_id} in {elapsed:.1f}s.'
+        ))
+
     def _collect_drops(self, archive):
         data_by_id = {}
         duplicate_data_paths = []
@@ -273,11 +421,13 @@ class Command(BaseCommand):
         image_only_ids = sorted(set(image_by_id) - set(data_by_id), key=int)
         return drops, duplicate_data_paths, image_only_ids
 
-    def _import_claim_rows(self, batch, drop, drop_entry, rows, errors):
-        entries = [
+    def _claim_entries(self, drop_entry, rows):
+        return [
             self._claim_entry(drop_entry, row, row_number)
             for row_number, row in enumerate(rows, start=2)
         ]
+
+    def _import_claim_rows(self, batch, drop, drop_entry, entries, errors, user_by_wallet):
         batch.total_rows += len(entries)
 
         valid_entries = []
@@ -295,13 +445,7 @@ class Command(BaseCommand):
             valid_entries.append(entry)
         entries = valid_entries
 
-        user_by_wallet = self._users_by_wallet(entries)
-        user_by_wallet.update(self._users_by_previously_linked_wallet(entries, user_by_wallet))
-        existing_user_ids = set(
-            PoapClaim.objects
-            .filter(drop=drop, user_id__in=[user.id for user in user_by_wallet.values()])
-            .values_list('user_id', flat=True)
-        )
+        existing_user_ids = self._existing_claim_user_ids(drop, entries, user_by_wallet)
         unmatched_by_wallet, unmatched_by_external, unmatched_by_email = self._unmatched_claim_maps(drop)
 
         claims_to_create = []
@@ -411,20 +555,19 @@ class Command(BaseCommand):
                 errors.append(f'{model_field} exceeds max length {max_length}')
         return errors
 
-    def _dry_run_drop_stats(self, drop_entry, rows, existing_drop):
+    def _dry_run_drop_stats(self, drop_entry, claim_entries, existing_drop, user_by_wallet):
         stats = DryRunDropStats(
             legacy_id=drop_entry.legacy_id,
             title=drop_entry.title,
-            total_rows=len(rows),
+            total_rows=len(claim_entries),
         )
         entries = []
-        for row_number, row in enumerate(rows, start=2):
-            entry = self._claim_entry(drop_entry, row, row_number)
+        for entry in claim_entries:
             entry_errors = self._claim_entry_errors(entry)
             if entry_errors:
                 stats.invalid_rows += 1
                 for error in entry_errors:
-                    stats.errors.append(f'{drop_entry.legacy_id} row {row_number}: {error}')
+                    stats.errors.append(f'{drop_entry.legacy_id} row {entry["row_number"]}: {error}')
                 continue
             entries.append(entry)
 
@@ -433,13 +576,7 @@ class Command(BaseCommand):
             return stats
 
         drop = existing_drop or self._existing_drop_for_legacy_id(drop_entry.legacy_id)
-        user_by_wallet = self._users_by_wallet(entries)
-        user_by_wallet.update(self._users_by_previously_linked_wallet(entries, user_by_wallet))
-        existing_user_ids = set(
-            PoapClaim.objects
-            .filter(drop=drop, user_id__in=[user.id for user in user_by_wallet.values()])
-            .values_list('user_id', flat=True)
-        )
+        existing_user_ids = self._existing_claim_user_ids(drop, entries, user_by_wallet)
         unmatched_by_wallet, unmatched_by_external, unmatched_by_email = self._unmatched_claim_maps(drop)
 
         simulated_unmatched_by_wallet = dict(unmatched_by_wallet)
@@ -558,47 +695,75 @@ class Command(BaseCommand):
             import_batch=batch,
         )
 
-    def _users_by_wallet(self, entries):
-        wallet_keys = sorted({entry['wallet_key'] for entry in entries if entry['wallet_key']})
+    def _existing_claim_user_ids(self, drop, entries, user_by_wallet):
+        user_ids = {
+            user_by_wallet[entry['wallet_key']].id
+            for entry in entries
+            if entry['wallet_key'] in user_by_wallet
+        }
+        if drop is None or not user_ids:
+            return set()
+        return set(
+            PoapClaim.objects
+            .filter(drop=drop, user_id__in=user_ids)
+            .values_list('user_id', flat=True)
+        )
+
+    def _wallet_key_chunks(self, wallet_keys):
+        for start in range(0, len(wallet_keys), self.WALLET_LOOKUP_CHUNK_SIZE):
+            yield wallet_keys[start:start + self.WALLET_LOOKUP_CHUNK_SIZE]
+
+    def _index_wallets(self, entries, user_by_wallet, indexed_wallets):
+        """Add users for the entries' wallets that have not been looked up yet."""
+        wallet_keys = {entry['wallet_key'] for entry in entries if entry['wallet_key']} - indexed_wallets
+        if not wallet_keys:
+            return
+        indexed_wallets.update(wallet_keys)
+        user_by_wallet.update(self._users_by_wallet(wallet_keys))
+        user_by_wallet.update(self._users_by_previously_linked_wallet(wallet_keys, user_by_wallet))
+
+    def _users_by_wallet(self, wallet_keys):
+        wallet_keys = sorted(wallet_keys)
         if not wallet_keys:
             return {}
 
         User = get_user_model()
-        users = (
-            User.objects
-            .exclude(address__isnull=True)
-            .exclude(address='')
-            .annotate(address_key=Lower('address'))
-            .filter(address_key__in=wallet_keys)
-            .only('id', 'address')
-        )
-        return {user.address.lower(): user for user in users if user.address}
+        user_by_wallet = {}
+        for chunk in self._wallet_key_chunks(wallet_keys):
+            users = (
+                User.objects
+                .exclude(address__isnull=True)
+                .exclude(address='')
+                .annotate(address_key=Lower('address'))
+                .filter(address_key__in=chunk)
+                .only('id', 'address')
+            )
+            user_by_wallet.update({user.address.lower(): user for user in users if user.address})
+        return user_by_wallet
 
-    def _users_by_previously_linked_wallet(self, entries, existing_user_by_wallet):
+    def _users_by_previously_linked_wallet(self, wallet_keys, existing_user_by_wallet):
         wallet_keys = sorted(
-            {
-                entry['wallet_key']
-                for entry in entries
-                if entry['wallet_key'] and entry['wallet_key'] not in existing_user_by_wallet
-            }
+            wallet_key for wallet_key in wallet_keys
+            if wallet_key not in existing_user_by_wallet
         )
         if not wallet_keys:
             return {}
 
         user_ids_by_wallet = {}
-        claims = (
-            PoapClaim.objects
-            .filter(user__isnull=False)
-            .exclude(legacy_wallet_address='')
-            .annotate(wallet_key=Lower('legacy_wallet_address'))
-            .filter(wallet_key__in=wallet_keys)
-            .select_related('user')
-            .only('legacy_wallet_address', 'user__id', 'user__address')
-            .order_by('legacy_wallet_address', 'user_id')
-        )
-        for claim in claims:
-            wallet_key = claim.legacy_wallet_address.lower()
-            user_ids_by_wallet.setdefault(wallet_key, {})[claim.user_id] = claim.user
+        for chunk in self._wallet_key_chunks(wallet_keys):
+            claims = (
+                PoapClaim.objects
+                .filter(user__isnull=False)
+                .exclude(legacy_wallet_address='')
+                .annotate(wallet_key=Lower('legacy_wallet_address'))
+                .filter(wallet_key__in=chunk)
+                .select_related('user')
+                .only('legacy_wallet_address', 'user__id', 'user__address')
+                .order_by('legacy_wallet_address', 'user_id')
+            )
+            for claim in claims:
+                wallet_key = claim.legacy_wallet_address.lower()
+                user_ids_by_wallet.setdefault(wallet_key, {})[claim.user_id] = claim.user
 
         return {
             wallet_key: next(iter(users.values()))
@@ -665,25 +830,6 @@ class Command(BaseCommand):
         )
         return drop
 
-    def _prepare_artwork(self, archive, drop_entry, options, existing_drop=None):
-        if self._drop_has_existing_artwork(existing_drop):
-            return {
-                'artwork_url': existing_drop.artwork_url,
-                'artwork_public_id': existing_drop.artwork_public_id,
-            }
-
-        self._validate_artwork_source(drop_entry, options, existing_drop=existing_drop)
-        image_data = archive.read(drop_entry.image_path)
-        suffix = PurePosixPath(drop_entry.image_path).suffix.lower() or '.webp'
-        filename = f'poap-{drop_entry.legacy_id}{suffix}'
-
-        return self._upload_artwork(
-            image_data,
-            filename=filename,
-            drop_entry=drop_entry,
-            folder=options['cloudinary_folder'],
-        )
-
     def _validate_artwork_source(self, drop_entry, options, existing_drop=None):
         if self._drop_has_existing_artwork(existing_drop):
             return
@@ -744,112 +890,6 @@ class Command(BaseCommand):
                 existing_drop=existing_drops_by_id.get(drop.legacy_id),
             )
 
-    def _read_rows(self, archive, path):
-        data = archive.read(path)
-        if path.lower().endswith('.xlsx'):
-            return self._read_xlsx_rows(data)
-        return self._read_csv_rows(data)
-
-    def _read_csv_rows(self, data):
-        stream = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8-sig', newline='')
-        reader = csv.DictReader(stream)
-        if not reader.fieldnames:
-            return []
-        return [self._clean_row(row) for row in reader]
-
-    def _read_xlsx_rows(self, data):
-        matrix = self._read_xlsx_matrix(data)
-        if not matrix:
-            return []
-
-        headers = [str(value or '').strip() for value in matrix[0]]
-        rows = []
-        for values in matrix[1:]:
-            if not any(str(value or '').strip() for value in values):
-                continue
-            row = {}
-            for index, header in enumerate(headers):
-                if header:
-                    row[header] = values[index] if index < len(values) else ''
-            rows.append(self._clean_row(row))
-        return rows
-
-    def _read_xlsx_matrix(self, data):
-        main_ns = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
-        rel_ns = '{http://schemas.openxmlformats.org/package/2006/relationships}'
-        office_rel_ns = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
-
-        with zipfile.ZipFile(io.BytesIO(data)) as workbook:
-            shared_strings = self._xlsx_shared_strings(workbook, main_ns)
-            workbook_root = ElementTree.fromstring(workbook.read('xl/workbook.xml'))
-            sheets = workbook_root.findall(f'{main_ns}sheets/{main_ns}sheet')
-            if not sheets:
-                return []
-
-            rel_id = sheets[0].attrib.get(f'{office_rel_ns}id')
-            rels_root = ElementTree.fromstring(workbook.read('xl/_rels/workbook.xml.rels'))
-            sheet_target = ''
-            for rel in rels_root.findall(f'{rel_ns}Relationship'):
-                if rel.attrib.get('Id') == rel_id:
-                    sheet_target = rel.attrib.get('Target', '')
-                    break
-            if not sheet_target:
-                return []
-
-            sheet_path = self._xlsx_target_path(sheet_target)
-            sheet_root = ElementTree.fromstring(workbook.read(sheet_path))
-            rows = []
-            for row in sheet_root.findall(f'.//{main_ns}sheetData/{main_ns}row'):
-                values = []
-                for cell in row.findall(f'{main_ns}c'):
-                    ref = cell.attrib.get('r', '')
-                    column_index = self._xlsx_column_index(ref)
-                    while len(values) < column_index:
-                        values.append('')
-                    values.append(self._xlsx_cell_value(cell, shared_strings, main_ns))
-                rows.append(values)
-            return rows
-
-    def _xlsx_shared_strings(self, workbook, main_ns):
-        if 'xl/sharedStrings.xml' not in workbook.namelist():
-            return []
-        root = ElementTree.fromstring(workbook.read('xl/sharedStrings.xml'))
-        return [
-            ''.join(text_node.text or '' for text_node in item.iter(f'{main_ns}t'))
-            for item in root.findall(f'{main_ns}si')
-        ]
-
-    def _xlsx_cell_value(self, cell, shared_strings, main_ns):
-        cell_type = cell.attrib.get('t')
-        if cell_type == 'inlineStr':
-            return ''.join(text_node.text or '' for text_node in cell.iter(f'{main_ns}t')).strip()
-
-        value_node = cell.find(f'{main_ns}v')
-        if value_node is None:
-            return ''
-
-        raw = value_node.text or ''
-        if cell_type == 's':
-            try:
-                return shared_strings[int(raw)].strip()
-            except (IndexError, ValueError):
-                return ''
-        return raw.strip()
-
-    def _xlsx_target_path(self, target):
-        if target.startswith('/'):
-            return target.lstrip('/')
-        return posixpath.normpath(posixpath.join('xl', target))
-
-    def _xlsx_column_index(self, cell_reference):
-        match = re.match(r'([A-Z]+)', (cell_reference or '').upper())
-        if not match:
-            return 0
-        value = 0
-        for char in match.group(1):
-            value = value * 26 + ord(char) - ord('A') + 1
-        return value - 1
-
     def _data_metadata(self, path):
         filename = PurePosixPath(path).name
         match = self.DATA_FILENAME_RE.match(filename)
@@ -897,13 +937,6 @@ class Command(BaseCommand):
         value = re.sub(r'\s+', ' ', value)
         return value.strip()
 
-    def _clean_row(self, row):
-        return {
-            (key or '').strip(): '' if value is None else str(value).strip()
-            for key, value in row.items()
-            if key is not None
-        }
-
     def _row_value(self, row, candidates):
         normalized_row = {
             self._normalize_header(key): value
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.6 on 2026-10-19 12:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('poaps', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='poapdistribution',
+            index=models.Index(fields=['drop', 'method', 'secret_hash'], name='poaps_poapd_drop_id_57d7e5_idx'),
+        ),
+    ]
@@ -102,11 +102,40 @@ class PoapDistribution(BaseModel):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['method', 'active', 'starts_at', 'ends_at']),
+            models.Index(fields=['drop', 'method', 'secret_hash']),
         ]
 
     def __str__(self):
         return f'{self.drop} - {self.get_method_display()}'
 
+    def save(self, *args, **kwargs):
+        # claimed_count is only maintained while the distribution is capped,
+        # so bring it current from the claims whenever a cap is saved.
+        if self.max_claims is not None and not self._state.adding:
+            self.claimed_count = self.claims.count()
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'max_claims' in update_fields:
+                kwargs['update_fields'] = {*update_fields, 'claimed_count'}
+        super().save(*args, **kwargs)
+
+    def get_claimed_count(self):
+        """
+        Count claims taken through this distribution.
+
+        A capped distribution keeps claimed_count current with the guarded
+        UPDATE that enforces its cap. Uncapped ones leave the row alone on
+        claim and count their claims, using the claims_count_value
+        annotation when the queryset provides it.
+        """
+        if self.max_claims is not None:
+            return self.claimed_count
+        annotated_count = getattr(self, 'claims_count_value', None)
+        if annotated_count is not None:
+            return annotated_count
+        if self.pk is None:
+            return 0
+        return self.claims.count()
+
     def is_open(self, at_time=None):
         at_time = at_time or timezone.now()
         if not self.active:
@@ -105,7 +105,7 @@ class PoapDropDetailSerializer(PoapDropListSerializer):
                 'starts_at': distribution.starts_at,
                 'ends_at': distribution.ends_at,
                 'max_claims': distribution.max_claims,
-                'claimed_count': distribution.claimed_count,
+                'claimed_count': distribution.get_claimed_count(),
                 'mint_link_count': getattr(distribution, 'mint_link_count', 0),
             })
         return result
@@ -1,5 +1,6 @@
 import base64
 import hashlib
+from functools import lru_cache
 
 from cryptography.fernet import Fernet, InvalidToken
 from django.conf import settings
@@ -7,7 +8,7 @@ from django.contrib.auth import get_user_model
 from django.db import IntegrityError, transaction
 from django.db.models import F
 from django.utils import timezone
-from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.crypto import salted_hmac
 from social_connections.models import DiscordConnection
 
 from .models import PoapClaim, PoapDistribution, PoapDrop, PoapMintLink
@@ -48,12 +49,25 @@ def hash_token(value):
     return salted_hmac('poap.mint-link', value or '', secret=settings.SECRET_KEY).hexdigest()
 
 
-def secure_compare(left, right):
-    return constant_time_compare(left or '', right or '')
+def _token_hasher():
+    """Return a hash_token equivalent that derives the HMAC key only once."""
+    keyed = salted_hmac('poap.mint-link', '', secret=settings.SECRET_KEY)
+
+    def hasher(value):
+        digest = keyed.copy()
+        digest.update((value or '').encode('utf-8'))
+        return digest.hexdigest()
+
+    return hasher
 
 
 def _fernet():
-    digest = hashlib.sha256(settings.SECRET_KEY.encode('utf-8')).digest()
+    return _fernet_for_key(settings.SECRET_KEY)
+
+
+@lru_cache(maxsize=4)
+def _fernet_for_key(secret_key):
+    digest = hashlib.sha256(secret_key.encode('utf-8')).digest()
     return Fernet(base64.urlsafe_b64encode(digest))
 
 
@@ -92,9 +106,8 @@ def validate_discord_connection(user):
 
 
 def _create_claim(*, drop, user, distribution, mint_link=None, method=None):
-    if PoapClaim.objects.filter(drop=drop, user=user).exists():
-        raise AlreadyClaimedError('You already claimed this POAP.')
-
+    # The unique (drop, user) constraint is the duplicate check; a pre-check
+    # query would only add a round trip and still race.
     try:
         claim = PoapClaim.objects.create(
             drop=drop,
@@ -107,16 +120,33 @@ def _create_claim(*, drop, user, distribution, mint_link=None, method=None):
     except IntegrityError as exc:
         raise AlreadyClaimedError('You already claimed this POAP.') from exc
 
-    PoapDistribution.objects.filter(pk=distribution.pk).update(
-        claimed_count=F('claimed_count') + 1
-    )
     if mint_link:
         PoapMintLink.objects.filter(pk=mint_link.pk).update(
             used_count=F('used_count') + 1
         )
+
+    # Only a capped distribution keeps claimed_count, enforcing its limit in
+    # the same statement; uncapped ones are counted from their claims, so a
+    # popular drop does not queue every claim behind one distribution row.
+    if distribution.max_claims is not None:
+        counted = PoapDistribution.objects.filter(
+            pk=distribution.pk,
+            claimed_count__lt=F('max_claims'),
+        )
+        if not counted.update(claimed_count=F('claimed_count') + 1):
+            raise ClaimClosedError('This distribution has reached its claim limit.')
     return claim
 
 
+def _get_drop_for_claim(**lookup):
+    drop = PoapDrop.objects.get(**lookup)
+    if drop.max_claims is not None:
+        # Only a drop-wide cap needs concurrent claims on the drop serialized;
+        # uncapped drops are claimed without touching the drop row.
+        drop = PoapDrop.objects.select_for_update().get(pk=drop.pk)
+    return drop
+
+
 def claim_with_secret(*, drop_slug, user, secret):
     if not user or not user.is_authenticated:
         raise InvalidClaimError('Authentication is required.')
@@ -124,30 +154,25 @@ def claim_with_secret(*, drop_slug, user, secret):
 
     candidate_hash = hash_secret(secret)
     with transaction.atomic():
-        drop = PoapDrop.objects.select_for_update().get(slug=drop_slug)
+        drop = _get_drop_for_claim(slug=drop_slug)
         validate_drop_capacity(drop)
 
-        distributions = (
+        # secret_hash is a keyed HMAC digest, so an indexed equality lookup
+        # reveals nothing that comparing in constant time would protect.
+        matches = list(
             PoapDistribution.objects
-            .select_for_update()
             .filter(
                 drop=drop,
                 method=PoapDistribution.METHOD_SECRET,
                 active=True,
+                secret_hash=candidate_hash,
             )
             .order_by('-created_at')
         )
-        distribution = None
-        matched_closed_distribution = False
-        for item in distributions:
-            if secure_compare(item.secret_hash, candidate_hash):
-                if item.is_open():
-                    distribution = item
-                    break
-                matched_closed_distribution = True
+        distribution = next((item for item in matches if item.is_open()), None)
 
         if distribution is None:
-            if matched_closed_distribution:
+            if matches:
                 raise ClaimClosedError('This distribution is not currently open.')
             raise InvalidClaimError('Invalid secret phrase.')
 
@@ -171,8 +196,8 @@ def claim_with_mint_link(*, token, user):
         try:
             mint_link = (
                 PoapMintLink.objects
-                .select_for_update()
-                .select_related('distribution', 'distribution__drop')
+                .select_for_update(of=('self',))
+                .select_related('distribution')
                 .get(token_hash=token_digest)
             )
         except PoapMintLink.DoesNotExist as exc:
@@ -181,7 +206,7 @@ def claim_with_mint_link(*, token, user):
             ) from exc
 
         distribution = mint_link.distribution
-        drop = PoapDrop.objects.select_for_update().get(pk=distribution.drop_id)
+        drop = _get_drop_for_claim(pk=distribution.drop_id)
         now = timezone.now()
 
         if distribution.method != PoapDistribution.METHOD_MINT_LINK:
@@ -217,18 +242,50 @@ def claim_with_mint_link(*, token, user):
         )
 
 
+MINT_LINK_BATCH_SIZE = 1000
+
+
+def iter_mint_link_batches(*, distribution, count, max_uses=1, expires_at=None, batch_size=MINT_LINK_BATCH_SIZE):
+    """Create mint links in bulk batches, yielding each batch's (link, token) pairs.
+
+    Only one batch of plaintext tokens is held at a time, so callers that
+    stream the tokens out (a CSV export) can generate any number of links.
+    """
+    fernet = _fernet()
+    token_hasher = _token_hasher()
+    remaining = count
+    while remaining > 0:
+        tokens = [PoapMintLink.generate_token() for _ in range(min(batch_size, remaining))]
+        links = PoapMintLink.objects.bulk_create([
+            PoapMintLink(
+                distribution=distribution,
+                token_hash=token_hasher(token),
+                token_ciphertext=fernet.encrypt(token.encode('utf-8')).decode('utf-8'),
+                max_uses=max_uses,
+                expires_at=expires_at,
+            )
+            for token in tokens
+        ])
+        remaining -= len(links)
+        yield list(zip(links, tokens))
+
+
+def mint_link_claim_url(token):
+    frontend_url = getattr(settings, 'FRONTEND_URL', '').rstrip('/')
+    if not frontend_url:
+        return f'/claim/poap/{token}'
+    return f'{frontend_url}/claim/poap/{token}'
+
+
 def generate_mint_links(*, distribution, count, max_uses=1, expires_at=None):
     created = []
-    for _ in range(count):
-        token = PoapMintLink.generate_token()
-        link = PoapMintLink.objects.create(
-            distribution=distribution,
-            token_hash=hash_token(token),
-            token_ciphertext=encrypt_token(token),
-            max_uses=max_uses,
-            expires_at=expires_at,
-        )
-        created.append((link, token))
+    for batch in iter_mint_link_batches(
+        distribution=distribution,
+        count=count,
+        max_uses=max_uses,
+        expires_at=expires_at,
+    ):
+        created.extend(batch)
     return created
 
 
@@ -0,0 +1,60 @@
+import io
+import zipfile
+
+from django.test import SimpleTestCase
+
+from poaps.archive_parsing import read_xlsx_rows
+
+MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+OFFICE_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_REL = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def build_xlsx(sheet_rows, shared_strings):
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, 'w') as workbook:
+        workbook.writestr(
+            'xl/workbook.xml',
+            f'<workbook xmlns="{MAIN}" xmlns:r="{OFFICE_REL}">'
+            '<sheets><sheet name="Collectors" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        workbook.writestr(
+            'xl/_rels/workbook.xml.rels',
+            f'<Relationships xmlns="{PACKAGE_REL}">'
+            '<Relationship Id="rId1" Target="worksheets/sheet1.xml"/></Relationships>',
+        )
+        workbook.writestr(
+            'xl/sharedStrings.xml',
+            f'<sst xmlns="{MAIN}">'
+            + ''.join(f'<si><t>{value}</t></si>' for value in shared_strings)
+            + '</sst>',
+        )
+        workbook.writestr(
+            'xl/worksheets/sheet1.xml',
+            f'<worksheet xmlns="{MAIN}"><sheetData>{"".join(sheet_rows)}</sheetData></worksheet>',
+        )
+    data.seek(0)
+    return data
+
+
+class ReadXlsxRowsTest(SimpleTestCase):
+    def test_reads_shared_inline_and_sparse_cells(self):
+        data = build_xlsx(
+            [
+                '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c>'
+                '<c r="C1" t="s"><v>2</v></c></row>',
+                '<row r="2"><c r="A2" t="inlineStr"><is><t> wallet.eth </t></is></c>'
+                '<c r="C2"><v>42</v></c></row>',
+                '<row r="3"><c r="A3" t="s"><v>9</v></c></row>',
+                '<row r="4"><c r="B4" t="s"><v>3</v></c></row>',
+            ],
+            ['ens', 'ethereum_address', 'token_id', '0xabc'],
+        )
+
+        self.assertEqual(read_xlsx_rows(data), [
+            {'ens': 'wallet.eth', 'ethereum_address': '', 'token_id': '42'},
+            {'ens': '', 'ethereum_address': '0xabc', 'token_id': ''},
+        ])
+
+    def test_sheet_without_rows_reads_empty(self):
+        self.assertEqual(read_xlsx_rows(build_xlsx([], [])), [])
@@ -1,3 +1,4 @@
+import csv
 import io
 import tempfile
 import zipfile
@@ -21,9 +22,17 @@ from rest_framework.test import APIClient
 from creators.models import Creator
 from ethereum_auth.models import Nonce
 from ethereum_auth.testing import login_wallet_session
-from poaps.admin import PoapDistributionAdminForm, PoapDropAdmin, PoapDropAdminForm
-from poaps.models import PoapClaim, PoapDistribution, PoapDrop, PoapImportBatch
-from poaps.services import generate_mint_links, hash_secret
+from poaps.admin import PoapDistributionAdminForm, PoapDropAdmin, PoapDropAdminForm, PoapMintLinkAdmin
+from poaps.models import PoapClaim, PoapDistribution, PoapDrop, PoapImportBatch, PoapMintLink
+from poaps.services import (
+    ClaimClosedError,
+    _create_claim,
+    decrypt_token,
+    generate_mint_links,
+    hash_secret,
+    hash_token,
+    iter_mint_link_batches,
+)
 from social_connections.models import DiscordConnection
 
 User = get_user_model()
@@ -145,7 +154,7 @@ class PoapAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(PoapClaim.objects.filter(drop=self.drop, user=self.user).exists())
         distribution.refresh_from_db()
-        self.assertEqual(distribution.claimed_count, 1)
+        self.assertEqual(distribution.get_claimed_count(), 1)
 
     def test_read_only_community_viewer_cannot_claim_secret(self):
         distribution = self._secret_distribution()
@@ -163,7 +172,7 @@ class PoapAPITest(TestCase):
         self.assertEqual(response.data['code'], 'role_view_only')
         self.assertFalse(PoapClaim.objects.filter(drop=self.drop, user=self.user).exists())
         distribution.refresh_from_db()
-        self.assertEqual(distribution.claimed_count, 0)
+        self.assertEqual(distribution.get_claimed_count(), 0)
 
     def test_real_creator_with_view_flag_can_still_claim_secret(self):
         self._secret_distribution()
@@ -195,7 +204,7 @@ class PoapAPITest(TestCase):
         self.assertIn('link your Discord', response.data['error'])
         self.assertFalse(PoapClaim.objects.filter(drop=self.drop, user=self.user).exists())
         distribution.refresh_from_db()
-        self.assertEqual(distribution.claimed_count, 0)
+        self.assertEqual(distribution.get_claimed_count(), 0)
 
     def test_secret_claim_rejects_invalid_secret(self):
         self._secret_distribution()
@@ -242,6 +251,61 @@ class PoapAPITest(TestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(PoapDistribution.objects.get().get_claimed_count(), 1)
+
+    def test_secret_claim_matches_distribution_by_secret_hash(self):
+        self._secret_distribution(secret='first-phrase')
+        second = self._secret_distribution(secret='second-phrase')
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(
+            '/api/v1/poaps/ama-session/claim-secret/',
+            {'secret': 'Second-Phrase'},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(PoapClaim.objects.get(drop=self.drop, user=self.user).distribution, second)
+
+    def test_claim_refuses_capped_distribution_filled_since_it_was_read(self):
+        distribution = self._secret_distribution(max_claims=1)
+        stale_read = PoapDistribution.objects.get(pk=distribution.pk)
+        PoapDistribution.objects.filter(pk=distribution.pk).update(claimed_count=1)
+
+        with self.assertRaisesMessage(ClaimClosedError, 'This distribution has reached its claim limit.'):
+            with transaction.atomic():
+                _create_claim(drop=self.drop, user=self.user, distribution=stale_read)
+
+        self.assertFalse(PoapClaim.objects.filter(drop=self.drop, user=self.user).exists())
+        distribution.refresh_from_db()
+        self.assertEqual(distribution.get_claimed_count(), 1)
+
+    def test_uncapped_claim_leaves_the_distribution_row_alone(self):
+        distribution = self._secret_distribution()
+
+        with CaptureQueriesContext(connection) as queries:
+            with transaction.atomic():
+                _create_claim(drop=self.drop, user=self.user, distribution=distribution)
+
+        self.assertFalse(any(
+            query['sql'].startswith('UPDATE') and 'poaps_poapdistribution' in query['sql']
+            for query in queries.captured_queries
+        ))
+        distribution.refresh_from_db()
+        self.assertEqual(distribution.claimed_count, 0)
+        self.assertEqual(distribution.get_claimed_count(), 1)
+
+    def test_capping_a_distribution_counts_its_existing_claims(self):
+        distribution = self._secret_distribution()
+        with transaction.atomic():
+            _create_claim(drop=self.drop, user=self.user, distribution=distribution)
+
+        distribution.max_claims = 5
+        distribution.save(update_fields=['max_claims', 'updated_at'])
+
+        distribution.refresh_from_db()
+        self.assertEqual(distribution.claimed_count, 1)
+        self.assertEqual(distribution.get_claimed_count(), 1)
 
     def test_secret_claim_enforces_window_and_capacity(self):
         self._secret_distribution(
@@ -292,7 +356,60 @@ class PoapAPITest(TestCase):
         link.refresh_from_db()
         distribution.refresh_from_db()
         self.assertEqual(link.used_count, 1)
-        self.assertEqual(distribution.claimed_count, 1)
+        self.assertEqual(distribution.get_claimed_count(), 1)
+
+    def test_mint_link_batches_store_hash_and_ciphertext_of_each_token(self):
+        distribution = PoapDistribution.objects.create(
+            drop=self.drop,
+            method=PoapDistribution.METHOD_MINT_LINK,
+        )
+
+        batches = list(iter_mint_link_batches(distribution=distribution, count=7, max_uses=2, batch_size=3))
+
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+        for link, token in (pair for batch in batches for pair in batch):
+            link.refresh_from_db()
+            self.assertEqual(link.token_hash, hash_token(token))
+            self.assertEqual(decrypt_token(link.token_ciphertext), token)
+            self.assertEqual(link.max_uses, 2)
+        self.assertEqual(distribution.mint_links.count(), 7)
+
+    def test_generate_mint_links_command_streams_claim_urls(self):
+        distribution = PoapDistribution.objects.create(
+            drop=self.drop,
+            method=PoapDistribution.METHOD_MINT_LINK,
+        )
+        stdout = io.StringIO()
+
+        with tempfile.NamedTemporaryFile('r', suffix='.csv') as output:
+            call_command(
+                'generate_poap_mint_links', str(distribution.pk),
+                '--count', '5', '--batch-size', '2', '--output', output.name,
+                stdout=stdout,
+            )
+            rows = list(csv.DictReader(output))
+
+        self.assertEqual(len(rows), 5)
+        self.assertIn('Generated 5 mint link(s)', stdout.getvalue())
+        token = rows[0]['claim_url'].rsplit('/', 1)[-1]
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post('/api/v1/poaps/claim-link/', {'token': token}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_mint_link_admin_download_streams_claim_urls(self):
+        distribution = PoapDistribution.objects.create(
+            drop=self.drop,
+            method=PoapDistribution.METHOD_MINT_LINK,
+        )
+        [(link, token)] = generate_mint_links(distribution=distribution, count=1)
+        model_admin = PoapMintLinkAdmin(PoapMintLink, admin.site)
+
+        response = model_admin.download_selected_claim_urls(None, PoapMintLink.objects.all())
+
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(rows[0][:4], ['drop', 'distribution_id', 'mint_link_id', 'claim_url'])
+        self.assertEqual(rows[1][2], str(link.pk))
+        self.assertEqual(rows[1][3], f'http://localhost:5173/claim/poap/{token}')
 
     def test_mint_link_legacy_path_still_claims(self):
         distribution = PoapDistribution.objects.create(
@@ -309,7 +426,7 @@ class PoapAPITest(TestCase):
         link.refresh_from_db()
         distribution.refresh_from_db()
         self.assertEqual(link.used_count, 1)
-        self.assertEqual(distribution.claimed_count, 1)
+        self.assertEqual(distribution.get_claimed_count(), 1)
 
     def test_read_only_community_viewer_cannot_claim_mint_links(self):
         distribution = PoapDistribution.objects.create(
@@ -342,7 +459,7 @@ class PoapAPITest(TestCase):
         distribution.refresh_from_db()
         self.assertEqual(modern_link.used_count, 0)
         self.assertEqual(legacy_link.used_count, 0)
-        self.assertEqual(distribution.claimed_count, 0)
+        self.assertEqual(distribution.get_claimed_count(), 0)
 
     def test_real_creator_with_view_flag_can_claim_mint_link(self):
         distribution = PoapDistribution.objects.create(
@@ -415,7 +532,7 @@ class PoapAPITest(TestCase):
         link.refresh_from_db()
         distribution.refresh_from_db()
         self.assertEqual(link.used_count, 0)
-        self.assertEqual(distribution.claimed_count, 0)
+        self.assertEqual(distribution.get_claimed_count(), 0)
 
     def test_mint_link_claim_reports_inactive_distribution(self):
         distribution = PoapDistribution.objects.create(
@@ -1528,3 +1645,46 @@ class PoapAPITest(TestCase):
         self.assertIn('would_create=2 (matched=1, unmatched=1)', report)
         self.assertIn('would_attach_existing_unmatched=1', report)
         self.assertIn('duplicates=3 (existing_user=1, existing_unmatched=1, in_file=1)', report)
+
+    @patch('users.cloudinary_service.CloudinaryService.upload_image')
+    def test_poap_archive_import_parses_in_worker_processes_and_uploads_concurrently(self, upload_image):
+        upload_image.side_effect = lambda image_file, folder, public_id: {
+            'url': f'https://res.cloudinary.com/demo/image/upload/{image_file.name}',
+            'public_id': public_id,
+        }
+        wallet = '0x9090909090909090909090909090909090909090'
+        matched_user = User.objects.create_user(
+            email='worker-match@example.com',
+            password='pass123',
+            address=wallet,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive_path = f'{temp_dir}/poaps.zip'
+            with zipfile.ZipFile(archive_path, 'w') as archive:
+                for legacy_id in ('901', '902', '903'):
+                    archive.writestr(
+                        f'poap.data/POAP_drop_{legacy_id}_collectors_2026-03-25 - Worker Drop {legacy_id}.csv',
+                        f'ethereum_address\n{wallet.upper()}\n',
+                    )
+                    archive.writestr(f'poap.data/poap_images/ID {legacy_id}_Worker Drop.webp', b'fake-webp')
+
+            output = io.StringIO()
+            call_command(
+                'import_poap_archive',
+                archive_path,
+                '--upload-artwork',
+                '--workers', '2',
+                '--upload-workers', '3',
+                stdout=output,
+                verbosity=0,
+            )
+
+        drops = PoapDrop.objects.filter(legacy_poap_id__in=['901', '902', '903'])
+        self.assertEqual(
+            sorted(drops.values_list('artwork_url', flat=True)),
+            [f'https://res.cloudinary.com/demo/image/upload/poap-{legacy_id}.webp' for legacy_id in ('901', '902', '903')],
+        )
+        self.assertEqual(PoapClaim.objects.filter(drop__in=drops, user=matched_user).count(), 3)
+        self.assertEqual(upload_image.call_count, 3)
+        self.assertIn('Stage timings: parse', output.getvalue())
@@ -167,7 +167,10 @@ class PoapDropViewSet(viewsets.ReadOnlyModelViewSet):
         if self.action == 'retrieve':
             distributions = (
                 PoapDistribution.objects
-                .annotate(mint_link_count=Count('mint_links'))
+                .annotate(
+                    mint_link_count=Count('mint_links', distinct=True),
+                    claims_count_value=Count('claims', distinct=True),
+                )
                 .order_by('-created_at')
             )
             queryset = queryset.prefetch_related(
@@ -9,6 +9,7 @@ from .models import (
     DiscordConnection,
     DiscordEarnedRoleAssignment,
     DiscordRole,
+    DiscordRoleAssignmentTask,
     DiscordRoleSyncLock,
     GitHubConnection,
     PendingOAuthState,
@@ -108,6 +109,25 @@ class DiscordRoleSyncLockAdmin(admin.ModelAdmin):
     readonly_fields = ('name', 'owner_token', 'acquired_at', 'heartbeat_at', 'released_at')
 
 
+@admin.register(DiscordRoleAssignmentTask)
+class DiscordRoleAssignmentTaskAdmin(admin.ModelAdmin):
+    list_select_related = ('connection__user',)
+    list_display = ('created_at', 'role_name', 'connection', 'attempts', 'last_error', 'updated_at')
+    list_filter = ('role_name',)
+    search_fields = ('connection__platform_username', 'connection__user__email')
+    readonly_fields = (
+        'connection',
+        'role_id',
+        'role_name',
+        'total_points',
+        'poap_count',
+        'attempts',
+        'last_error',
+        'created_at',
+        'updated_at',
+    )
+
+
 @admin.register(DiscordEarnedRoleAssignment)
 class DiscordEarnedRoleAssignmentAdmin(admin.ModelAdmin):
     run_assignment_permission = 'social_connections.run_discord_earned_role_assignment'
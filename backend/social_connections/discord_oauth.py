@@ -26,6 +26,7 @@ from .discord_roles import (
     DiscordRoleSyncError,
     DiscordRoleSyncService,
     DiscordRoleSyncUnavailable,
+    batch_rate_limit_max_wait,
     manual_refresh_next_allowed_at,
 )
 from .models import DiscordRoleSyncLock
@@ -365,7 +366,9 @@ def sync_discord_roles(request):
 
         start = time.time()
         try:
-            stats = DiscordRoleSyncService().sync_oldest_connections(batch_size=batch_size)
+            stats = DiscordRoleSyncService(
+                rate_limit_max_wait=batch_rate_limit_max_wait(),
+            ).sync_oldest_connections(batch_size=batch_size)
             logger.info(
                 "Background Discord role sync completed in %.1fs: %s",
                 time.time() - start,
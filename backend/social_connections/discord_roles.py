@@ -1,6 +1,8 @@
 """Discord guild role synchronization via the Discord REST API."""
 
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import timedelta, timezone as datetime_timezone
 from urllib.parse import quote
@@ -43,15 +45,180 @@ class MemberRoleSyncResult:
     is_member: bool
 
 
+# Interactive paths (a member refreshing their own roles) give up quickly;
+# backfills wait out a bucket, and Discord's role buckets reset around every
+# 10 seconds.
+DEFAULT_RATE_LIMIT_MAX_WAIT_SECONDS = 2
+DEFAULT_BATCH_RATE_LIMIT_MAX_WAIT_SECONDS = 30
+DEFAULT_RATE_LIMIT_RETRIES = 3
+DEFAULT_REQUEST_CONCURRENCY = 4
+
+
+def batch_rate_limit_max_wait():
+    """How long batch and backfill jobs wait for a rate-limit window."""
+    return getattr(
+        settings,
+        'DISCORD_BATCH_RATE_LIMIT_MAX_WAIT_SECONDS',
+        DEFAULT_BATCH_RATE_LIMIT_MAX_WAIT_SECONDS,
+    )
+
+
+def _header_float(headers, name):
+    try:
+        value = headers.get(name)
+        return float(value) if value not in (None, '') else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _RateLimitBucket:
+    remaining: int | None = None
+    reset_at: float = 0.0
+
+
+class DiscordRateLimiter:
+    """Process-wide view of Discord's rate-limit buckets.
+
+    Discord reports limits per bucket (X-RateLimit-Bucket) scoped to the
+    route's major parameter (the guild), with X-RateLimit-Remaining and
+    X-RateLimit-Reset-After describing the current window, plus a global
+    limit that only shows up as a 429. Requests reserve a slot here before
+    going out, so concurrent workers and jobs share one budget and wait for
+    the window to reset instead of spending requests on 429s. Until a
+    route's bucket is known only one request to it is in flight.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self.reset()
+
+    def reset(self):
+        with self._condition:
+            self._route_buckets = {}
+            self._buckets = {}
+            self._in_flight = {}
+            self._global_reset_at = 0.0
+
+    def _bucket_key(self, route):
+        major, _ = route
+        bucket_id = self._route_buckets.get(route)
+        return (major, bucket_id) if bucket_id else route
+
+    def _blocked_until(self, route, now):
+        bucket = self._buckets.get(self._bucket_key(route))
+        blocked_until = self._global_reset_at
+        if bucket and bucket.remaining is not None and bucket.remaining <= 0:
+            blocked_until = max(blocked_until, bucket.reset_at)
+        return blocked_until if blocked_until > now else 0.0
+
+    def acquire(self, route, max_wait=None):
+        """Reserve a request slot on a route, sleeping until one is free.
+
+        Raises DiscordRoleSyncUnavailable (429) instead of sleeping longer
+        than max_wait seconds.
+        """
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                blocked_until = self._blocked_until(route, now)
+                if not blocked_until:
+                    if route not in self._route_buckets and self._in_flight.get(route):
+                        # First response for this route has not told us its
+                        # bucket yet.
+                        self._condition.wait(timeout=1)
+                        continue
+                    bucket = self._buckets.get(self._bucket_key(route))
+                    if bucket and bucket.remaining is not None:
+                        bucket.remaining -= 1
+                    self._in_flight[route] = self._in_flight.get(route, 0) + 1
+                    return
+
+            delay = blocked_until - now
+            if max_wait is not None and delay > max_wait:
+                raise DiscordRoleSyncUnavailable(
+                    'Discord rate limit exceeded',
+                    status_code=429,
+                    retry_after=round(delay, 3),
+                )
+            time.sleep(delay)
+            with self._condition:
+                # The window we waited for is over, whatever the clock says.
+                if self._global_reset_at <= blocked_until:
+                    self._global_reset_at = 0.0
+                bucket = self._buckets.get(self._bucket_key(route))
+                if bucket and bucket.reset_at <= blocked_until:
+                    bucket.remaining = None
+
+    def release(self, route, response=None, retry_after=None):
+        """Return a slot and record the limits reported by the response."""
+        with self._condition:
+            self._in_flight[route] = max(self._in_flight.get(route, 0) - 1, 0)
+            if response is not None:
+                self._record(route, response, retry_after)
+            self._condition.notify_all()
+
+    def _record(self, route, response, retry_after):
+        headers = response.headers
+        now = time.monotonic()
+        bucket_id = headers.get('X-RateLimit-Bucket')
+        if bucket_id:
+            self._route_buckets[route] = str(bucket_id)
+
+        if response.status_code == 429 and (
+            str(headers.get('X-RateLimit-Global', '')).lower() == 'true'
+            or headers.get('X-RateLimit-Scope') == 'global'
+        ):
+            self._global_reset_at = max(self._global_reset_at, now + (retry_after or 1))
+            return
+
+        bucket = self._buckets.setdefault(self._bucket_key(route), _RateLimitBucket())
+        remaining = _header_float(headers, 'X-RateLimit-Remaining')
+        reset_after = _header_float(headers, 'X-RateLimit-Reset-After')
+        if response.status_code == 429:
+            remaining = 0
+            reset_after = max(reset_after or 0, retry_after or 0) or 1
+        if remaining is not None:
+            bucket.remaining = int(remaining)
+        if reset_after is not None:
+            bucket.reset_at = now + reset_after
+
+
+discord_rate_limiter = DiscordRateLimiter()
+
+
 class DiscordRoleSyncService:
     """Small REST client and persistence layer for Discord guild roles."""
 
     api_base_url = 'https://discord.com/api/v10'
 
-    def __init__(self, guild_id=None, bot_token=None, timeout=10):
+    def __init__(
+        self,
+        guild_id=None,
+        bot_token=None,
+        timeout=10,
+        concurrency=None,
+        rate_limit_max_wait=None,
+        rate_limiter=None,
+    ):
         self.guild_id = guild_id or getattr(settings, 'DISCORD_GUILD_ID', '')
         self.bot_token = bot_token or getattr(settings, 'DISCORD_BOT_TOKEN', '')
         self.timeout = timeout
+        self.concurrency = max(1, int(
+            concurrency
+            or getattr(settings, 'DISCORD_REQUEST_CONCURRENCY', DEFAULT_REQUEST_CONCURRENCY)
+        ))
+        if rate_limit_max_wait is None:
+            rate_limit_max_wait = getattr(
+                settings,
+                'DISCORD_RATE_LIMIT_MAX_WAIT_SECONDS',
+                DEFAULT_RATE_LIMIT_MAX_WAIT_SECONDS,
+            )
+        self.rate_limit_max_wait = float(rate_limit_max_wait)
+        self.rate_limit_retries = int(
+            getattr(settings, 'DISCORD_RATE_LIMIT_RETRIES', DEFAULT_RATE_LIMIT_RETRIES)
+        )
+        self.rate_limiter = rate_limiter or discord_rate_limiter
 
     def _ensure_configured(self):
         if not self.guild_id:
@@ -78,7 +245,7 @@ class DiscordRoleSyncService:
         except (TypeError, ValueError):
             return None
 
-    def _request(self, method, path, trace_name, retry_once=True, audit_log_reason=None):
+    def _request(self, method, path, trace_name, audit_log_reason=None):
         self._ensure_configured()
 
         url = f"{self.api_base_url}{path}"
@@ -89,43 +256,93 @@ class DiscordRoleSyncService:
         if audit_log_reason:
             headers['X-Audit-Log-Reason'] = quote(audit_log_reason, safe='')
 
-        try:
-            with trace_external('discord', trace_name):
-                response = requests.request(
+        # Every route this client calls is scoped to the configured guild.
+        route = (self.guild_id, f'{method} {trace_name}')
+        for attempt in range(self.rate_limit_retries + 1):
+            self.rate_limiter.acquire(route, max_wait=self.rate_limit_max_wait)
+            try:
+                with trace_external('discord', trace_name):
+                    response = requests.request(
+                        method,
+                        url,
+                        headers=headers,
+                        timeout=self.timeout,
+                    )
+            except requests.RequestException as exc:
+                self.rate_limiter.release(route)
+                logger.warning(
+                    "Discord request failed for %s %s: %s",
                     method,
-                    url,
-                    headers=headers,
-                    timeout=self.timeout,
+                    path,
+                    exc,
                 )
-        except requests.RequestException as exc:
-            logger.warning(
-                "Discord request failed for %s %s: %s",
+                raise DiscordRoleSyncUnavailable(
+                    'Discord request failed',
+                ) from exc
+
+            retry_after = self._parse_retry_after(response) if response.status_code == 429 else None
+            self.rate_limiter.release(route, response, retry_after)
+            if response.status_code != 429:
+                return response
+            if retry_after is None or retry_after > self.rate_limit_max_wait:
+                break
+            logger.info(
+                "Discord rate limited %s %s, retrying in %.2fs (attempt %s)",
                 method,
                 path,
-                exc,
-            )
-            raise DiscordRoleSyncUnavailable(
-                'Discord request failed',
-            ) from exc
-
-        if response.status_code == 429 and retry_once:
-            retry_after = self._parse_retry_after(response)
-            if retry_after is not None and retry_after <= 2:
-                time.sleep(retry_after)
-                return self._request(
-                    method,
-                    path,
-                    trace_name,
-                    retry_once=False,
-                    audit_log_reason=audit_log_reason,
-                )
-            raise DiscordRoleSyncUnavailable(
-                'Discord rate limit exceeded',
-                status_code=429,
-                retry_after=retry_after,
+                retry_after,
+                attempt + 1,
             )
 
-        return response
+        raise DiscordRoleSyncUnavailable(
+            'Discord rate limit exceeded',
+            status_code=429,
+            retry_after=retry_after,
+        )
+
+    def pipelined(self, func, items, stop=None):
+        """Run func(item) for each item on up to `concurrency` workers.
+
+        Yields (item, result, error) in completion order, where error is the
+        DiscordRoleSyncError func raised. Requests still go through the shared
+        rate limiter, so the pool only fills whatever the buckets allow.
+        Once `stop` (a threading.Event) is set no further items are started;
+        items already in flight are still yielded. func must not touch the
+        database: callers persist results on their own thread.
+        """
+        items = iter(items)
+
+        def call(item):
+            try:
+                return func(item), None
+            except DiscordRoleSyncError as exc:
+                return None, exc
+
+        if self.concurrency == 1:
+            for item in items:
+                if stop is not None and stop.is_set():
+                    return
+                yield (item, *call(item))
+            return
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            in_flight = {}
+
+            def submit_next():
+                if stop is not None and stop.is_set():
+                    return
+                for item in items:
+                    in_flight[executor.submit(call, item)] = item
+                    return
+
+            for _ in range(self.concurrency):
+                submit_next()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    yield (item, *future.result())
+                    submit_next()
 
     def sync_role_catalog(self):
         """Fetch and persist all roles for the configured guild."""
@@ -242,12 +459,17 @@ class DiscordRoleSyncService:
         if sync_catalog:
             self.sync_role_catalog()
 
-        response = self._request(
+        response = self._fetch_member(connection.platform_user_id)
+        return self._record_member_response(connection, response)
+
+    def _fetch_member(self, discord_user_id):
+        return self._request(
             'GET',
-            f'/guilds/{self.guild_id}/members/{connection.platform_user_id}',
+            f'/guilds/{self.guild_id}/members/{discord_user_id}',
             'get_guild_member',
         )
 
+    def _record_member_response(self, connection, response):
         if response.status_code == 404:
             return self._record_not_member(connection)
 
@@ -339,10 +561,18 @@ class DiscordRoleSyncService:
             )[:batch_size]
         )
 
-        for connection in connections:
+        # Member lookups are pipelined; responses are persisted here, on the
+        # calling thread, as they arrive.
+        fetched = self.pipelined(
+            lambda connection: self._fetch_member(connection.platform_user_id),
+            connections,
+        )
+        for connection, response, error in fetched:
             stats['checked'] += 1
             try:
-                result = self.sync_member_roles(connection, sync_catalog=False)
+                if error is not None:
+                    raise error
+                result = self._record_member_response(connection, response)
                 if result.is_member:
                     stats['members'] += 1
                 else:
@@ -2,20 +2,32 @@
 
 Portal → Discord is add-only: a role is assigned when its threshold is met and
 never removed by this system. Each role's threshold is evaluated independently.
+
+Missing grants are first written to a persisted queue
+(DiscordRoleAssignmentTask) and then sent to Discord through the service's
+rate-limited pipeline. A grant leaves the queue only once it is recorded, so
+an aborted or interrupted run is picked up by the next one.
 """
 
+import threading
+
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Count
+from django.db.models import Count, F
+from django.utils import timezone
 
 from tally.middleware.logging_utils import get_app_logger
 
 from .discord_roles import (
     DiscordRoleSyncConfigurationError,
     DiscordRoleSyncService,
-    DiscordRoleSyncUnavailable,
+    batch_rate_limit_max_wait,
+)
+from .models import (
+    DiscordConnection,
+    DiscordEarnedRoleAssignment,
+    DiscordRoleAssignmentTask,
 )
-from .models import DiscordConnection, DiscordEarnedRoleAssignment
 
 logger = get_app_logger('discord_roles')
 
@@ -58,10 +70,40 @@ def _wanted_roles(role_ids, total_points, poap_count, held_role_ids):
     return wanted
 
 
+def _audit_reason(task):
+    return (
+        f'Automatic earned role assignment: {task.role_name} '
+        f'({task.total_points} CP, {task.poap_count} POAPs)'
+    )
+
+
+def _assignment_row(task):
+    connection = task.connection
+    return {
+        'user_id': connection.user_id,
+        'user_name': connection.user.name or connection.user.email,
+        'discord_username': connection.platform_username,
+        'role': task.role_name,
+        'total_points': task.total_points,
+        'poap_count': task.poap_count,
+    }
+
+
+def _is_abort_error(exc):
+    return (
+        isinstance(exc, DiscordRoleSyncConfigurationError)
+        or getattr(exc, 'status_code', None) in ABORT_STATUS_CODES
+    )
+
+
 def assign_earned_community_roles(dry_run=False, service=None):
     """Assign missing Synapse/Brain roles to every qualifying user.
 
-    Returns stats plus the list of (would-be) assignments.
+    Returns stats plus the list of (would-be) assignments. Grants left
+    queued by an earlier, interrupted run are sent along with new ones if
+    the member still qualifies and does not hold the role yet; `pending` is
+    the number still queued afterwards (in a dry run, the number of due
+    grants that are already queued).
     """
     from community_xp.utils import build_effective_community_scores_queryset
     from poaps.models import PoapClaim
@@ -73,6 +115,7 @@ def assign_earned_community_roles(dry_run=False, service=None):
         'skipped_not_member': 0,
         'errors': 0,
         'aborted': False,
+        'pending': 0,
         'assignments': [],
     }
 
@@ -86,8 +129,6 @@ def assign_earned_community_roles(dry_run=False, service=None):
         .filter(total_points__gte=SYNAPSE_CP)
     )
     points_by_user_id = {user.id: user.total_points or 0 for user in candidates}
-    if not points_by_user_id:
-        return stats
 
     poaps_by_user_id = {
         row['user_id']: row['n']
@@ -106,8 +147,7 @@ def assign_earned_community_roles(dry_run=False, service=None):
         .prefetch_related('current_roles')
     )
 
-    service = service or DiscordRoleSyncService()
-
+    wanted = []
     for connection in connections:
         stats['checked'] += 1
         if not connection.guild_member:
@@ -117,70 +157,111 @@ def assign_earned_community_roles(dry_run=False, service=None):
         total_points = points_by_user_id.get(connection.user_id, 0)
         poap_count = poaps_by_user_id.get(connection.user_id, 0)
         held = {role.role_id for role in connection.current_roles.all()}
-
         for label, role_id in _wanted_roles(role_ids, total_points, poap_count, held):
-            if not dry_run:
-                try:
-                    audit_reason = (
-                        f'Automatic earned role assignment: {label} '
-                        f'({total_points} CP, {poap_count} POAPs)'
-                    )
-                    assigned = service.add_member_role(
-                        connection.platform_user_id,
-                        role_id,
-                        audit_log_reason=audit_reason,
-                    )
-                except DiscordRoleSyncConfigurationError as exc:
-                    logger.warning("Earned role assignment aborted: %s", exc)
-                    stats['errors'] += 1
-                    stats['aborted'] = True
-                    return stats
-                except DiscordRoleSyncUnavailable as exc:
-                    stats['errors'] += 1
-                    if exc.status_code in ABORT_STATUS_CODES:
-                        logger.warning("Earned role assignment aborted: %s", exc)
-                        stats['aborted'] = True
-                        return stats
-                    logger.warning(
-                        "Failed to assign %s role to connection %s: %s",
-                        label,
-                        connection.id,
-                        exc,
-                    )
-                    continue
-
-                if not assigned:
-                    stats['skipped_not_member'] += 1
-                    continue
-
-                with transaction.atomic():
-                    connection.current_roles.add(*service._get_or_create_missing_roles([role_id]))
-                    DiscordEarnedRoleAssignment.objects.create(
-                        connection=connection,
-                        discord_user_id=connection.platform_user_id,
-                        discord_username=connection.platform_username,
-                        role_id=role_id,
-                        role_name=label,
-                        total_points=total_points,
-                        poap_count=poap_count,
-                    )
-                logger.info(
-                    "Assigned %s role to user %s (discord %s): %s CP, %s POAPs",
-                    label,
-                    connection.user_id,
-                    connection.platform_user_id,
-                    total_points,
-                    poap_count,
-                )
-
-            stats[f'{label}_assigned'] += 1
-            stats['assignments'].append({
-                'user_id': connection.user_id,
-                'user_name': connection.user.name or connection.user.email,
-                'discord_username': connection.platform_username,
-                'role': label,
-                'total_points': total_points,
-                'poap_count': poap_count,
-            })
+            wanted.append(DiscordRoleAssignmentTask(
+                connection=connection,
+                role_id=role_id,
+                role_name=label,
+                total_points=total_points,
+                poap_count=poap_count,
+            ))
+
+    # The queue is re-checked against this run's eligibility and held roles:
+    # a queued grant is sent only if it is still wanted now.
+    wanted_keys = {(task.connection.id, task.role_id) for task in wanted}
+    queued = list(DiscordRoleAssignmentTask.objects.values_list('pk', 'connection_id', 'role_id'))
+    stale_task_ids = [pk for pk, connection_id, role_id in queued if (connection_id, role_id) not in wanted_keys]
+    queued_keys = {(connection_id, role_id) for _, connection_id, role_id in queued} & wanted_keys
+
+    if dry_run:
+        for task in wanted:
+            stats[f'{task.role_name}_assigned'] += 1
+            stats['assignments'].append(_assignment_row(task))
+        stats['pending'] = len(queued_keys)
+        return stats
+
+    if wanted:
+        DiscordRoleAssignmentTask.objects.bulk_create(
+            wanted,
+            update_conflicts=True,
+            unique_fields=['connection', 'role_id'],
+            update_fields=['role_name', 'total_points', 'poap_count', 'updated_at'],
+        )
+    # Leftovers that are no longer due: the member already holds the role,
+    # fell below the thresholds, left the guild, or the role is no longer one
+    # of the configured earned roles.
+    for start in range(0, len(stale_task_ids), 1000):
+        DiscordRoleAssignmentTask.objects.filter(pk__in=stale_task_ids[start:start + 1000]).delete()
+
+    tasks = list(DiscordRoleAssignmentTask.objects.select_related('connection__user'))
+    if not tasks:
+        return stats
+
+    service = service or DiscordRoleSyncService(rate_limit_max_wait=batch_rate_limit_max_wait())
+    stop = threading.Event()
+    grants = service.pipelined(
+        lambda task: service.add_member_role(
+            task.connection.platform_user_id,
+            task.role_id,
+            audit_log_reason=_audit_reason(task),
+        ),
+        tasks,
+        stop=stop,
+    )
+
+    for task, assigned, error in grants:
+        connection = task.connection
+        if error is not None:
+            if stop.is_set():
+                # In flight when the run aborted; it stays queued.
+                continue
+            stats['errors'] += 1
+            if _is_abort_error(error):
+                logger.warning("Earned role assignment aborted: %s", error)
+                stats['aborted'] = True
+                stop.set()
+                continue
+            logger.warning(
+                "Failed to assign %s role to connection %s: %s",
+                task.role_name,
+                connection.id,
+                error,
+            )
+            DiscordRoleAssignmentTask.objects.filter(pk=task.pk).update(
+                attempts=F('attempts') + 1,
+                last_error=str(error)[:1000],
+                updated_at=timezone.now(),
+            )
+            continue
+
+        if not assigned:
+            stats['skipped_not_member'] += 1
+            task.delete()
+            continue
+
+        with transaction.atomic():
+            connection.current_roles.add(*service._get_or_create_missing_roles([task.role_id]))
+            DiscordEarnedRoleAssignment.objects.create(
+                connection=connection,
+                discord_user_id=connection.platform_user_id,
+                discord_username=connection.platform_username,
+                role_id=task.role_id,
+                role_name=task.role_name,
+                total_points=task.total_points,
+                poap_count=task.poap_count,
+            )
+            task.delete()
+        logger.info(
+            "Assigned %s role to user %s (discord %s): %s CP, %s POAPs",
+            task.role_name,
+            connection.user_id,
+            connection.platform_user_id,
+            task.total_points,
+            task.poap_count,
+        )
+
+        stats[f'{task.role_name}_assigned'] += 1
+        stats['assignments'].append(_assignment_row(task))
 
+    stats['pending'] = DiscordRoleAssignmentTask.objects.count()
     return stats
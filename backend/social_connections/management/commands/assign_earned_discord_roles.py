@@ -31,6 +31,8 @@ class Command(BaseCommand):
             f"{stats['skipped_not_member']} not guild members, "
             f"{stats['errors']} errors)"
         )
+        if stats['pending']:
+            summary += f" — {stats['pending']} grants still queued for the next run"
         if stats['aborted']:
             self.stdout.write(self.style.WARNING(summary + ' — run ABORTED early, see logs'))
         else:
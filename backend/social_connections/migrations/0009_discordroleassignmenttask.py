@@ -0,0 +1,34 @@
+# Generated by Django 6.0.6 on 2026-10-19 10:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_connections', '0008_telegramconnection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscordRoleAssignmentTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role_id', models.CharField(max_length=100)),
+                ('role_name', models.CharField(max_length=100)),
+                ('total_points', models.PositiveIntegerField()),
+                ('poap_count', models.PositiveIntegerField()),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('connection', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='role_assignment_tasks', to='social_connections.discordconnection')),
+            ],
+            options={
+                'db_table': 'social_connections_discord_role_assignment_task',
+                'ordering': ['id'],
+                'constraints': [models.UniqueConstraint(fields=('connection', 'role_id'), name='unique_discord_role_assignment_task')],
+            },
+        ),
+    ]
@@ -194,6 +194,42 @@ class DiscordEarnedRoleAssignment(BaseModel):
         return f"{self.discord_username or self.discord_user_id}: {self.role_name}"
 
 
+class DiscordRoleAssignmentTask(models.Model):
+    """Queued earned-role grant, kept until Discord confirms it.
+
+    The assignment job enqueues every missing grant before calling Discord
+    and deletes each row once it is recorded, so an interrupted or
+    rate-limited run leaves exactly the outstanding work for the next run.
+    """
+
+    connection = models.ForeignKey(
+        DiscordConnection,
+        on_delete=models.CASCADE,
+        related_name='role_assignment_tasks',
+    )
+    role_id = models.CharField(max_length=100)
+    role_name = models.CharField(max_length=100)
+    total_points = models.PositiveIntegerField()
+    poap_count = models.PositiveIntegerField()
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'social_connections_discord_role_assignment_task'
+        ordering = ['id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['connection', 'role_id'],
+                name='unique_discord_role_assignment_task',
+            ),
+        ]
+
+    def __str__(self):
+        return f"DiscordRoleAssignmentTask({self.connection_id}, {self.role_name})"
+
+
 class PendingOAuthState(models.Model):
     """Short-lived OAuth state data stored server-side for multi-worker safety."""
 
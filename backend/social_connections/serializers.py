@@ -101,7 +101,25 @@ class DiscordConnectionSerializer(serializers.ModelSerializer):
 
     def get_mee6_synced_at(self, obj):
         current = self._get_mee6_current_xp(obj)
-        return current.synced_at if current else None
+        if not current:
+            return None
+        # Unchanged rows keep the run that last changed them; the XP is as
+        # of the latest applied baseline.
+        latest_sync = self._get_latest_applied_sync(obj, current.guild_id)
+        return latest_sync.completed_at if latest_sync else current.synced_at
+
+    def _get_latest_applied_sync(self, obj, guild_id):
+        if hasattr(obj, '_mee6_latest_sync_cache'):
+            return obj._mee6_latest_sync_cache
+
+        # One lookup per guild for the whole response, however many
+        # connections it serializes.
+        from community_xp.utils import get_latest_applied_sync
+
+        latest_syncs = self.context.setdefault('_mee6_latest_syncs', {})
+        if guild_id not in latest_syncs:
+            latest_syncs[guild_id] = get_latest_applied_sync(guild_id)
+        return latest_syncs[guild_id]
 
     class Meta:
         model = DiscordConnection
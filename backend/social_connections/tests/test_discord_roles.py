@@ -9,6 +9,7 @@ from users.models import User
 from social_connections.discord_roles import (
     DiscordRoleSyncService,
     DiscordRoleSyncUnavailable,
+    discord_rate_limiter,
 )
 from social_connections.models import DiscordConnection, DiscordRole
 
@@ -28,6 +29,8 @@ def mock_response(status_code=200, payload=None, headers=None):
 )
 class DiscordRoleSyncServiceTest(TestCase):
     def setUp(self):
+        discord_rate_limiter.reset()
+        self.addCleanup(discord_rate_limiter.reset)
         self.user = User.objects.create_user(
             email='discord-role@test.com',
             password='testpass123',
@@ -125,6 +128,44 @@ class DiscordRoleSyncServiceTest(TestCase):
         self.assertFalse(self.connection.guild_member)
         self.assertEqual(self.connection.current_roles.count(), 0)
 
+    @patch('social_connections.discord_roles.requests.request')
+    def test_sync_oldest_connections_pipelines_member_lookups(self, mock_request):
+        others = [
+            DiscordConnection.objects.create(
+                user=User.objects.create_user(
+                    email=f'pipelined-{index}@test.com',
+                    password='testpass123',
+                ),
+                platform_user_id=f'user-{index}',
+                platform_username=f'pipelined-{index}',
+                linked_at=timezone.now(),
+            )
+            for index in (2, 3)
+        ]
+
+        def respond(method, url, **kwargs):
+            if url.endswith('/roles'):
+                return mock_response(200, [{'id': 'role-1', 'name': 'Builder'}])
+            if url.endswith('/members/user-3'):
+                return mock_response(404, {'message': 'Unknown Member'})
+            return mock_response(
+                200,
+                {'roles': ['role-1']},
+                headers={'X-RateLimit-Bucket': 'members', 'X-RateLimit-Remaining': '5'},
+            )
+
+        mock_request.side_effect = respond
+        service = DiscordRoleSyncService(concurrency=3)
+
+        stats = service.sync_oldest_connections(batch_size=10)
+
+        self.assertEqual(stats, {'checked': 3, 'members': 2, 'non_members': 1, 'errors': 0})
+        self.connection.refresh_from_db()
+        self.assertTrue(self.connection.guild_member)
+        self.assertEqual(list(self.connection.current_roles.values_list('role_id', flat=True)), ['role-1'])
+        others[1].refresh_from_db()
+        self.assertFalse(others[1].guild_member)
+
     @patch('social_connections.discord_roles.requests.request')
     def test_request_exception_becomes_unavailable(self, mock_request):
         mock_request.side_effect = requests.Timeout('timed out')
@@ -14,6 +14,7 @@ from social_connections.discord_oauth import (
 from social_connections.discord_roles import (
     DiscordRoleSyncService,
     DiscordRoleSyncUnavailable,
+    discord_rate_limiter,
 )
 from social_connections.earned_roles import (
     BRAIN_CP,
@@ -26,6 +27,7 @@ from social_connections.models import (
     DiscordConnection,
     DiscordEarnedRoleAssignment,
     DiscordRole,
+    DiscordRoleAssignmentTask,
 )
 from social_tasks.models import SocialTask, SocialTaskCompletion
 from users.models import User
@@ -51,6 +53,8 @@ ROLE_SETTINGS = {
 @override_settings(DISCORD_GUILD_ID='guild-1', DISCORD_BOT_TOKEN='bot-token')
 class AddMemberRoleTest(TestCase):
     def setUp(self):
+        discord_rate_limiter.reset()
+        self.addCleanup(discord_rate_limiter.reset)
         self.service = DiscordRoleSyncService()
 
     @patch('social_connections.discord_roles.requests.request')
@@ -102,10 +106,57 @@ class AddMemberRoleTest(TestCase):
         self.assertTrue(self.service.add_member_role('user-1', 'role-1'))
         self.assertEqual(mock_request.call_count, 2)
 
+    @patch('social_connections.discord_roles.time.sleep')
+    @patch('social_connections.discord_roles.requests.request')
+    def test_repeated_short_rate_limits_retry_until_success(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            mock_response(429, headers={'Retry-After': '1'}),
+            mock_response(429, headers={'Retry-After': '0.5'}),
+            mock_response(204),
+        ]
+
+        self.assertTrue(self.service.add_member_role('user-1', 'role-1'))
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('social_connections.discord_roles.requests.request')
+    def test_exhausted_bucket_waits_without_spending_a_request(self, mock_request):
+        mock_request.return_value = mock_response(204, headers={
+            'X-RateLimit-Bucket': 'roles-bucket',
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset-After': '30',
+        })
+
+        self.assertTrue(self.service.add_member_role('user-1', 'role-1'))
+        with self.assertRaises(DiscordRoleSyncUnavailable) as ctx:
+            self.service.add_member_role('user-2', 'role-1')
+
+        self.assertEqual(ctx.exception.status_code, 429)
+        self.assertGreater(ctx.exception.retry_after, 2)
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch('social_connections.discord_roles.time.sleep')
+    @patch('social_connections.discord_roles.requests.request')
+    def test_global_rate_limit_pauses_other_routes(self, mock_request, mock_sleep):
+        mock_request.return_value = mock_response(429, headers={
+            'Retry-After': '10',
+            'X-RateLimit-Global': 'true',
+        })
+
+        with self.assertRaises(DiscordRoleSyncUnavailable):
+            self.service.add_member_role('user-1', 'role-1')
+        with self.assertRaises(DiscordRoleSyncUnavailable):
+            self.service.sync_role_catalog()
+
+        self.assertEqual(mock_request.call_count, 1)
+        mock_sleep.assert_not_called()
+
 
 @override_settings(**ROLE_SETTINGS)
 class AssignEarnedCommunityRolesTest(TestCase):
     def setUp(self):
+        discord_rate_limiter.reset()
+        self.addCleanup(discord_rate_limiter.reset)
         self.sync_run = Mee6SyncRun.objects.create(
             guild_id='guild-1',
             status=Mee6SyncRun.STATUS_SUCCESS,
@@ -302,7 +353,7 @@ class AssignEarnedCommunityRolesTest(TestCase):
 
     @patch('social_connections.discord_roles.requests.request')
     def test_rate_limit_aborts_run(self, mock_request):
-        mock_request.return_value = mock_response(429, headers={'Retry-After': '30'})
+        mock_request.return_value = mock_response(429, headers={'Retry-After': '120'})
         self.make_user('rl-a@test.com', SYNAPSE_CP, poaps=SYNAPSE_POAPS)
         self.make_user('rl-b@test.com', SYNAPSE_CP, poaps=SYNAPSE_POAPS)
 
@@ -313,6 +364,107 @@ class AssignEarnedCommunityRolesTest(TestCase):
         self.assertEqual(stats['errors'], 1)
         self.assertEqual(mock_request.call_count, 1)
 
+    @patch('social_connections.discord_roles.requests.request')
+    def test_aborted_run_leaves_grants_queued_for_next_run(self, mock_request):
+        mock_request.return_value = mock_response(429, headers={'Retry-After': '120'})
+        _, held_connection = self.make_user('queued-a@test.com', SYNAPSE_CP, poaps=SYNAPSE_POAPS)
+        self.make_user('queued-b@test.com', BRAIN_CP, poaps=BRAIN_POAPS)
+
+        stats = assign_earned_community_roles()
+
+        self.assertTrue(stats['aborted'])
+        self.assertEqual(stats['pending'], 2)
+        self.assertEqual(DiscordRoleAssignmentTask.objects.count(), 2)
+
+        mock_request.reset_mock()
+        stats = assign_earned_community_roles(dry_run=True)
+        self.assertEqual(stats['synapse_assigned'], 2)
+        self.assertEqual(stats['pending'], 2)
+        mock_request.assert_not_called()
+
+        # One member picked up the role elsewhere in the meantime; only the
+        # grant that is still due is sent, and it is recorded once.
+        role, _ = DiscordRole.objects.get_or_create(
+            guild_id='guild-1',
+            role_id='role-synapse',
+            defaults={'name': 'role-synapse'},
+        )
+        held_connection.current_roles.add(role)
+        discord_rate_limiter.reset()
+        mock_request.return_value = mock_response(204)
+
+        stats = assign_earned_community_roles()
+
+        self.assertFalse(stats['aborted'])
+        self.assertEqual(stats['synapse_assigned'], 1)
+        self.assertEqual(stats['pending'], 0)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertFalse(DiscordRoleAssignmentTask.objects.exists())
+        self.assertEqual(DiscordEarnedRoleAssignment.objects.count(), 1)
+        self.assertFalse(
+            DiscordEarnedRoleAssignment.objects.filter(connection=held_connection).exists()
+        )
+
+    @patch('social_connections.discord_roles.requests.request')
+    def test_queued_grant_is_dropped_once_member_no_longer_qualifies(self, mock_request):
+        DiscordRoleAssignmentTask.objects.create(
+            connection=self.make_user('fallen@test.com', 100, poaps=SYNAPSE_POAPS)[1],
+            role_id='role-synapse',
+            role_name='synapse',
+            total_points=SYNAPSE_CP,
+            poap_count=SYNAPSE_POAPS,
+        )
+
+        stats = assign_earned_community_roles()
+
+        self.assertEqual(stats['synapse_assigned'], 0)
+        mock_request.assert_not_called()
+        self.assertFalse(DiscordRoleAssignmentTask.objects.exists())
+
+    @override_settings(DISCORD_REQUEST_CONCURRENCY=4)
+    @patch('social_connections.discord_roles.requests.request')
+    def test_pipelined_run_assigns_every_queued_grant(self, mock_request):
+        mock_request.return_value = mock_response(204, headers={
+            'X-RateLimit-Bucket': 'roles-bucket',
+            'X-RateLimit-Remaining': '10',
+            'X-RateLimit-Reset-After': '1',
+        })
+        connections = [
+            self.make_user(f'pipe-{index}@test.com', SYNAPSE_CP, poaps=SYNAPSE_POAPS)[1]
+            for index in range(6)
+        ]
+
+        stats = assign_earned_community_roles()
+
+        self.assertEqual(stats['synapse_assigned'], 6)
+        self.assertEqual(stats['errors'], 0)
+        self.assertEqual(mock_request.call_count, 6)
+        for connection in connections:
+            self.assertTrue(connection.current_roles.filter(role_id='role-synapse').exists())
+        self.assertFalse(DiscordRoleAssignmentTask.objects.exists())
+
+    @override_settings(DISCORD_REQUEST_CONCURRENCY=1)
+    @patch('social_connections.discord_roles.time.sleep')
+    @patch('social_connections.discord_roles.requests.request')
+    def test_backfill_waits_for_a_bucket_longer_than_the_interactive_limit(self, mock_request, mock_sleep):
+        mock_request.return_value = mock_response(204, headers={
+            'X-RateLimit-Bucket': 'roles-bucket',
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset-After': '10',
+        })
+        for index in range(3):
+            self.make_user(f'bucket-{index}@test.com', SYNAPSE_CP, poaps=SYNAPSE_POAPS)
+
+        stats = assign_earned_community_roles()
+
+        self.assertFalse(stats['aborted'])
+        self.assertEqual(stats['errors'], 0)
+        self.assertEqual(stats['synapse_assigned'], 3)
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertGreater(mock_sleep.call_args.args[0], 2)
+        self.assertFalse(DiscordRoleAssignmentTask.objects.exists())
+
     @patch('social_connections.discord_roles.requests.request')
     def test_transient_error_continues_with_next_user(self, mock_request):
         mock_request.side_effect = [mock_response(500), mock_response(204)]
@@ -324,6 +476,9 @@ class AssignEarnedCommunityRolesTest(TestCase):
         self.assertFalse(stats['aborted'])
         self.assertEqual(stats['errors'], 1)
         self.assertEqual(stats['synapse_assigned'], 1)
+        failed = DiscordRoleAssignmentTask.objects.get()
+        self.assertEqual(failed.attempts, 1)
+        self.assertIn('500', failed.last_error)
 
     @patch('social_connections.discord_roles.requests.request')
     def test_member_left_between_queries_skipped(self, mock_request):
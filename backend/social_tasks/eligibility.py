@@ -1,10 +1,13 @@
 from dataclasses import dataclass
 
 from django.core.exceptions import ValidationError
+from django.db.models import Count
 
 from users.role_access import (
     VIEWABLE_ROLE_CATEGORIES,
     is_role_section_read_only,
+    load_role_profile_access,
+    user_can_view_role_sections,
     user_has_role_profile,
 )
 
@@ -23,6 +26,66 @@ class EligibilityResult:
     details: dict | None = None
 
 
+class EligibilityContext:
+    """One user's eligibility facts, shared by every task evaluated for them.
+
+    Each kind of fact (accepted contribution counts per category, community
+    points per source, role profiles) is loaded by one grouped query the
+    first time a rule needs it. A task list therefore costs the same number
+    of queries whether it has two gated tasks or fifty.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._contribution_counts = None
+        self._community_points = {}
+
+    def _load_role_access(self):
+        # user_has_role_profile caches per user object; fill it for all roles
+        # at once instead of one EXISTS per category as tasks ask.
+        load_role_profile_access(self.user)
+
+    def is_role_section_read_only(self, category_slug):
+        if user_can_view_role_sections(self.user):
+            self._load_role_access()
+        return is_role_section_read_only(self.user, category_slug)
+
+    def has_role_profile(self, category_slug):
+        self._load_role_access()
+        return user_has_role_profile(self.user, category_slug)
+
+    def accepted_contribution_count(self, category_slug, submittable=True):
+        if self._contribution_counts is None:
+            from contributions.models import Contribution
+
+            rows = (
+                Contribution.objects
+                .filter(user=self.user)
+                .order_by()
+                .values_list('contribution_type__category__slug', 'contribution_type__is_submittable')
+                .annotate(count=Count('id'))
+            )
+            self._contribution_counts = {
+                (slug, is_submittable): count
+                for slug, is_submittable, count in rows
+            }
+        count = self._contribution_counts.get((category_slug, True), 0)
+        if not submittable:
+            count += self._contribution_counts.get((category_slug, False), 0)
+        return count
+
+    def community_points(self, source):
+        if source not in self._community_points:
+            if source == 'portal':
+                from leaderboard.models import calculate_category_points
+                points = calculate_category_points(self.user, 'community')
+            else:
+                from community_xp.utils import get_effective_community_points
+                points = get_effective_community_points(self.user)['total_points']
+            self._community_points[source] = points
+        return self._community_points[source]
+
+
 def validate_eligibility_requirements(value):
     """Validate SocialTask.eligibility_requirements.
 
@@ -38,8 +101,13 @@ def validate_eligibility_requirements(value):
             _validate_rule(rule)
 
 
-def evaluate_task_eligibility(task, user):
-    """Evaluate task rules without allowing read-only access to award points."""
+def evaluate_task_eligibility(task, user, context=None):
+    """Evaluate task rules without allowing read-only access to award points.
+
+    Pass one EligibilityContext for `user` when evaluating several tasks.
+    """
+    if context is None:
+        context = EligibilityContext(user)
     category_slug = getattr(getattr(task, 'category', None), 'slug', None)
 
     # Journey tasks remain available to ordinary pre-role users. The explicit
@@ -49,7 +117,7 @@ def evaluate_task_eligibility(task, user):
         category_slug in VIEWABLE_ROLE_CATEGORIES
         and user is not None
         and getattr(user, 'is_authenticated', False)
-        and is_role_section_read_only(user, category_slug)
+        and context.is_role_section_read_only(category_slug)
     ):
         return EligibilityResult(
             False,
@@ -71,7 +139,7 @@ def evaluate_task_eligibility(task, user):
                 details={'requirements': [], 'required_role': 'validator'},
             )
 
-        if not user_has_role_profile(user, 'validator'):
+        if not context.has_role_profile('validator'):
             return EligibilityResult(
                 False,
                 'Only validators can complete validator tasks.',
@@ -91,8 +159,8 @@ def evaluate_task_eligibility(task, user):
             details={'requirements': []},
         )
 
-    all_results = [_evaluate_rule(rule, task, user) for rule in normalized['all']]
-    any_results = [_evaluate_rule(rule, task, user) for rule in normalized['any']]
+    all_results = [_evaluate_rule(rule, task, context) for rule in normalized['all']]
+    any_results = [_evaluate_rule(rule, task, context) for rule in normalized['any']]
 
     all_ok = all(result['eligible'] for result in all_results)
     any_ok = True if not any_results else any(result['eligible'] for result in any_results)
@@ -189,12 +257,12 @@ def _validate_rule(rule):
             })
 
 
-def _evaluate_rule(rule, task, user):
+def _evaluate_rule(rule, task, context):
     rule_type = rule['type']
     if rule_type == 'accepted_submittable_contribution':
-        return _accepted_submittable_contribution_result(rule, task, user)
+        return _accepted_submittable_contribution_result(rule, task, context)
     if rule_type == 'community_points':
-        return _community_points_result(rule, user)
+        return _community_points_result(rule, context)
     return {
         'type': rule_type,
         'eligible': False,
@@ -202,22 +270,13 @@ def _evaluate_rule(rule, task, user):
     }
 
 
-def _accepted_submittable_contribution_result(rule, task, user):
-    from contributions.models import Contribution
-
+def _accepted_submittable_contribution_result(rule, task, context):
     category = rule.get('category', 'task')
     category_slug = task.category.slug if category == 'task' else category
     minimum = rule.get('minimum', 1)
     submittable = rule.get('submittable', True)
 
-    filters = {
-        'user': user,
-        'contribution_type__category__slug': category_slug,
-    }
-    if submittable:
-        filters['contribution_type__is_submittable'] = True
-
-    count = Contribution.objects.filter(**filters).count()
+    count = context.accepted_contribution_count(category_slug, submittable=submittable)
     label = category_slug.replace('-', ' ')
     return {
         'type': 'accepted_submittable_contribution',
@@ -229,15 +288,10 @@ def _accepted_submittable_contribution_result(rule, task, user):
     }
 
 
-def _community_points_result(rule, user):
+def _community_points_result(rule, context):
     minimum = rule.get('minimum', 1)
     source = rule.get('source', 'effective')
-    if source == 'portal':
-        from leaderboard.models import calculate_category_points
-        current = calculate_category_points(user, 'community')
-    else:
-        from community_xp.utils import get_effective_community_points
-        current = get_effective_community_points(user)['total_points']
+    current = context.community_points(source)
 
     return {
         'type': 'community_points',
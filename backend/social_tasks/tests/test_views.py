@@ -1,11 +1,14 @@
 from unittest.mock import patch
 
 from cryptography.fernet import Fernet
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework.test import APIClient
 
 from contributions.models import Category, Contribution, ContributionType
+from creators.models import Creator
 from leaderboard.models import GlobalLeaderboardMultiplier
 from social_connections.encryption import encrypt_token
 from social_connections.models import DiscordConnection, TwitterConnection
@@ -572,6 +575,69 @@ class SocialTaskViewSetTest(TestCase):
         by_slug = {t['slug']: t for t in response.json()}
         self.assertEqual(by_slug[self.click_task.slug]['status'], 'active')
 
+    def test_list_eligibility_query_count_does_not_grow_with_tasks(self):
+        validator_category, _ = Category.objects.get_or_create(
+            slug='validator', defaults={'name': 'Validator'}
+        )
+        builder_category, _ = Category.objects.get_or_create(
+            slug='builder', defaults={'name': 'Builder'}
+        )
+        self.user.can_view_role_sections = True
+        self.user.save(update_fields=['can_view_role_sections', 'updated_at'])
+        Creator.objects.create(user=self.user)
+        Contribution.objects.create(
+            user=self.user,
+            contribution_type=_make_contribution_type(self.category, 'community-counted'),
+            points=10,
+            contribution_date=timezone.now(),
+        )
+        requirements = [
+            {'type': 'accepted_submittable_contribution', 'category': 'task'},
+            {'type': 'accepted_submittable_contribution', 'category': 'builder', 'submittable': False},
+            {'any': [
+                {'type': 'community_points', 'minimum': 5},
+                {'type': 'community_points', 'source': 'portal', 'minimum': 5},
+            ]},
+        ]
+        categories = [self.category, builder_category, validator_category]
+
+        def add_tasks(start, count):
+            for index in range(start, start + count):
+                SocialTask.objects.create(
+                    slug=f'gated-task-{index}',
+                    name=f'Gated Task {index}',
+                    category=categories[index % len(categories)],
+                    points=5,
+                    verification_type='click_through',
+                    action_url='https://example.com',
+                    eligibility_requirements=requirements[(index // len(categories)) % len(requirements)],
+                )
+
+        def list_queries():
+            # force_authenticate reuses this user object; start each request
+            # with a cold role cache, like a freshly loaded request user.
+            self.user.__dict__.pop('_role_profile_access_cache', None)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get('/api/v1/social-tasks/')
+            self.assertEqual(response.status_code, 200)
+            return len(queries), response.json()
+
+        add_tasks(0, 9)
+        list_queries()  # warm process-wide caches (table introspection)
+        few_queries, _ = list_queries()
+        add_tasks(9, 18)
+        many_queries, tasks = list_queries()
+
+        self.assertEqual(many_queries, few_queries)
+        by_slug = {task['slug']: task for task in tasks}
+        # Community task gated on its own category: the contribution counts.
+        self.assertTrue(by_slug['gated-task-0']['eligibility']['eligible'])
+        # View-only access still locks builder and validator tasks.
+        self.assertTrue(by_slug['gated-task-1']['eligibility']['read_only'])
+        self.assertTrue(by_slug['gated-task-2']['eligibility']['read_only'])
+        # Community points: 10 portal points meet the 5-point gate.
+        self.assertTrue(by_slug['gated-task-6']['eligibility']['eligible'])
+
     def test_clean_rejects_unknown_eligibility_rule(self):
         from django.core.exceptions import ValidationError
 
@@ -8,7 +8,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
 
-from .eligibility import evaluate_task_eligibility
+from .eligibility import EligibilityContext, evaluate_task_eligibility
 from .models import SocialTask, SocialTaskCompletion
 from .serializers import SocialTaskSerializer
 from .verifiers import verify
@@ -49,13 +49,14 @@ class SocialTaskViewSet(viewsets.GenericViewSet):
                 ).defer('verification_data')
             }
 
+        eligibility_context = EligibilityContext(user)
         now = timezone.now()
         active_tasks = []
         completed_tasks = []
         for task in qs:
             completion = completions_by_task_id.get(task.id)
             task._user_completion = completion if completion else False
-            task._eligibility_result = evaluate_task_eligibility(task, user)
+            task._eligibility_result = evaluate_task_eligibility(task, user, eligibility_context)
             if completion:
                 completed_tasks.append(task)
             elif task.is_currently_active(now):
@@ -12,6 +12,8 @@ if [ "${RUN_MIGRATIONS_ON_STARTUP:-true}" = "false" ]; then
 else
   echo "Running database migrations with advisory lock..."
   python3 manage.py migrate_with_lock --noinput
+  echo "Seeding the participants-growth series if it is empty..."
+  python3 manage.py refresh_participants_growth --if-empty
 fi
 
 echo "Startup complete. Starting Django server..."
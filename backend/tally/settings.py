@@ -143,6 +143,37 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/ref/settings/#caches
+
+# 'default' is per process: each Gunicorn worker on each container keeps its
+# own copy, which suits TTL-bounded caches. Values that every worker must agree
+# on as soon as they change (notification badge counts, the contribution
+# catalog version) use 'shared', a Redis instance at REDIS_URL: its reads never
+# touch the database and its incr is atomic. Without REDIS_URL (local
+# development, tests) 'shared' falls back to a per-process cache, which is only
+# correct with a single worker.
+REDIS_URL = os.environ.get('REDIS_URL', '').strip()
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': (
+        {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'tally',
+        }
+        if REDIS_URL
+        else {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'tally-shared',
+        }
+    ),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -366,6 +397,10 @@ PENDING_WALLET_SIGNUP_TTL_SECONDS = int(os.environ.get('PENDING_WALLET_SIGNUP_TT
 # Marketing campaign vanity links (campaigns app).
 CAMPAIGN_HIT_RETENTION_DAYS = int(os.environ.get('CAMPAIGN_HIT_RETENTION_DAYS', '90') or '90')
 CAMPAIGN_ATTRIBUTION_WINDOW_DAYS = int(os.environ.get('CAMPAIGN_ATTRIBUTION_WINDOW_DAYS', '30') or '30')
+# Redirect hits are buffered per process and bulk-inserted by a writer thread
+# (campaigns.hit_buffer). An interval of 0 disables the thread.
+CAMPAIGN_HIT_FLUSH_INTERVAL_SECONDS = float(os.environ.get('CAMPAIGN_HIT_FLUSH_INTERVAL_SECONDS', '2') or '2')
+CAMPAIGN_HIT_FLUSH_BATCH_SIZE = int(os.environ.get('CAMPAIGN_HIT_FLUSH_BATCH_SIZE', '500') or '500')
 EMAIL_VERIFICATION_HMAC_KEY = os.environ.get('EMAIL_VERIFICATION_HMAC_KEY', SECRET_KEY)
 EMAIL_VERIFICATION_ENCRYPTION_KEY = os.environ.get('EMAIL_VERIFICATION_ENCRYPTION_KEY', '')
 
@@ -19,3 +19,8 @@ MIGRATION_MODULES = _DisableMigrations()
 
 GITHUB_ENCRYPTION_KEY = 'oXf4yjCFpof8TTKIFuwb2Ie2BERopbplB_CnQGHfG64='
 SOCIAL_ENCRYPTION_KEY = GITHUB_ENCRYPTION_KEY
+
+# Write campaign redirect hits inline, one per request, instead of from the
+# buffer's writer thread.
+CAMPAIGN_HIT_FLUSH_INTERVAL_SECONDS = 0
+CAMPAIGN_HIT_FLUSH_BATCH_SIZE = 1
@@ -0,0 +1,157 @@
+"""
+Per-user facts behind UserSerializer, loaded in a few grouped queries.
+
+The profile payload (``/users/me/`` on every page load, and every nested
+user in contribution and leaderboard responses) used to resolve each badge,
+leaderboard entry, referral count, working group and social connection
+with its own query, several of them as a type lookup plus an ``exists()``.
+``load_user_profile_facts`` fetches all of them for a set of users at once:
+one query per kind of fact, whatever the number of users.
+
+Serializers read the facts through ``profile_facts_for``, which keeps them
+in the serializer context, so the user serializer and its nested validator
+and builder serializers share one load per response.
+"""
+
+from dataclasses import dataclass, field
+
+from django.db.models import Count
+
+# Contribution types whose presence UserSerializer reports as a flag.
+PROFILE_BADGE_SLUGS = (
+    'validator-waitlist',
+    'builder-welcome',
+    'validator-welcome',
+    'community-welcome',
+    'community-link-x',
+    'community-link-discord',
+    'community-link-github',
+)
+
+PROFILE_FACTS_CONTEXT_KEY = '_user_profile_facts'
+
+
+@dataclass
+class UserProfileFacts:
+    badge_slugs: frozenset = frozenset()
+    leaderboard_entries: dict = field(default_factory=dict)
+    referral_count: int = 0
+    connections: dict = field(default_factory=dict)
+    working_groups: list = field(default_factory=list)
+
+    def has_badge(self, slug):
+        return slug in self.badge_slugs
+
+    def leaderboard_entry(self, leaderboard_type):
+        return self.leaderboard_entries.get(leaderboard_type)
+
+    def connection(self, related_name):
+        return self.connections.get(related_name)
+
+
+def _connection_models():
+    # Keyed by the reverse one-to-one accessor on User.
+    from social_connections.models import DiscordConnection, GitHubConnection, TwitterConnection
+
+    return {
+        'githubconnection': GitHubConnection,
+        'twitterconnection': TwitterConnection,
+        'discordconnection': DiscordConnection,
+    }
+
+
+def load_user_profile_facts(users):
+    """Return {user_id: UserProfileFacts} for `users` (instances or ids)."""
+    from community_xp.models import Mee6CurrentXP
+    from community_xp.services import get_default_guild_id
+    from community_xp.utils import get_latest_applied_sync
+    from contributions.models import Contribution
+    from leaderboard.models import LeaderboardEntry
+    from stewards.models import WorkingGroupParticipant
+    from users.models import User
+
+    user_ids = {getattr(user, 'pk', user) for user in users} - {None}
+    if not user_ids:
+        return {}
+
+    badges = {user_id: set() for user_id in user_ids}
+    for user_id, slug in (
+        Contribution.objects
+        .filter(user_id__in=user_ids, contribution_type__slug__in=PROFILE_BADGE_SLUGS)
+        .order_by()
+        .values_list('user_id', 'contribution_type__slug')
+        .distinct()
+    ):
+        badges[user_id].add(slug)
+
+    facts = {
+        user_id: UserProfileFacts(badge_slugs=frozenset(badges[user_id]))
+        for user_id in user_ids
+    }
+
+    for entry in LeaderboardEntry.objects.filter(user_id__in=user_ids).order_by('pk'):
+        facts[entry.user_id].leaderboard_entries.setdefault(entry.type, entry)
+
+    for referrer_id, count in (
+        User.objects
+        .filter(referred_by_id__in=user_ids)
+        .order_by()
+        .values('referred_by_id')
+        .annotate(count=Count('id'))
+        .values_list('referred_by_id', 'count')
+    ):
+        facts[referrer_id].referral_count = count
+
+    for related_name, model in _connection_models().items():
+        for connection in model.objects.filter(user_id__in=user_ids):
+            facts[connection.user_id].connections[related_name] = connection
+
+    discord_connections = [
+        item.connections['discordconnection']
+        for item in facts.values()
+        if 'discordconnection' in item.connections
+    ]
+    if discord_connections:
+        # Prime the MEE6 lookups DiscordConnectionSerializer would run per user.
+        current_xp = {
+            row.discord_id: row
+            for row in Mee6CurrentXP.objects.filter(
+                guild_id=get_default_guild_id(),
+                discord_id__in=[connection.platform_user_id for connection in discord_connections],
+            )
+        }
+        latest_sync = get_latest_applied_sync() if current_xp else None
+        for connection in discord_connections:
+            connection._mee6_current_xp_cache = current_xp.get(connection.platform_user_id)
+            connection._mee6_latest_sync_cache = latest_sync
+
+    memberships = (
+        WorkingGroupParticipant.objects
+        .filter(user_id__in=user_ids)
+        .select_related('working_group')
+        .annotate(participant_count=Count('working_group__participants'))
+    )
+    for membership in memberships:
+        group = membership.working_group
+        facts[membership.user_id].working_groups.append({
+            'id': group.id,
+            'name': group.name,
+            'icon': group.icon,
+            'description': group.description,
+            'participant_count': membership.participant_count,
+            'joined_at': membership.created_at,
+        })
+
+    return facts
+
+
+def profile_facts_for(context, user):
+    """Return the user's facts, loading them once per serializer context.
+
+    List views can pre-load a whole page by storing
+    ``load_user_profile_facts(users)`` under PROFILE_FACTS_CONTEXT_KEY.
+    """
+    facts_by_user = context.setdefault(PROFILE_FACTS_CONTEXT_KEY, {})
+    if user.pk not in facts_by_user:
+        facts_by_user.update(load_user_profile_facts([user]))
+    return facts_by_user.setdefault(user.pk, UserProfileFacts())
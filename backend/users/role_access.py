@@ -1,6 +1,8 @@
 """Server-authoritative helpers for non-steward role section access."""
 
 from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef
 
 
 VIEWABLE_ROLE_CATEGORIES = frozenset({'builder', 'validator', 'community'})
@@ -28,6 +30,36 @@ def user_has_role_profile(user, category):
     return cache[category]
 
 
+def load_role_profile_access(user):
+    """Fill user_has_role_profile's per-user cache for every role in one query."""
+    user_id = getattr(user, 'pk', None)
+    if not user_id:
+        return
+
+    cache = getattr(user, '_role_profile_access_cache', None)
+    if cache is None:
+        cache = {}
+        user._role_profile_access_cache = cache
+    missing = [category for category in VIEWABLE_ROLE_CATEGORIES if category not in cache]
+    if not missing:
+        return
+
+    profiles = {}
+    for category in missing:
+        app_label, model_name = _ROLE_PROFILE_MODELS[category]
+        model = apps.get_model(app_label, model_name)
+        profiles[f'has_{category}'] = Exists(model.objects.filter(user_id=OuterRef('pk')))
+    row = (
+        get_user_model().objects
+        .filter(pk=user_id)
+        .annotate(**profiles)
+        .values(*profiles)
+        .first()
+    ) or {}
+    for category in missing:
+        cache[category] = bool(row.get(f'has_{category}'))
+
+
 def user_can_view_role_sections(user):
     """Return whether admin enabled the non-steward read-only viewer flag."""
     return bool(
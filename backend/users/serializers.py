@@ -5,8 +5,9 @@ from builders.models import Builder
 from stewards.models import Steward
 from creators.models import Creator
 from contributions.node_upgrade.models import TargetNodeVersion
-from leaderboard.models import LeaderboardEntry
+from contributions.catalog import get_category
 from contributions.models import Category
+from .profile_facts import profile_facts_for
 from .utils import truncate_address
 
 
@@ -236,19 +237,19 @@ class ValidatorSerializer(serializers.ModelSerializer):
 
     def get_total_points(self, obj):
         """Get total points for validator leaderboard."""
-        leaderboard = LeaderboardEntry.objects.filter(user=obj.user, type='validator').first()
+        leaderboard = profile_facts_for(self.context, obj.user).leaderboard_entry('validator')
         return leaderboard.total_points if leaderboard else 0
 
     def get_rank(self, obj):
         """Get rank in validator leaderboard."""
-        leaderboard = LeaderboardEntry.objects.filter(user=obj.user, type='validator').first()
+        leaderboard = profile_facts_for(self.context, obj.user).leaderboard_entry('validator')
         return leaderboard.rank if leaderboard else None
     
     def get_total_contributions(self, obj):
         """Get total number of contributions in validator category."""
         from contributions.models import Contribution, ContributionType
         try:
-            category = Category.objects.get(slug='validator')
+            category = get_category('validator')
             contribution_types = ContributionType.objects.filter(category=category)
             return Contribution.objects.filter(
                 user=obj.user,
@@ -270,7 +271,7 @@ class ValidatorSerializer(serializers.ModelSerializer):
         from django.db.models import Count, Sum
 
         try:
-            category = Category.objects.get(slug='validator')
+            category = get_category('validator')
             contribution_types = ContributionType.objects.filter(category=category)
 
             # Get contribution stats grouped by type
@@ -395,7 +396,7 @@ class BuilderSerializer(serializers.ModelSerializer):
     
     def get_total_points(self, obj):
         """Get total points for builder leaderboard."""
-        leaderboard = LeaderboardEntry.objects.filter(user=obj.user, type='builder').first()
+        leaderboard = profile_facts_for(self.context, obj.user).leaderboard_entry('builder')
         if leaderboard:
             return leaderboard.total_points
         # No entry == not eligible for the public ranking (no real builder
@@ -405,7 +406,7 @@ class BuilderSerializer(serializers.ModelSerializer):
     
     def get_rank(self, obj):
         """Get rank in builder leaderboard."""
-        leaderboard = LeaderboardEntry.objects.filter(user=obj.user, type='builder').first()
+        leaderboard = profile_facts_for(self.context, obj.user).leaderboard_entry('builder')
         return leaderboard.rank if leaderboard else None
     
     def get_total_contributions(self, obj):
@@ -615,16 +616,13 @@ class UserSerializer(serializers.ModelSerializer):
         if self.context.get('use_light_serializers', False):
             return None
 
-        try:
-            # Get the validator leaderboard entry (default leaderboard)
-            entry = LeaderboardEntry.objects.filter(user=obj, type='validator').first()
-            if entry:
-                return {
-                    'rank': entry.rank,
-                    'total_points': entry.total_points
-                }
-        except:
-            pass
+        # Get the validator leaderboard entry (default leaderboard)
+        entry = profile_facts_for(self.context, obj).leaderboard_entry('validator')
+        if entry:
+            return {
+                'rank': entry.rank,
+                'total_points': entry.total_points
+            }
         return None
     
     def get_has_validator_waitlist(self, obj):
@@ -635,14 +633,7 @@ class UserSerializer(serializers.ModelSerializer):
         # Skip expensive queries for nested/list views
         if self.context.get('use_light_serializers', False):
             return False
-
-        from contributions.models import Contribution, ContributionType
-
-        try:
-            waitlist_type = ContributionType.objects.get(slug='validator-waitlist')
-            return Contribution.objects.filter(user=obj, contribution_type=waitlist_type).exists()
-        except ContributionType.DoesNotExist:
-            return False
+        return profile_facts_for(self.context, obj).has_badge('validator-waitlist')
 
     def _has_contribution_type(self, obj, slug):
         """Whether the user has any contribution of the given type slug.
@@ -651,12 +642,7 @@ class UserSerializer(serializers.ModelSerializer):
         """
         if self.context.get('use_light_serializers', False):
             return False
-        from contributions.models import Contribution, ContributionType
-        try:
-            contribution_type = ContributionType.objects.get(slug=slug)
-            return Contribution.objects.filter(user=obj, contribution_type=contribution_type).exists()
-        except ContributionType.DoesNotExist:
-            return False
+        return profile_facts_for(self.context, obj).has_badge(slug)
 
     def get_has_builder_welcome(self, obj):
         """Check if the user started the builder journey (point-free marker)."""
@@ -766,7 +752,7 @@ class UserSerializer(serializers.ModelSerializer):
         """
         if not self._can_view_private_user_data(obj):
             return 0
-        return User.objects.filter(referred_by=obj).count()
+        return profile_facts_for(self.context, obj).referral_count
 
     def get_referral_details(self, obj):
         """Referral breakdown. Only included when include_referral_details=True."""
@@ -782,28 +768,13 @@ class UserSerializer(serializers.ModelSerializer):
         """
         Get list of working groups the user belongs to.
         """
-        from stewards.models import WorkingGroupParticipant
-        memberships = WorkingGroupParticipant.objects.filter(
-            user=obj
-        ).select_related('working_group')
-        return [
-            {
-                'id': m.working_group.id,
-                'name': m.working_group.name,
-                'icon': m.working_group.icon,
-                'description': m.working_group.description,
-                'participant_count': m.working_group.participants.count(),
-                'joined_at': m.created_at
-            }
-            for m in memberships
-        ]
+        return profile_facts_for(self.context, obj).working_groups
 
     def _get_social_connection(self, obj, related_name, serializer_class):
-        try:
-            connection = getattr(obj, related_name)
-            return serializer_class(connection).data
-        except Exception:
+        connection = profile_facts_for(self.context, obj).connection(related_name)
+        if connection is None:
             return None
+        return serializer_class(connection).data
 
     def get_github_connection(self, obj):
         if self._can_view_private_user_data(obj):
@@ -828,19 +799,19 @@ class UserSerializer(serializers.ModelSerializer):
 
     def get_github_username(self, obj):
         """Backward compat: read from GitHubConnection if available."""
-        try:
-            return obj.githubconnection.platform_username
-        except Exception:
-            return obj.github_username or ''
+        connection = profile_facts_for(self.context, obj).connection('githubconnection')
+        if connection is not None:
+            return connection.platform_username
+        return obj.github_username or ''
 
     def get_github_linked_at(self, obj):
         """Backward compat: read from GitHubConnection if available."""
         if not self._can_view_private_user_data(obj):
             return None
-        try:
-            return obj.githubconnection.linked_at
-        except Exception:
-            return obj.github_linked_at
+        connection = profile_facts_for(self.context, obj).connection('githubconnection')
+        if connection is not None:
+            return connection.linked_at
+        return obj.github_linked_at
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
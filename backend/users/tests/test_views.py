@@ -1,7 +1,14 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework.test import APITestCase
 
 from builders.models import Builder
+from contributions.models import Category, Contribution, ContributionType
 from creators.models import Creator
+from leaderboard.models import GlobalLeaderboardMultiplier
+from social_connections.models import GitHubConnection, TwitterConnection
+from stewards.models import WorkingGroup, WorkingGroupParticipant
 from users.models import User
 from validators.models import Validator
 
@@ -63,3 +70,87 @@ class RoleSectionViewerAPITests(APITestCase):
         self.assertIn('can_view_role_sections', response.data)
         self.other_user.refresh_from_db()
         self.assertFalse(self.other_user.can_view_role_sections)
+
+
+class UserProfileFactsAPITests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='profile-facts@example.com',
+            password='testpass123',
+            visible=True,
+        )
+        self.category, _ = Category.objects.get_or_create(
+            slug='community', defaults={'name': 'Community'}
+        )
+        self.badge_types = {}
+        for slug in ('community-link-x', 'community-link-discord', 'community-link-github'):
+            contribution_type = ContributionType.objects.create(
+                name=slug.replace('-', ' ').title(),
+                slug=slug,
+                category=self.category,
+                min_points=1,
+                max_points=10,
+            )
+            GlobalLeaderboardMultiplier.objects.create(
+                contribution_type=contribution_type,
+                multiplier_value=1.0,
+                valid_from=timezone.now() - timezone.timedelta(days=1),
+            )
+            self.badge_types[slug] = contribution_type
+        now = timezone.now()
+        GitHubConnection.objects.create(
+            user=self.user, platform_user_id='1', platform_username='octo', linked_at=now,
+        )
+        TwitterConnection.objects.create(
+            user=self.user, platform_user_id='2', platform_username='tweeter', linked_at=now,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def _add_facts(self, index, badge_slug):
+        Contribution.objects.create(
+            user=self.user,
+            contribution_type=self.badge_types[badge_slug],
+            points=5,
+            contribution_date=timezone.now(),
+        )
+        User.objects.create_user(
+            email=f'referred-{index}@example.com',
+            password='testpass123',
+            referred_by=self.user,
+        )
+        group = WorkingGroup.objects.create(name=f'Group {index}')
+        WorkingGroupParticipant.objects.create(working_group=group, user=self.user)
+        WorkingGroupParticipant.objects.create(
+            working_group=group,
+            user=User.objects.create_user(email=f'member-{index}@example.com', password='testpass123'),
+        )
+
+    def _me(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/users/me/')
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response.data
+
+    def test_me_query_count_does_not_grow_with_profile_facts(self):
+        self._add_facts(0, 'community-link-x')
+        self._me()  # warm process-wide caches
+        few_queries, _ = self._me()
+
+        self._add_facts(1, 'community-link-discord')
+        self._add_facts(2, 'community-link-github')
+        many_queries, data = self._me()
+
+        self.assertEqual(many_queries, few_queries)
+        self.assertTrue(data['has_community_link_x'])
+        self.assertTrue(data['has_community_link_discord'])
+        self.assertTrue(data['has_community_link_github'])
+        self.assertFalse(data['has_validator_waitlist'])
+        self.assertEqual(data['total_referrals'], 3)
+        self.assertEqual(
+            [(group['name'], group['participant_count']) for group in data['working_groups']],
+            [('Group 0', 2), ('Group 1', 2), ('Group 2', 2)],
+        )
+        self.assertEqual(data['github_username'], 'octo')
+        self.assertEqual(data['github_connection']['platform_username'], 'octo')
+        self.assertEqual(data['twitter_connection']['platform_username'], 'tweeter')
+        self.assertIsNone(data['discord_connection'])